@@ -37,11 +37,14 @@ modules = [
 
     # ----------------------- Regression List --------------------------
     'scripts/aerodynamics/aerodynamics.py',
+    'scripts/aerodynamics/training_cache_test.py',
+    'scripts/aerodynamics/vortex_lattice_test.py',
     #'scripts/aerodynamics_super/aerodynamics_super.py',
     #'scripts/regression/test_mission_AS2.py', 
     'scripts/airfoil_import/airfoil_import_test.py',    
     'scripts/atmosphere/atmosphere.py',
     'scripts/atmosphere/constant_temperature.py',
+    'scripts/atmosphere/atmosphere_throughput.py',
     'scripts/AVL/test_AVL.py',
     'scripts/B737/mission_B737.py',
     'scripts/battery/battery.py', 
@@ -49,6 +52,8 @@ modules = [
     'scripts/cmalpha/cmalpha.py',
     'scripts/cnbeta/cnbeta.py',    
     'scripts/concorde/concorde.py',
+    'scripts/data/data_access_test.py',
+    'scripts/data/data_layout_test.py',
     'scripts/DC_10_noise/DC_10_noise.py',
     'scripts/ducted_fan/ducted_fan_network.py',
     'scripts/ducted_fan/battery_ducted_fan_network.py',
@@ -69,23 +74,36 @@ modules = [
     'scripts/mission_range_and_weight_sizing/take_off_weight_from_tofl.py', 
     'scripts/multifidelity/optimize_mf.py',
     'scripts/noise_optimization/Noise_Test.py', 
+    'scripts/noise_fidelity_one/jet_noise_test.py',
+    'scripts/noise_fidelity_one/noise_footprint_test.py',
     'scripts/optimization_packages/optimization_packages.py',    
+    'scripts/optimization_packages/parallel_gradient_test.py',
+    'scripts/optimization_packages/evaluation_cache_test.py',
+    'scripts/optimization_packages/parallel_swarm_test.py',
     'scripts/payload_range/payload_range.py',
     'scripts/propeller/propeller_test.py',
     'scripts/motor/motor_test.py', 
     'scripts/propulsion_surrogate/propulsion_surrogate.py',
     'scripts/ramjet_network/ramjet_network.py',
+    'scripts/ramjet_network/compressible_flow_benchmark.py',
     'scripts/Regional_Jet_Optimization/Optimize2.py',
     'scripts/scramjet_network/scramjet_network.py',
     'scripts/rocket_network/Rocketdyne_F1.py',
     'scripts/rocket_network/Rocketdyne_J2.py',   
     'scripts/segments/segment_test.py',     
+    'scripts/segments/sparse_jacobian_test.py',
+    'scripts/segments/batch_mission_test.py',
+    'scripts/segments/warm_start_test.py',
+    'scripts/segments/process_profiler_test.py',
     'scripts/sizing_loop/sizing_loop.py',
+    'scripts/sizing_loop/sizing_history_test.py',
     'scripts/solar_network/solar_network.py',
     'scripts/solar_network/solar_low_fidelity_network.py',
     'scripts/solar_radiation/solar_radiation.py',
     'scripts/SU2_surrogate/BWB-450.py',   
+    'scripts/SU2_surrogate/SU2_scheduler_test.py',
     'scripts/sweeps/test_sweeps.py',
+    'scripts/sweeps/parallel_sweep_test.py',
     'scripts/test_input_output/test_xml_read_write.py',
     'scripts/test_input_output/test_freemind_write.py',    
     'scripts/variable_cruise_distance/variable_cruise_distance.py', 
@@ -0,0 +1,35 @@
+#!/usr/bin/env python
+# fake_avl.py
+#
+# Created: Oct 2026, SUAVE Team
+#
+""" stands in for the AVL executable in the regression: reads an input deck from stdin and, 
+for every results file the deck asks for, copies the stored file of the same name from avl_files
+into the working folder"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import os
+import sys
+import shutil
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+    
+    stored_folder = os.path.join(os.path.dirname(os.path.abspath(__file__)),'avl_files')
+    commands      = [line.strip() for line in sys.stdin]
+    
+    # st, fn, fs and sb are followed by the name of the file they write
+    for command, filename in zip(commands[:-1],commands[1:]):
+        if command in ['st','fn','fs','sb']:
+            shutil.copy(os.path.join(stored_folder,filename),filename)
+    
+    return
+
+if __name__ == '__main__':
+    main()
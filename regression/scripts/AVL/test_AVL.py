@@ -1,6 +1,7 @@
 # test_AVL.py
 # 
 # Created:  May 2017, M. Clarke
+# Modified: Oct 2026, SUAVE Team
 #
 """ setup file for a mission with a 737 using AVL
 """
@@ -15,11 +16,12 @@ from SUAVE.Core import Units
 import numpy as np
 import pylab as plt
 
-import copy, time
+import copy, time, os, tempfile
 
 from SUAVE.Core import (
 Data, Container,
 )
+from SUAVE.Methods.Utilities.Grid_Surrogate import Grid_Surrogate, surrogate_grid_points
 
 import sys
 
@@ -143,8 +145,95 @@ def main():
     print('CM difference')
     print(diff_CM)
     assert np.abs((moment_coefficient - moment_coefficient_true)/moment_coefficient_true) < 1e-6    
+    
+    # a surrogate tabulated on a grid reproduces the Gaussian process at the mission conditions
+    conditions    = results.segments.cruise.conditions
+    points        = np.hstack([conditions.aerodynamics.angle_of_attack,conditions.freestream.mach_number])
+    training      = aerodynamics.process.compute.lift.inviscid.training
+    lift_model    = aerodynamics.process.compute.lift.inviscid.surrogates.lift_coefficient
+    grid_points   = surrogate_grid_points(training.grid_points, 50)
+    grid_model    = Grid_Surrogate(lift_model, grid_points)
+    diff_grid_CL  = np.max(np.abs(grid_model.predict(points) - lift_model.predict(points)))
+    print('Grid surrogate CL difference')
+    print(diff_grid_CL)
+    assert diff_grid_CL < 1e-3
+    
+    # a dimension with a single training value is held constant
+    single_mach   = np.hstack([training.grid_points[:,0:1], 0*training.grid_points[:,1:2] + points[0,1]])
+    grid_points   = surrogate_grid_points(single_mach, 50)
+    assert len(grid_points[1]) == 1
+    grid_model    = Grid_Surrogate(lift_model, grid_points)
+    diff_grid_CL  = np.max(np.abs(grid_model.predict(points) - lift_model.predict(single_mach[:1]*[0,1] + points*[1,0])))
+    assert diff_grid_CL < 1e-3
+    try:
+        surrogate_grid_points(training.grid_points, 1)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError('a grid with a single point per dimension was built')
+    
+    # the training cases run concurrently match the serial run
+    concurrent_training_test(aerodynamics.process.compute.lift.inviscid.geometry, stability.geometry)
  
     return
 
+def concurrent_training_test(aerodynamics_geometry, stability_geometry):
+    """ runs the AVL training cases in separate folders and processes, with a stand-in 
+    executable that returns the stored AVL results, and compares them with the serial run"""
+    
+    fake_avl   = os.path.abspath('fake_avl.py')
+    run_folder = os.path.join(tempfile.mkdtemp(),'avl_files')
+    
+    for analysis, geometry, name in [[SUAVE.Analyses.Aerodynamics.AVL_Inviscid(),aerodynamics_geometry,'aerodynamics'],
+                                     [SUAVE.Analyses.Stability.AVL()             ,stability_geometry   ,'stability']]:
+        
+        # serial run on the stored results
+        serial                              = analysis
+        serial.regression_flag              = True
+        serial.keep_files                   = True
+        serial.settings.spanwise_vortices   = 30
+        serial.geometry                     = copy.deepcopy(geometry)
+        serial.sample_training()
+        
+        # concurrent run, one AVL process per case
+        concurrent                              = type(analysis)()
+        concurrent.regression_flag              = False
+        concurrent.keep_files                   = False
+        concurrent.settings.spanwise_vortices   = 30
+        concurrent.settings.number_of_workers   = 4
+        concurrent.settings.filenames.run_folder   = run_folder
+        concurrent.settings.filenames.avl_bin_name = fake_avl
+        concurrent.geometry                     = copy.deepcopy(geometry)
+        concurrent.sample_training()
+        
+        diff_training = np.max(np.abs(concurrent.training.coefficients - serial.training.coefficients))
+        print('Concurrent ' + name + ' training difference')
+        print(diff_training)
+        assert diff_training < 1e-12
+        assert not os.path.exists(run_folder)
+        
+    # a failed AVL run raises an error that names the case
+    failing_avl = os.path.join(tempfile.mkdtemp(),'failing_avl.py')
+    with open(failing_avl,'w') as script:
+        script.write('#!' + sys.executable + '\nimport sys\nsys.exit(3)\n')
+    os.chmod(failing_avl,0o755)
+    
+    failing                                 = SUAVE.Analyses.Aerodynamics.AVL_Inviscid()
+    failing.keep_files                      = False
+    failing.settings.spanwise_vortices      = 30
+    failing.settings.number_of_workers      = 2
+    failing.settings.filenames.run_folder   = run_folder
+    failing.settings.filenames.avl_bin_name = failing_avl
+    failing.geometry                        = copy.deepcopy(aerodynamics_geometry)
+    try:
+        failing.sample_training()
+    except RuntimeError as error:
+        print(error)
+        assert 'status 3' in str(error)
+    else:
+        raise AssertionError('a failed AVL run was not reported')
+    
+    return
+
 if __name__ == '__main__': 
     main()    
@@ -0,0 +1,111 @@
+# SU2_scheduler_test.py
+#
+# Created: Oct 2026, SUAVE Team
+#
+""" runs the SU2_inviscid training grid with a stand-in SU2_CFD executable, concurrently, and
+checks the coefficients, the processor split, the history reader and resuming an interrupted grid"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data, Units, redirect
+from SUAVE.Input_Output.SU2 import read_SU2_history, split_processors, SU2_CFD_command
+
+import numpy as np
+import os
+import time
+import tempfile
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    fake_SU2_CFD = os.path.abspath('fake_SU2_CFD.py')
+
+    # processor budget
+    assert split_processors(8,2,True)  == (2,4)
+    assert split_processors(8,3,True)  == (3,2)
+    assert split_processors(8,4,False) == (4,1)
+    assert split_processors(2,4,True)  == (4,1)
+
+    settings = Data(SU2_CFD_command = 'SU2_CFD', mpi_command = 'mpiexec --bind-to none')
+    assert SU2_CFD_command('wing',1,settings) == ['SU2_CFD','wing.cfg']
+    assert SU2_CFD_command('wing',4,settings) == ['mpiexec','--bind-to','none','-n','4','SU2_CFD','wing.cfg']
+
+    with redirect.folder(tempfile.mkdtemp()):
+
+        # the history reader only reads the end of the file
+        history = 'long_history.dat'
+        with open(history,'w') as f:
+            f.write('"Inner_Iter","rms[Rho]","rms[RhoU]","rms[RhoV]","rms[RhoW]","rms[RhoE]","CEff","CMz","CD","CL"\n')
+            for i in range(20000):
+                f.write(','.join([str(i)] + ['{:.10e}'.format(np.sin(i+k)) for k in range(9)]) + '\n')
+        with open(history) as f:
+            final_state = f.readlines()[-1].split(',')
+        assert read_SU2_history(history) == (float(final_state[9]),float(final_state[8]))
+        assert read_SU2_history(history,block_size=16) == (float(final_state[9]),float(final_state[8]))
+
+        # serial and concurrent training grids
+        serial_time,     serial     = sample_training(fake_SU2_CFD,1,'serial')
+        concurrent_time, concurrent = sample_training(fake_SU2_CFD,3,'concurrent')
+
+        AoA  = concurrent.training.grid_points[:,0]
+        mach = concurrent.training.grid_points[:,1]
+        CL   = 2. * np.pi * AoA / np.sqrt(1. - mach**2)
+        CD   = CL**2 / (np.pi * 8.)
+        assert np.max(np.abs(concurrent.training.coefficients[:,0] - CL)) < 1e-9
+        assert np.max(np.abs(concurrent.training.coefficients[:,1] - CD)) < 1e-9
+        assert np.all(concurrent.training.coefficients == serial.training.coefficients)
+
+        print('Serial training grid:     {:.3f} s'.format(serial_time))
+        print('Concurrent training grid: {:.3f} s'.format(concurrent_time))
+
+        # an interrupted grid only runs the cases without results
+        run_folder = concurrent.settings.run_folder
+        histories  = [os.path.join(run_folder,case,'wing_history.dat') for case in sorted(os.listdir(run_folder))]
+        modified   = [os.stat(history).st_mtime_ns for history in histories]
+        os.remove(os.path.join(run_folder,'case_02_02','wing_results.dat'))
+        os.remove(os.path.join(run_folder,'case_02_02','wing_history.dat'))
+
+        resume_time, resumed = sample_training(fake_SU2_CFD,3,'concurrent')
+        print('Resumed training grid:    {:.3f} s'.format(resume_time))
+
+        assert np.all(resumed.training.coefficients == concurrent.training.coefficients)
+        for history, mtime in zip(histories,modified):
+            if 'case_02_02' in history:
+                assert os.path.exists(history)
+            else:
+                assert os.stat(history).st_mtime_ns == mtime
+
+        # a changed configuration runs the cases again
+        _, changed = sample_training(fake_SU2_CFD,3,'concurrent',maximum_iterations=150)
+        assert all([os.stat(history).st_mtime_ns != mtime for history, mtime in zip(histories,modified)])
+        assert np.max(np.abs(changed.training.coefficients - concurrent.training.coefficients)) < 1e-9
+
+    return
+
+def sample_training(SU2_CFD,concurrent_cases,run_folder,maximum_iterations=200):
+    """ samples the training grid of SU2_inviscid with the stand-in executable """
+
+    analysis = SUAVE.Analyses.Aerodynamics.SU2_inviscid()
+    analysis.geometry.tag                 = 'wing'
+    analysis.geometry.reference_area      = 10.
+    analysis.settings.SU2_CFD_command     = SU2_CFD
+    analysis.settings.concurrent_cases    = concurrent_cases
+    analysis.settings.processors          = concurrent_cases
+    analysis.settings.run_folder          = run_folder
+    analysis.settings.maximum_iterations  = maximum_iterations
+    analysis.training.angle_of_attack     = np.array([-2.,3.,8.]) * Units.deg
+    analysis.training.Mach                = np.array([0.3,0.5,0.7])
+
+    time0 = time.time()
+    analysis.sample_training()
+
+    return time.time() - time0, analysis
+
+if __name__ == '__main__':
+    main()
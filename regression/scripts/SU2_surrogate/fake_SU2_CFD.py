@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+# fake_SU2_CFD.py
+#
+# Created: Oct 2026, SUAVE Team
+#
+""" stands in for SU2_CFD in the regression: reads the Mach number, angle of attack and history
+file name from a .cfg file and writes a convergence history that ends on thin airfoil values
+with a Prandtl-Glauert correction"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import sys
+import math
+import time
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+    
+    settings = {}
+    with open(sys.argv[1]) as cfg:
+        for line in cfg:
+            if '=' in line:
+                key, value = line.split('=',1)
+                settings[key.strip()] = value.strip()
+    
+    mach       = float(settings['MACH_NUMBER'])
+    AoA        = float(settings['AOA']) * math.pi / 180.
+    iterations = int(settings['INNER_ITER'])
+    
+    CL = 2. * math.pi * AoA / math.sqrt(1. - mach**2)
+    CD = CL**2 / (math.pi * 8.)
+    
+    # a solver takes time, which lets cases overlap
+    time.sleep(0.2)
+    
+    with open(settings['CONV_FILENAME'] + '.dat','w') as history:
+        history.write('"Inner_Iter","rms[Rho]","rms[RhoU]","rms[RhoV]","rms[RhoW]","rms[RhoE]","CEff","CMz","CD","CL"\n')
+        for i in range(iterations):
+            factor = 1. - 0.5**(i+1)
+            history.write(','.join(['{:d}'.format(i)] + ['{:.10e}'.format(x) for x in [-i,-i,-i,-i,-i,CL/CD,0.,CD*factor,CL*factor]]) + '\n')
+    
+    return
+
+if __name__ == '__main__':
+    main()
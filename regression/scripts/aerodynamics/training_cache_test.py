@@ -0,0 +1,84 @@
+# training_cache_test.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" checks that surrogate training data is stored on disk and reloaded
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Input_Output.SUAVE import hash_data, load_training_cache
+
+import numpy as np
+import os
+import shutil
+import tempfile
+import sys
+
+sys.path.append('../Vehicles')
+from Boeing_737 import vehicle_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    vehicle      = vehicle_setup()
+    cache_folder = tempfile.mkdtemp(prefix='suave_training_cache_')
+
+    try:
+        # the hash only depends on the content
+        assert hash_data(vehicle, np.array([1.,2.])) == hash_data(vehicle_setup(), np.array([1.,2.]))
+        assert hash_data(vehicle, np.array([1.,2.])) != hash_data(vehicle, np.array([1.,3.]))
+
+        # the first initialization runs the vortex lattice and stores the training data
+        vortex_lattice = SUAVE.Analyses.Aerodynamics.Vortex_Lattice()
+        vortex_lattice.geometry = vehicle
+        vortex_lattice.training_cache_directory = cache_folder
+        vortex_lattice.initialize()
+
+        files = [f for f in os.listdir(cache_folder) if f.endswith('.npz')]
+        assert len(files) == 1
+
+        # an identical analysis reloads it without running the vortex lattice
+        reloaded = SUAVE.Analyses.Aerodynamics.Vortex_Lattice()
+        reloaded.geometry = vehicle_setup()
+        reloaded.training_cache_directory = cache_folder
+        reloaded.settings.number_panels_spanwise = -1 # would fail if the vortex lattice was run
+        key    = hash_data('Vortex_Lattice', reloaded.geometry, reloaded.training.angle_of_attack, vortex_lattice.settings)
+        tables = load_training_cache(cache_folder, key)
+        assert tables is not None
+
+        reloaded.settings.number_panels_spanwise = vortex_lattice.settings.number_panels_spanwise
+        reloaded.initialize()
+
+        assert np.all(reloaded.training.lift_coefficient == vortex_lattice.training.lift_coefficient)
+        for wing in vehicle.wings.keys():
+            assert np.all(reloaded.training.wing_lift_coefficients[wing] == vortex_lattice.training.wing_lift_coefficients[wing])
+
+        AoA = np.array([[0.],[3.]]) * Units.deg
+        assert np.all(reloaded.surrogates.lift_coefficient(AoA) == vortex_lattice.surrogates.lift_coefficient(AoA))
+
+        # a different geometry is trained again
+        changed = SUAVE.Analyses.Aerodynamics.Vortex_Lattice()
+        changed.geometry = vehicle_setup()
+        changed.geometry.wings.main_wing.spans.projected = 0.9 * vehicle.wings.main_wing.spans.projected
+        changed.training_cache_directory = cache_folder
+        changed.initialize()
+
+        files = [f for f in os.listdir(cache_folder) if f.endswith('.npz')]
+        assert len(files) == 2
+        assert not np.all(changed.training.lift_coefficient == vortex_lattice.training.lift_coefficient)
+
+    finally:
+        shutil.rmtree(cache_folder)
+
+    return
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+# vortex_lattice_test.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" checks the vortex lattice solved for all angles of attack with one factorization against
+solves at each angle of attack, and the reuse of the factored influence matrices
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift import weissinger_vortex_lattice, weissinger_influence, weissinger_solve
+
+import numpy as np
+import time
+import sys
+
+sys.path.append('../Vehicles')
+from Boeing_737 import vehicle_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    vehicle  = vehicle_setup()
+    AoA      = np.linspace(-10.,10.,41) * Units.deg
+    settings = Data(number_panels_spanwise = 50)
+
+    # all angles of attack at once and one at a time
+    for wing in vehicle.wings:
+        time0     = time.time()
+        influence = weissinger_influence(settings, wing)
+        CL, CD    = weissinger_solve(influence, AoA)
+        batch_time = time.time() - time0
+
+        time0 = time.time()
+        single = np.array([weissinger_vortex_lattice(Data(aerodynamics = Data(angle_of_attack = alpha)), settings, wing) for alpha in AoA])
+        single_time = time.time() - time0
+
+        print(wing.tag, 'batched: {:.4f} s, one at a time: {:.4f} s'.format(batch_time, single_time))
+        assert np.max(np.abs(CL - single[:,0])) < 1e-12
+        assert np.max(np.abs(CD - single[:,1])) < 1e-12
+
+        if wing.vertical:
+            assert np.all(CL == 0.)
+        else:
+            assert np.all(np.diff(CL) > 0.)
+
+    # an array of angles of attack keeps its shape
+    conditions = Data(aerodynamics = Data(angle_of_attack = np.array([[0.],[2.],[4.]]) * Units.deg))
+    CL_column, _ = weissinger_vortex_lattice(conditions, settings, vehicle.wings.main_wing)
+    assert CL_column.shape == (3,1)
+
+    # a degenerate wing, like the wing of the multicopter, gives undefined coefficients instead of an error
+    wing = SUAVE.Components.Wings.Main_Wing()
+    wing.aspect_ratio    = 1
+    wing.spans.projected = 0.01
+    CL, CD = weissinger_solve(weissinger_influence(settings, wing), AoA)
+    assert CL.shape == AoA.shape
+    assert np.all(np.isnan(CL)) and np.all(np.isnan(CD))
+
+    # the influence matrices are kept while the geometry is unchanged
+    vortex_lattice = SUAVE.Analyses.Aerodynamics.Vortex_Lattice()
+    vortex_lattice.geometry = vehicle
+    vortex_lattice.initialize()
+    factors = Data()
+    for wing in vehicle.wings.keys():
+        factors[wing] = vortex_lattice.influence_matrices[wing][1]
+
+    vehicle.wings.main_wing.spans.projected = 0.9 * vehicle.wings.main_wing.spans.projected
+    vortex_lattice.initialize()
+    assert vortex_lattice.influence_matrices.main_wing[1] is not factors.main_wing
+    assert vortex_lattice.influence_matrices.horizontal_stabilizer[1] is factors.horizontal_stabilizer
+
+    # the training data matches the vortex lattice at each angle of attack
+    training = vortex_lattice.training
+    for i, alpha in enumerate(training.angle_of_attack):
+        conditions = Data(aerodynamics = Data(angle_of_attack = alpha))
+        CL_total   = 0.
+        for wing in vehicle.wings:
+            CL_wing, _ = weissinger_vortex_lattice(conditions, vortex_lattice.settings, wing)
+            CL_total  += CL_wing * wing.areas.reference / vehicle.reference_area
+            assert np.abs(training.wing_lift_coefficients[wing.tag][i] - CL_wing) < 1e-12
+        assert np.abs(training.lift_coefficient[i] - CL_total) < 1e-12
+
+    return
+
+if __name__ == '__main__':
+    main()
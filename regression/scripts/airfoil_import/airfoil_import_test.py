@@ -4,6 +4,9 @@ from SUAVE.Methods.Geometry.Two_Dimensional.Cross_Section.Airfoil.import_airfoil
      import import_airfoil_geometry
 from SUAVE.Methods.Geometry.Two_Dimensional.Cross_Section.Airfoil.import_airfoil_polars \
      import import_airfoil_polars
+from SUAVE.Methods.Geometry.Two_Dimensional.Cross_Section.Airfoil.compute_airfoil_polars \
+     import compute_airfoil_polars, cached_airfoil_polars, interpolate_airfoil_polars
+import numpy as np
 
 # ----------------------------------------------------------------------
 #   Main
@@ -17,6 +20,31 @@ def main():
     airfoil_geometry_names = ['airfoil_geometry_1.txt','airfoil_geometry_2.txt']    
     airfoil_geometry_data = import_airfoil_geometry (airfoil_geometry_names)
     
+    # processed polars are only computed once per propeller geometry
+    prop = Data()
+    prop.hub_radius         = 0.1
+    prop.tip_radius         = 1.0
+    prop.chord_distribution = np.linspace(0.2,0.1,10)
+    
+    polars   = compute_airfoil_polars(prop, airfoil_geometry_names, airfoil_polar_names)
+    cached_1 = cached_airfoil_polars(prop, airfoil_geometry_names, airfoil_polar_names)
+    cached_2 = cached_airfoil_polars(prop, airfoil_geometry_names, airfoil_polar_names)
+    assert cached_1 is cached_2
+    assert np.all(cached_1.lift_coefficients == polars.lift_coefficients)
+    assert np.all(cached_1.drag_coefficients == polars.drag_coefficients)
+    
+    prop.chord_distribution = np.linspace(0.3,0.1,10)
+    assert not cached_airfoil_polars(prop, airfoil_geometry_names, airfoil_polar_names) is cached_1
+    
+    # the vectorized lookup matches np.interp at every station
+    stations  = [0,0,0,1,1,1,1,0,1,0]
+    alpha     = np.linspace(-30.,100.,40)[:,None]*Units.degrees + np.linspace(0.,0.1,10)
+    Cl        = interpolate_airfoil_polars(alpha, polars.angle_of_attacks, polars.lift_coefficients, stations)
+    Cl_truth  = np.zeros_like(alpha)
+    for k in range(len(stations)):
+        Cl_truth[:,k] = np.interp(alpha[:,k], polars.angle_of_attacks, polars.lift_coefficients[stations[k]])
+    assert np.max(np.abs(Cl - Cl_truth)) < 1e-12
+    
     return  
 
 if __name__ == '__main__': 
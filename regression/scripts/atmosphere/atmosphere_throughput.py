@@ -0,0 +1,116 @@
+# atmosphere_throughput.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" checks the US Standard 1976 atmosphere against the layer by layer evaluation it replaced,
+checks the interpolated atmosphere, and times both for 10 to 10^6 altitudes
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+
+import numpy as np
+import time
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    atmosphere = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+    fields     = ['pressure','temperature','density','speed_of_sound','dynamic_viscosity']
+
+    # altitudes below, inside and above the model, with the breaks converted to geometric altitude
+    Rad    = atmosphere.planet.mean_radius
+    breaks = atmosphere.breaks.altitude
+    z      = np.concatenate([np.linspace(-3.,90.,2001) * Units.km, breaks*Rad/(Rad - breaks), [0., 11. * Units.km]])
+
+    # the same values as the layer by layer evaluation
+    for delta_isa in [0., 15.]:
+        for var_gamma in [False, True]:
+            conditions = atmosphere.compute_values(z, delta_isa, var_gamma)
+            reference  = layer_loop(atmosphere, z, delta_isa, var_gamma)
+            for field in fields:
+                assert np.array_equal(conditions[field], reference[field])
+
+    # a single altitude and values stored in given conditions
+    conditions = atmosphere.compute_values(5000.)
+    assert conditions.pressure.shape == (1,1)
+    results = Data()
+    assert atmosphere.compute_values(z, 10., results = results) is results
+    assert np.array_equal(results.temperature, layer_loop(atmosphere, z, 10.).temperature)
+
+    # the interpolated atmosphere
+    for delta_isa in [0., 15.]:
+        conditions   = atmosphere.compute_values(z, delta_isa)
+        interpolated = atmosphere.interpolate_values(z, delta_isa)
+        for field in fields:
+            error = np.max(np.abs(interpolated[field]/conditions[field] - 1.))
+            print(field, 'interpolation error:', error)
+            assert error < 1e-7
+
+    # throughput
+    print('altitudes     compute_values   interpolate_values   layer by layer')
+    for n_points in [10, 100, 1000, 10000, 100000, 1000000]:
+        z_bench = np.linspace(0., 80., n_points) * Units.km
+        repeats = max(1, 10000//n_points)
+        times   = []
+        for function in [atmosphere.compute_values, atmosphere.interpolate_values,
+                         lambda zs: layer_loop(atmosphere, zs)]:
+            time0 = time.time()
+            for _ in range(repeats):
+                function(z_bench)
+            times.append((time.time() - time0)/repeats)
+        print('{:9d}  {:12.6f} s  {:15.6f} s  {:13.6f} s'.format(n_points, *times))
+
+    return
+
+def layer_loop(atmosphere,zs,delta_isa=0.,var_gamma=False):
+    """ the US Standard 1976 atmosphere evaluated one layer at a time with boolean masks """
+
+    gas  = atmosphere.fluid_properties
+    grav = atmosphere.planet.sea_level_gravity
+    Rad  = atmosphere.planet.mean_radius
+    R    = gas.gas_specific_constant
+
+    breaks = atmosphere.breaks
+    zs     = np.atleast_2d(zs).T
+    zs     = zs/(1 + zs/Rad)
+    zs[zs < breaks.altitude[0]]  = breaks.altitude[0]
+    zs[zs > breaks.altitude[-1]] = breaks.altitude[-1]
+
+    p     = np.zeros_like(zs)
+    z0    = np.zeros_like(zs)
+    T0    = np.zeros_like(zs)
+    p0    = np.zeros_like(zs)
+    alpha = np.zeros_like(zs)
+    for i in range(len(breaks.altitude)-1):
+        i_inside = (zs >= breaks.altitude[i]) & (zs <= breaks.altitude[i+1])
+        z0[i_inside]    = breaks.altitude[i]
+        T0[i_inside]    = breaks.temperature[i]
+        p0[i_inside]    = breaks.pressure[i]
+        alpha[i_inside] = -(breaks.temperature[i+1] - breaks.temperature[i])/(breaks.altitude[i+1] - breaks.altitude[i])
+
+    dz = zs-z0
+    i_isoth = (alpha == 0.)
+    i_adiab = (alpha != 0.)
+    p[i_isoth] = p0[i_isoth] * np.exp(-1.*dz[i_isoth]*grav/(R*T0[i_isoth]))
+    p[i_adiab] = p0[i_adiab] * ( (1.-alpha[i_adiab]*dz[i_adiab]/T0[i_adiab]) **(1.*grav/(alpha[i_adiab]*R)) )
+    T = T0 - dz*alpha + delta_isa
+
+    values = Data()
+    values.pressure          = p
+    values.temperature       = T
+    values.density           = gas.compute_density(T,p)
+    values.speed_of_sound    = gas.compute_speed_of_sound(T,p,var_gamma)
+    values.dynamic_viscosity = gas.compute_absolute_viscosity(T)
+
+    return values
+
+if __name__ == '__main__':
+    main()
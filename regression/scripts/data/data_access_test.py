@@ -0,0 +1,176 @@
+# data_access_test.py
+#
+# Created: Oct 2026, SUAVE Team
+#
+""" checks that attribute access on the conditions of an evaluated mission segment behaves the same
+with the current Data attribute methods and with the exception driven methods they replaced. Run
+the script with the argument benchmark to time both."""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data
+from SUAVE.Analyses.Mission.Segments.Conditions import Conditions
+
+import numpy as np
+import timeit
+import sys
+
+sys.path.append('../segments')
+from segment_test import full_setup, simple_sizing
+
+dictgetitem  = dict.__getitem__
+objgetattrib = object.__getattribute__
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    conditions = evaluated_conditions()
+    legacy     = legacy_copy(conditions)
+    paths      = leaf_paths(conditions)
+
+    # both forms see the same data
+    for path in paths:
+        a = get_path(conditions, path)
+        b = get_path(legacy, path)
+        assert(np.all(a == b))
+
+    # methods are found on every node
+    for path in node_paths(conditions, 'pack_array'):
+        assert(callable(get_path(conditions, path)))
+
+    # every leaf written and new keys added end up in the same places
+    for code in [set_code(paths), new_code(len(paths))]:
+        new_env    = run_code(code, conditions, Data)
+        legacy_env = run_code(code, legacy, Legacy_Data)
+        assert(leaf_paths(new_env['c']) == leaf_paths(legacy_env['c']))
+        for path in leaf_paths(new_env['c']):
+            assert(np.all(get_path(new_env['c'], path) == get_path(legacy_env['c'], path)))
+        if 'd' in new_env:
+            assert(list(new_env['d'].keys()) == list(legacy_env['d'].keys()))
+
+    # attributes of the class are still set as attributes
+    conditions._size = 5
+    assert(not '_size' in conditions)
+    assert(conditions.ones_row(1).shape[0] == 5)
+
+    return
+
+def benchmark():
+
+    conditions = evaluated_conditions()
+    legacy     = legacy_copy(conditions)
+    paths      = leaf_paths(conditions)
+
+    # every leaf read, every leaf written, and a method looked up on every node
+    get_code    = '\n'.join(['x = c.' + path for path in paths])
+    method_code = '\n'.join(['x = c.' + path for path in node_paths(conditions,'pack_array')])
+
+    print('Attribute access on ' + str(len(paths)) + ' leaves, microseconds per access')
+
+    results = Data()
+    for name, code, count in [['get', get_code, len(paths)], ['set', set_code(paths), len(paths)],
+                              ['method', method_code, len(node_paths(conditions,'pack_array'))],
+                              ['new key', new_code(len(paths)), len(paths)]]:
+        new_time    = time_code(code, conditions, Data)
+        legacy_time = time_code(code, legacy, Legacy_Data)
+        results[name] = [legacy_time / count * 1e6, new_time / count * 1e6]
+        print('{:<8} before {:8.3f}   after {:8.3f}'.format(name, *results[name]))
+
+    return results
+
+def evaluated_conditions():
+    """ Conditions of the first climb of the segment test mission """
+
+    configs, analyses = full_setup()
+    simple_sizing(configs, analyses)
+    configs.finalize()
+    analyses.finalize()
+
+    segment = analyses.missions.base.segments.climb_1
+    segment.evaluate()
+
+    return segment.state.conditions
+
+# ----------------------------------------------------------------------
+#   Legacy Data
+# ----------------------------------------------------------------------
+
+class Legacy_Data(Conditions):
+    """ Data with the attribute methods that try a key and fall back on an exception """
+
+    def __getattribute__(self, k):
+        try:
+            return dictgetitem(self,k)
+        except:
+            return objgetattrib(self,k)
+
+    def __setattr__(self, k, v):
+        try:
+            objgetattrib(self, k)
+        except:
+            self[k] = v
+        else:
+            object.__setattr__(self, k, v)
+
+def legacy_copy(data):
+    """ Copies the structure of a Data into Legacy_Data """
+    legacy = Legacy_Data()
+    dict.clear(legacy)
+    for key, value in dict.items(data):
+        if isinstance(value, Data):
+            value = legacy_copy(value)
+        dict.__setitem__(legacy, key, value)
+    return legacy
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def leaf_paths(data, prefix=''):
+    paths = []
+    for key, value in dict.items(data):
+        if isinstance(value, Data):
+            paths.extend(leaf_paths(value, prefix + key + '.'))
+        elif key.isidentifier():
+            paths.append(prefix + key)
+    return paths
+
+def node_paths(data, name, prefix=''):
+    paths = [prefix + name]
+    for key, value in dict.items(data):
+        if isinstance(value, Data):
+            paths.extend(node_paths(value, name, prefix + key + '.'))
+    return paths
+
+def get_path(data, path):
+    for key in path.split('.'):
+        data = getattr(data, key)
+    return data
+
+def set_code(paths):
+    return '\n'.join(['c.' + path + ' = 1.' for path in paths])
+
+def new_code(count):
+    return '\n'.join(['d = Data()'] + ['d.key_%i = 1.' % i for i in range(count)])
+
+def run_code(code, conditions, data_class):
+    env = {'c': conditions, 'Data': data_class}
+    exec(compile(code, '<test>', 'exec'), env)
+    return env
+
+def time_code(code, conditions, data_class):
+    code = compile(code, '<benchmark>', 'exec')
+    env  = {'c': conditions, 'Data': data_class}
+    return min(timeit.repeat(lambda: exec(code, env), number=20, repeat=5)) / 20.
+
+if __name__ == '__main__':
+    if 'benchmark' in sys.argv[1:]:
+        benchmark()
+    else:
+        main()
@@ -0,0 +1,83 @@
+# data_layout_test.py
+#
+# Created: Oct 2026, SUAVE Team
+#
+""" checks that the compiled layout packs and unpacks Data the same way as the recursive walk"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data, Data_Layout
+
+import numpy as np
+import copy
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    ones = np.ones([4,1])
+
+    data = Data()
+    data.tag            = 'numerical data'
+    data.height         = ones * 1.
+    data.rates          = Data()
+    data.rates.angle    = ones * 3.
+    data.rates.special  = 'nope'
+    data.rates.vector   = np.array([1.,2.,3.])
+    data.value          = 5.0
+    data.count          = 2
+    data.position       = np.reshape(np.arange(12.),[4,3])
+
+    # the same values packed by hand, 2D arrays are packed by column
+    truth = np.hstack([ones[:,0]*1., ones[:,0]*3., [1.,2.,3.], [5.,2.], np.arange(12.).reshape([4,3]).ravel(order='F')])
+
+    packed = data.pack_array()
+    assert(np.all(packed == truth))
+    assert(packed.dtype == truth.dtype)
+
+    # the layout is compiled once and reused
+    layout = data.get_layout()
+    assert(isinstance(layout,Data_Layout))
+    assert(layout.size == len(truth))
+    data.pack_array()
+    assert(data.get_layout() is layout)
+
+    # unpacking writes into the existing arrays
+    height = data.height
+    data.unpack_array(truth * 2.)
+    assert(data.height is height)
+    assert(np.all(data.pack_array() == truth * 2.))
+    assert(np.all(data.position == np.reshape(np.arange(12.),[4,3]) * 2.))
+    assert(data.value == 10.)
+
+    # changing the structure compiles a new layout
+    data.rates.extra = ones * 7.
+    packed = data.pack_array()
+    assert(not data.get_layout() is layout)
+    assert(len(packed) == len(truth) + 4)
+
+    # so does changing a shape
+    layout = data.get_layout()
+    data.height = np.ones([6,1])
+    assert(len(data.pack_array()) == len(truth) + 6)
+    assert(not data.get_layout() is layout)
+
+    # copies compile their own layout
+    other = copy.deepcopy(data)
+    other.height[:] = 3.
+    assert(np.all(other.pack_array()[:6] == 3.))
+    assert(np.all(data.pack_array()[:6] == 1.))
+
+    # array output still uses the recursive walk
+    array = data.pack_array('array')
+    assert(array.shape[0] == 6)
+
+    return
+
+if __name__ == '__main__':
+    main()
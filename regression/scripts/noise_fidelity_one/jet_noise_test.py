@@ -0,0 +1,104 @@
+# jet_noise_test.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" runs the SAE jet noise model over a takeoff climb past a sideline microphone and checks it
+against the values of the step by step implementation
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Methods.Noise.Fidelity_One.Engine import noise_SAE
+
+import numpy as np
+import time
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    turbofan      = turbofan_setup()
+    noise_segment = climb_segment()
+    analyses      = Data()
+    analyses.atmosphere = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+
+    time0 = time.time()
+    EPNL, SPL_history, SENEL = noise_SAE(turbofan, noise_segment, None, analyses)
+    print('SAE jet noise: {:.4f} s'.format(time.time() - time0))
+    print('EPNL  =', EPNL)
+    print('SENEL =', SENEL)
+
+    # values of the step by step implementation, which did not compute the primary jet in the
+    # highest band and only kept the dBA level of one step
+    EPNL_truth     = 90.18239616451969
+    SPL_0_truth    = 967.2009395589926
+    SPL_last_truth = 1003.4518637174807
+
+    assert SPL_history.shape == (68,24)
+    assert np.abs(EPNL - EPNL_truth)/EPNL_truth < 1e-10
+    assert np.abs(np.sum(SPL_history[0,0:23]) - SPL_0_truth)/SPL_0_truth < 1e-10
+    assert np.abs(np.sum(SPL_history[-1,0:23]) - SPL_last_truth)/SPL_last_truth < 1e-10
+
+    # the levels of the highest band include the primary jet
+    assert np.all(SPL_history[:,23] > SPL_history[:,22] - 20.)
+
+    return
+
+def turbofan_setup():
+    """ the jet noise properties of a turbofan """
+
+    turbofan = Data()
+    turbofan.design_thrust        = 49200. * Units.N
+    turbofan.core_nozzle_diameter = 0.92  * Units.m
+    turbofan.fan_nozzle_diameter  = 1.659 * Units.m
+    turbofan.engine_height        = 0.5   * Units.m
+    turbofan.exa                  = 1.
+    turbofan.plug_diameter        = 0.1   * Units.m
+    turbofan.geometry_xe          = 1.
+    turbofan.geometry_ye          = 1.
+    turbofan.geometry_Ce          = 2.
+    turbofan.core_nozzle          = Data(noise_speed = 415. * Units['m/s'])
+    turbofan.fan_nozzle           = Data(noise_speed = 315. * Units['m/s'])
+    turbofan.fan                  = Data(rotation    = 3470.) # [rpm]
+
+    return turbofan
+
+def climb_segment():
+    """ a climb at constant speed past a microphone 450 m to the side of the runway """
+
+    t        = np.linspace(0., 34., 9)
+    velocity = 80.5
+    altitude = 10.7 + 0.45*t**2 - 0.0085*t**3
+    x        = velocity*t - 1500.
+
+    ones = np.ones((len(t),1))
+    conditions = Data()
+    conditions.frames     = Data(inertial = Data(time = t[:,None]))
+    conditions.freestream = Data(altitude = altitude[:,None], velocity = velocity*ones)
+    conditions.aerodynamics = Data(angle_of_attack = 10. * Units.deg * ones)
+
+    conditions.propulsion = Data(acoustic_outputs = Data(core = Data(), fan = Data()))
+    core = conditions.propulsion.acoustic_outputs.core
+    fan  = conditions.propulsion.acoustic_outputs.fan
+    core.exit_stagnation_temperature = 784.4 * ones + 0.2*t[:,None]
+    core.exit_stagnation_pressure    = 101200. * ones - 165.*t[:,None]
+    fan.exit_stagnation_temperature  = 339.9 * ones - 0.1*t[:,None]
+    fan.exit_stagnation_pressure     = 101200. * ones - 165.*t[:,None]
+
+    # distance and angles from the aircraft to the microphone
+    noise_segment = Data()
+    noise_segment.conditions = conditions
+    noise_segment.dist  = np.sqrt(x**2 + 450.**2 + altitude**2)
+    noise_segment.theta = np.arccos(-x/noise_segment.dist)
+    noise_segment.phi   = np.arctan2(450.,altitude)
+
+    return noise_segment
+
+if __name__ == '__main__':
+    main()
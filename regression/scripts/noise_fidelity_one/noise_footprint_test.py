@@ -0,0 +1,137 @@
+# noise_footprint_test.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" computes the noise footprint of a takeoff climb on a grid of ground observers and checks it
+against the airframe and jet noise models run for each microphone, serially and in parallel
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Methods.Noise.Fidelity_One import noise_footprint
+from SUAVE.Methods.Noise.Fidelity_One.Airframe import noise_airframe_Fink
+from SUAVE.Methods.Noise.Fidelity_One.Engine import noise_SAE
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import noise_counterplot
+from SUAVE.Methods.Geometry.Two_Dimensional.Planform import wing_planform
+
+import numpy as np
+import time
+import sys
+import os
+
+from jet_noise_test import climb_segment
+
+sys.path.append('../Vehicles')
+from Boeing_737 import vehicle_setup, configs_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    vehicle = vehicle_setup()
+    wing_planform(vehicle.wings.main_wing)
+    configs = configs_setup(vehicle)
+    for config in configs:
+        config.propulsors.turbofan.design_thrust = 52700. * Units.N
+
+    analyses = Data()
+    analyses.atmosphere = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+
+    # the climb of the jet noise test along the x axis
+    noise_segment = climb_segment()
+    conditions    = noise_segment.conditions
+    t             = conditions.frames.inertial.time[:,0]
+    conditions.frames.inertial.position_vector = np.zeros((len(t),3))
+    conditions.frames.inertial.position_vector[:,0] = 80.5*t - 1500.
+    conditions.frames.inertial.position_vector[:,2] = -conditions.freestream.altitude[:,0]
+
+    # the geometry of several microphones is the geometry of each microphone
+    microphones = np.array([[0., 0., 450.], [-800., 1.2, -200.], [1500., 0., 0.]])
+    dist, theta, phi = noise_counterplot(noise_segment, Data(mic_array = microphones), None)
+    assert dist.shape == (3, len(t))
+    for i, microphone in enumerate(microphones):
+        single = noise_counterplot(noise_segment, Data(mic_array = microphone), None)
+        assert np.array_equal(single[0], dist[i])
+        assert np.array_equal(single[1], theta[i])
+        assert np.array_equal(single[2], phi[i])
+
+    # the sideline microphone has the geometry of the jet noise test
+    reference = climb_segment()
+    assert np.max(np.abs(dist[0] - reference.dist)) < 1e-9
+    assert np.max(np.abs(theta[0] - reference.theta)) < 1e-12
+    assert np.max(np.abs(phi[0] - reference.phi)) < 1e-12
+
+    # each microphone of a footprint has the levels of the noise models run for that microphone
+    for tag, engine_flag in [('takeoff', 1), ('landing', 0)]:
+        config    = configs[tag]
+        footprint = noise_footprint(config, analyses, noise_segment, microphones, engine_flag)
+        for i, microphone in enumerate(microphones):
+            noise_counterplot(noise_segment, Data(mic_array = microphone), config)
+            airframe = noise_airframe_Fink(config, analyses, noise_segment)
+            assert np.abs(footprint.airframe.EPNL[i] - airframe[0]) < 1e-8
+            assert np.abs(footprint.airframe.SENEL[i] - airframe[2]) < 1e-8
+            if engine_flag:
+                engine = noise_SAE(config.propulsors.turbofan, noise_segment, config, analyses)
+                assert np.abs(footprint.engine.EPNL[i] - engine[0]) < 1e-8
+                assert np.abs(footprint.engine.SENEL[i] - engine[2]) < 1e-8
+                total = 10. * np.log10(10**(airframe[0]/10) + 10**(engine[0]/10))
+            else:
+                assert footprint.engine.EPNL[i] == 0.
+                total = airframe[0]
+            assert np.abs(footprint.EPNL[i] - total) < 1e-8
+
+    # a segment that starts after t = 0 holds the end positions like the models of each microphone
+    late_segment = climb_segment()
+    late_segment.conditions.frames.inertial.time += 20.
+    late_segment.conditions.frames.inertial.position_vector = conditions.frames.inertial.position_vector
+    late_microphones = np.array([[0., 0., 450.], [-1500., 0., 0.]])
+    footprint = noise_footprint(configs.takeoff, analyses, late_segment, late_microphones)
+    for i, microphone in enumerate(late_microphones):
+        noise_counterplot(late_segment, Data(mic_array = microphone), configs.takeoff)
+        airframe = noise_airframe_Fink(configs.takeoff, analyses, late_segment)
+        engine   = noise_SAE(configs.takeoff.propulsors.turbofan, late_segment, configs.takeoff, analyses)
+        assert np.abs(footprint.airframe.EPNL[i] - airframe[0]) < 1e-8
+        assert np.abs(footprint.airframe.SENEL[i] - airframe[2]) < 1e-8
+        assert np.abs(footprint.engine.EPNL[i] - engine[0]) < 1e-8
+        assert np.abs(footprint.engine.SENEL[i] - engine[2]) < 1e-8
+
+    # the whole history is computed, and the levels are written to files by a separate stage
+    EPNL, SPL, SENEL = noise_airframe_Fink(configs.landing, analyses, noise_segment, 1, 'Noise_footprint_test.dat')
+    assert np.all(SPL[-1] != 0.)
+    assert os.path.getsize('Noise_footprint_test.dat') > 0
+    os.remove('Noise_footprint_test.dat')
+    os.remove('History_Noise_landing.dat')
+
+    # the contours of the takeoff climb, serially and in parallel
+    noise  = SUAVE.Analyses.Noise.Fidelity_One()
+    x      = np.linspace(-1200., 1200., 4)
+    y      = np.array([0., 450., 1000.])
+    noise.settings.footprint.chunk_size = 4
+
+    time0  = time.time()
+    serial = noise.compute_footprint(configs.takeoff, analyses, noise_segment, x, y)
+    print('footprint of {} observers: {:.3f} s'.format(serial.EPNL.size, time.time() - time0))
+    print('EPNL =')
+    print(serial.EPNL)
+
+    noise.settings.footprint.number_of_workers = 2
+    parallel = noise.compute_footprint(configs.takeoff, analyses, noise_segment, x, y)
+
+    assert serial.EPNL.shape == (3,4)
+    assert np.array_equal(serial.EPNL, parallel.EPNL)
+    assert np.array_equal(serial.SENEL, parallel.SENEL)
+    assert np.array_equal(serial.engine.EPNL, parallel.engine.EPNL)
+
+    # the levels fall off to the side of the flight path
+    assert np.all(serial.EPNL[0] > serial.EPNL[2])
+
+    return
+
+if __name__ == '__main__':
+    main()
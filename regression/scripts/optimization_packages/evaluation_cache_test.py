@@ -0,0 +1,129 @@
+# evaluation_cache_test.py
+#
+# Created: Oct 2026, SUAVE Team
+#
+""" checks the evaluation cache of a nexus: revisited designs and the results restored with them,
+the least recently used limit, fidelity levels, and replaying a finished optimization from the cache file"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units
+import SUAVE.Optimization.Package_Setups.scipy_setup as scipy_setup
+from optimization_packages import setup
+
+import numpy as np
+import os
+import tempfile
+from contextlib import redirect_stdout
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    a = np.array([0.3,-0.7])
+    b = np.array([1.2, 0.4])
+    c = np.array([-1.,0.5])
+
+    # revisited designs are not run again
+    problem = cached_setup(2)
+    obj_a   = problem.objective(a)
+    obj_b   = problem.objective(b)
+    assert problem.objective(a) == obj_a
+    assert np.all(problem.all_constraints(a) == a)
+    assert problem.evaluation_count == 2
+
+    # the results, the summary and the stored paths are those of the revisited design
+    assert np.all(problem.results.design == a)
+    assert problem.summary.radius == np.sqrt(float(obj_a[0]))
+    assert problem.vehicle_configurations.base.radius == np.sqrt(float(obj_a[0]))
+    assert problem.evaluation_cache.hits == 1 and problem.evaluation_cache.misses == 2
+
+    # the least recently used design is dropped
+    problem.objective(c)
+    assert problem.objective(a) == obj_a
+    assert problem.evaluation_count == 3
+    assert problem.objective(b) == obj_b
+    assert problem.evaluation_count == 4
+
+    # other fidelity levels and forced evaluations are run
+    problem.fidelity_level = 2
+    problem.objective(b)
+    assert problem.evaluation_count == 5
+    problem.force_evaluate = True
+    problem.objective(b)
+    assert problem.evaluation_count == 6
+    print('Hit rate:', problem.evaluation_cache.hit_rate())
+
+    # the cache is off by default
+    problem = setup('SLSQP')
+    problem.objective(a)
+    problem.objective(b)
+    problem.objective(a)
+    assert problem.evaluation_count == 3
+
+    # a restarted optimization replays the evaluations of the first one
+    filename = os.path.join(tempfile.mkdtemp(),'evaluations.pkl')
+    first    = solve(filename)
+    restart  = solve(filename)
+    print('Optimum:', restart.outputs)
+    print('First run evaluations:', first.evaluation_count, ', restarted run evaluations:', restart.evaluation_count)
+    assert first.evaluation_count > 0 and restart.evaluation_count == 0
+    assert np.all(restart.outputs == first.outputs)
+    assert np.isclose(restart.objective(restart.outputs)[0], 1, atol=1e-6)
+
+    # an unfinished record is ignored
+    with open(filename,'ab') as f:
+        f.write(b'\x80\x04\x95')
+    assert solve(filename).evaluation_count == 0
+
+    # a changed problem does not replay the evaluations
+    changed = cached_setup(100)
+    changed.optimization_problem.constraints[1][2] = 0.5
+    changed.evaluation_cache.filename = filename
+    changed.objective(first.outputs)
+    assert changed.evaluation_count == 1
+
+    return
+
+def cached_setup(maximum_size):
+    """ the optimization_packages problem with the evaluation cache turned on """
+
+    problem = setup('SLSQP')
+    problem.procedure.summary = summarize
+    problem.evaluation_cache.maximum_size = maximum_size
+    problem.evaluation_cache.stored_paths = ['vehicle_configurations.*.radius']
+
+    return problem
+
+def summarize(nexus):
+    """ results, summary and vehicle values that are cached besides the objective and constraints """
+
+    radius = np.sqrt(nexus.obj[0])
+    nexus.results.design = np.array([nexus.vehicle_configurations.base.x1,nexus.vehicle_configurations.base.x2])
+    nexus.summary.radius = radius
+    for config in nexus.vehicle_configurations.values():
+        config.radius = radius
+
+    return nexus
+
+def solve(filename):
+    """ solves the problem with one active constraint, storing the evaluations in a file """
+
+    problem = cached_setup(1000)
+    problem.evaluation_cache.filename = filename
+    problem.optimization_problem.constraints = np.array([
+        [ 'x1' , '>', -10., 1., Units.less],
+        [ 'x2' , '>',   1., 1., Units.less],
+    ])
+    with open(os.devnull,'w') as devnull, redirect_stdout(devnull):
+        problem.outputs = scipy_setup.SciPy_Solve(problem, solver='SLSQP' , sense_step = 1.4901161193847656e-08)
+
+    return problem
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+# parallel_gradient_test.py
+#
+# Created: Oct 2026, SUAVE Team
+#
+""" checks the finite differences of a Nexus evaluated in worker processes against the serial
+ones, and solves the optimization_packages problem with SLSQP on the parallel gradients"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units
+import SUAVE.Optimization.Package_Setups.scipy_setup as scipy_setup
+from optimization_packages import setup
+
+import numpy as np
+import os
+from contextlib import redirect_stdout
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    x = np.array([0.3,-0.7])
+
+    # serial and parallel forward differences are the same
+    serial            = setup('SLSQP')
+    grad_obj, jac_con = serial.finite_difference(x,diff_interval=1e-6)
+
+    parallel                   = setup('SLSQP')
+    parallel.number_of_workers = 3
+    grad_obj_p, jac_con_p      = parallel.finite_difference(x,diff_interval=1e-6)
+
+    print('Forward difference gradient:', grad_obj_p)
+    assert np.all(grad_obj_p == grad_obj)
+    assert np.all(jac_con_p  == jac_con)
+    assert parallel.evaluation_count == serial.evaluation_count == 3
+
+    # the problem is left at the design the gradient was taken at
+    assert parallel.vehicle_configurations.base.x1 == x[0]
+    assert parallel.vehicle_configurations.base.x2 == x[1]
+
+    # central differences
+    grad_obj_c, jac_con_c = parallel.finite_difference(x,diff_interval=1e-4,central_difference=True)
+    print('Central difference gradient:', grad_obj_c)
+    assert np.max(np.abs(grad_obj_c - 2.*x)) < 1e-9
+    assert np.max(np.abs(jac_con_c - np.eye(2))) < 1e-9
+
+    # SLSQP on the parallel gradients, with one active constraint
+    problem                   = setup('SLSQP')
+    problem.number_of_workers = 2
+    problem.optimization_problem.constraints = np.array([
+        [ 'x1' , '>', -10., 1., Units.less],
+        [ 'x2' , '>',   1., 1., Units.less],
+    ])
+    with open(os.devnull,'w') as devnull, redirect_stdout(devnull):
+        outputs = scipy_setup.SciPy_Solve(problem, solver='SLSQP' , sense_step = 1.4901161193847656e-08)
+    print(outputs)
+    obj = problem.objective(outputs)[0]
+
+    assert( np.isclose(obj,        1, atol=1e-6) )
+    assert( np.isclose(outputs[0], 0, atol=1e-2) )
+    assert( np.isclose(outputs[1], 1, atol=1e-2) )
+
+    # SLSQP on the parallel gradients of a problem without constraints
+    problem                   = setup('SLSQP')
+    problem.number_of_workers = 2
+    problem.optimization_problem.constraints = np.zeros((0,5))
+    with open(os.devnull,'w') as devnull, redirect_stdout(devnull):
+        outputs = scipy_setup.SciPy_Solve(problem, solver='SLSQP' , sense_step = 1.4901161193847656e-08)
+    print(outputs)
+    obj = problem.objective(outputs)[0]
+
+    assert( np.isclose(obj,        0, atol=1e-6) )
+    assert( np.isclose(outputs[0], 0, atol=1e-2) )
+    assert( np.isclose(outputs[1], 0, atol=1e-2) )
+
+    return
+
+if __name__ == '__main__':
+    main()
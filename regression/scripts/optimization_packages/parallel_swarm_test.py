@@ -0,0 +1,82 @@
+# parallel_swarm_test.py
+#
+# Created: Oct 2026, SUAVE Team
+#
+""" solves the optimization_packages problem with a particle swarm evaluated by pools of worker
+processes and by a vectorized function, and checks that seeded swarms repeat"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units
+import SUAVE.Optimization.Package_Setups.scipy_setup as scipy_setup
+from SUAVE.Optimization.Package_Setups.particle_swarm_optimization import particle_swarm_optimization
+from optimization_packages import setup
+
+import numpy as np
+import os, sys
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    # a seeded swarm repeats, whatever the global random state
+    _, serial   = solve(1,4)
+    np.random.seed(3)
+    _, serial_2 = solve(1,4)
+    assert np.all(serial[0] == serial_2[0]) and serial[1] == serial_2[1]
+
+    # the swarm evaluated by pools of two and three workers
+    problem_2, parallel_2 = solve(2,4)
+    problem_3, parallel_3 = solve(3,4)
+    print('Parallel swarm optimum:', parallel_3)
+    assert np.all(parallel_2[0] == parallel_3[0]) and parallel_2[1] == parallel_3[1]
+    assert problem_2.evaluation_count == problem_3.evaluation_count > 0
+
+    obj = parallel_3[1][0]
+    x1  = parallel_3[0][0]
+    x2  = parallel_3[0][1]
+    assert( np.isclose(obj,  1, atol=1e-2) )
+    assert( np.isclose(x1 ,  0, atol=1e-1) )
+    assert( np.isclose(x2 ,  1, atol=1e-1) )
+
+    # the same swarm with a vectorized objective and constraint
+    sys.stdout = open(os.devnull,'w')
+    vectorized = particle_swarm_optimization(None, [-2.,-2.], [2.,2.], swarmsize=10, maxiter=1000, minstep=1e-4, minfunc=1e-4,
+                                             f_batch=swarm, seed=4)
+    sys.stdout = sys.__stdout__
+    print('Vectorized swarm optimum:', vectorized)
+    assert np.max(np.abs(vectorized[0] - parallel_3[0])) < 1e-12
+    assert np.abs(vectorized[1] - obj) < 1e-12
+
+    return
+
+def solve(number_of_workers,seed):
+    """ solves the problem with one active constraint """
+
+    problem = setup('particle_swarm_optimization')
+    problem.number_of_workers = number_of_workers
+    problem.optimization_problem.constraints = np.array([
+        [ 'x1' , '>', -10., 1., Units.less],
+        [ 'x2' , '>',   1., 1., Units.less],
+    ])
+    sys.stdout = open(os.devnull,'w')
+    outputs    = scipy_setup.SciPy_Solve(problem, solver='particle_swarm_optimization', pop_size = 10, prob_seed = seed)
+    sys.stdout = sys.__stdout__
+
+    return problem, outputs
+
+def swarm(x):
+    """ the objective and inequality constraints of the problem for a whole swarm """
+
+    obj  = x[:,0]**2 + x[:,1]**2
+    cons = np.vstack([x[:,0] + 10., x[:,1] - 1.]).T
+
+    return obj, cons
+
+if __name__ == '__main__':
+    main()
@@ -2,6 +2,7 @@
 # 
 # Created:  Sep 2014, E. Botero
 # Modified: Feb 2020, M. Clarke  
+#           Oct 2026, SUAVE Team
 
 #----------------------------------------------------------------------
 #   Imports
@@ -18,6 +19,7 @@ import numpy as np
 import copy, time
 from SUAVE.Methods.Propulsion import propeller_design
 from SUAVE.Components.Energy.Networks.Battery_Propeller import Battery_Propeller
+from SUAVE.Components.Energy.Converters.Rotor import compute_induced_velocity
 
 def main():
     
@@ -186,6 +188,29 @@ def main():
     
     for k,v in list(error.items()):
         assert(np.abs(v)<1e-6)
+        
+    # a propeller map converges every operating point independently,
+    # so each point matches a single point analysis
+    omegas     = np.array([150.,200.,250.])
+    velocities = np.array([0.5,20.,50.,80.])
+    altitudes  = np.array([0.,3000.])
+    prop_map   = prop_a.compute_performance_map(omegas,velocities,altitudes,atmosphere)
+    
+    for i,j,k in [(1,2,0),(2,0,1),(0,3,1)]:
+        atmo_data                                  = atmosphere.compute_values(altitudes[k])
+        conditions.freestream.update(atmo_data)
+        conditions.frames.inertial.velocity_vector = np.array([[velocities[j],0,0]])
+        prop_a.inputs.omega                        = np.array([[omegas[i]]])
+        F_ijk, Q_ijk, P_ijk, Cp_ijk, _, _          = prop_a.spin(conditions)
+        assert np.abs(prop_map.thrust[i,j,k] - F_ijk[0,0]) < 1e-6*np.maximum(1.,np.abs(F_ijk[0,0]))
+        assert np.abs(prop_map.power[i,j,k]  - P_ijk[0,0]) < 1e-6*np.maximum(1.,np.abs(P_ijk[0,0]))
+
+    # the vectorized forward flight inflow satisfies momentum theory at every point
+    Vh       = rot.induced_hover_velocity
+    V_thrust = np.array([[10.,0.,-2.],[30.,0.,-5.],[1.,0.,-40.],[-3.,0.,-10.]])
+    ua       = compute_induced_velocity(V_thrust, Vh, np.zeros(4,dtype=bool), np.zeros(4,dtype=bool))
+    residual = ua[:,0] - Vh**2/np.sqrt(V_thrust[:,2]**2 + (V_thrust[:,0] + ua[:,0])**2)
+    assert np.all(np.abs(residual) < 1e-8)
      
     return
 
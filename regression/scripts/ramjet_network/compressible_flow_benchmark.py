@@ -0,0 +1,98 @@
+# compressible_flow_benchmark.py
+#
+# Created: Oct 2026, SUAVE Team
+#
+""" compares the elementwise compressible flow solvers with the fsolve based solutions they
+replaced, for accuracy against a point by point solution and for speed on column vectors"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Methods.Propulsion import fm_solver, rayleigh, mach_area, exit_Mach_shock
+
+import numpy as np
+from scipy.optimize import fsolve
+import timeit
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    n     = 200
+    gamma = np.linspace(1.25, 1.4, n)
+
+    # subsonic and supersonic inputs, heat addition below thermal choking
+    M_sub   = np.linspace(0.1, 0.6, n)
+    M_sup   = np.linspace(1.5, 3.0, n)
+    T_sub   = 1. + (rayleigh_choking_ratio(M_sub, gamma) - 1.)*np.linspace(0.05, 0.95, n)
+    T_sup   = 1. + (rayleigh_choking_ratio(M_sup, gamma) - 1.)*np.linspace(0.05, 0.95, n)
+    Pt      = np.linspace(2.e5, 6.e5, n)
+    g_col   = gamma[:,None]
+
+    rayleigh_mach = lambda *args: rayleigh(*args)[0]
+
+    cases = [['fm_solver subsonic'  , fm_solver      , legacy_fm_solver      , (1.5, M_sub, gamma)],
+             ['fm_solver supersonic', fm_solver      , legacy_fm_solver      , (1.5, M_sup, gamma)],
+             ['rayleigh subsonic'   , rayleigh_mach  , legacy_rayleigh       , (gamma, M_sub, T_sub)],
+             ['rayleigh supersonic' , rayleigh_mach  , legacy_rayleigh       , (gamma, M_sup, T_sup)],
+             ['mach_area subsonic'  , mach_area      , legacy_mach_area      , (2.0, g_col, True)],
+             ['mach_area supersonic', mach_area      , legacy_mach_area      , (2.0, g_col, False)],
+             ['exit_Mach_shock'     , exit_Mach_shock, legacy_exit_Mach_shock, (2.0, gamma, Pt, 1.e5)]]
+
+    print('Column vectors of ' + str(n) + ' points, milliseconds per call')
+    for name, new, legacy, args in cases:
+
+        # accuracy against the legacy relation solved one point at a time
+        reference = np.array([legacy(*[a[i:i+1] if isinstance(a, np.ndarray) else a for a in args])[0] for i in range(n)])
+        M         = new(*args)
+        error     = np.max(np.abs(M - reference))
+        assert(error < 1e-8)
+
+        new_time    = min(timeit.repeat(lambda: new(*args), number=3, repeat=3)) / 3. * 1e3
+        legacy_time = min(timeit.repeat(lambda: legacy(*args), number=1, repeat=3)) * 1e3
+        print('{:<22} before {:9.3f}   after {:7.3f}   max difference {:.2e}'.format(name, legacy_time, new_time, error))
+
+    return
+
+# ----------------------------------------------------------------------
+#   Legacy Solutions
+# ----------------------------------------------------------------------
+
+def legacy_fm_solver(area_ratio, M0, gamma):
+    func = lambda M1: ((M0/M1*((1.+(gamma-1.)/2.*M1*M1)/(1.+(gamma-1.)/2.*M0*M0))**((gamma+1.)/(2.*(gamma-1.))))-area_ratio)
+    M1_guess = np.ones_like(M0)
+    M1_guess[M0 < 1.0]  = 0.1
+    M1_guess[M0 >= 1.0] = 1.1
+    return fsolve(func, M1_guess, factor=0.1)
+
+def legacy_rayleigh(gamma, M0, TtR):
+    func = lambda M1: (((1.+gamma*M0*M0)**2.*M1*M1*(1.+(gamma-1.)/2.*M1*M1))/((1.+gamma*M1*M1)**2.*M0*M0*(1.+(gamma-1.)/2.*M0*M0))-TtR)
+    M1_guess = np.ones_like(M0)
+    M1_guess[M0 <= 1.0] = .01
+    M1_guess[M0 > 1.0]  = 1.1
+    return fsolve(func, M1_guess, factor=0.1)
+
+def legacy_mach_area(area_ratio, gamma, subsonic):
+    func = lambda Me : (area_ratio**2. - ((1./Me)**2.)*(((2./(gamma+1.))*(1.+((gamma-1.)/2.)*Me**2.))**((gamma+1.)/((gamma-1.)))))[:,0]
+    Me_initial_guess = 0.01*np.ones(len(gamma)) if subsonic else 2.0*np.ones(len(gamma))
+    return fsolve(func, Me_initial_guess, factor = 0.1)
+
+def legacy_exit_Mach_shock(area_ratio, gamma, Pt_out, P0):
+    func = lambda Me : (Pt_out/P0)*(1./area_ratio)-(((gamma+1.)/2.)**((gamma+1.)/(2.*(gamma-1.))))*Me*((1.+(gamma-1.)/2.*Me**2.)**0.5)
+    Me_initial_guess = 0.1*np.ones_like(Pt_out)
+    return fsolve(func, Me_initial_guess)
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def rayleigh_choking_ratio(M0, gamma):
+    """ Stagnation temperature ratio that thermally chokes a Rayleigh flow """
+    return (1.+gamma*M0*M0)**2./((2.*(1.+gamma)*M0*M0)*(1.+(gamma-1.)/2.*M0*M0))
+
+if __name__ == '__main__':
+    main()
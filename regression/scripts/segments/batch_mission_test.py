@@ -0,0 +1,122 @@
+# batch_mission_test.py
+#
+# Created: Oct 2026, SUAVE Team
+#
+""" evaluates two copies of the segment test mission together as a batch"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data
+
+import numpy as np
+import scipy.optimize
+import copy
+
+from segment_test import full_setup, simple_sizing
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    configs, analyses = full_setup()
+    simple_sizing(configs, analyses)
+    configs.finalize()
+    analyses.finalize()
+    base = analyses.missions.base
+    base.tag = 'base'
+
+    # the first segments of the mission, kept before it is flown
+    short = copy.deepcopy(base)
+    for tag in list(short.segments.keys())[3:]:
+        delattr(short.segments,tag)
+
+    # the same mission flown 2000 kg lighter
+    light = copy.deepcopy(base)
+    light.tag = 'light'
+    light.segments[0].analyses.weights.vehicle.mass_properties.takeoff -= 2000.
+
+    batch = SUAVE.Analyses.Mission.Batch()
+    batch.append_mission(base)
+    batch.append_mission(light)
+
+    results = batch.evaluate()
+
+    # the first member has to match the mission flown on its own
+    segments = results.base.segments
+    climb_throttle_1   = segments.climb_1.conditions.propulsion.throttle[3][0]
+    cruise_CL_1        = segments.cruise_1.conditions.aerodynamics.lift_coefficient[2][0]
+    cruise_CL_2        = segments.cruise_2.conditions.aerodynamics.lift_coefficient[2][0]
+    single_pt_CL_1     = segments.single_point_1.conditions.aerodynamics.lift_coefficient[0][0]
+    loiter_CL          = segments.loiter.conditions.aerodynamics.lift_coefficient[2][0]
+    descent_throttle_3 = segments.descent_2.conditions.propulsion.throttle[3][0]
+
+    # Truth values, same as segment_test.py
+    climb_throttle_1_truth   = 0.9499524546537521
+    cruise_CL_1_truth        = 0.44622880901388906
+    cruise_CL_2_truth        = 0.4383927979043647
+    single_pt_CL_1_truth     = 0.2579265640161655
+    loiter_CL_truth          = 0.5255640469802842
+    descent_throttle_3_truth = 0.15473366469514083
+
+    # Store errors
+    error = Data()
+    error.climb_throttle_1   = np.max(np.abs(climb_throttle_1     - climb_throttle_1_truth))
+    error.cruise_CL_1        = np.max(np.abs(cruise_CL_1          - cruise_CL_1_truth ))
+    error.cruise_CL_2        = np.max(np.abs(cruise_CL_2          - cruise_CL_2_truth ))
+    error.single_pt_CL_1     = np.max(np.abs(single_pt_CL_1       - single_pt_CL_1_truth ))
+    error.loiter_CL          = np.max(np.abs(loiter_CL            - loiter_CL_truth ))
+    error.descent_throttle_3 = np.max(np.abs(descent_throttle_3   - descent_throttle_3_truth))
+
+    print('Errors:')
+    print(error)
+
+    for k,v in list(error.items()):
+        assert(np.abs(v)<1e-6)
+
+    # the lighter member flies at a lower lift coefficient and ends lighter
+    light_segments = results.light.segments
+    print('Cruise CL, base and light: ' + str([cruise_CL_1, light_segments.cruise_1.conditions.aerodynamics.lift_coefficient[2][0]]))
+    assert(light_segments.cruise_1.conditions.aerodynamics.lift_coefficient[2][0] < cruise_CL_1)
+    assert(light_segments.landing.conditions.weights.total_mass[-1,0] < segments.landing.conditions.weights.total_mass[-1,0])
+
+    # every member carries the convergence of its own segments
+    for mission in [results.base, results.light]:
+        for segment in mission.segments.values():
+            assert segment.state.numerics.converged
+
+    # when the joint solve fails, each member starts again from its own initial unknowns
+    starts  = []
+    batch   = SUAVE.Analyses.Mission.Batch()
+    for tag in ['first','second']:
+        mission = copy.deepcopy(short)
+        mission.tag = tag
+        mission.segments.climb_1.settings.root_finder = failing_root_finder(starts)
+        batch.append_mission(mission)
+
+    results = batch.evaluate()
+    assert len(starts) == 3
+    assert np.all(np.hstack(starts[1:]) == starts[0])
+    for mission in results.values():
+        assert mission.segments.climb_1.state.numerics.converged
+
+    return
+
+def failing_root_finder(starts):
+    """ a root finder whose joint batch solves fail after leaving the members at diverged unknowns """
+
+    def root_finder(function,x0,args,full_output,**options):
+        starts.append(np.array(x0))
+        if isinstance(args,list) or 'segments' in args:
+            function(x0*1.5,args)
+            return x0*1.5, dict(), 0, 'failed'
+        return scipy.optimize.fsolve(function,x0,args=args,full_output=full_output,**options)
+
+    return root_finder
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+# process_profiler_test.py
+#
+# Created: Oct 2026, SUAVE Team
+#
+""" profiles the steps of mission segments"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+
+import numpy as np
+
+from segment_test import full_setup, simple_sizing
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    configs, analyses = full_setup()
+    simple_sizing(configs, analyses)
+    configs.finalize()
+    analyses.finalize()
+    segment = analyses.missions.base.segments.climb_1
+
+    profiler = SUAVE.Analyses.Process_Profiler()
+    profiler.memory = True
+
+    with profiler:
+        segment.evaluate()
+
+    # nothing is recorded once the profiler is stopped
+    assert(SUAVE.Analyses.Process.profiler is None)
+    records = len(profiler.records)
+    segment.process.finalize(segment)
+    assert(len(profiler.records) == records)
+
+    print(profiler)
+
+    report = profiler.report()
+
+    # the process tree is kept under the segment
+    assert(list(report.steps.keys()) == ['climb_1'])
+    converge   = report.steps.climb_1.steps.converge
+    iterate    = converge.steps.converge_root.steps
+    conditions = iterate.conditions.steps
+    assert(converge.calls == 1)
+    assert(iterate.conditions.calls > 1)
+    assert(conditions.aerodynamics.calls == iterate.conditions.calls)
+
+    # the steps of the aerodynamics compute process are nested under the mission step
+    compute = conditions.aerodynamics.steps
+    assert('drag' in compute)
+    assert(compute.drag.steps.parasite.calls == conditions.aerodynamics.calls)
+
+    # nested steps never take longer than their parent
+    check_times(report)
+
+    # the top level steps make up the total
+    total = np.sum([step.time for step in report.steps.values()])
+    assert(np.abs(total - report.time) < 1e-9)
+
+    # steps of the same name in different segments are recorded apart
+    climb_2  = analyses.missions.base.segments.climb_2
+    profiler = SUAVE.Analyses.Process_Profiler()
+
+    with profiler:
+        segment.evaluate()
+        climb_2.evaluate()
+
+    report = profiler.report()
+    assert(list(report.steps.keys()) == ['climb_1','climb_2'])
+
+    first  = report.steps.climb_1.steps.converge.steps.converge_root.steps.conditions
+    second = report.steps.climb_2.steps.converge.steps.converge_root.steps.conditions
+    assert(first.calls  > 1)
+    assert(second.calls > 1)
+    assert(first.steps.aerodynamics.calls  == first.calls)
+    assert(second.steps.aerodynamics.calls == second.calls)
+    assert(report.steps.climb_1.calls == 1)
+    assert(report.steps.climb_2.calls == 1)
+    check_times(report)
+
+    return
+
+def check_times(node):
+    for step in node.steps.values():
+        children = np.sum([child.time for child in step.steps.values()])
+        assert(children <= step.time + 1e-9)
+        check_times(step)
+    return
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,7 @@
 # segment_test.py
 # 
 # Created: Feb 2020, M. Clarke
+# Modified: Oct 2026, SUAVE Team
 #
 """ setup file for segment test regression with a Boeing 737"""
 
@@ -105,6 +106,13 @@ def main():
     
     for k,v in list(error.items()):
         assert(np.abs(v)<1e-6)  
+        
+    # segments with the same number of control points share one set of read only operators
+    numerics_1 = results.segments.climb_1.state.numerics
+    numerics_2 = results.segments.cruise_1.state.numerics
+    assert numerics_1.number_control_points == numerics_2.number_control_points
+    assert numerics_1.dimensionless.integrate is numerics_2.dimensionless.integrate
+    assert not numerics_1.dimensionless.differentiate.flags.writeable
     
     plt.show()    
     return
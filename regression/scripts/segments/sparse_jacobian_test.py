@@ -0,0 +1,135 @@
+# sparse_jacobian_test.py
+#
+# Created: Oct 2026, SUAVE Team
+#
+""" solves the segment test mission with colored finite difference jacobians and with a user supplied
+jacobian, and compares the residual evaluations with the dense jacobians of the root finder"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data
+
+import numpy as np
+
+from SUAVE.Methods.Missions.Segments.converge_root import jacobian_sparsity, color_jacobian, iterate
+
+from segment_test import full_setup, simple_sizing
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    # residual evaluations of each segment with the dense jacobians of the root finder
+    dense, _ = evaluate_mission()
+
+    # colored jacobians on every segment but the first climb, which gets a user supplied jacobian
+    jacobians = []
+    sparse, results = evaluate_mission(supplied_jacobian(jacobians))
+
+    # every segment has to converge
+    for segment in results.segments.values():
+        assert(segment.state.numerics.converged)
+
+    # the supplied jacobian was used
+    assert(len(jacobians) > 0)
+
+    print('Residual evaluations, dense and sparse:')
+    for tag in dense.keys():
+        print(tag, dense[tag], sparse[tag])
+
+    # unknowns that share no residuals are perturbed together
+    assert(sparse['climb_6'] < dense['climb_6'])
+
+    # the fuel burned couples each control point to the later ones, which halves the columns of a climb
+    climb    = results.segments.climb_1
+    sparsity = jacobian_sparsity(climb)
+    colors   = color_jacobian(sparsity)
+    print('Climb jacobian colors: ' + str(np.max(colors)+1))
+    assert(np.max(colors)+1 == sparsity.shape[1] // 2)
+
+    # Extract sample values from computation
+    climb_throttle_1   = results.segments.climb_1.conditions.propulsion.throttle[3][0]
+    cruise_CL_1        = results.segments.cruise_1.conditions.aerodynamics.lift_coefficient[2][0]
+    cruise_CL_2        = results.segments.cruise_2.conditions.aerodynamics.lift_coefficient[2][0]
+    single_pt_CL_1     = results.segments.single_point_1.conditions.aerodynamics.lift_coefficient[0][0]
+    loiter_CL          = results.segments.loiter.conditions.aerodynamics.lift_coefficient[2][0]
+    descent_throttle_3 = results.segments.descent_2.conditions.propulsion.throttle[3][0]
+
+    # Truth values, same as the dense jacobian solution in segment_test.py
+    climb_throttle_1_truth   = 0.9499524546537521
+    cruise_CL_1_truth        = 0.44622880901388906
+    cruise_CL_2_truth        = 0.4383927979043647
+    single_pt_CL_1_truth     = 0.2579265640161655
+    loiter_CL_truth          = 0.5255640469802842
+    descent_throttle_3_truth = 0.15473366469514083
+
+    # Store errors
+    error = Data()
+    error.climb_throttle_1   = np.max(np.abs(climb_throttle_1     - climb_throttle_1_truth))
+    error.cruise_CL_1        = np.max(np.abs(cruise_CL_1          - cruise_CL_1_truth ))
+    error.cruise_CL_2        = np.max(np.abs(cruise_CL_2          - cruise_CL_2_truth ))
+    error.single_pt_CL_1     = np.max(np.abs(single_pt_CL_1       - single_pt_CL_1_truth ))
+    error.loiter_CL          = np.max(np.abs(loiter_CL            - loiter_CL_truth ))
+    error.descent_throttle_3 = np.max(np.abs(descent_throttle_3   - descent_throttle_3_truth))
+
+    print('Errors:')
+    print(error)
+
+    for k,v in list(error.items()):
+        assert(np.abs(v)<1e-6)
+
+    return
+
+def evaluate_mission(climb_jacobian=None):
+    """ flies the segment test mission, counting the residual evaluations of each segment """
+
+    configs, analyses = full_setup()
+    simple_sizing(configs, analyses)
+    configs.finalize()
+    analyses.finalize()
+    mission = analyses.missions.base
+
+    counts = Data()
+    for segment in mission.segments.values():
+        counts[segment.tag] = 0
+        segment.process.iterate.count = count_evaluation(counts, segment.tag)
+        if climb_jacobian is not None:
+            segment.state.numerics.solver_jacobian = "sparse"
+
+    if climb_jacobian is not None:
+        mission.segments.climb_1.state.numerics.solver_jacobian = climb_jacobian
+
+    results = mission.evaluate()
+
+    return counts, results
+
+def count_evaluation(counts, tag):
+    def count(segment):
+        counts[tag] += 1
+    return count
+
+def supplied_jacobian(jacobians):
+    """ a user supplied jacobian, here forward differences of the residuals of the segment """
+
+    def jacobian(segment):
+        unknowns  = segment.state.unknowns.pack_array()
+        residuals = segment.state.residuals.pack_array()
+        step      = 1e-8 * np.maximum(np.abs(unknowns),1.)
+        J         = np.zeros((len(residuals),len(unknowns)))
+        for j in range(len(unknowns)):
+            x       = np.array(unknowns)
+            x[j]   += step[j]
+            J[:,j]  = (iterate(x, segment) - residuals)/step[j]
+        iterate(unknowns, segment)
+        jacobians.append(J)
+        return J
+
+    return jacobian
+
+if __name__ == '__main__':
+    main()
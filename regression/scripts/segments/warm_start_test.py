@@ -0,0 +1,115 @@
+# warm_start_test.py
+#
+# Created: Oct 2026, SUAVE Team
+#
+""" evaluates the segment test mission twice, the second time seeded with the stored unknowns"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data
+
+import numpy as np
+import copy
+
+from segment_test import full_setup, simple_sizing
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    configs, analyses = full_setup()
+    simple_sizing(configs, analyses)
+    configs.finalize()
+    analyses.finalize()
+    mission = analyses.missions.base
+
+    # count the iterations of every segment
+    counter = Data()
+    counter.iterations = 0
+    def count_iterations(segment):
+        counter.iterations += 1
+    for segment in mission.segments.values():
+        segment.process.iterate.count_iterations = count_iterations
+
+    # every evaluation starts from a fresh copy of the mission
+    pristine = copy.deepcopy(mission)
+
+    warm_start     = SUAVE.Analyses.Mission.Warm_Start()
+    warm_start.key = np.array([1.0, 1.0])
+
+    mission.warm_start = warm_start
+    results    = mission.evaluate()
+    cold_count = counter.iterations
+    check_results(results)
+
+    # a nearby design starts from the stored unknowns
+    counter.iterations = 0
+    mission            = copy.deepcopy(pristine)
+    mission.warm_start = warm_start
+    warm_start.key     = np.array([1.0, 1.01])
+    results    = mission.evaluate()
+    warm_count = counter.iterations
+    check_results(results)
+
+    print('Iterations, cold and warm: ' + str([cold_count, warm_count]))
+    assert(warm_count < cold_count)
+    assert(len(mission.warm_start.entries) == 2)
+
+    # the seeded unknowns do not outlive the evaluation
+    for segment in mission.segments.values():
+        assert(segment.state.numerics.initial_unknowns is None)
+
+    # the closest key is picked
+    entry = mission.warm_start.nearest(np.array([1.0, 1.009]))
+    assert(entry is mission.warm_start.entries[1])
+
+    # the store is bounded
+    mission.warm_start.max_size = 2
+    mission.warm_start.key      = np.array([2.0, 2.0])
+    mission.warm_start.store(mission)
+    assert(len(mission.warm_start.entries) == 2)
+
+    return
+
+def check_results(results):
+
+    # Extract sample values from computation
+    climb_throttle_1   = results.segments.climb_1.conditions.propulsion.throttle[3][0]
+    cruise_CL_1        = results.segments.cruise_1.conditions.aerodynamics.lift_coefficient[2][0]
+    cruise_CL_2        = results.segments.cruise_2.conditions.aerodynamics.lift_coefficient[2][0]
+    single_pt_CL_1     = results.segments.single_point_1.conditions.aerodynamics.lift_coefficient[0][0]
+    loiter_CL          = results.segments.loiter.conditions.aerodynamics.lift_coefficient[2][0]
+    descent_throttle_3 = results.segments.descent_2.conditions.propulsion.throttle[3][0]
+
+    # Truth values, same as segment_test.py
+    climb_throttle_1_truth   = 0.9499524546537521
+    cruise_CL_1_truth        = 0.44622880901388906
+    cruise_CL_2_truth        = 0.4383927979043647
+    single_pt_CL_1_truth     = 0.2579265640161655
+    loiter_CL_truth          = 0.5255640469802842
+    descent_throttle_3_truth = 0.15473366469514083
+
+    # Store errors
+    error = Data()
+    error.climb_throttle_1   = np.max(np.abs(climb_throttle_1     - climb_throttle_1_truth))
+    error.cruise_CL_1        = np.max(np.abs(cruise_CL_1          - cruise_CL_1_truth ))
+    error.cruise_CL_2        = np.max(np.abs(cruise_CL_2          - cruise_CL_2_truth ))
+    error.single_pt_CL_1     = np.max(np.abs(single_pt_CL_1       - single_pt_CL_1_truth ))
+    error.loiter_CL          = np.max(np.abs(loiter_CL            - loiter_CL_truth ))
+    error.descent_throttle_3 = np.max(np.abs(descent_throttle_3   - descent_throttle_3_truth))
+
+    print('Errors:')
+    print(error)
+
+    for k,v in list(error.items()):
+        assert(np.abs(v)<1e-6)
+
+    return
+
+if __name__ == '__main__':
+    main()
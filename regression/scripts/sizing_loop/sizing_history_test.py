@@ -0,0 +1,106 @@
+# sizing_history_test.py
+#
+# Created: Oct 2026, SUAVE Team
+#
+""" checks the in-memory sizing history against the file reader and scikit-learn models
+it replaces in the sizing loop initial step, and times both on a growing history"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data
+from SUAVE.Sizing import Sizing_History, read_sizing_inputs, write_sizing_outputs
+
+import sklearn.neighbors as neighbors
+import sklearn.gaussian_process as gaussian_process
+from sklearn.gaussian_process.kernels import RationalQuadratic
+
+import numpy as np
+import os
+import time
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    sizing_loop                 = Data()
+    sizing_loop.output_filename = 'sizing_history_test.txt'
+    sizing_loop.default_y       = np.array([1.,1.])
+    if os.path.exists(sizing_loop.output_filename):
+        os.remove(sizing_loop.output_filename)
+
+    history    = Sizing_History()
+    rng        = np.random.RandomState(1)
+    x          = np.array([0.4,0.6,0.5])
+    file_time  = 0.
+    index_time = 0.
+
+    for i in range(300):
+        inputs = rng.rand(3)
+        write_sizing_outputs(sizing_loop, np.array([np.sum(inputs), np.prod(inputs)]), inputs.tolist())
+
+        # the whole file, as read before every sizing loop
+        time0 = time.time()
+        data_inputs, data_outputs, read_success = read_sizing_inputs(sizing_loop, x)
+        reference = neighbors.KNeighborsRegressor(n_neighbors = min(5, len(data_outputs)))
+        y_file    = np.array([reference.fit(data_inputs, data_outputs[:,j]).predict(x.reshape(1,-1))[0] for j in range(2)])
+        file_time += time.time() - time0
+
+        # the lines added since the previous call
+        time0 = time.time()
+        number_of_points = history.load(sizing_loop.output_filename, 3, 2)
+        y_index          = history.predict_neighbors(x, 5)
+        index_time += time.time() - time0
+
+        assert number_of_points == i + 1
+        assert np.all(history.inputs == data_inputs)
+        assert np.all(history.outputs == data_outputs)
+        assert np.max(np.abs(y_index - y_file)) < 1e-12
+
+    print('300 sizing loop initial steps, file and refit: {:.3f} s'.format(file_time))
+    print('300 sizing loop initial steps, history index:  {:.3f} s'.format(index_time))
+
+    # closest point and distance weighted neighbours
+    diff     = np.linalg.norm(data_inputs - x, axis=1)
+    min_norm, i_min_dist = history.find_min_norm(x)
+    assert i_min_dist == np.argmin(diff) and np.abs(min_norm - np.min(diff)) < 1e-14
+    weighted = neighbors.KNeighborsRegressor(n_neighbors = 5, weights = 'distance')
+    y_file   = np.array([weighted.fit(data_inputs, data_outputs[:,j]).predict(x.reshape(1,-1))[0] for j in range(2)])
+    assert np.max(np.abs(history.predict_neighbors(x, 5, True) - y_file)) < 1e-12
+    assert np.all(history.predict_neighbors(data_inputs[7], 3, True) == data_outputs[7])
+
+    # a Gaussian process is only refit after refit_points new points
+    regression = gaussian_process.GaussianProcessRegressor(kernel=RationalQuadratic(length_scale=1.0, alpha=1.0),normalize_y=True)
+    history.refit_points = 10
+    y_gp  = history.predict(x, regression, 'GPR')
+    write_sizing_outputs(sizing_loop, np.array([1.,0.]), x.tolist())
+    history.load(sizing_loop.output_filename, 3, 2)
+    assert np.all(history.predict(x, regression, 'GPR') == y_gp)
+    fitted = [regression.fit(history.inputs, history.outputs[:,j]).predict(x.reshape(1,-1))[0] for j in range(2)]
+    assert np.max(np.abs(history.predict(x, regression) - fitted)) < 1e-10
+
+    # a line that is still being written is read once it is complete
+    with open(sizing_loop.output_filename, 'a') as f:
+        f.write('[0.1, 0.2, 0.3] [0.6')
+    assert history.load(sizing_loop.output_filename, 3, 2) == 301
+    with open(sizing_loop.output_filename, 'a') as f:
+        f.write(', 0.006]\n')
+    assert history.load(sizing_loop.output_filename, 3, 2) == 302
+    assert np.all(history.outputs[-1] == [0.6, 0.006])
+
+    # a new file is read from its start
+    os.remove(sizing_loop.output_filename)
+    write_sizing_outputs(sizing_loop, np.array([2.,3.]), [1.,2.,3.])
+    assert history.load(sizing_loop.output_filename, 3, 2) == 1
+    assert np.all(history.predict_neighbors(x, 5) == [2.,3.])
+
+    os.remove(sizing_loop.output_filename)
+
+    return
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+# parallel_sweep_test.py
+#
+# Created: Oct 2026, SUAVE Team
+#
+""" runs carpet and line plots of the optimization_packages problem serially and in parallel,
+resumes an interrupted sweep from its table, and checks that each optimization of a Pareto
+type sweep starts from the optimum of the nearest finished point"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units
+from SUAVE.Optimization import carpet_plot, line_plot, design_sweep
+
+import numpy as np
+import scipy as sp
+import scipy.optimize
+import os, sys
+import tempfile
+from contextlib import redirect_stdout
+
+sys.path.append('../optimization_packages')
+from optimization_packages import setup
+
+# starting designs of the optimizations of the Pareto type sweep
+starting_designs = []
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    # serial and parallel carpet plots
+    serial   = carpet_plot(setup('SLSQP'), 5, plot_obj = 0, plot_const = 0)
+    parallel = carpet_plot(setup('SLSQP'), 5, plot_obj = 0, plot_const = 0, number_of_workers = 3)
+    assert np.all(parallel.objective == serial.objective)
+    assert np.all(parallel.constraint_val == serial.constraint_val)
+
+    x1, x2 = np.meshgrid(serial.inputs[0], serial.inputs[1])
+    assert np.max(np.abs(serial.objective - (x1**2 + x2**2))) < 1e-12
+    assert np.all(serial.constraint_val[0] == x1) and np.all(serial.constraint_val[1] == x2)
+
+    # an interrupted line plot only runs the points missing from its table
+    filename = os.path.join(tempfile.mkdtemp(),'line_plot.txt')
+    complete = line_plot(setup('SLSQP'), 9, plot_obj = 0, plot_const = 0, filename = filename)
+    with open(filename) as f:
+        lines = f.readlines()
+    with open(filename,'w') as f:
+        f.writelines(lines[0:4])
+        f.write(lines[4][0:10])
+
+    problem = setup('SLSQP')
+    resumed = line_plot(problem, 9, plot_obj = 0, plot_const = 0, filename = filename, number_of_workers = 2)
+    print('Evaluations of the resumed line plot:', problem.evaluation_count)
+    assert problem.evaluation_count == 6
+    assert np.all(resumed.objective == complete.objective)
+    assert np.all(resumed.constraint_val == complete.constraint_val)
+    with open(filename) as f:
+        assert len(f.readlines()) == 10
+
+    # the table of a finished sweep is only read
+    problem = setup('SLSQP')
+    line_plot(problem, 9, plot_obj = 0, plot_const = 0, filename = filename)
+    assert problem.evaluation_count == 0
+
+    # optimizations of x2 along x1, each started from the nearest finished optimum
+    problem = setup('SLSQP')
+    problem.optimization_problem.inputs[1][1] = -1.5
+    problem.optimization_problem.constraints = np.array([
+        [ 'x1' , '>', -10., 1., Units.less],
+        [ 'x2' , '>',   1., 1., Units.less],
+    ])
+    values = np.linspace(-1.,1.,5)
+    objectives, constraint_values, designs = design_sweep(problem, [0], values, solve = solve_x2)
+    print('Pareto type sweep objectives:', objectives)
+    assert np.max(np.abs(objectives - (values**2 + 1.))) < 1e-6
+    assert np.max(np.abs(designs[:,1] - 1.)) < 1e-6
+    assert starting_designs[0][1] == -1.5
+    for ii in range(1,len(values)):
+        assert starting_designs[ii][0] == values[ii]
+        assert starting_designs[ii][1] == designs[ii-1,1]
+
+    return
+
+def solve_x2(problem,sweep_indices):
+    """ optimizes x2 with the swept x1 fixed, the swept inputs are taken out of the design vector """
+
+    opt_prob = problem.optimization_problem
+    inputs   = opt_prob.inputs
+    starting_designs.append(np.array(inputs[:,1],dtype=float))
+
+    scale  = np.array(inputs[:,3],dtype=float)
+    x      = np.array(inputs[:,1],dtype=float)/scale
+    free   = [ii for ii in range(len(inputs)) if ii not in sweep_indices]
+    bounds = [(inputs[ii][2][0]/scale[ii],inputs[ii][2][1]/scale[ii]) for ii in free]
+
+    def design(y):
+        full       = np.array(x)
+        full[free] = y
+        return full
+
+    with open(os.devnull,'w') as devnull, redirect_stdout(devnull):
+        outputs = sp.optimize.fmin_slsqp(lambda y: problem.objective(design(y)), x[free], bounds = bounds,
+                                         f_ieqcons = lambda y: problem.inequality_constraint(design(y)))
+    problem.objective(design(outputs))
+
+    return outputs
+
+if __name__ == '__main__':
+    main()
@@ -5,6 +5,7 @@
 # Modified: Jan 2018, W. Maier
 #           Oct 2018, M. Clarke
 #           Aug 2019, M. Clarke
+#           Oct 2026, SUAVE Team
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
@@ -21,13 +22,15 @@ from SUAVE.Methods.Aerodynamics.AVL.write_geometry            import write_geome
 from SUAVE.Methods.Aerodynamics.AVL.write_mass_file           import write_mass_file
 from SUAVE.Methods.Aerodynamics.AVL.write_run_cases           import write_run_cases
 from SUAVE.Methods.Aerodynamics.AVL.write_input_deck          import write_input_deck
-from SUAVE.Methods.Aerodynamics.AVL.run_analysis              import run_analysis
+from SUAVE.Methods.Aerodynamics.AVL.run_analysis              import run_analysis, evaluate_conditions_concurrently
 from SUAVE.Methods.Aerodynamics.AVL.translate_data            import translate_conditions_to_cases, translate_results_to_conditions
 from SUAVE.Methods.Aerodynamics.AVL.purge_files               import purge_files
 from SUAVE.Methods.Aerodynamics.AVL.Data.Settings             import Settings
 from SUAVE.Methods.Aerodynamics.AVL.Data.Cases                import Run_Case
 from SUAVE.Methods.Geometry.Two_Dimensional.Planform.populate_control_sections   import populate_control_sections  
 from SUAVE.Components.Wings.Control_Surfaces import Aileron , Elevator , Slat , Flap , Rudder 
+from SUAVE.Methods.Utilities.Grid_Surrogate import Grid_Surrogate, surrogate_grid_points
+from SUAVE.Input_Output.SUAVE.training_cache import hash_data, load_training_cache, save_training_cache
 
 # Package imports
 import pylab as plt
@@ -86,6 +89,8 @@ class AVL_Inviscid(Aerodynamics):
         self.settings.spanwise_vortices      = 20
         self.settings.chordwise_vortices     = 10
         self.settings.trim_aircraft          = False 
+        self.settings.use_grid_surrogate     = False
+        self.settings.grid_surrogate_points  = 50
         
         # Conditions table, used for surrogate model training
         self.training                        = Data()   
@@ -98,6 +103,7 @@ class AVL_Inviscid(Aerodynamics):
         self.training.drag_coefficient       = None
         self.training.span_efficiency_factor = None
         self.training_file                   = None
+        self.training_cache_directory        = None
         
         # Surrogate model
         self.surrogates                      = Data()
@@ -171,16 +177,11 @@ class AVL_Inviscid(Aerodynamics):
         drag_model    = surrogates.drag_coefficient
         e_model       = surrogates.span_efficiency_factor
         
-        # Inviscid lift
-        data_len        = len(AoA)
-        inviscid_lift   = np.zeros([data_len,1])
-        inviscid_drag   = np.zeros([data_len,1])    
-        span_efficiency = np.zeros([data_len,1]) 
-        
-        for ii,_ in enumerate(AoA):
-            inviscid_lift[ii]   = lift_model.predict([np.array([AoA[ii][0],mach[ii][0]])])  
-            inviscid_drag[ii]   = drag_model.predict([np.array([AoA[ii][0],mach[ii][0]])])
-            span_efficiency[ii] = e_model.predict([np.array([AoA[ii][0],mach[ii][0]])])
+        # Inviscid lift, one prediction per model for all control points
+        points          = np.hstack([AoA[:,0:1],mach[:,0:1]])
+        inviscid_lift   = np.reshape(lift_model.predict(points),(-1,1))
+        inviscid_drag   = np.reshape(drag_model.predict(points),(-1,1))
+        span_efficiency = np.reshape(e_model.predict(points),(-1,1))
         
         # Store inviscid lift results     
         conditions.aerodynamics.lift_breakdown.inviscid_wings_lift       = Data()    
@@ -222,15 +223,26 @@ class AVL_Inviscid(Aerodynamics):
           angle_of_attack  [radians]
           Mach             [-]
         self.training_file (optional - file containing previous AVL data)
+        self.training_cache_directory (optional - folder of training data stored by previous runs)
         """          
         # Unpack 
         run_folder    = os.path.abspath(self.settings.filenames.run_folder)
         geometry      = self.geometry
         training      = self.training   
         trim_aircraft = self.settings.trim_aircraft
+        cache_folder  = self.training_cache_directory
         
         AoA           = training.angle_of_attack
         mach          = training.Mach   
+        
+        # Reload the training data of an identical geometry, grid and settings
+        if cache_folder and not self.training_file:
+            cache_key = self.training_cache_key()
+            tables    = load_training_cache(cache_folder, cache_key)
+            if tables is not None:
+                training.coefficients = tables['coefficients']
+                training.grid_points  = tables['grid_points']
+                return
                       
         CL            = np.zeros([len(AoA)*len(mach),1])
         CD            = np.zeros([len(AoA)*len(mach),1])
@@ -242,25 +254,32 @@ class AVL_Inviscid(Aerodynamics):
         count         = 0
         
         # remove old files in run directory
-        if os.path.exists('avl_files'):
+        if os.path.exists(run_folder):
             if not self.regression_flag:
                 rmtree(run_folder)
             
         for i,_ in enumerate(mach):
             for j,_ in enumerate(AoA):
                 xy[i*len(mach)+j,:] = np.array([AoA[j],mach[i]])
+        run_conditions = []
         for j,_ in enumerate(mach):
             # Set training conditions
-            run_conditions = Aerodynamics()
-            run_conditions.freestream.density           = 1.2
-            run_conditions.freestream.gravity           = 9.81        
-            run_conditions.aerodynamics.angle_of_attack = AoA 
-            run_conditions.aerodynamics.side_slip_angle = 0 
-            run_conditions.freestream.mach_number       = mach[j]
-            run_conditions.freestream.velocity          = mach[j] * run_conditions.freestream.speed_of_sound
+            conditions = Aerodynamics()
+            conditions.freestream.density           = 1.2
+            conditions.freestream.gravity           = 9.81        
+            conditions.aerodynamics.angle_of_attack = AoA 
+            conditions.aerodynamics.side_slip_angle = 0 
+            conditions.freestream.mach_number       = mach[j]
+            conditions.freestream.velocity          = mach[j] * conditions.freestream.speed_of_sound
+            run_conditions.append(conditions)
+
+        # Run AVL at every Mach number, with concurrent processes when more than one worker is set
+        if self.settings.number_of_workers > 1 and not self.regression_flag:
+            batch_results, _ = evaluate_conditions_concurrently(self, run_conditions, trim_aircraft)
+        else:
+            batch_results = [self.evaluate_conditions(conditions, trim_aircraft) for conditions in run_conditions]
             
-            #Run Analysis at AoA[i] and mach[j]
-            results =  self.evaluate_conditions(run_conditions, trim_aircraft)
+        for results in batch_results:
             
             # Obtain CD , CL and e  
             CL[count*len(mach):(count+1)*len(mach),0]   = results.aerodynamics.lift_coefficient[:,0]
@@ -284,9 +303,40 @@ class AVL_Inviscid(Aerodynamics):
         training.coefficients = np.hstack([CL,CD,e])
         training.grid_points  = xy
         
+        if cache_folder and not self.training_file:
+            save_training_cache(cache_folder, cache_key, coefficients = training.coefficients, grid_points = xy)
+        
 
         return        
 
+    def training_cache_key(self):
+        """Hashes the inputs of the training runs, used to store and reload the training data.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        None
+
+        Outputs:
+        key                  <string>
+
+        Properties Used:
+        self.geometry
+        self.training.     
+          angle_of_attack    [radians]
+          Mach               [-]
+        self.settings.
+          spanwise_vortices  [-]
+          chordwise_vortices [-]
+          trim_aircraft      <boolean>
+        """
+        return hash_data(self.__class__.__name__, self.geometry, self.training.angle_of_attack, self.training.Mach,
+                         self.settings.spanwise_vortices, self.settings.chordwise_vortices, self.settings.trim_aircraft)
+
     def build_surrogate(self):
         """Builds a surrogate based on sample evalations using a Guassian process.
 
@@ -309,7 +359,9 @@ class AVL_Inviscid(Aerodynamics):
           span_efficiency_factor <Guassian process surrogate>
 
         Properties Used:
-        No others
+        self.settings.
+          use_grid_surrogate     <boolean> tabulate the surrogates on a regular grid
+          grid_surrogate_points  [-]       grid points per dimension
         """   
         # Unpack data
         training                         = self.training
@@ -327,6 +379,13 @@ class AVL_Inviscid(Aerodynamics):
         cd_surrogate                     = regr_cd.fit(xy, CD_data)
         e_surrogate                      = regr_e.fit(xy, e_data)
         
+        # Tabulate the surrogates so that evaluations are table lookups
+        if self.settings.use_grid_surrogate:
+            grid_points  = surrogate_grid_points(xy, self.settings.grid_surrogate_points)
+            cl_surrogate = Grid_Surrogate(cl_surrogate, grid_points)
+            cd_surrogate = Grid_Surrogate(cd_surrogate, grid_points)
+            e_surrogate  = Grid_Surrogate(e_surrogate, grid_points)
+        
         self.surrogates.lift_coefficient = cl_surrogate
         self.surrogates.drag_coefficient = cd_surrogate
         self.surrogates.span_efficiency_factor = e_surrogate  
@@ -369,6 +428,58 @@ class AVL_Inviscid(Aerodynamics):
           cases
         """           
         
+        # unpack
+        run_folder                       = os.path.abspath(self.settings.filenames.run_folder)
+        
+        # update current status
+        self.current_status.batch_index += 1
+        
+        # write the input files
+        cases                            = self.write_input_files(run_conditions,trim_aircraft,run_folder)
+
+        # RUN AVL!
+        with redirect.folder(run_folder,force=False):
+            results_avl = run_analysis(self)
+    
+        # translate results
+        results = translate_results_to_conditions(cases,results_avl)
+    
+        if not self.keep_files:
+            rmtree( run_folder )
+            
+        return results
+
+    def write_input_files(self,run_conditions,trim_aircraft,folder,case_index=None):
+        """Writes the geometry, mass, run case and input deck files of the current batch into a folder.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        run_conditions <SUAVE data type> aerodynamic conditions
+        trim_aircraft  <boolean>
+        folder         <string> folder the files are written to
+        case_index     [-] index of the only angle of attack to write, None for all of them
+
+        Outputs:
+        cases          <SUAVE data type> run cases
+
+        Properties Used:
+        self.settings.filenames.
+          run_folder
+          output_template
+          batch_template
+          deck_template
+        self.current_status.
+          batch_index
+          batch_file
+          deck_file
+          cases
+        """           
+        
         # unpack
         run_folder                       = os.path.abspath(self.settings.filenames.run_folder)
         run_script_path                  = run_folder.rstrip('avl_files').rstrip('/')   
@@ -387,7 +498,6 @@ class AVL_Inviscid(Aerodynamics):
         self.settings.filenames.mass_file= self.geometry._base.tag + '.mass'
         
         # update current status
-        self.current_status.batch_index += 1
         batch_index                      = self.current_status.batch_index
         self.current_status.batch_file   = batch_template.format(batch_index)
         self.current_status.deck_file    = deck_template.format(batch_index)
@@ -419,6 +529,10 @@ class AVL_Inviscid(Aerodynamics):
 
         # translate conditions
         cases                            = translate_conditions_to_cases(self,run_conditions)    
+        if case_index is not None:
+            case  = cases[case_index]
+            cases = Run_Case.Container()
+            cases.append_case(case)
         for case in cases:
             cases[case].stability_and_control.number_control_surfaces = num_cs
             cases[case].stability_and_control.control_surface_names   = cs_names
@@ -434,19 +548,10 @@ class AVL_Inviscid(Aerodynamics):
             cases[case].eigen_result_filename_2    = dynamic_results_template_2.format(case)     # 'system_matrix_{}.dat'
         
         # write the input files
-        with redirect.folder(run_folder,force=False):
+        with redirect.folder(folder,force=False):
             write_geometry(self,run_script_path)
             write_mass_file(self,run_conditions)
             write_run_cases(self,trim_aircraft)
             write_input_deck(self, trim_aircraft)
 
-            # RUN AVL!
-            results_avl = run_analysis(self)
-    
-        # translate results
-        results = translate_results_to_conditions(cases,results_avl)
-    
-        if not self.keep_files:
-            rmtree( run_folder )
-            
-        return results
+        return cases
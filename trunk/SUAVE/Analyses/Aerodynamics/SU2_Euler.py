@@ -5,6 +5,7 @@
 # Modified: Jan 2017, T. MacDonald
 #           Apr 2019, T. MacDonald
 #           Mar 2020, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -19,6 +20,7 @@ import numpy as np
 from SUAVE.Input_Output.OpenVSP.write_vsp_mesh import write_vsp_mesh
 from SUAVE.Input_Output.GMSH.write_geo_file import write_geo_file
 from SUAVE.Input_Output.GMSH.mesh_geo_file import mesh_geo_file
+from SUAVE.Input_Output.SUAVE.training_cache import load_training_cache
 
 # The aero methods
 from SUAVE.Methods.Aerodynamics.Common import Fidelity_Zero as Common
@@ -124,6 +126,7 @@ class SU2_Euler(Markup):
         self.geometry.tag               <string> (geometry is also set as part of the lift process)
         self.process.compute.lift.
           inviscid.training_file        (optional - determines if new SU2 runs are necessary)
+          inviscid.training_cache_directory (optional - stored training data also skips the SU2 runs)
         self.settings.
           half_mesh_flag                <boolean> Determines if a symmetry plane is used
           vsp_mesh_growth_ratio         [-] Determines how the mesh grows
@@ -133,8 +136,12 @@ class SU2_Euler(Markup):
         self.process.compute.lift.inviscid.geometry = self.geometry
         
         tag = self.geometry.tag
-        # Mesh the geometry in prepartion for CFD if no training file exists
-        if self.process.compute.lift.inviscid.training_file is None:
+        # Mesh the geometry in prepartion for CFD if no training file or stored training data exists
+        inviscid = self.process.compute.lift.inviscid
+        cached   = False
+        if inviscid.training_cache_directory:
+            cached = load_training_cache(inviscid.training_cache_directory, inviscid.training_cache_key()) is not None
+        if inviscid.training_file is None and not cached:
             write_vsp_mesh(self.geometry,tag,self.settings.half_mesh_flag,self.settings.vsp_mesh_growth_ratio,self.settings.vsp_mesh_growth_limiting_flag)
             write_geo_file(tag)
             mesh_geo_file(tag)
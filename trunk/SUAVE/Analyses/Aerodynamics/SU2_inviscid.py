@@ -3,6 +3,7 @@
 #
 # Created:  Sep 2016, E. Botero
 # Modified: Jan 2017, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -16,11 +17,15 @@ from SUAVE.Core import Data, Units
 from .Aerodynamics import Aerodynamics
 from SUAVE.Input_Output.SU2.call_SU2_CFD import call_SU2_CFD
 from SUAVE.Input_Output.SU2.write_SU2_cfg import write_SU2_cfg
+from SUAVE.Input_Output.SU2.run_SU2_cases import run_SU2_cases
 from sklearn.gaussian_process.kernels import ExpSineSquared
+from SUAVE.Methods.Utilities.Grid_Surrogate import Grid_Surrogate, surrogate_grid_points
+from SUAVE.Input_Output.SUAVE.training_cache import hash_data, load_training_cache, save_training_cache
 
 # Package imports
 import numpy as np
 import time
+import os
 import pylab as plt
 import sklearn
 from sklearn import gaussian_process
@@ -65,7 +70,14 @@ class SU2_inviscid(Aerodynamics):
         self.settings.half_mesh_flag     = True
         self.settings.parallel           = False
         self.settings.processors         = 1
+        self.settings.concurrent_cases   = 1
         self.settings.maximum_iterations = 1500
+        self.settings.run_folder         = 'SU2_files'
+        self.settings.SU2_CFD_command    = 'SU2_CFD'
+        self.settings.mpi_command        = 'mpirun'
+        self.settings.run_timeout        = None
+        self.settings.use_grid_surrogate    = False
+        self.settings.grid_surrogate_points = 50
 
         # Conditions table, used for surrogate model training
         self.training = Data()        
@@ -74,6 +86,7 @@ class SU2_inviscid(Aerodynamics):
         self.training.lift_coefficient = None
         self.training.drag_coefficient = None
         self.training_file             = None
+        self.training_cache_directory  = None
         
         # Surrogate model
         self.surrogates = Data()
@@ -136,11 +149,10 @@ class SU2_inviscid(Aerodynamics):
         lift_model = surrogates.lift_coefficient
         drag_model = surrogates.drag_coefficient
         
-        # Inviscid lift
-        data_len = len(AoA)
-        inviscid_lift = np.zeros([data_len,1])
-        for ii,_ in enumerate(AoA):
-            inviscid_lift[ii] = lift_model.predict([np.array([AoA[ii][0],mach[ii][0]])]) #sklearn fix
+        # Inviscid lift, one prediction for all control points
+        data_len      = len(AoA)
+        points        = np.hstack([AoA[:,0:1],mach[:,0:1]])
+        inviscid_lift = np.reshape(lift_model.predict(points),(-1,1))
             
         conditions.aerodynamics.lift_breakdown.inviscid_wings_lift       = Data()
         conditions.aerodynamics.lift_breakdown.inviscid_wings_lift.total = inviscid_lift
@@ -177,11 +189,16 @@ class SU2_inviscid(Aerodynamics):
           angle_of_attack  [radians]
           Mach             [-]
         self.training_file (optional - file containing previous AVL data)
+        self.training_cache_directory (optional - folder of training data stored by previous runs)
+        self.settings.
+          run_folder       <string> folder of the case folders
+          see run_SU2_cases for the settings that schedule the cases
         """               
         # Unpack
-        geometry = self.geometry
-        settings = self.settings
-        training = self.training
+        geometry     = self.geometry
+        settings     = self.settings
+        training     = self.training
+        cache_folder = self.training_cache_directory
         
         AoA  = training.angle_of_attack
         mach = training.Mach 
@@ -192,10 +209,21 @@ class SU2_inviscid(Aerodynamics):
         konditions              = Data()
         konditions.aerodynamics = Data()
 
-        if self.training_file is None:
-            # Calculate aerodynamics for table
+        # Reload the training data of an identical geometry, grid and settings
+        tables = None
+        if cache_folder and self.training_file is None:
+            tables = load_training_cache(cache_folder, self.training_cache_key())
+            
+        if tables is not None:
+            xy = tables['grid_points']
+            CL = tables['coefficients'][:,0:1]
+            CD = tables['coefficients'][:,1:2]
+            
+        elif self.training_file is None:
+            # Calculate aerodynamics for table, every case in its own folder
             table_size = len(AoA)*len(mach)
             xy = np.zeros([table_size,2])
+            cases = []
             count = 0
             time0 = time.time()
             for i,_ in enumerate(AoA):
@@ -206,12 +234,21 @@ class SU2_inviscid(Aerodynamics):
                     konditions.aerodynamics.angle_of_attack = AoA[i]
                     konditions.aerodynamics.mach            = mach[j]
                     
-                    CL[count],CD[count] = call_SU2(konditions, settings, geometry)
+                    case              = Data()
+                    case.folder       = os.path.join(settings.run_folder,'case_{:02d}_{:02d}'.format(i+1,j+1))
+                    case.SU2_settings = SU2_case_settings(konditions, settings, geometry)
+                    cases.append(case)
                     count += 1
             
+            # Run the cases concurrently
+            CL[:,0], CD[:,0] = run_SU2_cases(geometry.tag, cases, settings)
+            
             time1 = time.time()
             
             print('The total elapsed time to run SU2: '+ str(time1-time0) + '  Seconds')
+            
+            if cache_folder:
+                save_training_cache(cache_folder, self.training_cache_key(), coefficients = np.hstack([CL,CD]), grid_points = xy)
         else:
             data_array = np.loadtxt(self.training_file)
             xy         = data_array[:,0:2]
@@ -228,6 +265,33 @@ class SU2_inviscid(Aerodynamics):
 
         return
 
+    def training_cache_key(self):
+        """Hashes the inputs of the training runs, used to store and reload the training data.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        None
+
+        Outputs:
+        key                <string>
+
+        Properties Used:
+        self.geometry
+        self.training.     
+          angle_of_attack  [radians]
+          Mach             [-]
+        self.settings.
+          half_mesh_flag     <boolean>
+          maximum_iterations [-]
+        """
+        return hash_data(self.__class__.__name__, self.geometry, self.training.angle_of_attack, self.training.Mach,
+                         self.settings.half_mesh_flag, self.settings.maximum_iterations)
+
     def build_surrogate(self):
         """Builds a surrogate based on sample evalations using a Guassian process.
 
@@ -248,7 +312,9 @@ class SU2_inviscid(Aerodynamics):
           drag_coefficient <Guassian process surrogate>
 
         Properties Used:
-        No others
+        self.settings.
+          use_grid_surrogate    <boolean> tabulate the surrogates on a regular grid
+          grid_surrogate_points [-]       grid points per dimension
         """  
         # Unpack data
         training  = self.training
@@ -279,6 +345,12 @@ class SU2_inviscid(Aerodynamics):
         #cd_surrogate = regr_cd.fit(xy, CD_data)          
         
         
+        # Tabulate the surrogates so that evaluations are table lookups
+        if self.settings.use_grid_surrogate:
+            grid_points  = surrogate_grid_points(xy, self.settings.grid_surrogate_points)
+            cl_surrogate = Grid_Surrogate(cl_surrogate, grid_points)
+            cd_surrogate = Grid_Surrogate(cd_surrogate, grid_points)
+        
         self.surrogates.lift_coefficient = cl_surrogate
         self.surrogates.drag_coefficient = cd_surrogate
         
@@ -288,13 +360,9 @@ class SU2_inviscid(Aerodynamics):
         
         AoA_mesh,mach_mesh = np.meshgrid(AoA_points,mach_points)
         
-        CL_sur = np.zeros(np.shape(AoA_mesh))
-        CD_sur = np.zeros(np.shape(AoA_mesh))        
-        
-        for jj in range(len(AoA_points)):
-            for ii in range(len(mach_points)):
-                CL_sur[ii,jj] = cl_surrogate.predict([np.array([AoA_mesh[ii,jj],mach_mesh[ii,jj]])])
-                CD_sur[ii,jj] = cd_surrogate.predict([np.array([AoA_mesh[ii,jj],mach_mesh[ii,jj]])])  #sklearn fix        
+        mesh_points = np.vstack([AoA_mesh.flatten(),mach_mesh.flatten()]).T
+        CL_sur      = np.reshape(cl_surrogate.predict(mesh_points),np.shape(AoA_mesh))
+        CD_sur      = np.reshape(cd_surrogate.predict(mesh_points),np.shape(AoA_mesh))
 
         fig = plt.figure('Coefficient of Lift Surrogate Plot')    
         plt_handle = plt.contourf(AoA_mesh/Units.deg,mach_mesh,CL_sur,levels=None)
@@ -352,10 +420,47 @@ def call_SU2(conditions,settings,geometry):
     N/A
     """      
 
-    half_mesh_flag = settings.half_mesh_flag
     tag            = geometry.tag
     parallel       = settings.parallel
     processors     = settings.processors 
+    
+    SU2_settings = SU2_case_settings(conditions,settings,geometry)
+    
+    # Build SU2 configuration file
+    write_SU2_cfg(tag, SU2_settings)
+    
+    # Run SU2
+    CL, CD = call_SU2_CFD(tag,parallel,processors)
+        
+    return CL, CD
+
+def SU2_case_settings(conditions,settings,geometry):
+    """Sets up the SU2 configuration of one training case
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    conditions.
+      mach_number        [-]
+      angle_of_attack    [radians]
+    settings.
+      half_mesh_flag     <boolean> Determines if a symmetry plane is used
+      maximum_iterations [-]
+    geometry.
+      reference_area     [m^2]
+
+    Outputs:
+    SU2_settings         see write_SU2_cfg
+
+    Properties Used:
+    N/A
+    """      
+
+    half_mesh_flag = settings.half_mesh_flag
     iters          = settings.maximum_iterations
     
     SU2_settings = Data()
@@ -366,11 +471,5 @@ def call_SU2(conditions,settings,geometry):
     SU2_settings.mach_number     = conditions.aerodynamics.mach
     SU2_settings.angle_of_attack = conditions.aerodynamics.angle_of_attack / Units.deg
     SU2_settings.maximum_iterations = iters
-    
-    # Build SU2 configuration file
-    write_SU2_cfg(tag, SU2_settings)
-    
-    # Run SU2
-    CL, CD = call_SU2_CFD(tag,parallel,processors)
         
-    return CL, CD
+    return SU2_settings
@@ -6,6 +6,7 @@
 #           Feb 2016, A. Wendorff
 #           Apr 2017, T. MacDonald
 #           Nov 2017, E. Botero
+#           Oct 2026, SUAVE Team
 
 
 # ----------------------------------------------------------------------
@@ -18,10 +19,11 @@ import SUAVE
 from SUAVE.Core import Data
 from SUAVE.Core import Units
 
-from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift import weissinger_vortex_lattice
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift import weissinger_vortex_lattice, weissinger_influence, weissinger_solve
 
 # local imports
 from .Aerodynamics import Aerodynamics
+from SUAVE.Input_Output.SUAVE.training_cache import hash_data, load_training_cache, save_training_cache
 
 # package imports
 import numpy as np
@@ -79,6 +81,10 @@ class Vortex_Lattice(Aerodynamics):
         self.training = Data()        
         self.training.angle_of_attack  = np.array([-10.,-5.,0.,5.,10.]) * Units.deg
         self.training.lift_coefficient = None
+        self.training_cache_directory  = None
+        
+        # factored influence matrices of the wings, kept while their geometry is unchanged
+        self.influence_matrices = Data()
         
         # surrogoate models
         self.surrogates = Data()
@@ -201,40 +207,77 @@ class Vortex_Lattice(Aerodynamics):
         self.geometry.wings.*.tag
         self.settings                 (passed to calculate vortex lattice)
         self.training.angle_of_attack [radians]
+        self.training_cache_directory (optional - folder of training data stored by previous runs)
+        self.influence_matrices       (factored influence matrices of previous runs)
         """        
         # unpack
-        geometry = self.geometry
-        settings = self.settings
-        training = self.training
+        geometry     = self.geometry
+        settings     = self.settings
+        training     = self.training
+        cache_folder = self.training_cache_directory
         
         AoA = training.angle_of_attack
+        
+        # reload the training data of an identical geometry, grid and settings
+        if cache_folder:
+            cache_key = hash_data(self.__class__.__name__, geometry, AoA, settings)
+            tables    = load_training_cache(cache_folder, cache_key)
+            if tables is not None:
+                training.lift_coefficient       = tables['lift_coefficient']
+                training.wing_lift_coefficients = Data()
+                for i, wing in enumerate(geometry.wings.values()):
+                    training.wing_lift_coefficients[wing.tag] = tables['wing_lift_coefficients'][i]
+                return
+                
         CL  = np.zeros_like(AoA)
         
+        # calculate aerodynamics for table, all angles of attack of a wing at once
         wing_CLs = Data() 
         for wing in geometry.wings.values():
-            wing_CLs[wing.tag] = np.zeros_like(AoA)
-
-        # condition input, local, do not keep
-        konditions              = Data()
-        konditions.aerodynamics = Data()
-
-        # calculate aerodynamics for table
-        for i,_ in enumerate(AoA):
-            
-            # overriding conditions, thus the name mangling
-            konditions.aerodynamics.angle_of_attack = AoA[i]
-            
-            # these functions are inherited from Aerodynamics() or overridden
-            CL[i], wing_lifts = calculate_lift_vortex_lattice(konditions, settings, geometry)
-            for wing in geometry.wings.values():
-                wing_CLs[wing.tag][i] = wing_lifts[wing.tag]
+            influence   = self.wing_influence(wing)
+            wing_CLs[wing.tag], _ = weissinger_solve(influence, AoA)
+            wing_CLs[wing.tag]    = np.reshape(wing_CLs[wing.tag], np.shape(AoA))
+            CL += wing_CLs[wing.tag] * wing.areas.reference / geometry.reference_area
 
         # store training data
         training.lift_coefficient = CL
         training.wing_lift_coefficients = wing_CLs
+        
+        if cache_folder:
+            wing_table = np.array([wing_CLs[wing.tag] for wing in geometry.wings.values()])
+            save_training_cache(cache_folder, cache_key, lift_coefficient = CL, wing_lift_coefficients = wing_table)
 
         return
 
+    def wing_influence(self,wing):
+        """Returns the factored vortex lattice influence matrix of a wing, which is only built
+        again when the wing or the panelling has changed.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        wing                          (passed to the vortex lattice method)
+
+        Outputs:
+        influence                     see weissinger_influence
+
+        Properties Used:
+        self.settings.number_panels_spanwise
+        self.influence_matrices
+        """  
+        key    = hash_data(wing, self.settings.number_panels_spanwise)
+        stored = self.influence_matrices.get(wing.tag)
+        
+        if stored is None or stored[0] != key:
+            stored = (key, weissinger_influence(self.settings, wing))
+            self.influence_matrices[wing.tag] = stored
+            
+        return stored[1]
+
     def build_surrogate(self):
         """Build a surrogate using sample evaluation results.
 
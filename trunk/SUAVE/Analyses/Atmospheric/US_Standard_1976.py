@@ -4,6 +4,7 @@
 # Created: 
 # Modified: Feb 2016, Andrew Wendorff
 #           Jan 2018, W. Maier
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -21,7 +22,7 @@ from SUAVE.Attributes.Planets import Earth
 
 from SUAVE.Analyses.Mission.Segments.Conditions import Conditions
 
-from SUAVE.Core import Units
+from SUAVE.Core import Units, Data
 from SUAVE.Core.Arrays import atleast_2d_col
 
 
@@ -62,10 +63,14 @@ class US_Standard_1976(Atmospheric):
         
         atmo_data = SUAVE.Attributes.Atmospheres.Earth.US_Standard_1976()
         self.update(atmo_data)        
+        
+        self.table_resolution = 10. * Units.m  # altitude step of the table used by interpolate_values
+        self.table            = None
     
-    def compute_values(self,altitude,temperature_deviation=0.0,var_gamma=False):
+    def compute_values(self,altitude,temperature_deviation=0.0,var_gamma=False,results=None):
 
-        """Computes atmospheric values.
+        """Computes atmospheric values. The layer of each altitude is found with a binary search
+        of the breaks, and all layers are evaluated together.
 
         Assumptions:
         US 1976 Standard Atmosphere
@@ -76,11 +81,14 @@ class US_Standard_1976(Atmospheric):
         Inputs:
         altitude                                 [m]
         temperature_deviation                    [K]
+        var_gamma                                [Boolean]
+        results                                  Conditions to store the values in (optional)
 
         Output:
         atmo_data.
           pressure                               [Pa]
           temperature                            [K]
+          density                                [kg/m^3]
           speed_of_sound                         [m/s]
           dynamic_viscosity                      [kg/(m*s)]
 
@@ -99,23 +107,22 @@ class US_Standard_1976(Atmospheric):
         zs        = altitude
         gas       = self.fluid_properties
         planet    = self.planet
-        grav      = self.planet.sea_level_gravity        
         Rad       = self.planet.mean_radius
-        R         = gas.gas_specific_constant
         delta_isa = temperature_deviation
         
         # check properties
-        if not gas == Air():
+        if not gas == standard_air:
             warn('US Standard Atmosphere not using Air fluid properties')
-        if not planet == Earth():
+        if not planet == standard_planet:
             warn('US Standard Atmosphere not using Earth planet properties')          
         
         # convert input if necessary
         zs = atleast_2d_col(zs)
 
         # get model altitude bounds
-        zmin = self.breaks.altitude[0]
-        zmax = self.breaks.altitude[-1]   
+        breaks = self.breaks
+        zmin   = breaks.altitude[0]
+        zmax   = breaks.altitude[-1]   
         
         # convert geometric to geopotential altitude
         zs = zs/(1 + zs/Rad)
@@ -128,42 +135,149 @@ class US_Standard_1976(Atmospheric):
             print("Warning: altitude requested above maximum for this atmospheric model; returning values for h = 86.0 km")   
             zs[zs > zmax] = zmax        
 
-        # initialize return data
-        zeros = np.zeros_like(zs)
-        p     = zeros * 0.0
-        T     = zeros * 0.0
-        rho   = zeros * 0.0
-        a     = zeros * 0.0
-        mu    = zeros * 0.0
-        z0    = zeros * 0.0
-        T0    = zeros * 0.0
-        p0    = zeros * 0.0
-        alpha = zeros * 0.0
-        
-        # populate the altitude breaks
-        # this uses >= and <= to capture both edges and because values should be the same at the edges
-        for i in range( len(self.breaks.altitude)-1 ): 
-            i_inside = (zs >= self.breaks.altitude[i]) & (zs <= self.breaks.altitude[i+1])
-            z0[ i_inside ]    = self.breaks.altitude[i]
-            T0[ i_inside ]    = self.breaks.temperature[i]
-            p0[ i_inside ]    = self.breaks.pressure[i]
-            alpha[ i_inside ] = -(self.breaks.temperature[i+1] - self.breaks.temperature[i])/ \
-                                 (self.breaks.altitude[i+1]    - self.breaks.altitude[i])
+        p, T = self.layer_values(zs)
+        
+        T   = T + delta_isa
+        rho = gas.compute_density(T,p)
+        a   = gas.compute_speed_of_sound(T,p,var_gamma)
+        mu  = gas.compute_absolute_viscosity(T)
+        
+        if results is None:
+            atmo_data = Conditions()
+            atmo_data.expand_rows(zs.shape[0])
+        else:
+            atmo_data = results
+        atmo_data.pressure          = p
+        atmo_data.temperature       = T
+        atmo_data.density           = rho
+        atmo_data.speed_of_sound    = a
+        atmo_data.dynamic_viscosity = mu
+        
+        return atmo_data
+
+    def layer_values(self,zs):
+
+        """Computes the pressure and standard temperature at geopotential altitudes inside the
+        model, with all layers evaluated together.
+
+        Assumptions:
+        US 1976 Standard Atmosphere
+
+        Source:
+        U.S. Standard Atmosphere, 1976, U.S. Government Printing Office, Washington, D.C., 1976
+
+        Inputs:
+        zs                                       [m] geopotential altitude
+
+        Output:
+        p                                        [Pa]
+        T                                        [K]
+
+        Properties Used:
+        self.
+          fluid_properties.gas_specific_constant [J/(kg*K)]
+          planet.sea_level_gravity               [m/s^2]
+          breaks.
+            altitude                             [m]
+            temperature                          [K]
+            pressure                             [Pa]
+        """
+        
+        breaks = self.breaks
+        grav   = self.planet.sea_level_gravity
+        R      = self.fluid_properties.gas_specific_constant
+        
+        # lapse rate of each layer, the isothermal layers have none
+        layer_alpha = -np.diff(breaks.temperature)/np.diff(breaks.altitude)
+        
+        # find the layers, an altitude on a break is in the layer above it
+        n_layers = len(layer_alpha)
+        layer    = np.searchsorted(breaks.altitude, zs, side='right') - 1
+        layer    = np.minimum(np.maximum(layer, 0), n_layers-1)
+        
+        z0    = breaks.altitude[layer]
+        T0    = breaks.temperature[layer]
+        p0    = breaks.pressure[layer]
+        alpha = layer_alpha[layer]
         
         # interpolate the breaks
-        dz = zs-z0
+        dz      = zs-z0
+        p       = np.empty_like(zs)
         i_isoth = (alpha == 0.)
-        i_adiab = (alpha != 0.)
-        p[i_isoth] = p0[i_isoth] * np.exp(-1.*dz[i_isoth]*grav/(R*T0[i_isoth]))
-        p[i_adiab] = p0[i_adiab] * ( (1.-alpha[i_adiab]*dz[i_adiab]/T0[i_adiab]) **(1.*grav/(alpha[i_adiab]*R)) )
+        if np.all(i_isoth):
+            p[:] = p0 * np.exp(-1.*dz*grav/(R*T0))
+        elif not np.any(i_isoth):
+            p[:] = p0 * ( (1.-alpha*dz/T0) **(1.*grav/(alpha*R)) )
+        else:
+            i_adiab = ~i_isoth
+            p[i_isoth] = p0[i_isoth] * np.exp(-1.*dz[i_isoth]*grav/(R*T0[i_isoth]))
+            p[i_adiab] = p0[i_adiab] * ( (1.-alpha[i_adiab]*dz[i_adiab]/T0[i_adiab]) **(1.*grav/(alpha[i_adiab]*R)) )
         
-        T   = T0 - dz*alpha + delta_isa
+        T = T0 - dz*alpha
+        
+        return p, T
+
+    def interpolate_values(self,altitude,temperature_deviation=0.0,var_gamma=False,results=None):
+
+        """Computes atmospheric values by interpolating a table of the standard atmosphere, which
+        is built on the first call. This is faster than compute_values for large numbers of
+        altitudes, but is not exact.
+
+        Assumptions:
+        US 1976 Standard Atmosphere
+        The temperature deviation does not change the pressure, so the table only depends on altitude.
+        The breaks are points of the table, so the temperature is exact. The logarithm of the pressure
+        is interpolated linearly, which gives relative errors below 1e-7 for the default resolution.
+
+        Source:
+        U.S. Standard Atmosphere, 1976, U.S. Government Printing Office, Washington, D.C., 1976
+
+        Inputs:
+        altitude                                 [m]
+        temperature_deviation                    [K]
+        var_gamma                                [Boolean]
+        results                                  Conditions to store the values in (optional)
+
+        Output:
+        atmo_data.
+          pressure                               [Pa]
+          temperature                            [K]
+          density                                [kg/m^3]
+          speed_of_sound                         [m/s]
+          dynamic_viscosity                      [kg/(m*s)]
+
+        Properties Used:
+        self.
+          table_resolution                       [m]
+          planet.mean_radius                     [m]
+          breaks.altitude                        [m]
+        """
+        
+        gas   = self.fluid_properties
+        table = self.table
+        if table is None or table.resolution != self.table_resolution:
+            table = self.build_table()
+        
+        # convert geometric to geopotential altitude
+        zs = atleast_2d_col(altitude)
+        zs = zs/(1 + zs/self.planet.mean_radius)
+        if np.amin(zs) < table.altitude[0]:
+            print("Warning: altitude requested below minimum for this atmospheric model; returning values for h = -2.0 km")
+        if np.amax(zs) > table.altitude[-1]:
+            print("Warning: altitude requested above maximum for this atmospheric model; returning values for h = 86.0 km")   
+        
+        # the ends of the table are used beyond it
+        p   = np.exp(np.interp(zs, table.altitude, table.log_pressure))
+        T   = np.interp(zs, table.altitude, table.temperature) + temperature_deviation
         rho = gas.compute_density(T,p)
         a   = gas.compute_speed_of_sound(T,p,var_gamma)
         mu  = gas.compute_absolute_viscosity(T)
-                
-        atmo_data = Conditions()
-        atmo_data.expand_rows(zs.shape[0])
+        
+        if results is None:
+            atmo_data = Conditions()
+            atmo_data.expand_rows(zs.shape[0])
+        else:
+            atmo_data = results
         atmo_data.pressure          = p
         atmo_data.temperature       = T
         atmo_data.density           = rho
@@ -171,6 +285,55 @@ class US_Standard_1976(Atmospheric):
         atmo_data.dynamic_viscosity = mu
         
         return atmo_data
+    
+    def build_table(self):
+
+        """Tabulates the standard atmosphere in geopotential altitude for interpolate_values.
+
+        Assumptions:
+        US 1976 Standard Atmosphere
+
+        Source:
+        N/A
+
+        Inputs:
+        None
+
+        Output:
+        table.
+          resolution                             [m]
+          altitude                               [m]
+          temperature                            [K]
+          log_pressure                           [-]
+
+        Properties Used:
+        self.
+          table_resolution                       [m]
+          breaks.altitude                        [m]
+        """
+        
+        # the breaks are points of the table, with a point just below each of them since the
+        # tabulated break pressures are not quite continuous
+        breaks   = self.breaks.altitude
+        n_points = int(np.ceil((breaks[-1] - breaks[0])/self.table_resolution)) + 1
+        zs       = np.linspace(breaks[0], breaks[-1], n_points)
+        zs       = np.union1d(zs, np.concatenate([breaks, np.nextafter(breaks[1:], -np.inf)]))
+        
+        p, T = self.layer_values(zs)
+        
+        table = Data()
+        table.resolution   = self.table_resolution
+        table.altitude     = zs
+        table.temperature  = T
+        table.log_pressure = np.log(p)
+        
+        self.table = table
+        
+        return table
+
+# the properties the atmosphere is defined for
+standard_air    = Air()
+standard_planet = Earth()
 
 
 # ----------------------------------------------------------------------
@@ -0,0 +1,126 @@
+## @ingroup Analyses-Mission
+# Batch.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Analyses import Analysis
+from SUAVE.Methods import Missions as Methods
+from .Mission import Mission
+from .Sequential_Segments import Sequential_Segments
+
+# ----------------------------------------------------------------------
+#   Class
+# ----------------------------------------------------------------------
+
+## @ingroup Analyses-Mission
+class Batch(Analysis):
+    """ Evaluates several copies of a sequential mission together, for example with different takeoff weights,
+        ranges or cruise altitudes. Segments are solved in turn, each one converging all missions at once.
+        The row by row steps in settings.stacked_steps, such as atmosphere and aerodynamics, are run once per
+        iteration on the stacked conditions of every mission.
+
+        Assumptions:
+        All missions have the same segments with the same processes.
+        Stacked steps use the analyses and segment settings of the first mission.
+
+        Source:
+        None
+    """
+
+    def __defaults__(self):
+        """This sets the default values.
+
+            Assumptions:
+            Energy networks may integrate over the segment, so propulsion is not stacked by default.
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            None
+
+            Properties Used:
+            None
+            """
+
+        self.tag      = 'batch'
+        self.missions = Mission.Container()
+
+        self.settings.stacked_steps = ['conditions.atmosphere',
+                                       'conditions.gravity',
+                                       'conditions.freestream',
+                                       'conditions.orientations',
+                                       'conditions.aerodynamics',
+                                       'conditions.stability']
+
+    def append_mission(self,mission):
+        """ Adds a mission to the batch
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            mission  [Mission()]
+
+            Outputs:
+            None
+
+            Properties Used:
+            None
+        """
+        self.missions.append(mission)
+        return
+
+    def evaluate(self,state=None):
+        """ Evaluates every mission in the batch
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            results  [Data()] - one evaluated mission per tag
+
+            Properties Used:
+            None
+        """
+
+        missions = list(self.missions.values())
+        results  = SUAVE.Core.Data()
+
+        if not missions:
+            return results
+
+        tags = list(missions[0].segments.keys())
+        for mission in missions:
+            if not isinstance(mission, Sequential_Segments):
+                raise TypeError('mission %s is not a Sequential_Segments mission' % mission.tag)
+            if list(mission.segments.keys()) != tags:
+                raise ValueError('mission %s does not have the same segments as %s' % (mission.tag, missions[0].tag))
+            mission.process.initialize(mission)
+
+        for tag in tags:
+            segments = [mission.segments[tag] for mission in missions]
+            Methods.Segments.evaluate_batch(segments, self.settings.stacked_steps)
+
+        for mission in missions:
+            mission.process.finalize(mission)
+            results[mission.tag] = mission
+
+        return results
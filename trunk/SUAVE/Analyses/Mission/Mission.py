@@ -3,6 +3,7 @@
 #
 # Created:  
 # Modified: Feb 2016, Andrew Wendorff
+#           Oct 2026, SUAVE Team
 
 """ Mission.py: Top-level mission class """
 
@@ -49,8 +50,48 @@ class Mission(Segments.Simple.Container):
         """         
         self.tag = 'mission'
         
+        # optional store of converged unknowns, see Warm_Start
+        self.warm_start = None
+        
         # see Segments.Simple.Container
         
+    def evaluate(self,state=None):
+        """ Evaluates the mission. If a warm start is set, the segments are first seeded with the
+            stored unknowns closest to warm_start.key and the converged unknowns are stored afterwards.
+            The initial unknowns of the segments are restored once the mission is evaluated.
+    
+            Assumptions:
+            None
+    
+            Source:
+            N/A
+    
+            Inputs:
+            State  [Data()]
+    
+            Outputs:
+            Mission  [Mission()]
+    
+            Properties Used:
+            self.warm_start
+        """
+        
+        warm_start = self.warm_start
+        
+        if warm_start is None:
+            self.process(self)
+            return self
+        
+        # the seeded unknowns only apply to this evaluation
+        previous = warm_start.seed(self)
+        try:
+            self.process(self)
+            warm_start.store(self)
+        finally:
+            warm_start.restore(previous)
+        
+        return self
+        
     def finalize(self):
         """ Stub
     
@@ -3,6 +3,7 @@
 #
 # Created:  
 # Modified: Feb 2016, Andrew Wendorff
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -53,7 +54,10 @@ class Numerics(Conditions):
         self.discretization_method = chebyshev_data
         
         self.solver_jacobian                  = "none"
+        self.jacobian_sparsity                = None
+        self.initial_unknowns                 = None
         self.tolerance_solution               = 1e-8
+        self.tolerance_residuals              = 1e-6
         self.tolerance_boundary_conditions    = 1e-8  
         self.converged                        = None
         
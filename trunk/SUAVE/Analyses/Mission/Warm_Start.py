@@ -0,0 +1,272 @@
+## @ingroup Analyses-Mission
+# Warm_Start.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+from SUAVE.Core import Data
+
+# ----------------------------------------------------------------------
+#   Class
+# ----------------------------------------------------------------------
+
+## @ingroup Analyses-Mission
+class Warm_Start(Data):
+    """ Stores the converged unknowns of each segment of a mission, keyed by a design vector. Before a mission is
+        evaluated, the segments are seeded with the unknowns stored for the closest key, which cuts the number of
+        solver iterations when a mission is evaluated repeatedly for slightly different vehicles.
+
+        Assumptions:
+        Stored unknowns are only used on segments with the same number of unknowns.
+        When the store is full the oldest entry is dropped.
+
+        Source:
+        None
+    """
+
+    def __defaults__(self):
+        """This sets the default values.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            None
+
+            Properties Used:
+            None
+            """
+
+        self.tag         = 'warm_start'
+        self.max_size    = 20
+        self.key         = None
+        self.stored_keys = []
+        self.entries     = []
+
+    def seed(self,mission):
+        """ Sets the initial unknowns of every segment from the entry closest to the current key.
+            If no key is set, the most recent entry is used. The replaced initial unknowns are
+            returned so that restore can put them back after the mission is evaluated.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            mission                                    [Mission()]
+
+            Outputs:
+            segment.state.numerics.initial_unknowns    [array]
+            previous                                   [list] (segment, replaced initial unknowns) pairs
+
+            Properties Used:
+            self.key
+            """
+
+        entry    = self.nearest(self.key)
+        previous = []
+
+        for tag, segment in all_segments(mission):
+            previous.append((segment, segment.state.numerics.initial_unknowns))
+            if entry is None or not tag in entry:
+                segment.state.numerics.initial_unknowns = None
+            else:
+                segment.state.numerics.initial_unknowns = entry[tag] * 1.
+
+        return previous
+
+    def restore(self,previous):
+        """ Puts back the initial unknowns replaced by seed, so the seeded unknowns are not used
+            once the mission is evaluated without a warm start
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            previous                                   [list] (segment, replaced initial unknowns) pairs
+
+            Outputs:
+            segment.state.numerics.initial_unknowns    [array or None]
+
+            Properties Used:
+            None
+            """
+
+        for segment, initial_unknowns in previous:
+            segment.state.numerics.initial_unknowns = initial_unknowns
+
+        return
+
+    def store(self,mission):
+        """ Saves the unknowns of every converged segment under the current key
+
+            Assumptions:
+            Segments that did not converge are not stored
+
+            Source:
+            N/A
+
+            Inputs:
+            mission                                    [Mission()]
+
+            Outputs:
+            None
+
+            Properties Used:
+            self.key
+            self.max_size
+            """
+
+        entry = Data()
+        for tag, segment in all_segments(mission):
+            if segment.state.numerics.converged:
+                entry[tag] = segment.state.unknowns.pack_array() * 1.
+
+        if not len(entry):
+            return
+
+        key = None if self.key is None else np.array(self.key, dtype=float).flatten()
+
+        # replace an entry with the same key
+        for i, stored in enumerate(self.stored_keys):
+            if same_key(stored, key):
+                del self.stored_keys[i]
+                del self.entries[i]
+                break
+
+        self.stored_keys.append(key)
+        self.entries.append(entry)
+
+        while len(self.entries) > self.max_size:
+            del self.stored_keys[0]
+            del self.entries[0]
+
+        return
+
+    def nearest(self,key):
+        """ Finds the stored entry whose key is closest to the given key
+
+            Assumptions:
+            Keys are compared by euclidean distance. If the key is None or no stored
+            key has the same length, the most recent entry is returned.
+
+            Source:
+            N/A
+
+            Inputs:
+            key                                        [array]
+
+            Outputs:
+            entry                                      [Data()]
+
+            Properties Used:
+            None
+            """
+
+        if not len(self.entries):
+            return None
+
+        if key is None:
+            return self.entries[-1]
+
+        key = np.array(key, dtype=float).flatten()
+
+        distances = [np.inf if (stored is None or stored.shape != key.shape) else np.linalg.norm(stored - key) \
+                     for stored in self.stored_keys]
+
+        i = int(np.argmin(distances))
+        if np.isinf(distances[i]):
+            return self.entries[-1]
+
+        return self.entries[i]
+
+    def reset(self):
+        """ Removes all stored entries
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            None
+
+            Properties Used:
+            None
+            """
+
+        self.stored_keys = []
+        self.entries     = []
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def all_segments(segment, prefix=''):
+    """ Lists a mission and all of its segments. Nested segments are tagged by their path.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        segment                                    [Mission() or Segment()]
+        prefix                                     [string] path of the segment, empty for the mission
+
+        Outputs:
+        segments                                   [list] (tag, segment) pairs, the mission has the tag ''
+
+        Properties Used:
+        None
+        """
+    segments = [] if prefix else [('', segment)]
+    for tag, sub_segment in segment.segments.items():
+        segments.append((prefix + tag, sub_segment))
+        if 'segments' in sub_segment:
+            segments.extend(all_segments(sub_segment, prefix + tag + '.'))
+    return segments
+
+def same_key(key_1, key_2):
+    """ Checks if two stored keys are equal. A key of None only matches another None.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        key_1                                      [array or None]
+        key_2                                      [array or None]
+
+        Outputs:
+        equal                                      [bool]
+
+        Properties Used:
+        None
+        """
+    if key_1 is None or key_2 is None:
+        return key_1 is None and key_2 is None
+    return key_1.shape == key_2.shape and np.all(key_1 == key_2)
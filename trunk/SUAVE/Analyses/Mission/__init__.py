@@ -6,6 +6,8 @@
 from .All_At_Once import All_At_Once
 from .Mission import Mission
 from .Sequential_Segments import Sequential_Segments
+from .Batch import Batch
+from .Warm_Start import Warm_Start
 
 # packages
 from . import Segments
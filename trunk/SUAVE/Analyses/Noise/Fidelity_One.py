@@ -3,12 +3,18 @@
 #
 # Created:  
 # Modified: Feb 2016, Andrew Wendorff
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 from .Noise import Noise
 
+from SUAVE.Core import Data
+from SUAVE.Methods.Noise.Fidelity_One import noise_footprint
+
+import numpy as np
+
 # ----------------------------------------------------------------------
 #  Analysis
 # ----------------------------------------------------------------------
@@ -54,4 +60,61 @@ class Fidelity_One(Noise):
         settings.approach       = 0
         settings.sideline       = 0
         settings.mic_x_position = 0
-        
\ No newline at end of file
+
+        # ground observer grid of the footprint
+        settings.footprint = Data()
+        settings.footprint.observer_height   = 0.
+        settings.footprint.number_of_workers = 1
+        settings.footprint.chunk_size        = 50
+
+    def compute_footprint(self,config,analyses,noise_segment,x,y,engine_flag=1):
+        """ Computes the EPNL and SENEL contours of a segment on a grid of ground observers.
+
+                Assumptions:
+                The observers are at settings.footprint.observer_height above the ground.
+
+                Source:
+                N/A
+
+                Inputs:
+                config          SUAVE type vehicle
+                analyses        containing the atmosphere of the segment
+                noise_segment   flight segment with the inertial position vector
+                x               [m]   observer positions along the flight path
+                y               [m]   observer positions to the side of the flight path
+                engine_flag     [int] 1 to add the jet noise, 0 for the airframe alone
+
+                Output:
+                footprint.
+                  x, y          [m]     grids of the observer positions, one row per value of y
+                  EPNL          [EPNdB] grid of the levels of the aircraft
+                  SENEL         [dBA]   grid of the levels of the aircraft
+                  airframe, engine      grids of the levels of each source
+
+                Properties Used:
+                self.settings.footprint.
+                  observer_height       [m]
+                  number_of_workers     [int]
+                  chunk_size            [int]
+        """
+
+        settings = self.settings.footprint
+
+        x_grid, y_grid = np.meshgrid(np.atleast_1d(x),np.atleast_1d(y))
+        observers      = np.column_stack([x_grid.ravel(),settings.observer_height*np.ones(x_grid.size),y_grid.ravel()])
+
+        levels = noise_footprint(config,analyses,noise_segment,observers,engine_flag,
+                                 settings.number_of_workers,settings.chunk_size)
+
+        footprint = Data()
+        footprint.x        = x_grid
+        footprint.y        = y_grid
+        footprint.EPNL     = np.reshape(levels.EPNL,x_grid.shape)
+        footprint.SENEL    = np.reshape(levels.SENEL,x_grid.shape)
+        footprint.airframe = Data()
+        footprint.engine   = Data()
+        for source in ['airframe','engine']:
+            footprint[source].EPNL  = np.reshape(levels[source].EPNL,x_grid.shape)
+            footprint[source].SENEL = np.reshape(levels[source].SENEL,x_grid.shape)
+
+        return footprint
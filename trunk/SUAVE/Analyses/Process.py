@@ -3,6 +3,7 @@
 #
 # Created:  
 # Modified: Feb 2016, Andrew Wendorff
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -27,7 +28,10 @@ class Process(ContainerOrdered):
             N/A
     """    
     
-    verbose = False
+    verbose  = False
+    
+    # the running Process_Profiler, if any
+    profiler = None
     
     def evaluate(self,*args,**kwarg):
         """This is used to execute the evaluate functions of the analyses
@@ -49,7 +53,8 @@ class Process(ContainerOrdered):
                 N/A
             """        
         
-        results = Data()
+        results  = Data()
+        profiler = self.profiler
         
         if self.verbose:
             print('process start')
@@ -61,7 +66,9 @@ class Process(ContainerOrdered):
             
             #if not callable(step): continue
             
-            if hasattr(step,'evaluate'): 
+            if profiler is not None:
+                result = profiler.evaluate_step(tag,step,*args,**kwarg)
+            elif hasattr(step,'evaluate'): 
                 result = step.evaluate(*args,**kwarg)
             else:
                 result = step(*args,**kwarg)
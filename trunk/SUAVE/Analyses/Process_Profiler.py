@@ -0,0 +1,348 @@
+## @ingroup Analyses
+# Process_Profiler.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import time
+import tracemalloc
+
+from SUAVE.Core import Data
+
+# ----------------------------------------------------------------------
+#  Process Profiler
+# ----------------------------------------------------------------------
+
+## @ingroup Analyses
+class Process_Profiler(Data):
+    """ SUAVE.Analyses.Process_Profiler()
+
+        Records the wall time, the number of calls and optionally the memory allocated by every step of every
+        Process evaluated while it is running. Steps are recorded by their path in the process tree, so a step
+        of a nested Process, such as segment.process.iterate.conditions.aerodynamics or the compute.drag steps
+        of an aerodynamics analysis, is recorded under the step that evaluated it. The path includes the tag of
+        every mission and segment whose process is evaluated, so steps of the same name in different missions
+        or segments are recorded apart.
+
+        Usage:
+            profiler = SUAVE.Analyses.Process_Profiler()
+            with profiler:
+                results = mission.evaluate()
+            print(profiler)
+
+            Assumptions:
+            Times include the time spent in nested steps.
+            Memory is the net change in memory traced by tracemalloc over each step.
+            A mission or segment is as long as the steps of its process, and it has as many calls as the first one.
+
+            Source:
+            N/A
+    """
+
+    def __defaults__(self):
+        """This sets the default values.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            None
+
+            Properties Used:
+            None
+        """
+        self.tag     = 'process_profiler'
+        self.memory  = False
+        self.records = {}
+        self.stack   = []
+        self.owners  = []
+        self.previous_profiler = None
+        self.stop_tracing      = False
+
+    def start(self):
+        """Starts recording every Process evaluation
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            None
+
+            Properties Used:
+            self.memory
+        """
+        from .Process import Process
+
+        self.previous_profiler = Process.profiler
+        Process.profiler = self
+
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.stop_tracing = True
+        else:
+            self.stop_tracing = False
+
+    def stop(self):
+        """Stops recording, restoring any profiler that was running before
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            None
+
+            Properties Used:
+            None
+        """
+        from .Process import Process
+
+        Process.profiler = self.previous_profiler
+        self.previous_profiler = None
+
+        if self.stop_tracing:
+            tracemalloc.stop()
+            self.stop_tracing = False
+
+    def __enter__(self):
+        """Starts recording at the start of a with block
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            self        [Process_Profiler]
+
+            Properties Used:
+            None
+        """
+        self.start()
+        return self
+
+    def __exit__(self,*args):
+        """Stops recording at the end of a with block, also when it raised
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            args        the exception raised in the block, if any
+
+            Outputs:
+            False       the exception is not suppressed
+
+            Properties Used:
+            None
+        """
+        self.stop()
+        return False
+
+    def reset(self):
+        """Removes all records
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            None
+
+            Properties Used:
+            None
+        """
+        self.records = {}
+        self.stack   = []
+        self.owners  = []
+
+    def evaluate_step(self,tag,step,*args,**kwarg):
+        """Evaluates a single step of a Process, recording it under the current path. When the step
+            belongs to the process of another mission or segment, the tag of that mission or segment
+            is added to the path first.
+
+            Assumptions:
+            The mission or segment of a process is the first input of its steps
+
+            Source:
+            N/A
+
+            Inputs:
+            tag         [string]
+            step        [Process, Analysis or function]
+            args,kwarg  the inputs of the step
+
+            Outputs:
+            result      the result of the step
+
+            Properties Used:
+            self.memory
+        """
+
+        from .Mission.Segments.Segment import Segment
+
+        stack  = self.stack
+        owners = self.owners
+
+        # the mission or segment that runs the step
+        current = owners[-1] if owners else None
+        owner   = args[0] if (args and isinstance(args[0],Segment)) else current
+        levels  = [tag] if owner is current else [owner.tag, tag]
+
+        stack.extend(levels)
+        owners.append(owner)
+        path  = tuple(stack)
+
+        memory = self.memory and tracemalloc.is_tracing()
+        if memory:
+            memory_start = tracemalloc.get_traced_memory()[0]
+        time_start = time.perf_counter()
+
+        try:
+            if hasattr(step,'evaluate'):
+                result = step.evaluate(*args,**kwarg)
+            else:
+                result = step(*args,**kwarg)
+        finally:
+            elapsed = time.perf_counter() - time_start
+            del stack[-len(levels):]
+            owners.pop()
+
+            record = self.records.get(path)
+            if record is None:
+                record = self.records[path] = [0, 0., 0]
+            record[0] += 1
+            record[1] += elapsed
+            if memory:
+                record[2] += tracemalloc.get_traced_memory()[0] - memory_start
+
+        return result
+
+    def report(self):
+        """Builds the hierarchical report of the recorded steps
+
+            Assumptions:
+            Steps are listed in the order they were first evaluated
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            report                   [Data]
+              .time                  [s]     total time of the top level steps
+              .steps.<tag>.calls     [-]
+              .steps.<tag>.time      [s]
+              .steps.<tag>.memory    [bytes]
+              .steps.<tag>.steps     [Data]  nested steps
+
+            Properties Used:
+            None
+        """
+
+        report = Data()
+        report.time  = 0.
+        report.steps = Data()
+
+        recorded = []
+        for path, (calls, elapsed, memory) in self.records.items():
+            node = report
+            for tag in path:
+                if not tag in node.steps:
+                    node.steps[tag]        = Data()
+                    node.steps[tag].calls  = 0
+                    node.steps[tag].time   = 0.
+                    node.steps[tag].memory = 0
+                    node.steps[tag].steps  = Data()
+                node = node.steps[tag]
+            node.calls  = calls
+            node.time   = elapsed
+            node.memory = memory
+            recorded.append(node)
+
+        # missions and segments are not steps, they add up the steps of their process
+        def add_up(node):
+            for step in node.steps.values():
+                add_up(step)
+            if node.steps and not any([node is step for step in recorded]):
+                steps       = list(node.steps.values())
+                node.calls  = steps[0].calls
+                node.time   = sum([step.time for step in steps])
+                node.memory = sum([step.memory for step in steps])
+
+        add_up(report)
+        report.time = sum([step.time for step in report.steps.values()])
+
+        return report
+
+    def __str__(self,indent=''):
+        """Prints the report as an indented table
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            table   [string]
+
+            Properties Used:
+            None
+        """
+
+        report = self.report()
+        total  = report.time or 1.
+
+        lines = ['{:<60} {:>10} {:>12} {:>8}'.format('step','calls','time [s]','share')]
+        if self.memory:
+            lines[0] += ' {:>14}'.format('memory [kB]')
+
+        def add_lines(steps,depth):
+            for tag, node in steps.items():
+                line = '{:<60} {:>10d} {:>12.4f} {:>7.1f}%'.format('  '*depth + tag, node.calls, node.time, 100.*node.time/total)
+                if self.memory:
+                    line += ' {:>14.1f}'.format(node.memory/1024.)
+                lines.append(line)
+                add_lines(node.steps,depth+1)
+
+        add_lines(report.steps,0)
+
+        return indent + ('\n' + indent).join(lines) + '\n'
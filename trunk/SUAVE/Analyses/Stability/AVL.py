@@ -1,7 +1,8 @@
 ## @ingroup Analyses-Stability
 # AVL.py
 #
-# Created: Apr 2017, M. Clarke 
+# Created:  Apr 2017, M. Clarke 
+# Modified: Oct 2026, SUAVE Team
 
 
 # ----------------------------------------------------------------------
@@ -20,7 +21,7 @@ from SUAVE.Methods.Aerodynamics.AVL.write_geometry           import write_geomet
 from SUAVE.Methods.Aerodynamics.AVL.write_mass_file          import write_mass_file
 from SUAVE.Methods.Aerodynamics.AVL.write_run_cases          import write_run_cases
 from SUAVE.Methods.Aerodynamics.AVL.write_input_deck         import write_input_deck
-from SUAVE.Methods.Aerodynamics.AVL.run_analysis             import run_analysis
+from SUAVE.Methods.Aerodynamics.AVL.run_analysis             import run_analysis, evaluate_conditions_concurrently
 from SUAVE.Methods.Aerodynamics.AVL.translate_data           import translate_conditions_to_cases, translate_results_to_conditions
 from SUAVE.Methods.Aerodynamics.AVL.purge_files              import purge_files
 from SUAVE.Methods.Aerodynamics.AVL.Data.Settings            import Settings
@@ -278,27 +279,36 @@ class AVL(Stability):
         count         = 0
         
         # remove old files in run directory  
-        if os.path.exists('avl_files'):
+        if os.path.exists(run_folder):
             if not self.regression_flag:
                 rmtree(run_folder)
         
         for i,_ in enumerate(mach):
             for j,_ in enumerate(AoA):
                 xy[i*len(mach)+j,:] = np.array([AoA[j],mach[i]])
+        run_conditions = []
         for j,_ in enumerate(mach):
             # Set training conditions
-            run_conditions = Aerodynamics()
-            run_conditions.freestream.density           = 1.2
-            run_conditions.freestream.gravity           = 9.81        
-            run_conditions.aerodynamics.angle_of_attack = AoA 
-            run_conditions.freestream.speed_of_sound    = 343.
-            run_conditions.aerodynamics.side_slip_angle = 0
-            run_conditions.freestream.velocity          = mach[j] * run_conditions.freestream.speed_of_sound
-            run_conditions.freestream.mach_number       = mach[j] 
+            conditions = Aerodynamics()
+            conditions.freestream.density           = 1.2
+            conditions.freestream.gravity           = 9.81        
+            conditions.aerodynamics.angle_of_attack = AoA 
+            conditions.freestream.speed_of_sound    = 343.
+            conditions.aerodynamics.side_slip_angle = 0
+            conditions.freestream.velocity          = mach[j] * conditions.freestream.speed_of_sound
+            conditions.freestream.mach_number       = mach[j]
+            run_conditions.append(conditions)
+
+        # Run AVL at every Mach number, with concurrent processes when more than one worker is set
+        if self.settings.number_of_workers > 1 and not self.regression_flag:
+            batch_results, batch_cases = evaluate_conditions_concurrently(self, run_conditions, trim_aircraft)
+            if np.count_nonzero(self.geometry.mass_properties.moments_of_inertia.tensor) > 0:  
+                batch_results = [compute_dynamic_flight_modes(results,self.geometry,conditions,cases) \
+                                 for results, conditions, cases in zip(batch_results,run_conditions,batch_cases)]
+        else:
+            batch_results = [self.evaluate_conditions(conditions, trim_aircraft) for conditions in run_conditions]
             
-            #Run Analysis at AoA[i] and mach[j]
-            results =  self.evaluate_conditions(run_conditions, trim_aircraft)
-
+        for results in batch_results:
             # Obtain CM Cm_alpha, Cn_beta and the Neutral Point # Store other variables here as well 
             CM[count*len(mach):(count+1)*len(mach),0]       = results.aerodynamics.Cmtot[:,0]
             Cm_alpha[count*len(mach):(count+1)*len(mach),0] = results.stability.static.Cm_alpha[:,0]
@@ -414,6 +424,65 @@ class AVL(Stability):
           cases
         """           
         
+        # unpack
+        run_folder                       = os.path.abspath(self.settings.filenames.run_folder)
+        
+        # update current status
+        self.current_status.batch_index += 1
+        
+        # write the input files
+        cases                            = self.write_input_files(run_conditions,trim_aircraft,run_folder)
+
+        # RUN AVL!
+        with redirect.folder(run_folder,force=False):
+            results_avl = run_analysis(self)
+    
+        # translate results
+        results = translate_results_to_conditions(cases,results_avl)
+        
+        # -----------------------------------------------------------------------------------------------------------------------                     
+        # Dynamic Stability & System Matrix Computation
+        # -----------------------------------------------------------------------------------------------------------------------      
+        # Dynamic Stability
+        if np.count_nonzero(self.geometry.mass_properties.moments_of_inertia.tensor) > 0:  
+                results = compute_dynamic_flight_modes(results,self.geometry,run_conditions,cases)        
+             
+        if not self.keep_files:
+            rmtree( run_folder )           
+ 
+        return results
+
+    def write_input_files(self,run_conditions,trim_aircraft,folder,case_index=None):
+        """Writes the geometry, mass, run case and input deck files of the current batch into a folder.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        run_conditions <SUAVE data type> aerodynamic conditions
+        trim_aircraft  <boolean>
+        folder         <string> folder the files are written to
+        case_index     [-] index of the only angle of attack to write, None for all of them
+
+        Outputs:
+        cases          <SUAVE data type> run cases
+
+        Properties Used:
+        self.settings.filenames.
+          run_folder
+          output_template
+          batch_template
+          deck_template
+        self.current_status.
+          batch_index
+          batch_file
+          deck_file
+          cases
+        """           
+        
         # unpack
         run_folder                       = os.path.abspath(self.settings.filenames.run_folder)
         run_script_path                  = run_folder.rstrip('avl_files').rstrip('/')
@@ -432,7 +501,6 @@ class AVL(Stability):
         self.settings.filenames.mass_file= self.geometry._base.tag + '.mass'
         
         # update current status
-        self.current_status.batch_index += 1
         batch_index                      = self.current_status.batch_index
         self.current_status.batch_file   = batch_template.format(batch_index)
         self.current_status.deck_file    = deck_template.format(batch_index)
@@ -463,6 +531,10 @@ class AVL(Stability):
         
         # translate conditions
         cases                            = translate_conditions_to_cases(self, run_conditions)    
+        if case_index is not None:
+            case  = cases[case_index]
+            cases = Run_Case.Container()
+            cases.append_case(case)
         for case in cases:
             cases[case].stability_and_control.number_control_surfaces = num_cs
             cases[case].stability_and_control.control_surface_names   = cs_names
@@ -478,26 +550,10 @@ class AVL(Stability):
             cases[case].eigen_result_filename_2    = dynamic_results_template_2.format(case)     # 'system_matrix_{}.dat'
         
         # write the input files
-        with redirect.folder(run_folder,force=False):
+        with redirect.folder(folder,force=False):
             write_geometry(self,run_script_path)
             write_mass_file(self,run_conditions)
             write_run_cases(self,trim_aircraft)
             write_input_deck(self, trim_aircraft)
 
-            # RUN AVL!
-            results_avl = run_analysis(self)
-    
-        # translate results
-        results = translate_results_to_conditions(cases,results_avl)
-        
-        # -----------------------------------------------------------------------------------------------------------------------                     
-        # Dynamic Stability & System Matrix Computation
-        # -----------------------------------------------------------------------------------------------------------------------      
-        # Dynamic Stability
-        if np.count_nonzero(self.geometry.mass_properties.moments_of_inertia.tensor) > 0:  
-                results = compute_dynamic_flight_modes(results,self.geometry,run_conditions,cases)        
-             
-        if not self.keep_files:
-            rmtree( run_folder )           
- 
-        return results
+        return cases
@@ -5,13 +5,14 @@
 # Modified: Jan 2016, T. MacDonald
 #           Feb 2019, M. Vegh            
 #           Mar 2020, M. Clarke
+#           Oct 2026, SUAVE Team
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 from SUAVE.Components.Energy.Energy_Component import Energy_Component
 from SUAVE.Core import Data
 from SUAVE.Methods.Geometry.Two_Dimensional.Cross_Section.Airfoil.compute_airfoil_polars \
-     import compute_airfoil_polars
+     import cached_airfoil_polars, interpolate_airfoil_polars
 from SUAVE.Methods.Geometry.Three_Dimensional \
      import angles_to_dcms, orientation_product, orientation_transpose
 
@@ -180,7 +181,7 @@ class Propeller(Energy_Component):
             if len(a_loc) != N:
                 raise AssertionError('Dimension of airfoil sections must be equal to number of stations on propeller')
             # compute airfoil polars for airfoils 
-            airfoil_polars = compute_airfoil_polars(self, a_geo, a_pol)
+            airfoil_polars = cached_airfoil_polars(self, a_geo, a_pol)
             airfoil_cl     = airfoil_polars.lift_coefficients
             airfoil_cd     = airfoil_polars.drag_coefficients
             AoA_sweep      = airfoil_polars.angle_of_attacks
@@ -203,104 +204,21 @@ class Propeller(Energy_Component):
         Ut = omegar - ut
         U  = np.sqrt(Ua*Ua + Ut*Ut)
         
-        #Things that will change with iteration
-        size = (len(a),N)
-        Cl = np.zeros((1,N))  
-        
-        #Setup a Newton iteration
-        psi    = np.ones(size)
-        psiold = np.zeros(size)
-        diff   = 1.
-        
-        ii = 0
-        broke = False   
-        while (diff>tol):
-            sin_psi = np.sin(psi)
-            cos_psi = np.cos(psi)
-            Wa      = 0.5*Ua + 0.5*U*sin_psi
-            Wt      = 0.5*Ut + 0.5*U*cos_psi   
-            va     = Wa - Ua
-            vt      = Ut - Wt
-            alpha   = beta - np.arctan2(Wa,Wt)
-            W       = (Wa*Wa + Wt*Wt)**0.5
-            Ma      = (W)/a #a is the speed of sound 
-            
-            lamdaw = r*Wa/(R*Wt)
-            
-            # Limiter to keep from Nan-ing
-            lamdaw[lamdaw<0.] = 0.
-            
-            f            = (B/2.)*(1.-r/R)/lamdaw
-            piece        = np.exp(-f)
-            arccos_piece = np.arccos(piece)
-            F            = 2.*arccos_piece/pi
-            Gamma        = vt*(4.*pi*r/B)*F*(1.+(4.*lamdaw*R/(pi*B*r))*(4.*lamdaw*R/(pi*B*r)))**0.5
-            
-            # Estimate Cl max
-            Re         = (W*c)/nu 
-            Cl_max_ref = -0.0009*tc**3 + 0.0217*tc**2 - 0.0442*tc + 0.7005
-            Re_ref     = 9.*10**6      
-            Cl1maxp    = Cl_max_ref * ( Re / Re_ref ) **0.1
-            
-            # Compute blade CL distribution from the airfoil data 
-            if  a_pol != None and a_loc != None: 
-                for k in range(N):
-                    Cl[0,k] = np.interp(alpha[0,k],AoA_sweep,airfoil_cl[a_loc[k]])
-            else:
-                # If not airfoil polar provided, use 2*pi as lift curve slope
-                Cl = 2.*pi*alpha
-            
-            # By 90 deg, it's totally stalled.
-            Cl[Cl>Cl1maxp]  = Cl1maxp[Cl>Cl1maxp] # This line of code is what changed the regression testing
-            Cl[alpha>=pi/2] = 0.
-                
-            # Scale for Mach, this is Karmen_Tsien
-            Cl[Ma[:,:]<1.] = Cl[Ma[:,:]<1.]/((1-Ma[Ma[:,:]<1.]*Ma[Ma[:,:]<1.])**0.5+((Ma[Ma[:,:]<1.]*Ma[Ma[:,:]<1.])/(1+(1-Ma[Ma[:,:]<1.]*Ma[Ma[:,:]<1.])**0.5))*Cl[Ma<1.]/2)
-        
-            # If the blade segments are supersonic, don't scale
-            Cl[Ma[:,:]>=1.] = Cl[Ma[:,:]>=1.] 
-        
-            Rsquiggly = Gamma - 0.5*W*c*Cl
-            
-            #An analytical derivative for dR_dpsi, this is derived by taking a derivative of the above equations
-            #This was solved symbolically in Matlab and exported        
-            f_wt_2 = 4*Wt*Wt
-            f_wa_2 = 4*Wa*Wa
-            Ucospsi  = U*cos_psi
-            Usinpsi  = U*sin_psi
-            Utcospsi = Ut*cos_psi
-            Uasinpsi = Ua*sin_psi
-            
-            UapUsinpsi = (Ua + Usinpsi)
-            utpUcospsi = (Ut + Ucospsi)
-            
-            utpUcospsi2 = utpUcospsi*utpUcospsi
-            UapUsinpsi2 = UapUsinpsi*UapUsinpsi
-            
-            dR_dpsi = ((4.*U*r*arccos_piece*sin_psi*((16.*UapUsinpsi2)/(BB*pi2*f_wt_2) + 1.)**(0.5))/B - 
-                       (pi*U*(Ua*cos_psi - Ut*sin_psi)*(beta - np.arctan((Wa+Wa)/(Wt+Wt))))/(2.*(f_wt_2 + f_wa_2)**(0.5))
-                       + (pi*U*(f_wt_2 +f_wa_2)**(0.5)*(U + Utcospsi  +  Uasinpsi))/(2.*(f_wa_2/(f_wt_2) + 1.)*utpUcospsi2)
-                       - (4.*U*piece*((16.*UapUsinpsi2)/(BB*pi2*f_wt_2) + 1.)**(0.5)*(R - r)*(Ut/2. - 
-                      (Ucospsi)/2.)*(U + Utcospsi + Uasinpsi ))/(f_wa_2*(1. - np.exp(-(B*(Wt+Wt)*(R - 
-                       r))/(r*(Wa+Wa))))**(0.5)) + (128.*U*r*arccos_piece*(Wa+Wa)*(Ut/2. - (Ucospsi)/2.)*(U + 
-                       Utcospsi  + Uasinpsi ))/(BBB*pi2*utpUcospsi*utpUcospsi2*((16.*f_wa_2)/(BB*pi2*f_wt_2) + 1.)**(0.5))) 
-            
-            dR_dpsi[np.isnan(dR_dpsi)] = 0.1
-                      
-            dpsi   = -Rsquiggly/dR_dpsi
-            psi    = psi + dpsi
-            diff   = np.max(abs(psiold-psi))
-            psiold = psi
-            
-            # If its really not going to converge
-            if np.any(psi>(pi*85.0/180.)) and np.any(dpsi>0.0):
-                break
-                
-            ii+=1
-                
-            if ii>2000:
-                broke = True
-                break
+        # Converge the inflow angle of every control point independently
+        if  a_pol != None and a_loc != None:
+            polars = Data(angle_of_attacks = AoA_sweep, lift_coefficients = airfoil_cl, stations = a_loc)
+        else:
+            polars = None
+        blade = converge_blade_inflow(Ua,Ut,U,beta,r,c,R,B,nu,a,tc,polars,tol,limit_cl=True)
+        Wa    = blade.Wa
+        Wt    = blade.Wt
+        va    = blade.va
+        vt    = blade.vt
+        alpha = blade.alpha
+        Ma    = blade.Ma
+        Re    = blade.Re
+        Gamma = blade.Gamma
+        Cl    = blade.Cl
         
         #There is also RE scaling
         #This is an atrocious fit of DAE51 data at RE=50k for Cd
@@ -325,16 +243,13 @@ class Propeller(Energy_Component):
         Ct[Ct<0] = 0.        #prevent things from breaking
         kappa    = self.induced_power_factor 
         Cd0      = self.profile_drag_coefficient   
-        Cp    = np.zeros_like(Ct)
-        power = np.zeros_like(Ct)        
-        for i in range(len(Vv)):
-            if -1. <Vv[i][0] <1.: # vertical/axial flight
-                Cp[i]       = (kappa*(Ct[i]**1.5)/(2**.5))+sigma*Cd0/8.
-                power[i]    = Cp[i]*(rho[i]*(n[i]*n[i]*n[i])*(D*D*D*D*D))
-                torque[i]   = power[i]/omega[i]  
-            else:  
-                power[i]    = torque[i]*omega[i]   
-                Cp[i]       = power[i]/(rho[i]*(n[i]*n[i]*n[i])*(D*D*D*D*D)) 
+        
+        # vertical/axial flight uses momentum theory for the power
+        axial    = np.logical_and(-1. < Vv[:,0,None], Vv[:,0,None] < 1.)
+        Cp_axial = (kappa*(Ct**1.5)/(2**.5))+sigma*Cd0/8.
+        power    = np.where(axial, Cp_axial*(rho*(n*n*n)*(D*D*D*D*D)), torque*omega)
+        torque   = np.where(axial, power/omega, torque)
+        Cp       = np.where(axial, Cp_axial, power/(rho*(n*n*n)*(D*D*D*D*D)))
   
         # torque coefficient 
         Cq = torque/(rho*(n*n)*(D*D*D*D)*R) 
@@ -489,7 +404,7 @@ class Propeller(Energy_Component):
             if len(a_loc) != N:
                 raise AssertionError('Dimension of airfoil sections must be equal to number of stations on propeller')            
             # compute airfoil polars for airfoils 
-            airfoil_polars = compute_airfoil_polars(self,conditions, a_pol)
+            airfoil_polars = cached_airfoil_polars(self, a_geo, a_pol)
             airfoil_cl     = airfoil_polars.lift_coefficients
             airfoil_cd     = airfoil_polars.drag_coefficients
             AoA_sweep      = airfoil_polars.angle_of_attacks
@@ -500,6 +415,7 @@ class Propeller(Energy_Component):
             chi     = chi[0:N] 
          
         nu      = mu/rho          
+        tol     = 1e-6                     # Convergence tolerance  
         lamda   = V/(omega*R)              # Speed ratio
         r       = chi*R                    # Radial coordinate
         pi      = np.pi
@@ -512,103 +428,21 @@ class Propeller(Energy_Component):
         Ut      = omegar - ut
         U       = np.sqrt(Ua*Ua + Ut*Ut)
                 
-        #Things that will change with iteration
-        size = (len(a),N)
-        Cl = np.zeros((1,N))  
-    
-        #Setup a Newton iteration
-        psi    = np.ones(size)
-        psiold = np.zeros(size)
-        diff   = 1.
-        
-        ii    = 0
-        broke = False  
-        tol   = 1e-6    # Convergence tolerance  
-        while (diff>tol):
-            sin_psi = np.sin(psi)
-            cos_psi = np.cos(psi)
-            Wa      = 0.5*Ua + 0.5*U*sin_psi
-            Wt      = 0.5*Ut + 0.5*U*cos_psi   
-            va      = Wa - Ua
-            vt      = Ut - Wt
-            alpha   = beta - np.arctan2(Wa,Wt)
-            W       = (Wa*Wa + Wt*Wt)**0.5
-            Ma      = (W)/a #a is the speed of sound  
-            lamdaw  = r*Wa/(R*Wt)
-            
-            # Limiter to keep from Nan-ing
-            lamdaw[lamdaw<0.] = 0.
-            
-            f            = (B/2.)*(1.-r/R)/lamdaw
-            piece        = np.exp(-f)
-            arccos_piece = np.arccos(piece)
-            F            = 2.*arccos_piece/pi
-            Gamma        = vt*(4.*pi*r/B)*F*(1.+(4.*lamdaw*R/(pi*B*r))*(4.*lamdaw*R/(pi*B*r)))**0.5
-            
-            # Estimate Cl max
-            Re         = (W*c)/nu 
-            Cl_max_ref = -0.0009*tc**3 + 0.0217*tc**2 - 0.0442*tc + 0.7005
-            Re_ref     = 9.*10**6      
-            Cl1maxp    = Cl_max_ref * ( Re / Re_ref ) **0.1
-            
-            # Compute blade CL distribution from the airfoil data 
-            if  a_pol != None and a_loc != None: 
-                for k in range(N):
-                    Cl[0,k] = np.interp(alpha[0,k],AoA_sweep,airfoil_cl[a_loc[k]])
-            else:
-                # If not airfoil polar provided, use 2*pi as lift curve slope
-                Cl = 2.*pi*alpha
-            
-            # By 90 deg, it's totally stalled.
-            Cl[alpha>=pi/2] = 0.
-
-            # Scale for Mach, this is Karmen_Tsien
-            Cl[Ma[:,:]<1.] = Cl[Ma[:,:]<1.]/((1-Ma[Ma[:,:]<1.]*Ma[Ma[:,:]<1.])**0.5+((Ma[Ma[:,:]<1.]*Ma[Ma[:,:]<1.])/(1+(1-Ma[Ma[:,:]<1.]*Ma[Ma[:,:]<1.])**0.5))*Cl[Ma<1.]/2)
-
-            # If the blade segments are supersonic, don't scale
-            Cl[Ma[:,:]>=1.] = Cl[Ma[:,:]>=1.] 
-
-            Rsquiggly = Gamma - 0.5*W*c*Cl
-            
-            #An analytical derivative for dR_dpsi, this is derived by taking a derivative of the above equations
-            #This was solved symbolically in Matlab and exported        
-            f_wt_2 = 4*Wt*Wt
-            f_wa_2 = 4*Wa*Wa
-            Ucospsi  = U*cos_psi
-            Usinpsi  = U*sin_psi
-            Utcospsi = Ut*cos_psi
-            Uasinpsi = Ua*sin_psi
-            
-            UapUsinpsi = (Ua + Usinpsi)
-            utpUcospsi = (Ut + Ucospsi)
-            
-            utpUcospsi2 = utpUcospsi*utpUcospsi
-            UapUsinpsi2 = UapUsinpsi*UapUsinpsi
-            
-            dR_dpsi = ((4.*U*r*arccos_piece*sin_psi*((16.*UapUsinpsi2)/(BB*pi2*f_wt_2) + 1.)**(0.5))/B - 
-                       (pi*U*(Ua*cos_psi - Ut*sin_psi)*(beta - np.arctan((Wa+Wa)/(Wt+Wt))))/(2.*(f_wt_2 + f_wa_2)**(0.5))
-                       + (pi*U*(f_wt_2 +f_wa_2)**(0.5)*(U + Utcospsi  +  Uasinpsi))/(2.*(f_wa_2/(f_wt_2) + 1.)*utpUcospsi2)
-                       - (4.*U*piece*((16.*UapUsinpsi2)/(BB*pi2*f_wt_2) + 1.)**(0.5)*(R - r)*(Ut/2. - 
-                      (Ucospsi)/2.)*(U + Utcospsi + Uasinpsi ))/(f_wa_2*(1. - np.exp(-(B*(Wt+Wt)*(R - 
-                       r))/(r*(Wa+Wa))))**(0.5)) + (128.*U*r*arccos_piece*(Wa+Wa)*(Ut/2. - (Ucospsi)/2.)*(U + 
-                       Utcospsi  + Uasinpsi ))/(BBB*pi2*utpUcospsi*utpUcospsi2*((16.*f_wa_2)/(BB*pi2*f_wt_2) + 1.)**(0.5))) 
-            
-            dR_dpsi[np.isnan(dR_dpsi)] = 0.1
-                      
-            dpsi   = -Rsquiggly/dR_dpsi
-            psi    = psi + dpsi
-            diff   = np.max(abs(psiold-psi))
-            psiold = psi
-            
-            # If its really not going to converge
-            if np.any(psi>(pi*85.0/180.)) and np.any(dpsi>0.0):
-                break
-                
-            ii+=1
-                
-            if ii>2000:
-                broke = True
-                break
+        # Converge the inflow angle of every control point independently
+        if  a_pol != None and a_loc != None:
+            polars = Data(angle_of_attacks = AoA_sweep, lift_coefficients = airfoil_cl, stations = a_loc)
+        else:
+            polars = None
+        blade = converge_blade_inflow(Ua,Ut,U,beta,r,c,R,B,nu,a,tc,polars,tol,limit_cl=False)
+        Wa    = blade.Wa
+        Wt    = blade.Wt
+        va    = blade.va
+        vt    = blade.vt
+        alpha = blade.alpha
+        Ma    = blade.Ma
+        Re    = blade.Re
+        Gamma = blade.Gamma
+        Cl    = blade.Cl
         
         #There is also RE scaling
         #This is an atrocious fit of DAE51 data at RE=50k for Cd
@@ -633,16 +467,13 @@ class Propeller(Energy_Component):
         Ct[Ct<0] = 0.        #prevent things from breaking
         kappa    = self.induced_power_factor 
         Cd0      = self.profile_drag_coefficient   
-        Cp       = np.zeros_like(Ct)
-        power    = np.zeros_like(Ct)        
-        for i in range(len(Vv)):
-            if -1. <Vv[i][0] <1.: # vertical/axial flight
-                Cp[i]       = (kappa*(Ct[i]**1.5)/(2**.5))+sigma*Cd0/8.
-                power[i]    = Cp[i]*(rho[i]*(n[i]*n[i]*n[i])*(D*D*D*D*D))
-                torque[i]   = power[i]/omega[i]  
-            else:  
-                power[i]    = torque[i]*omega[i]   
-                Cp[i]       = power[i]/(rho[i]*(n[i]*n[i]*n[i])*(D*D*D*D*D))
+        
+        # vertical/axial flight uses momentum theory for the power
+        axial    = np.logical_and(-1. < Vv[:,0,None], Vv[:,0,None] < 1.)
+        Cp_axial = (kappa*(Ct**1.5)/(2**.5))+sigma*Cd0/8.
+        power    = np.where(axial, Cp_axial*(rho*(n*n*n)*(D*D*D*D*D)), torque*omega)
+        torque   = np.where(axial, power/omega, torque)
+        Cp       = np.where(axial, Cp_axial, power/(rho*(n*n*n)*(D*D*D*D*D)))
 
         # torque coefficient 
         Cq = torque/(rho*(n*n)*(D*D*D*D)*R) 
@@ -691,6 +522,298 @@ class Propeller(Energy_Component):
             mid_chord_aligment               = self.mid_chord_aligment     
         ) 
         
-        return thrust, torque, power, Cp, outputs  , etap  
+        return thrust, torque, power, Cp, outputs  , etap
+    
+    def compute_performance_map(self,omega,velocity,altitude,atmosphere=None):
+        """Runs spin at every combination of angular velocity, freestream velocity and altitude in a
+        single call, for example to build a propeller map.
+
+        Assumptions:
+        Axial freestream, full throttle
+
+        Source:
+        N/A
+
+        Inputs:
+        omega                        [radian/s]  (n_omega)
+        velocity                     [m/s]       (n_velocity)
+        altitude                     [m]         (n_altitude)
+        atmosphere                   atmosphere analysis, US_Standard_1976 by default
+
+        Outputs:
+        results.
+          omega, velocity, altitude  the grid    (n_omega, n_velocity, n_altitude)
+          thrust                     [N]         (n_omega, n_velocity, n_altitude)
+          torque                     [Nm]
+          power                      [W]
+          power_coefficient          [-]
+          efficiency                 [-]
+
+        Properties Used:
+        Same as spin
+        """
+
+        if atmosphere is None:
+            from SUAVE.Analyses.Atmospheric import US_Standard_1976
+            atmosphere = US_Standard_1976()
+
+        omega    = np.atleast_1d(np.array(omega,dtype=float))
+        velocity = np.atleast_1d(np.array(velocity,dtype=float))
+        altitude = np.atleast_1d(np.array(altitude,dtype=float))
+        grid     = np.meshgrid(omega,velocity,altitude,indexing='ij')
+        shape    = grid[0].shape
+        n_points = grid[0].size
+        
+        atmo_data = atmosphere.compute_values(grid[2].reshape((-1,1)))
+        
+        conditions                                   = Data()
+        conditions.freestream                        = Data()
+        conditions.propulsion                        = Data()
+        conditions.frames                            = Data()
+        conditions.frames.body                       = Data()
+        conditions.frames.inertial                   = Data()
+        conditions.freestream.density                = atmo_data.density
+        conditions.freestream.dynamic_viscosity      = atmo_data.dynamic_viscosity
+        conditions.freestream.speed_of_sound         = atmo_data.speed_of_sound
+        conditions.freestream.temperature            = atmo_data.temperature
+        conditions.frames.inertial.velocity_vector   = np.zeros((n_points,3))
+        conditions.frames.inertial.velocity_vector[:,0] = grid[1].flatten()
+        conditions.frames.body.transform_to_inertial = np.tile(np.eye(3),(n_points,1,1))
+        conditions.propulsion.throttle               = np.ones((n_points,1))
+        
+        omega_input       = self.inputs.omega if 'omega' in self.inputs else None
+        self.inputs.omega = grid[0].reshape((-1,1))
+        try:
+            thrust, torque, power, Cp, outputs, etap = self.spin(conditions)
+        finally:
+            self.inputs.omega = omega_input
+        
+        results                   = Data()
+        results.omega             = grid[0]
+        results.velocity          = grid[1]
+        results.altitude          = grid[2]
+        results.thrust            = thrust.reshape(shape)
+        results.torque            = torque.reshape(shape)
+        results.power             = power.reshape(shape)
+        results.power_coefficient = Cp.reshape(shape)
+        results.efficiency        = etap.reshape(shape)
+        
+        return results
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+## @ingroup Components-Energy-Converters
+def converge_blade_inflow(Ua,Ut,U,beta,r,c,R,B,nu,a,tc,polars=None,tol=1e-5,limit_cl=True,max_iterations=2000):
+    """Solves for the inflow angle psi at every blade station of every control point with a Newton
+    iteration. Each control point converges independently: once a point has converged, or is clearly
+    not going to converge, it is removed from the iteration and keeps its last evaluated blade state.
+
+    Assumptions:
+    per source
+
+    Source:
+    Drela, M. "Qprop Formulation", MIT AeroAstro, June 2006
+    http://web.mit.edu/drela/Public/web/qprop/qprop_theory.pdf
+
+    Inputs:
+    Ua, Ut, U          [m/s]       (n_points, n_stations)
+    beta               [radians]   twist, (n_stations) or (n_points, n_stations)
+    r                  [m]         (n_stations)
+    c                  [m]         (n_stations)
+    R                  [m]
+    B                  [-]
+    nu                 [m^2/s]     (n_points, 1)
+    a                  [m/s]       (n_points, 1)
+    tc                 [-]
+    polars.            (optional)
+      angle_of_attacks [radians]
+      lift_coefficients[-]
+      stations         [-]
+    tol                [radians]
+    limit_cl           <boolean>   clip the lift coefficient at the estimated Cl max
+    max_iterations     [-]
+
+    Outputs:
+    blade.
+      Wa, Wt, va, vt   [m/s]       (n_points, n_stations)
+      alpha            [radians]
+      Ma               [-]
+      Re               [-]
+      Gamma            [m^2/s]
+      Cl               [-]
+      psi              [radians]
+      iterations       [-]         (n_points)
+
+    Properties Used:
+    N/A
+    """
+
+    size     = np.shape(Ua)
+    n_points = size[0]
+    beta     = np.broadcast_to(beta, size)
+    nu       = np.broadcast_to(nu, (n_points,1))
+    a        = np.broadcast_to(a, (n_points,1))
+
+    #Setup a Newton iteration
+    psi        = np.ones(size)
+    psiold     = np.zeros(size)
+    iterations = np.zeros(n_points, dtype=int)
+    blade      = Data()
+    for key in ['Wa','Wt','va','vt','alpha','Ma','Re','Gamma','Cl']:
+        blade[key] = np.zeros(size)
+
+    active = np.arange(n_points)
+    ii     = 0
+    while len(active):
+        rows  = active
+        state = compute_blade_residual(psi[rows],Ua[rows],Ut[rows],U[rows],beta[rows],r,c,R,B,nu[rows],a[rows],
+                                       tc,polars,limit_cl)
+
+        # keep the last evaluated state of every point
+        for key in blade.keys():
+            blade[key][rows] = state[key]
+
+        dpsi         = -state.Rsquiggly/state.dR_dpsi
+        psi[rows]    = psi[rows] + dpsi
+        diff         = np.max(abs(psiold[rows]-psi[rows]),axis=1)
+        psiold[rows] = psi[rows]
+
+        iterations[rows] += 1
+        ii += 1
+        if ii>max_iterations:
+            break
+
+        # If its really not going to converge
+        diverging = np.logical_and(np.any(psi[rows]>(np.pi*85.0/180.),axis=1), np.any(dpsi>0.0,axis=1))
+
+        active = rows[np.logical_and(diff>tol, np.logical_not(diverging))]
+
+    blade.psi        = psi
+    blade.iterations = iterations
+
+    return blade
+
+## @ingroup Components-Energy-Converters
+def compute_blade_residual(psi,Ua,Ut,U,beta,r,c,R,B,nu,a,tc,polars=None,limit_cl=True):
+    """Evaluates the blade state, the circulation residual and its analytical derivative for a given
+    inflow angle psi.
+
+    Assumptions:
+    per source
+
+    Source:
+    Drela, M. "Qprop Formulation", MIT AeroAstro, June 2006
+    http://web.mit.edu/drela/Public/web/qprop/qprop_theory.pdf
+
+    Inputs:
+    see converge_blade_inflow, every array has one row per control point
+    psi                [radians]   (n_points, n_stations)
+
+    Outputs:
+    state.
+      Wa, Wt, va, vt   [m/s]
+      alpha            [radians]
+      Ma               [-]
+      Re               [-]
+      Gamma            [m^2/s]
+      Cl               [-]
+      Rsquiggly        [m^2/s]
+      dR_dpsi          [m^2/s]
+
+    Properties Used:
+    N/A
+    """
+
+    pi  = np.pi
+    pi2 = pi*pi
+    BB  = B*B
+    BBB = BB*B
+
+    sin_psi = np.sin(psi)
+    cos_psi = np.cos(psi)
+    Wa      = 0.5*Ua + 0.5*U*sin_psi
+    Wt      = 0.5*Ut + 0.5*U*cos_psi   
+    va      = Wa - Ua
+    vt      = Ut - Wt
+    alpha   = beta - np.arctan2(Wa,Wt)
+    W       = (Wa*Wa + Wt*Wt)**0.5
+    Ma      = (W)/a #a is the speed of sound 
+    
+    lamdaw = r*Wa/(R*Wt)
+    
+    # Limiter to keep from Nan-ing
+    lamdaw[lamdaw<0.] = 0.
+    
+    f            = (B/2.)*(1.-r/R)/lamdaw
+    piece        = np.exp(-f)
+    arccos_piece = np.arccos(piece)
+    F            = 2.*arccos_piece/pi
+    Gamma        = vt*(4.*pi*r/B)*F*(1.+(4.*lamdaw*R/(pi*B*r))*(4.*lamdaw*R/(pi*B*r)))**0.5
+    
+    # Estimate Cl max
+    Re         = (W*c)/nu 
+    Cl_max_ref = -0.0009*tc**3 + 0.0217*tc**2 - 0.0442*tc + 0.7005
+    Re_ref     = 9.*10**6      
+    Cl1maxp    = Cl_max_ref * ( Re / Re_ref ) **0.1
+    
+    # Compute blade CL distribution from the airfoil data 
+    if polars is not None:
+        Cl = interpolate_airfoil_polars(alpha,polars.angle_of_attacks,polars.lift_coefficients,polars.stations)
+    else:
+        # If not airfoil polar provided, use 2*pi as lift curve slope
+        Cl = 2.*pi*alpha
+    
+    # By 90 deg, it's totally stalled.
+    if limit_cl:
+        Cl[Cl>Cl1maxp]  = Cl1maxp[Cl>Cl1maxp] # This line of code is what changed the regression testing
+    Cl[alpha>=pi/2] = 0.
+        
+    # Scale for Mach, this is Karmen_Tsien
+    Cl[Ma[:,:]<1.] = Cl[Ma[:,:]<1.]/((1-Ma[Ma[:,:]<1.]*Ma[Ma[:,:]<1.])**0.5+((Ma[Ma[:,:]<1.]*Ma[Ma[:,:]<1.])/(1+(1-Ma[Ma[:,:]<1.]*Ma[Ma[:,:]<1.])**0.5))*Cl[Ma<1.]/2)
+
+    # If the blade segments are supersonic, don't scale
+    Cl[Ma[:,:]>=1.] = Cl[Ma[:,:]>=1.] 
+
+    Rsquiggly = Gamma - 0.5*W*c*Cl
+    
+    #An analytical derivative for dR_dpsi, this is derived by taking a derivative of the above equations
+    #This was solved symbolically in Matlab and exported        
+    f_wt_2 = 4*Wt*Wt
+    f_wa_2 = 4*Wa*Wa
+    Ucospsi  = U*cos_psi
+    Usinpsi  = U*sin_psi
+    Utcospsi = Ut*cos_psi
+    Uasinpsi = Ua*sin_psi
+    
+    UapUsinpsi = (Ua + Usinpsi)
+    utpUcospsi = (Ut + Ucospsi)
+    
+    utpUcospsi2 = utpUcospsi*utpUcospsi
+    UapUsinpsi2 = UapUsinpsi*UapUsinpsi
+    
+    dR_dpsi = ((4.*U*r*arccos_piece*sin_psi*((16.*UapUsinpsi2)/(BB*pi2*f_wt_2) + 1.)**(0.5))/B - 
+               (pi*U*(Ua*cos_psi - Ut*sin_psi)*(beta - np.arctan((Wa+Wa)/(Wt+Wt))))/(2.*(f_wt_2 + f_wa_2)**(0.5))
+               + (pi*U*(f_wt_2 +f_wa_2)**(0.5)*(U + Utcospsi  +  Uasinpsi))/(2.*(f_wa_2/(f_wt_2) + 1.)*utpUcospsi2)
+               - (4.*U*piece*((16.*UapUsinpsi2)/(BB*pi2*f_wt_2) + 1.)**(0.5)*(R - r)*(Ut/2. - 
+              (Ucospsi)/2.)*(U + Utcospsi + Uasinpsi ))/(f_wa_2*(1. - np.exp(-(B*(Wt+Wt)*(R - 
+               r))/(r*(Wa+Wa))))**(0.5)) + (128.*U*r*arccos_piece*(Wa+Wa)*(Ut/2. - (Ucospsi)/2.)*(U + 
+               Utcospsi  + Uasinpsi ))/(BBB*pi2*utpUcospsi*utpUcospsi2*((16.*f_wa_2)/(BB*pi2*f_wt_2) + 1.)**(0.5))) 
+    
+    dR_dpsi[np.isnan(dR_dpsi)] = 0.1
+
+    state = Data()
+    state.Wa        = Wa
+    state.Wt        = Wt
+    state.va        = va
+    state.vt        = vt
+    state.alpha     = alpha
+    state.Ma        = Ma
+    state.Re        = Re
+    state.Gamma     = Gamma
+    state.Cl        = Cl
+    state.Rsquiggly = Rsquiggly
+    state.dR_dpsi   = dR_dpsi
 
- 
+    return state
@@ -5,6 +5,7 @@
 # Modified: Jan 2016, T. MacDonald
 #           Feb 2019, M. Vegh            
 #           Mar 2020, M. Clarke
+#           Oct 2026, SUAVE Team
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
@@ -15,8 +16,7 @@ import scipy as sp
 from SUAVE.Components.Energy.Energy_Component import Energy_Component
 from SUAVE.Core import Data, Units
 import scipy.optimize as opt
-from scipy.optimize import fsolve
-from SUAVE.Methods.Geometry.Two_Dimensional.Cross_Section.Airfoil.compute_airfoil_polars import compute_airfoil_polars
+from SUAVE.Methods.Geometry.Two_Dimensional.Cross_Section.Airfoil.compute_airfoil_polars import cached_airfoil_polars, interpolate_airfoil_polars
 from SUAVE.Methods.Geometry.Three_Dimensional \
      import angles_to_dcms, orientation_product, orientation_transpose
 
@@ -176,32 +176,10 @@ class Rotor(Energy_Component):
         # Now just use the aligned velocity
         V = V_thrust[:,0,None]
         
-        ua = np.zeros_like(V)
-        power_ratio = np.zeros_like(V)
         if Vh != None:   
-            for i in range(len(V)):
-                V_inf = V_thrust[i] 
-                V_Vh =  V_thrust[i][0]/Vh
-            
-                if Vv[i,:].all()  == 0 :
-                    ua[i] = Vh
-                elif Vv[i][0]  == 0 and  Vv[i][2] != 0: # vertical / axial flight
-                    if V_Vh > 0: # climbing 
-                        ua[i] =Vh*(-.5*V_Vh+np.sqrt((.5*V_Vh)**2+1)) #Vh*(-(-V_inf[0]/(2*Vh)) + np.sqrt((-V_inf[0]/(2*Vh))**2 + 1))
-                        
-                    elif -2 <= V_Vh and V_Vh <= 0:  # slow descent                 
-                        ua[i] = Vh*(1.15-V_Vh)#Vh*(1.15 -1.125*(V_Vh) - 1.372*(V_Vh)**2 - 1.718*(V_Vh)**2 - 0.655*(V_Vh)**4 ) 
-                    else: # windmilling 
-                        print("rotor is in the windmill break state!")
-                        ua[i] = Vh*(-(-V_inf[0]/(2*Vh)) - np.sqrt((-V_inf[0]/(2*Vh))**2 + 1))
-                
-                
-                else: # forward flight conditions                 
-                    func = lambda vi: vi - (Vh**2)/(np.sqrt(((-V_inf[2])**2 + (V_inf[0] + vi)**2)))
-                    vi_initial_guess = V_inf[0]
-                    ua[i]    = fsolve(func,vi_initial_guess)
-           
-                power_ratio[i] = ua[i]/Vh+V_Vh 
+            hover = np.any(Vv == 0, axis=1)
+            axial = np.logical_and(Vv[:,0] == 0, Vv[:,2] != 0) # vertical / axial flight
+            ua    = compute_induced_velocity(V_thrust, Vh, hover, axial)
         else: 
             ua = 0.0 
         
@@ -219,7 +197,7 @@ class Rotor(Energy_Component):
             if len(a_loc) != N:
                 raise AssertionError('Dimension of airfoil sections must be equal to number of stations on rotor')
             # compute airfoil polars for airfoils 
-            airfoil_polars = compute_airfoil_polars(self, a_geo, a_pol)
+            airfoil_polars = cached_airfoil_polars(self, a_geo, a_pol)
             airfoil_cl     = airfoil_polars.lift_coefficients
             airfoil_cd     = airfoil_polars.drag_coefficients
             AoA_sweep      = airfoil_polars.angle_of_attacks
@@ -283,8 +261,7 @@ class Rotor(Energy_Component):
             
             # Compute blade CL distribution from the airfoil data 
             if  a_pol != None and a_loc != None: 
-                for k in range(N):
-                    Cl[0,k] = np.interp(alpha[0,k],AoA_sweep,airfoil_cl[a_loc[k]])
+                Cl = interpolate_airfoil_polars(alpha,AoA_sweep,airfoil_cl,a_loc)
             else:
                 # If not airfoil polar provided, use 2*pi as lift curve slope
                 Cl = 2.*pi*alpha
@@ -531,27 +508,13 @@ class Rotor(Energy_Component):
         
         # Now just use the aligned velocity
         V     = V_thrust[:,0,None] 
-        V_inf = V_thrust   
         ua    = np.zeros_like(V)
         ut    = np.zeros_like(V)
         
         if Vh != None:     
-            for i in range(len(V)): 
-                V_Vh =  V_thrust[i][0]/Vh
-                if Vv[i,:].all()  == True :
-                    ua[i] = Vh
-                elif Vv[i][0]  == 0 and  Vv[i][2] != 0: # vertical / axial flight
-                    if V_Vh > 0: # climbing 
-                        ua[i] = Vh*(-(-V_inf[i][0]/(2*Vh)) + np.sqrt((-V_inf[i][0]/(2*Vh))**2 + 1))
-                    elif -2 <= V_Vh and V_Vh <= 0:  # slow descent                 
-                        ua[i] = Vh*(1.15 -1.125*(V_Vh) - 1.372*(V_Vh)**2 - 1.718*(V_Vh)**2 - 0.655*(V_Vh)**4 ) 
-                    else: # windmilling 
-                        print("rotor is in the windmill break state!")
-                        ua[i] = Vh*(-(-V_inf[i][0]/(2*Vh)) - np.sqrt((-V_inf[i][0]/(2*Vh))**2 + 1))
-                else: # forward flight conditions                 
-                    func = lambda vi: vi - (Vh**2)/(np.sqrt(((-V_inf[i][2])**2 + (V_inf[i][0] + vi)**2)))
-                    vi_initial_guess = V_inf[i][0]
-                    ua[i]    = fsolve(func,vi_initial_guess)
+            hover = np.all(Vv != 0, axis=1)
+            axial = np.logical_and(Vv[:,0] == 0, Vv[:,2] != 0) # vertical / axial flight
+            ua    = compute_induced_velocity(V_thrust, Vh, hover, axial)
             lambda_i      = ua/(omega*R)
  
         #Things that don't change with iteration
@@ -563,7 +526,7 @@ class Rotor(Energy_Component):
             if len(a_loc) != N:
                 raise AssertionError('Dimension of airfoil sections must be equal to number of stations on rotor')
             # compute airfoil polars for airfoils 
-            airfoil_polars = compute_airfoil_polars(self, a_geo, a_pol)
+            airfoil_polars = cached_airfoil_polars(self, a_geo, a_pol)
             airfoil_cl     = airfoil_polars.lift_coefficients
             airfoil_cd     = airfoil_polars.drag_coefficients
             AoA_sweep      = airfoil_polars.angle_of_attacks
@@ -629,8 +592,7 @@ class Rotor(Energy_Component):
             
             # Compute blade CL distribution from the airfoil data 
             if  a_pol != None and a_loc != None: 
-                for k in range(N):
-                    Cl[0,k] = np.interp(alpha[0,k],AoA_sweep,airfoil_cl[a_loc[k]])
+                Cl = interpolate_airfoil_polars(alpha,AoA_sweep,airfoil_cl,a_loc)
             else:
                 # If not airfoil polar provided, use 2*pi as lift curve slope
                 Cl = 2.*pi*alpha
@@ -777,4 +739,81 @@ class Rotor(Energy_Component):
         ) 
         
         return thrust, torque, power, Cp, outputs , etap
- 
\ No newline at end of file
+ 
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+## @ingroup Components-Energy-Converters
+def compute_induced_velocity(V_thrust,Vh,hover,axial,tol=1e-10,iterations=50):
+    """Computes the momentum theory induced velocity of a rotor at every control point at once.
+    Hover, axial climb, slow descent and the windmill brake state use closed form expressions,
+    forward flight is solved with a safeguarded Newton iteration over all points together.
+
+    Assumptions:
+    Points that are neither hovering nor in axial flight are in forward flight.
+    Forward flight points without velocity through or along the disk have no induced velocity.
+    The forward flight induced velocity is positive and bracketed by [0, Vh + |V_x|].
+
+    Source:
+    Johnson, W. "Helicopter Theory", Dover, 1994
+
+    Inputs:
+    V_thrust           [m/s]       velocity in the thrust frame, (n_points, 3)
+    Vh                 [m/s]       induced hover velocity
+    hover              <boolean>   (n_points)
+    axial              <boolean>   (n_points)
+    tol                [m/s]
+    iterations         [-]         maximum number of Newton iterations
+
+    Outputs:
+    ua                 [m/s]       (n_points, 1)
+
+    Properties Used:
+    N/A
+    """
+
+    V_x      = V_thrust[:,0]
+    V_z      = V_thrust[:,2]
+    V_Vh     = V_x/Vh
+    ua       = np.zeros_like(V_x)
+
+    axial    = np.logical_and(axial, np.logical_not(hover))
+    forward  = np.logical_not(np.logical_or(hover, axial))
+    climb    = np.logical_and(axial, V_Vh > 0)
+    descent  = np.logical_and(axial, np.logical_and(-2 <= V_Vh, V_Vh <= 0))
+    windmill = np.logical_and(axial, V_Vh < -2)
+
+    ua[hover]   = Vh
+    ua[climb]   = Vh*(V_Vh[climb]/2 + np.sqrt((V_Vh[climb]/2)**2 + 1))
+    x           = V_Vh[descent]
+    ua[descent] = Vh*(1.15 -1.125*(x) - 1.372*(x)**2 - 1.718*(x)**2 - 0.655*(x)**4 )
+    if np.any(windmill):
+        print("rotor is in the windmill break state!")
+        ua[windmill] = Vh*(V_Vh[windmill]/2 - np.sqrt((V_Vh[windmill]/2)**2 + 1))
+
+    # forward flight: vi = Vh^2/sqrt(V_z^2 + (V_x + vi)^2)
+    # without any velocity through or along the disk the iteration starts at the singular point,
+    # those points keep a zero induced velocity as in the original point by point solution
+    forward = np.logical_and(forward, np.logical_or(V_x != 0, V_z != 0))
+    V_x   = V_x[forward]
+    V_z   = V_z[forward]
+    lower = np.zeros_like(V_x)
+    upper = Vh + np.abs(V_x)
+    vi    = np.clip(V_x, lower, upper)
+    for ii in range(iterations):
+        s     = V_x + vi
+        d     = np.maximum(np.sqrt(V_z*V_z + s*s), 1e-12)
+        f     = vi - Vh*Vh/d
+        if np.all(np.abs(f) <= tol):
+            break
+        lower = np.where(f < 0., vi, lower)
+        upper = np.where(f > 0., vi, upper)
+
+        # take the Newton step unless it leaves the bracket, then bisect
+        vi_new = vi - f/(1. + Vh*Vh*s/(d*d*d))
+        inside = np.logical_and(vi_new > lower, vi_new < upper)
+        vi     = np.where(inside, vi_new, 0.5*(lower + upper))
+    ua[forward] = vi
+
+    return ua[:,None]
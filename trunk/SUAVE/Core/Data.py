@@ -3,6 +3,7 @@
 #
 # Created:  Jun 2016, E. Botero
 # Modified: Jan 2020, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #   Imports
@@ -16,7 +17,12 @@ t_table = str.maketrans( chars          + string.ascii_uppercase ,
                             '_'*len(chars) + string.ascii_lowercase )
 
 dictgetitem = dict.__getitem__
+dictget     = dict.get
 objgetattrib = object.__getattribute__
+objsetattrib = object.__setattr__
+
+# names resolved as object attributes, per class
+_class_attributes = {}
 
 # ----------------------------------------------------------------------
 #   Data
@@ -34,6 +40,9 @@ class Data(dict):
         Source:
         N/A
     """
+
+    # compiled pack_array layout, see Data_Layout
+    _layout = None
     
     def __getattribute__(self, k):
         """ Retrieves an attribute set by a key k
@@ -62,7 +71,9 @@ class Data(dict):
         """ An override of the standard __setattr_ in Python.
             
             Assumptions:
-            This one tries to treat k as an object, if that fails it treats it as a key.
+            This one treats k as an object if it is an attribute of the class, otherwise it treats it as a key.
+            The attributes of each class are looked up once, so attributes added to a class after 
+            its first instance has been set will be treated as keys.
     
             Source:
             N/A
@@ -77,12 +88,11 @@ class Data(dict):
             Properties Used:
             N/A    
         """
-        try:
-            objgetattrib(self, k)
-        except:
+        names = dictget(_class_attributes,type(self)) or class_attributes(type(self))
+        if k in names:
+            objsetattrib(self, k, v)
+        else:
             self[k] = v
-        else:          
-            object.__setattr__(self, k, v) 
             
     def __delattr__(self, k):
         """ An override of the standard __delattr_ in Python. This deletes whatever is called by k
@@ -579,14 +589,20 @@ class Data(dict):
         
         """
         
-        # dont require dict to have numpy
-        import numpy as np
-        from .Arrays import atleast_2d_col, array_type, matrix_type
-        
         # check output type
         if not output in ('vector','array'): raise Exception('output type must be "vector" or "array"')        
         vector = output == 'vector'
         
+        # use the compiled layout if it still fits
+        if vector:
+            layout = get_layout(self)
+            if layout.valid:
+                return layout.pack()
+        
+        # dont require dict to have numpy
+        import numpy as np
+        from .Arrays import atleast_2d_col, array_type, matrix_type
+        
         # list to pre-dump array elements
         M = []
         
@@ -666,13 +682,21 @@ class Data(dict):
         """           
 
         
+        # check input type
+        vector = M.ndim  == 1
+        
+        # use the compiled layout if it still fits
+        if vector:
+            layout = get_layout(self)
+            if layout.valid:
+                if not M.shape[-1] == layout.size: warn('did not unpack all values',RuntimeWarning)
+                layout.unpack(M)
+                return self
+        
         # dont require dict to have numpy
         import numpy as np
         from .Arrays import atleast_2d_col, array_type, matrix_type
         
-        # check input type
-        vector = M.ndim  == 1
-        
         # valid types for output
         valid_types = ( int, float,
                         array_type,
@@ -745,6 +769,28 @@ class Data(dict):
         # done!
         return self     
     
+    def get_layout(self):
+        """ returns the compiled layout used to pack and unpack vectors, 
+            compiling it again if the structure of the data has changed
+    
+            Assumptions:
+            N/A
+    
+            Source:
+            N/A
+    
+            Inputs:
+            N/A
+            
+            Outputs:
+            layout - Data_Layout of this data
+    
+            Properties Used:
+            N/A    
+        """
+        
+        return get_layout(self)
+    
     def do_recursive(self,method,other=None,default=None):
         """ Recursively applies a method of the class.
     
@@ -801,6 +847,32 @@ class Data(dict):
     
         return result
 
+# ----------------------------------------------------------------------
+#   Attributes
+# ----------------------------------------------------------------------
+
+def class_attributes(cls):
+    """ Finds the names an instance of a class resolves as object attributes, these are cached per class """
+    
+    names = _class_attributes[cls] = frozenset(dir(cls))
+        
+    return names
+
+# ----------------------------------------------------------------------
+#   Layout
+# ----------------------------------------------------------------------
+
+def get_layout(data):
+    """ Returns the cached Data_Layout of a Data, compiling a new one if the cached layout no longer fits """
+    
+    layout = objgetattrib(data,'_layout')
+    if layout is None or not layout.check(data):
+        from .Data_Layout import Data_Layout
+        layout = Data_Layout(data)
+        object.__setattr__(data,'_layout',layout)
+        
+    return layout
+
 # ----------------------------------------------------------------------
 #   Module Tests
 # ----------------------------------------------------------------------        
@@ -828,4 +900,5 @@ if __name__ == '__main__':
     m.value = 1.0
     
     print(m)
+    
     
\ No newline at end of file
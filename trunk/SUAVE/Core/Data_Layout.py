@@ -0,0 +1,257 @@
+## @ingroup Core
+# Data_Layout.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+dictgetitem = dict.__getitem__
+dictkeys    = dict.keys
+
+# scalars unpack as numpy floats
+float_types = (float, np.float64)
+
+# ----------------------------------------------------------------------
+#   Data Layout
+# ----------------------------------------------------------------------
+
+## @ingroup Core
+class Data_Layout(object):
+    """ A compiled map of the leaves Data.pack_array packs into a vector. The layout records every node,
+        and the key, slice and shape of every packed leaf once, so packing and unpacking become slice copies
+        into a preallocated vector instead of a recursive walk.
+
+        Assumptions:
+        Only the vector output of pack_array is compiled.
+        The layout is checked before every use and is only valid while the keys of every node, and the
+        class, shape and type of every leaf, are unchanged.
+
+        Source:
+        N/A
+    """
+
+    def __init__(self,data):
+        """ Compiles the layout of a Data
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            data   [Data]
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+
+        self.root     = data
+        self.nodes    = []  # (node, keys)
+        self.children = []  # (node, key, child)
+        self.leaves   = []  # (node, key, class, shape, dtype)
+        self.slices   = []  # (node, key, start, stop, transposed shape)
+        self.valid    = True
+
+        self._index = 0
+        self._compile(data)
+
+        self.size  = self._index
+        self.dtype = np.result_type(*[leaf[4] for leaf in self.leaves]) if self.leaves else None
+
+        del self._index
+
+    def _compile(self,node):
+        """ Records the nodes and leaves of a Data, in the order pack_array visits them
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            node   [dict]
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+
+        self.nodes.append((node, tuple(dictkeys(node))))
+
+        for key in dictkeys(node):
+            v = dictgetitem(node,key)
+
+            if isinstance(v, dict):
+                self.children.append((node, key, v))
+                self._compile(v)
+                continue
+
+            elif isinstance(v, np.matrix):
+                # matrices pack as rows, leave them to the recursive pack
+                self.valid = False
+                continue
+
+            elif isinstance(v, np.ndarray):
+                if v.ndim == 0:
+                    self.valid = False
+                    continue
+                elif v.ndim > 2:
+                    continue
+                shape = v.shape
+                dtype = v.dtype
+                size  = v.size
+
+            elif isinstance(v, (int, float)):
+                shape = ()
+                dtype = np.array(v).dtype
+                size  = 1
+
+            else:
+                continue
+
+            # the transpose of a column is a row, which copies straight into the vector,
+            # wider arrays are copied through a transposed view of their slice
+            if not shape:
+                transposed = False
+            elif len(shape) == 2 and shape[1] != 1:
+                transposed = (shape[1], shape[0])
+            else:
+                transposed = None
+
+            start = self._index
+            self._index += size
+            self.leaves.append((node, key, v.__class__, shape, dtype))
+            self.slices.append((node, key, start, self._index, transposed))
+
+    def check(self,data):
+        """ Checks that the layout still describes a Data
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            data   [Data]
+
+            Outputs:
+            valid  [bool]
+
+            Properties Used:
+            N/A
+        """
+
+        if not self.valid or not data is self.root:
+            return False
+
+        for node, keys in self.nodes:
+            if tuple(dictkeys(node)) != keys:
+                return False
+
+        for node, key, child in self.children:
+            if not dictgetitem(node,key) is child:
+                return False
+
+        for node, key, cls, shape, dtype in self.leaves:
+            v = dictgetitem(node,key)
+            if not v.__class__ is cls and not (cls in float_types and v.__class__ in float_types):
+                return False
+            if shape and (v.shape != shape or v.dtype != dtype):
+                return False
+
+        return True
+
+    def pack(self):
+        """ Packs the leaves into a 1D vector, the same as Data.pack_array()
+
+            Assumptions:
+            The layout has been checked
+
+            Source:
+            N/A
+
+            Inputs:
+            N/A
+
+            Outputs:
+            M      [array]
+
+            Properties Used:
+            N/A
+        """
+
+        if not self.leaves:
+            return np.array([])
+
+        M = np.empty(self.size, dtype=self.dtype)
+
+        for node, key, start, stop, transposed in self.slices:
+            if transposed is None:
+                M[start:stop] = dictgetitem(node,key).T
+            elif transposed is False:
+                M[start] = dictgetitem(node,key)
+            else:
+                M[start:stop].reshape(transposed)[:] = dictgetitem(node,key).T
+
+        return M
+
+    def unpack(self,M):
+        """ Copies a 1D vector back into the leaves, the same as Data.unpack_array()
+
+            Assumptions:
+            The layout has been checked
+
+            Source:
+            N/A
+
+            Inputs:
+            M      [array]
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+
+        for node, key, start, stop, transposed in self.slices:
+            if transposed is None:
+                dictgetitem(node,key).T[:] = M[start:stop]
+            elif transposed is False:
+                node[key] = M[start]
+            else:
+                dictgetitem(node,key).T[:] = M[start:stop].reshape(transposed)
+
+        return
+
+    def __deepcopy__(self,memo):
+        """ Layouts are not copied, a copied Data compiles its own
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            memo   [dict]
+
+            Outputs:
+            None
+
+            Properties Used:
+            N/A
+        """
+        return None
@@ -4,6 +4,7 @@
 from .Arrays import *
 
 from .Data             import Data
+from .Data_Layout      import Data_Layout
 from .DataOrdered      import DataOrdered
 from .Diffed_Data      import Diffed_Data
 from .Container        import Container
@@ -4,9 +4,11 @@
 # Created:  Oct 2016, T. MacDonald
 # Modified: Jan 2017, T. MacDonald
 #           Mar 2018, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 import subprocess
 from SUAVE.Core import Data
+from SUAVE.Input_Output.SU2.read_SU2_history import read_SU2_history
 import sys, os
 
 ## @ingroup Input_Output-SU2
@@ -41,17 +43,10 @@ def call_SU2_CFD(tag,parallel=False,processors=1):
     else:
         subprocess.call(['SU2_CFD',tag+'.cfg'])
         
-    f = open(tag + '_history.dat')
-        
     SU2_results = Data()    
     
-    lines = f.readlines()
-    final_state = lines[-1].split(',')
-    
     # Lift and Drag
-    
-    CL  = float(final_state[9])
-    CD  = float(final_state[8])
+    CL, CD = read_SU2_history(tag + '_history.dat')
     
     SU2_results.coefficient_of_lift  = CL
     SU2_results.coefficient_of_drag  = CD
@@ -0,0 +1,56 @@
+## @ingroup Input_Output-SU2
+# read_SU2_history.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+import os
+
+## @ingroup Input_Output-SU2
+def read_SU2_history(filename,block_size=4096):
+    """Reads the lift and drag coefficients from the last line of an SU2 history file. The file
+    is read backwards from its end, so the cost does not grow with the number of iterations.
+
+    Assumptions:
+    The history is comma separated with the drag and lift coefficients in columns 8 and 9.
+
+    Source:
+    N/A
+
+    Inputs:
+    filename                     <string>  SU2 history file, <tag>_history.dat
+    block_size (optional)        [bytes]   Size of the blocks read from the end of the file
+
+    Outputs:
+    CL                           [-]
+    CD                           [-]
+
+    Properties Used:
+    N/A
+    """
+
+    with open(filename,'rb') as f:
+        f.seek(0,os.SEEK_END)
+        position = f.tell()
+        tail     = b''
+        lines    = []
+
+        # read blocks until the last line is known to be complete
+        while position > 0:
+            step      = min(block_size,position)
+            position -= step
+            f.seek(position)
+            tail      = f.read(step) + tail
+            lines     = tail.strip().splitlines()
+            if len(lines) > 1:
+                break
+
+    if len(lines) == 0:
+        raise ValueError('The SU2 history file ' + filename + ' is empty')
+
+    final_state = lines[-1].decode().split(',')
+
+    # Lift and Drag
+    CL  = float(final_state[9])
+    CD  = float(final_state[8])
+
+    return CL, CD
@@ -0,0 +1,207 @@
+## @ingroup Input_Output-SU2
+# run_SU2_cases.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+import os
+import subprocess
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+
+from SUAVE.Core import redirect
+from SUAVE.Input_Output.SU2.write_SU2_cfg    import write_SU2_cfg
+from SUAVE.Input_Output.SU2.read_SU2_history import read_SU2_history
+
+## @ingroup Input_Output-SU2
+def run_SU2_cases(tag,cases,settings):
+    """Runs a set of SU2 cases, each with its own configuration and output folder. Several cases
+    run at the same time and the processor budget is split between them. Cases with results
+    from a previous run with the same configuration are not run again, so an interrupted set
+    of cases can be resumed.
+
+    Assumptions:
+    The mesh <tag>.su2 is in the current working directory and is linked into each case folder.
+    The mesh is the same as in the previous run when results are reused.
+
+    Source:
+    N/A
+
+    Inputs:
+    tag                          <string>  Name of the mesh, .cfg and history files
+    cases                        list of Data, one per SU2 run
+      folder                     <string>  Case folder, created if needed
+      SU2_settings               see write_SU2_cfg
+    settings.
+      parallel                   <boolean> Run each case with MPI when it has more than one processor
+      processors                 [-]       Total number of processors for all of the cases
+      concurrent_cases           [-]       Number of cases run at the same time
+      SU2_CFD_command            <string>  SU2_CFD executable
+      mpi_command                <string>  MPI launcher, called as <mpi_command> -n <processors>
+      run_timeout                [s]       A case running longer is stopped, None for no limit
+
+    Outputs:
+    CL                           [-]       In the order of the cases
+    CD                           [-]
+    <folder>/<tag>_history.dat   SU2 convergence history of each case
+    <folder>/<tag>_results.dat   CL and CD of each finished case
+
+    Properties Used:
+    N/A
+    """
+
+    workers, case_processors = split_processors(settings.processors,settings.concurrent_cases,settings.parallel)
+    command   = SU2_CFD_command(tag,case_processors,settings)
+    mesh_file = tag + '.su2'
+
+    # write the configuration of every case, cases with the results of the same configuration are skipped
+    pending = []
+    for case in cases:
+        link = [mesh_file] if os.path.exists(mesh_file) else []
+        with redirect.folder(case.folder,link=link,force=False):
+            previous = read_file(tag + '.cfg')
+            write_SU2_cfg(tag,case.SU2_settings)
+            if previous == read_file(tag + '.cfg') and os.path.exists(tag + '_results.dat'):
+                continue
+            purge_file(tag + '_results.dat')
+        pending.append(case)
+
+    # the SU2 processes do the work, threads only wait on them
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures  = [executor.submit(run_SU2_case,command,tag,os.path.abspath(case.folder),settings.run_timeout) for case in pending]
+        finished = [future.result() for future in futures]
+
+    failed = [case.folder for case, done in zip(pending,finished) if not done]
+    if failed:
+        raise Exception('SU2 did not finish the cases in ' + ', '.join(failed))
+
+    CL = np.zeros(len(cases))
+    CD = np.zeros(len(cases))
+    for i, case in enumerate(cases):
+        CL[i], CD[i] = np.loadtxt(os.path.join(case.folder,tag + '_results.dat'))
+
+    return CL, CD
+
+## @ingroup Input_Output-SU2
+def split_processors(processors,concurrent_cases,parallel=True):
+    """Splits a processor budget between cases run at the same time and the MPI processes of
+    each case.
+
+    Assumptions:
+    Processors left over by an uneven split are not used.
+
+    Source:
+    N/A
+
+    Inputs:
+    processors                   [-]       Total number of processors
+    concurrent_cases             [-]       Number of cases run at the same time
+    parallel                     <boolean> Cases may use more than one processor
+
+    Outputs:
+    workers                      [-]       Number of cases run at the same time
+    case_processors              [-]       Number of processors of each case
+
+    Properties Used:
+    N/A
+    """
+
+    workers = max(1,int(concurrent_cases))
+    if parallel:
+        case_processors = max(1,int(processors)//workers)
+    else:
+        case_processors = 1
+
+    return workers, case_processors
+
+## @ingroup Input_Output-SU2
+def SU2_CFD_command(tag,processors,settings):
+    """Builds the command line that runs SU2_CFD on one case.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    tag                          <string>  Name of the .cfg file
+    processors                   [-]       Number of MPI processes
+    settings.
+      SU2_CFD_command            <string>
+      mpi_command                <string>
+
+    Outputs:
+    command                      <list>
+
+    Properties Used:
+    N/A
+    """
+
+    # a relative path to the executable would change with the case folder
+    executable = settings.SU2_CFD_command
+    if os.path.dirname(executable):
+        executable = os.path.abspath(executable)
+
+    command = [executable,tag + '.cfg']
+    if processors > 1:
+        command = settings.mpi_command.split() + ['-n',str(processors)] + command
+
+    return command
+
+def run_SU2_case(command,tag,folder,timeout=None):
+    """Runs SU2 in a case folder and stores the final lift and drag coefficients of the history.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    command                      <list>    SU2_CFD command line
+    tag                          <string>
+    folder                       <string>  Absolute path of the case folder
+    timeout                      [s]
+
+    Outputs:
+    finished                     <boolean>
+    <folder>/<tag>_results.dat
+
+    Properties Used:
+    N/A
+    """
+
+    try:
+        with open(os.path.join(folder,tag + '_SU2.log'),'wb') as log:
+            exit_status = subprocess.run(command,cwd=folder,stdout=log,stderr=subprocess.STDOUT,timeout=timeout).returncode
+    except subprocess.TimeoutExpired:
+        return False
+
+    history = os.path.join(folder,tag + '_history.dat')
+    if exit_status != 0 or not os.path.exists(history):
+        return False
+
+    CL, CD = read_SU2_history(history)
+
+    # written last and renamed into place, marks the case as finished
+    results = os.path.join(folder,tag + '_results.dat')
+    np.savetxt(results + '.tmp',[[CL,CD]])
+    os.replace(results + '.tmp',results)
+
+    return True
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+def read_file(filename):
+    """Contents of a file, None if it does not exist"""
+    if not os.path.exists(filename):
+        return None
+    with open(filename,'rb') as f:
+        return f.read()
+
+def purge_file(filename):
+    """Removes a file if it exists"""
+    if os.path.exists(filename):
+        os.remove(filename)
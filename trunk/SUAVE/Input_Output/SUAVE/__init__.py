@@ -2,4 +2,5 @@
 # Functions needed to save SUAVE data structures in JSON form
 # @ingroup Input_Output
 from .load import load
-from .archive import archive
\ No newline at end of file
+from .archive import archive
+from .training_cache import hash_data, load_training_cache, save_training_cache
\ No newline at end of file
@@ -0,0 +1,159 @@
+## @ingroup Input_Output-SUAVE
+# training_cache.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import os
+import hashlib
+import tempfile
+import numpy as np
+
+# ----------------------------------------------------------------------
+#  Method
+# ----------------------------------------------------------------------
+
+## @ingroup Input_Output-SUAVE
+def hash_data(*items):
+    """Builds a content hash of SUAVE data structures, arrays and values, for example the geometry,
+    training grid and settings of a surrogate analysis.
+
+    Assumptions:
+    Dictionary type structures are hashed in key order.
+    Functions and other objects are only hashed by their type name.
+
+    Source:
+    N/A
+
+    Inputs:
+    items      SUAVE data structures, numpy arrays, lists, strings or numbers
+
+    Outputs:
+    key        <string> - hexadecimal SHA-1 hash
+
+    Properties Used:
+    N/A
+    """
+
+    sha = hashlib.sha1()
+    for item in items:
+        update_hash(sha, item, set())
+
+    return sha.hexdigest()
+
+## @ingroup Input_Output-SUAVE
+def load_training_cache(directory,key):
+    """Loads the training tables stored under a key, if they exist.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    directory  <string> - cache folder
+    key        <string> - see hash_data
+
+    Outputs:
+    tables     <dict> of numpy arrays, or None if nothing is stored
+
+    Properties Used:
+    N/A
+    """
+
+    filename = os.path.join(directory, key + '.npz')
+    if not os.path.isfile(filename):
+        return None
+
+    try:
+        with np.load(filename) as stored:
+            tables = dict((name, stored[name]) for name in stored.files)
+    except (IOError, OSError, ValueError):
+        # a damaged file is treated as a miss and overwritten by the next save
+        return None
+
+    return tables
+
+## @ingroup Input_Output-SUAVE
+def save_training_cache(directory,key,**tables):
+    """Stores training tables under a key as a compressed .npz file.
+
+    Assumptions:
+    The file is written to a temporary name and renamed, so concurrent processes never
+    read a partially written file.
+
+    Source:
+    N/A
+
+    Inputs:
+    directory  <string> - cache folder, created if needed
+    key        <string> - see hash_data
+    tables     numpy arrays
+
+    Outputs:
+    filename   <string>
+
+    Properties Used:
+    N/A
+    """
+
+    if not os.path.isdir(directory):
+        os.makedirs(directory, exist_ok=True)
+
+    filename = os.path.join(directory, key + '.npz')
+
+    handle, temporary = tempfile.mkstemp(dir=directory, suffix='.npz')
+    try:
+        with os.fdopen(handle, 'wb') as f:
+            np.savez_compressed(f, **tables)
+        os.replace(temporary, filename)
+    except:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+
+    return filename
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+def update_hash(sha,v,visited):
+    """Adds a value to a hash, recursing through data structures"""
+
+    if v is None or isinstance(v, (bool, int, float, complex, str, np.number, np.bool_)):
+        sha.update(repr((type(v).__name__, v)).encode())
+
+    elif isinstance(v, np.ndarray):
+        sha.update(repr(('ndarray', v.dtype.str, v.shape)).encode())
+        if v.dtype.hasobject:
+            for element in v.flat:
+                update_hash(sha, element, visited)
+        else:
+            sha.update(np.ascontiguousarray(v).tobytes())
+
+    elif isinstance(v, (dict, list, tuple)):
+        # guard against structures that reference themselves
+        if id(v) in visited:
+            sha.update(b'<cycle>')
+            return
+        visited.add(id(v))
+        if isinstance(v, dict):
+            sha.update(repr((type(v).__name__, len(v))).encode())
+            for k in dict.keys(v):
+                update_hash(sha, k, visited)
+                update_hash(sha, dict.__getitem__(v, k), visited)
+        else:
+            sha.update(repr((type(v).__name__, len(v))).encode())
+            for element in v:
+                update_hash(sha, element, visited)
+        visited.remove(id(v))
+
+    else:
+        sha.update(repr(('object', type(v).__name__)).encode())
+
+    return
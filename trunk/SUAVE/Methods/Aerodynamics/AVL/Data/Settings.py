@@ -5,6 +5,7 @@
 # Modified: Jan 2016, E. Botero
 #           Oct 2018, M. Clarke
 #           Aug 2019, M. Clarke
+#           Oct 2026, SUAVE Team
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
@@ -60,6 +61,8 @@ class Settings(Data):
                 self.flow_symmetry                       = Data()
                 self.discretization                      = Data()
                 self.number_control_surfaces             = 0
+                self.number_of_workers                   = 1    # AVL processes run at once when sampling training data
+                self.run_timeout                         = None # [s] limit on each AVL process, None to wait indefinitely
                 
                 self.filenames.avl_bin_name              = 'avl' # to call avl from command line. If avl is not on the system path, include absolute path to the avl binary i.e. '/your/path/to/avl'
                 self.filenames.run_folder                = 'avl_files'  
@@ -8,7 +8,7 @@
 from .create_avl_datastructure import translate_avl_wing, translate_avl_body , populate_wing_sections, populate_body_sections
 from .purge_files              import purge_files
 from .read_results             import read_results
-from .run_analysis             import run_analysis
+from .run_analysis             import run_analysis, run_analyses_concurrently, evaluate_conditions_concurrently
 from .translate_data           import translate_conditions_to_cases, translate_results_to_conditions
 from .write_geometry           import write_geometry
 from .write_mass_file          import write_mass_file
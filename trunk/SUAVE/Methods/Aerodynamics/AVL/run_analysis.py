@@ -5,6 +5,7 @@
 # Modified: Jan 2016, E. Botero
 #           Jul 2017, M. Clarke
 #           Aug 2019, M. Clarke
+#           Oct 2026, SUAVE Team
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
@@ -13,9 +14,13 @@ import sys
 import time
 import subprocess
 import os
+import tempfile
+from shutil import rmtree
+from concurrent.futures import ThreadPoolExecutor
 from SUAVE.Methods.Aerodynamics.AVL.read_results import read_results
 from SUAVE.Methods.Aerodynamics.AVL.purge_files  import purge_files
-from SUAVE.Core                                  import redirect
+from SUAVE.Methods.Aerodynamics.AVL.translate_data import translate_results_to_conditions
+from SUAVE.Core                                  import redirect, Data
 
 ## @ingroup Methods-Aerodynamics-AVL
 def run_analysis(avl_object):
@@ -99,3 +104,199 @@ def call_avl(avl_object):
 
     return exit_status
 
+
+## @ingroup Methods-Aerodynamics-AVL
+def run_analyses_concurrently(avl_object,run_conditions,trim_aircraft):
+    """ This runs AVL on every angle of attack of a list of run conditions. Each angle of
+    attack is a separate AVL process working in its own temporary folder, and a pool of
+    processes runs them concurrently.
+
+    Assumptions:
+        The AVL analysis object writes its input files with 
+        write_input_files(run_conditions,trim_aircraft,folder,case_index)
+        
+    Source:
+        None
+
+    Inputs:
+        avl_object
+          settings.number_of_workers      [-]
+          settings.run_timeout            [s]
+          settings.filenames.run_folder   <string>
+        run_conditions                    list of conditions, one AVL batch each
+        trim_aircraft                     <boolean>
+        
+    Outputs:
+        batches                           list of Data with the cases and results of each 
+                                          run condition, in the order of run_conditions
+
+    Properties Used:
+        N/A
+    """    
+    run_folder = os.path.abspath(avl_object.settings.filenames.run_folder)
+    if not os.path.exists(run_folder):
+        os.makedirs(run_folder)
+    
+    batches = []
+    jobs    = []
+    try:
+        # write the input files of every case into its own folder
+        for conditions in run_conditions:
+            avl_object.current_status.batch_index += 1
+            batch      = Data()
+            batch.jobs = []
+            for i in range(len(conditions.aerodynamics.angle_of_attack)):
+                job           = Data()
+                job.folder    = tempfile.mkdtemp(prefix='batch_{0:02d}_'.format(avl_object.current_status.batch_index), dir=run_folder)
+                jobs.append(job)
+                job.cases     = avl_object.write_input_files(conditions,trim_aircraft,job.folder,case_index=i)
+                job.deck_file = avl_object.current_status.deck_file
+                batch.jobs.append(job)
+            batches.append(batch)
+                
+        # run AVL, number_of_workers processes at a time
+        call_avl_concurrently(avl_object,jobs)
+        
+        # read the results and regroup the cases of each batch 
+        for batch in batches:
+            batch.cases   = None
+            batch.results = Data()
+            for job in batch.jobs:
+                avl_object.current_status.cases = job.cases
+                with redirect.folder(job.folder,force=False):
+                    results = read_results(avl_object)
+                for tag in results.keys():
+                    batch.results[tag] = results[tag]
+                if batch.cases is None:
+                    batch.cases = job.cases
+                else:
+                    batch.cases.append(job.cases[0])
+            avl_object.current_status.cases = batch.cases
+            
+    finally:
+        if not avl_object.keep_files:
+            for job in jobs:
+                rmtree(job.folder,ignore_errors=True)
+
+    return batches
+
+
+## @ingroup Methods-Aerodynamics-AVL
+def evaluate_conditions_concurrently(avl_object,run_conditions,trim_aircraft):
+    """ This runs AVL for a list of run conditions, with every angle of attack in a separate 
+    AVL process and folder and up to settings.number_of_workers processes at a time, and 
+    translates the results of each run condition
+    
+    Assumptions:
+        None
+        
+    Source:
+        None
+        
+    Inputs:
+        avl_object                        see run_analyses_concurrently
+        run_conditions                    list of aerodynamic conditions
+        trim_aircraft                     <boolean>
+        
+    Outputs:
+        batch_results                     list of SUAVE data types, in the order of run_conditions
+        batch_cases                       list of the run cases of each run condition
+        
+    Properties Used:
+        N/A
+    """
+    run_folder = os.path.abspath(avl_object.settings.filenames.run_folder)
+    batches    = run_analyses_concurrently(avl_object,run_conditions,trim_aircraft)
+    
+    # translate results
+    batch_results = []
+    batch_cases   = []
+    for batch in batches:
+        batch_results.append(translate_results_to_conditions(batch.cases,batch.results))
+        batch_cases.append(batch.cases)
+        
+    if not avl_object.keep_files:
+        rmtree( run_folder )
+        
+    return batch_results, batch_cases
+
+
+def call_avl_concurrently(avl_object,jobs):
+    """ This calls the AVL executable in the folder of each job, running up to 
+    settings.number_of_workers processes at a time
+    
+    Assumptions:
+        None
+        
+    Source:
+        None
+        
+    Inputs:
+        avl_object
+        jobs          list of Data with the folder and deck_file of each run
+        
+    Outputs:
+        exit_status   list of exit codes, in the order of jobs, an error is raised when
+                      any of them is not zero
+        
+    Properties Used:
+        N/A
+    """
+    avl_call = avl_object.settings.filenames.avl_bin_name
+    geometry = avl_object.settings.filenames.features
+    timeout  = avl_object.settings.run_timeout
+    workers  = max(1,int(avl_object.settings.number_of_workers))
+    log_file = avl_object.settings.filenames.log_filename
+    if not isinstance(log_file,str):
+        log_file = None
+    
+    # a relative path to the executable would change with the working folder
+    if os.path.dirname(avl_call):
+        avl_call = os.path.abspath(avl_call)
+    
+    # the processes do the work, so threads are enough to wait on them
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures     = [executor.submit(call_avl_in_folder,avl_call,geometry,job.deck_file,job.folder,log_file,timeout) for job in jobs]
+        exit_status = [future.result() for future in futures]
+        
+    # a failed run would otherwise only show up as a missing results file
+    for job, status in zip(jobs,exit_status):
+        if status != 0:
+            tags = ', '.join([case.tag for case in job.cases.values()]) if 'cases' in job else job.folder
+            raise RuntimeError('AVL exited with status ' + str(status) + ' on case ' + tags)
+
+    return exit_status
+
+
+def call_avl_in_folder(avl_call,geometry,deck_file,folder,log_file=None,timeout=None):
+    """ This runs one AVL process in a folder, with the input deck as its commands
+    
+    Assumptions:
+        None
+        
+    Source:
+        None
+        
+    Inputs:
+        avl_call      <string> AVL executable
+        geometry      <string> geometry file, in the folder
+        deck_file     <string> input deck, in the folder
+        folder        <string>
+        log_file      <string> file in the folder for the console output, None to discard it
+        timeout       [s]      the process is stopped and an error raised after this time
+        
+    Outputs:
+        exit_status
+        
+    Properties Used:
+        N/A
+    """
+    if log_file is None:
+        log_path = os.devnull
+    else:
+        log_path = os.path.join(folder,log_file)
+    
+    with open(os.path.join(folder,deck_file),'rb') as commands, open(log_path,'wb') as log:
+        avl_run = subprocess.run([avl_call,geometry],cwd=folder,stdin=commands,stdout=log,stderr=subprocess.STDOUT,timeout=timeout)
+    
+    return avl_run.returncode
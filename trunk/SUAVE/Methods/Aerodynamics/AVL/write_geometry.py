@@ -5,6 +5,7 @@
 # Modified: Jan 2016, E. Botero
 #           Oct 2018, M. Clarke
 #           Aug 2019, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -13,6 +14,7 @@ from .purge_files import purge_files
 from SUAVE.Methods.Aerodynamics.AVL.Data.Settings    import Settings
 import numpy as np
 import shutil
+import os
 from .create_avl_datastructure import translate_avl_wing, translate_avl_body 
 
 ## @ingroup Methods-Aerodynamics-AVL
@@ -58,7 +60,7 @@ def write_geometry(avl_object,run_script_path):
                 if section.airfoil_coord_file is not None: 
                     filename = section.airfoil_coord_file
                     src      = run_script_path + '/' +  filename
-                    dst      = run_script_path + '/avl_files' + '/' + filename
+                    dst      = os.path.join(os.getcwd(), filename)
                     try: 
                         shutil.copy2(src, dst)       
                     except:
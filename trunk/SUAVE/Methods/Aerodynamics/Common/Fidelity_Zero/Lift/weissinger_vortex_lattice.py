@@ -5,14 +5,19 @@
 # Modified: Apr 2017, T. MacDonald
 #           Oct 2017, E. Botero
 #           Jun 2018, M. Clarke
+#           Oct 2026, SUAVE Team
 
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 
+# SUAVE imports
+from SUAVE.Core import Data
+
 # package imports
 import numpy as np 
+from scipy.linalg import lu_factor, lu_solve
 
 # ----------------------------------------------------------------------
 #  Weissinger Vortex Lattice
@@ -20,7 +25,9 @@ import numpy as np
 
 ## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
 def weissinger_vortex_lattice(conditions,configuration,wing):
-    """Uses the vortex lattice method to compute the lift coefficient and induced drag component
+    """Uses the vortex lattice method to compute the lift coefficient and induced drag component.
+    Several angles of attack are solved together with one factorization of the influence matrix,
+    see weissinger_influence and weissinger_solve.
 
     Assumptions:
     None
@@ -46,8 +53,59 @@ def weissinger_vortex_lattice(conditions,configuration,wing):
     conditions.aerodynamics.angle_of_attack [radians]
 
     Outputs:
-    Cl                                      [Unitless]
-    Cd                                      [Unitless]
+    Cl                                      [Unitless] same shape as the angle of attack
+    Cd                                      [Unitless] same shape as the angle of attack
+
+    Properties Used:
+    N/A
+    """ 
+    
+    # conditions
+    aoa = conditions.aerodynamics.angle_of_attack
+    
+    influence = weissinger_influence(configuration,wing)
+    CL, CD    = weissinger_solve(influence,aoa)
+    
+    # a single angle of attack gives numbers
+    CL = np.reshape(CL,np.shape(aoa))[()]
+    CD = np.reshape(CD,np.shape(aoa))[()]
+        
+    return CL, CD 
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def weissinger_influence(configuration,wing):
+    """Builds the horseshoe vortex panels of a wing and factors their influence matrix. These only
+    depend on the geometry, so they can be reused for any angle of attack.
+
+    Assumptions:
+    Vertical wings do not produce lift
+
+    Source:
+    An Introduction to Theoretical and Computational Aerodynamics by Jack Moran
+
+    Inputs:
+    wing.
+      spans.projected                       [m]
+      chords.root                           [m]
+      chords.tip                            [m]
+      sweeps.quarter_chord                  [radians]
+      taper                                 [Unitless]
+      twists.root                           [radians]
+      twists.tip                            [radians]
+      symmetric                             [Boolean]
+      areas.reference                       [m^2]
+      vertical                              [Boolean]
+      Segments                              (optional)
+    configuration.number_panels_spanwise    [Unitless]
+
+    Outputs:
+    influence.
+      influence_matrix                      [Unitless]
+      factors                               LU factors of the transposed influence matrix
+      twist_distribution                    [radians]
+      panel_widths                          [m]
+      reference_area                        [m^2]
+    None for a vertical wing
 
     Properties Used:
     N/A
@@ -67,17 +125,12 @@ def weissinger_vortex_lattice(conditions,configuration,wing):
     
     n  = configuration.number_panels_spanwise
     
-    # conditions
-    aoa = conditions.aerodynamics.angle_of_attack
-    
     # chord difference
     dchord = (root_chord-tip_chord)
     if sym_para is True :
         span = span/2
         
     deltax  = span/n    
-    sin_aoa = np.sin(aoa)
-    cos_aoa = np.cos(aoa)
 
     if orientation == False :
 
@@ -145,8 +198,6 @@ def weissinger_vortex_lattice(conditions,configuration,wing):
             xa = np.atleast_2d(xa)  # x coordinate of horseshoe vortex on panel
             x  = np.atleast_2d(x)   # x coordinate of control points on panel
             y  = np.atleast_2d(y)   # y coordinate of control points on panel
-            
-            RHS  = np.atleast_2d(np.sin(twist_distri+aoa))  
    
         else:   # no segments defined on wing 
             # discretizing the wing sections into panels 
@@ -159,40 +210,83 @@ def weissinger_vortex_lattice(conditions,configuration,wing):
             xa   = np.atleast_2d(((i+1)*deltax-deltax/2)*np.tan(sweep) + 0.25*section_length) # x coordinate of horseshoe vortex on panel
             x    = np.atleast_2d(((i+1)*deltax-deltax/2)*np.tan(sweep) + 0.75*section_length) # x coordinate of control points on panel
             y    = np.atleast_2d(((i+1)*deltax-deltax/2))                                     # y coordinate of control points on panel 
-                    
-            RHS  = np.atleast_2d(np.sin(twist_distri+aoa))                                  
                 
         
         A = (whav(x,y,xa.T,ya.T)-whav(x,y,xa.T,yb.T)\
             -whav(x,y,xa.T,-ya.T)+whav(x,y,xa.T,-yb.T))*0.25/np.pi
-    
-        # Vortex strength computation by matrix inversion
-        T = np.linalg.solve(A.T,RHS.T).T
         
-        # Calculating the effective velocty         
-        A_v = A*0.25/np.pi*T
-        v   = np.sum(A_v,axis=1)
+        # pack
+        influence                    = Data()
+        influence.influence_matrix   = A
+        influence.factors            = lu_factor(A.T,check_finite=False)
+        influence.twist_distribution = twist_distri
+        influence.panel_widths       = deltax
+        influence.reference_area     = Sref
         
-        Lfi = -T * (sin_aoa-v)
-        Lfk =  T * cos_aoa 
-        Lft = -Lfi * sin_aoa + Lfk * cos_aoa
-        Dg  =  Lfi * cos_aoa + Lfk * sin_aoa
-            
-        L  = deltax * Lft
-        D  = deltax * Dg
+    else:
         
-        # Total lift
-        LT = np.sum(L)
-        DT = np.sum(D)
-    
-        CL = 2*LT/(0.5*Sref)
-        CD = 2*DT/(0.5*Sref)     
+        influence = None
         
-    else:
+    return influence
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def weissinger_solve(influence,aoa):
+    """Solves the vortex strengths of a wing for all angles of attack in one back substitution
+    with the factored influence matrix, and integrates the lift and induced drag.
+
+    Assumptions:
+    None
+
+    Source:
+    An Introduction to Theoretical and Computational Aerodynamics by Jack Moran
+
+    Inputs:
+    influence                               see weissinger_influence
+    aoa                                     [radians] any shape
+
+    Outputs:
+    CL                                      [Unitless] one per angle of attack, flattened
+    CD                                      [Unitless] one per angle of attack, flattened
+
+    Properties Used:
+    N/A
+    """ 
+    
+    aoa = np.reshape(np.asarray(aoa,dtype=float),(-1,1))
+    
+    if influence is None:
+        return np.zeros(len(aoa)), np.zeros(len(aoa))
+    
+    A      = influence.influence_matrix
+    deltax = influence.panel_widths
+    Sref   = influence.reference_area
+    
+    sin_aoa = np.sin(aoa)
+    cos_aoa = np.cos(aoa)
+    
+    # one right hand side per angle of attack
+    RHS = np.sin(influence.twist_distribution+aoa)
+    
+    # Vortex strength computation by back substitution
+    T = lu_solve(influence.factors,RHS.T,check_finite=False).T
+    
+    # Calculating the effective velocty         
+    v   = np.dot(T,A.T)*0.25/np.pi
+    
+    Lfi = -T * (sin_aoa-v)
+    Lfk =  T * cos_aoa 
+    Lft = -Lfi * sin_aoa + Lfk * cos_aoa
+    Dg  =  Lfi * cos_aoa + Lfk * sin_aoa
         
-        CL = 0.0
-        CD = 0.0    
+    L  = deltax * Lft
+    D  = deltax * Dg
+    
+    # Total lift
+    LT = np.sum(L,axis=1)
+    DT = np.sum(D,axis=1)
 
+    CL = 2*LT/(0.5*Sref)
+    CD = 2*DT/(0.5*Sref)     
         
     return CL, CD 
 
@@ -3,7 +3,7 @@
 # @ingroup Methods-Geometry-Two_Dimensional-Cross_Section
 
 from .compute_naca_4series    import compute_naca_4series 
-from .compute_airfoil_polars  import compute_airfoil_polars
+from .compute_airfoil_polars  import compute_airfoil_polars, cached_airfoil_polars, interpolate_airfoil_polars
 from .import_airfoil_dat      import import_airfoil_dat
 from .import_airfoil_geometry import import_airfoil_geometry 
 from .import_airfoil_polars   import import_airfoil_polars
\ No newline at end of file
@@ -3,6 +3,7 @@
 # 
 # Created:  Mar 2019, M. Clarke
 #           Mar 2020, M. Clarke
+# Modified: Oct 2026, SUAVE Team
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
@@ -10,6 +11,12 @@ from SUAVE.Core               import Data , Units
 from .import_airfoil_geometry import import_airfoil_geometry 
 from .import_airfoil_polars   import import_airfoil_polars
 import numpy as np
+import os
+from collections import OrderedDict
+
+# processed polars, most recently used last
+airfoil_polars_cache      = OrderedDict()
+airfoil_polars_cache_size = 32
 
 ## @ingroup Methods-Geometry-Two_Dimensional-Cross_Section-Airfoil
 def compute_airfoil_polars(propeller,a_geo,a_polar):
@@ -60,10 +67,11 @@ def compute_airfoil_polars(propeller,a_geo,a_polar):
     CL = np.zeros((num_airfoils,len(AoA_sweep)))
     CD = np.zeros((num_airfoils,len(AoA_sweep)))
 
+    # read airfoil polars 
+    airfoil_polar_data =  import_airfoil_polars(a_polar)
+
     # AERODAS
     for i in range(num_airfoils):           
-        # read airfoil polars 
-        airfoil_polar_data =  import_airfoil_polars(a_polar)
         airfoil_cl  = airfoil_polar_data.lift_coefficients[i] 
         airfoil_cd  = airfoil_polar_data.drag_coefficients[i] 
         airfoil_aoa = airfoil_polar_data.angle_of_attacks[i]   
@@ -195,4 +203,102 @@ def compute_airfoil_polars(propeller,a_geo,a_polar):
     airfoil_data.drag_coefficients  = CD
     airfoil_data.angle_of_attacks   = AoA_sweep*Units.degrees 
 
-    return airfoil_data   
+    return airfoil_data
+
+## @ingroup Methods-Geometry-Two_Dimensional-Cross_Section-Airfoil
+def cached_airfoil_polars(propeller,a_geo,a_polar):
+    """Returns the processed airfoil polars of a propeller, computing them with compute_airfoil_polars
+    only the first time a propeller geometry and set of airfoil files is seen. Results are kept in a
+    module level least recently used cache.
+
+    Assumptions:
+    The returned polars are shared and must not be modified.
+    A file is reloaded when its modification time changes.
+
+    Source:
+    N/A
+
+    Inputs:
+    propeller. 
+        hub_radius         [m]
+        tip_radius         [m]
+        chord_distribution [m]
+    a_geo                  <list of strings>
+    a_polar                <list of strings>
+
+    Outputs:
+    airfoil_data           see compute_airfoil_polars
+
+    Properties Used:
+    airfoil_polars_cache_size
+    """
+
+    key = (file_keys(a_geo), file_keys(a_polar), float(propeller.hub_radius), float(propeller.tip_radius),
+           tuple(np.atleast_1d(propeller.chord_distribution).astype(float).tolist()))
+
+    airfoil_data = airfoil_polars_cache.pop(key, None)
+    if airfoil_data is None:
+        airfoil_data = compute_airfoil_polars(propeller, a_geo, a_polar)
+
+    airfoil_polars_cache[key] = airfoil_data
+    while len(airfoil_polars_cache) > airfoil_polars_cache_size:
+        airfoil_polars_cache.popitem(last=False)
+
+    return airfoil_data
+
+## @ingroup Methods-Geometry-Two_Dimensional-Cross_Section-Airfoil
+def interpolate_airfoil_polars(alpha,AoA_sweep,coefficients,stations):
+    """Linearly interpolates the airfoil coefficients of every blade station at once, the same as calling
+    np.interp station by station.
+
+    Assumptions:
+    The angle of attack sweep is increasing. Angles outside the sweep take the end values.
+
+    Source:
+    N/A
+
+    Inputs:
+    alpha          [radians]   (n_points, n_stations)
+    AoA_sweep      [radians]   (n_sweep)
+    coefficients   [unitless]  (n_airfoils, n_sweep)
+    stations       [int]       airfoil index of every station (n_stations)
+
+    Outputs:
+    values         [unitless]  (n_points, n_stations)
+
+    Properties Used:
+    N/A
+    """
+
+    AoA_sweep = np.asarray(AoA_sweep)
+    table     = np.asarray(coefficients)[np.asarray(stations,dtype=int)]
+    n_stations = table.shape[0]
+
+    # index of the sweep interval of every angle
+    j  = np.searchsorted(AoA_sweep, alpha, side='right') - 1
+    j  = np.clip(j, 0, len(AoA_sweep) - 2)
+    x0 = AoA_sweep[j]
+    x1 = AoA_sweep[j+1]
+    t  = np.clip((alpha - x0)/(x1 - x0), 0., 1.)
+
+    cols = np.broadcast_to(np.arange(n_stations), np.shape(j))
+    y0   = table[cols,j]
+    y1   = table[cols,j+1]
+
+    return y0 + t*(y1 - y0)
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+def file_keys(files):
+    """Identifies a list of files by their paths and modification times"""
+    if files is None:
+        return None
+    keys = []
+    for name in files:
+        try:
+            keys.append((os.path.abspath(name), os.path.getmtime(name)))
+        except (TypeError, OSError):
+            keys.append((str(name), None))
+    return tuple(keys)
@@ -3,6 +3,7 @@
 # 
 # Created:  Jul 2014, SUAVE Team
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -10,6 +11,12 @@
 
 from SUAVE.Core.Arrays import atleast_2d_col 
 
+import inspect
+import numpy as np
+
+# operators shared by every segment, keyed on (method, number of points, options)
+operator_store = {}
+
 # ----------------------------------------------------------------------
 #  Initialize Differentials
 # ----------------------------------------------------------------------
@@ -44,8 +51,7 @@ def initialize_differentials_dimensionless(segment):
     discretization_method = numerics.discretization_method
     
     # get operators
-    x,D,I = discretization_method(N,**numerics)
-    x = atleast_2d_col(x)
+    x,D,I = discretization_operators(discretization_method,N,numerics)
     
     # pack
     numerics.dimensionless.control_points = x
@@ -104,4 +110,63 @@ def update_differentials_time(segment):
     numerics.time.integrate      = I
 
     return
-    
\ No newline at end of file
+
+# ----------------------------------------------------------------------
+#  Operator Store
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments-Common
+def discretization_operators(discretization_method,N,options):
+    """ Returns the control points and the differentiation and integration operators of a
+        discretization method, building them only the first time they are requested
+    
+        Assumptions:
+        The operators only depend on the number of points and on the named keyword arguments
+        of the discretization method. The returned arrays are shared and read only.
+        
+        Inputs:
+            discretization_method     [function]
+            N                         [int]
+            options                   [Data] - usually state.numerics
+            
+        Outputs:
+            x                         [array]  column of control points
+            D                         [array]
+            I                         [array]
+
+        Properties Used:
+        N/A
+                                
+    """
+    
+    names = operator_options(discretization_method)
+    key   = (discretization_method, int(N), tuple((name, options[name]) for name in names if name in options))
+    
+    try:
+        operators = operator_store.get(key)
+    except TypeError:
+        # unhashable options are not stored
+        key, operators = None, None
+    
+    if operators is None:
+        x,D,I = discretization_method(N,**options)
+        x = atleast_2d_col(x)
+        operators = tuple(read_only(A) for A in (x,D,I))
+        if key is not None:
+            operator_store[key] = operators
+    
+    return operators
+
+def operator_options(discretization_method):
+    """ Lists the named keyword arguments of a discretization method, other than the number of points """
+    try:
+        parameters = inspect.signature(discretization_method).parameters.values()
+    except (TypeError, ValueError):
+        return ()
+    return tuple(p.name for p in parameters if p.kind in (p.POSITIONAL_OR_KEYWORD, p.KEYWORD_ONLY))[1:]
+
+def read_only(A):
+    """ Marks an array as read only """
+    if isinstance(A, np.ndarray):
+        A.flags.writeable = False
+    return A
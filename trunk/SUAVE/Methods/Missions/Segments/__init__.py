@@ -3,6 +3,7 @@
 # @ingroup Methods-Missions
 
 from .converge_root import converge_root
+from .converge_batch import converge_batch, evaluate_batch
 from .expand_state  import expand_state
 from .optimize      import converge_opt
 
@@ -0,0 +1,477 @@
+## @ingroup Methods-Missions-Segments
+# converge_batch.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import scipy.optimize
+import scipy.linalg
+import numpy as np
+
+from SUAVE.Core import Data
+from SUAVE.Analyses import Process
+from SUAVE.Analyses.Mission.Segments.Conditions import State, Conditions
+from .converge_root import converge_root, initial_unknowns, colored_jacobian
+
+# ----------------------------------------------------------------------
+#  Evaluate Batch
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments
+def evaluate_batch(segments, stacked_steps):
+    """Evaluates the same segment of several independent missions together. Each member is initialized and
+    finalized on its own, while the unknowns of all members are converged in a single root solve. Inside
+    each iteration the steps listed in stacked_steps are run once on the members' conditions stacked by row.
+
+    Assumptions:
+    Stacked steps only act row by row and use the analyses and settings of the first member.
+    Segments that are not converged by converge_root are evaluated one member at a time.
+
+    Source:
+    N/A
+
+    Inputs:
+    segments                           [list of Segments]
+    stacked_steps                      [list of strings]
+
+    Outputs:
+    segments[:].state                  [Data]
+
+    Properties Used:
+    N/A
+    """
+
+    converge = segments[0].process.converge
+    batched  = ('segments' not in segments[0]) and len(converge) and \
+        all([step is converge_root for step in converge.values()])
+
+    if not batched:
+        for segment in segments:
+            segment.evaluate()
+        return
+
+    for segment in segments:
+        segment.process.initialize(segment)
+
+    batch = Data()
+    batch.segments      = segments
+    batch.stacked_steps = stacked_steps
+
+    converge_batch(batch)
+
+    unknowns = np.hstack([segment.state.unknowns.pack_array() for segment in segments])
+    iterate_batch(unknowns, batch)
+
+    for segment in segments:
+        segment.process.finalize(segment)
+
+    return
+
+# ----------------------------------------------------------------------
+#  Converge Batch
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments
+def converge_batch(batch):
+    """Converges the unknowns of all members with one call to the root finder. The members do not interact,
+    so the jacobian is block diagonal and is found with colored finite differences. Members without a supplied
+    jacobian_sparsity get theirs from the nonzeros of the first jacobian, as in converge_root.
+    Each member's convergence is checked on its own. After a joint solve, members whose residuals are within
+    their residual tolerance are converged, and the others are solved on their own starting from the joint
+    solution. If the joint solve fails, each member is reconverged on its own from its initial unknowns.
+
+    Assumptions:
+    The solution tolerance is the root finder's step tolerance, so the residuals of each member are checked
+    against the separate tolerance_residuals
+
+    Source:
+    N/A
+
+    Inputs:
+    batch.segments                     [list of Segments]
+    batch.stacked_steps                [list of strings]
+    segment.settings.root_finder       [Data]
+    state.numerics.tolerance_solution  [Unitless]
+    state.numerics.tolerance_residuals [Unitless]
+    state.numerics.jacobian_sparsity   [boolean array or None]
+
+    Outputs:
+    state.unknowns                     [Any]
+    segment.state.numerics.converged   [Unitless]
+
+    Properties Used:
+    N/A
+    """
+
+    segments = batch.segments
+    starts   = [initial_unknowns(segment) for segment in segments]
+    unknowns = np.hstack(starts)
+
+    try:
+        root_finder = segments[0].settings.root_finder
+    except AttributeError:
+        root_finder = scipy.optimize.fsolve
+
+    # members never share residuals
+    supplied = [segment.state.numerics.jacobian_sparsity for segment in segments]
+    sizes    = [len(start) for start in starts]
+    bounds   = [np.ones((n,n)) if given is None else given for n, given in zip(sizes, supplied)]
+    sparsity = scipy.linalg.block_diag(*bounds).astype(bool)
+    fixed    = None
+    if any([given is None for given in supplied]):
+        blocks = [np.zeros((n,n)) if given is None else given for n, given in zip(sizes, supplied)]
+        fixed  = scipy.linalg.block_diag(*blocks).astype(bool)
+
+    fprime    = colored_jacobian(sparsity, iterate_batch, fixed)
+    tolerance = np.min([segment.state.numerics.tolerance_solution for segment in segments])
+
+    unknowns,infodict,ier,msg = root_finder( iterate_batch,
+                                             unknowns,
+                                             args = batch,
+                                             xtol = tolerance,
+                                             fprime = fprime,
+                                             full_output=1)
+
+    if ier!=1:
+        print("Batch did not converge, converging members individually. Segment Tag: " + segments[0].tag)
+        for segment, start in zip(segments, starts):
+            converge_root(segment, start)
+    else:
+        # each member checks its own residuals at the joint solution, and is solved on its own
+        # from the joint solution when they are not within the tolerance
+        iterate_batch(unknowns, batch)
+        start = 0
+        for segment in segments:
+            size      = len(segment.state.unknowns.pack_array())
+            residuals = segment.state.residuals.pack_array()
+            if np.all(np.abs(residuals) <= segment.state.numerics.tolerance_residuals):
+                segment.state.numerics.converged = True
+            else:
+                converge_root(segment,unknowns[start:start+size])
+            start += size
+
+    return
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments
+def iterate_batch(unknowns, batch):
+    """Runs one iteration of every member. Consecutive steps listed in stacked_steps are
+    run once on a segment holding all members' states, every other step is run per member.
+
+    Assumptions:
+    All members have the same iterate process
+
+    Source:
+    N/A
+
+    Inputs:
+    unknowns                      [array]
+    batch.segments                [list of Segments]
+    batch.stacked_steps           [list of strings]
+
+    Outputs:
+    residuals                     [array]
+
+    Properties Used:
+    N/A
+    """
+
+    segments      = batch.segments
+    stacked_steps = batch.stacked_steps
+    
+    # unpack the unknowns of each member
+    start = 0
+    for segment in segments:
+        size = len(segment.state.unknowns.pack_array())
+        segment.state.unknowns.unpack_array(unknowns[start:start+size])
+        start += size
+
+    member_steps = [process_steps(segment.process.iterate) for segment in segments]
+    tags         = [tag for tag,step in member_steps[0]]
+
+    i = 0
+    while i < len(tags):
+        if tags[i] in stacked_steps:
+            # run the whole stretch of stacked steps at once
+            j = i
+            while j < len(tags) and tags[j] in stacked_steps:
+                j += 1
+            stacked = stack_segments(segments)
+            for tag, step in member_steps[0][i:j]:
+                evaluate_step(step, stacked)
+            split_segments(stacked, segments)
+            i = j
+        else:
+            for segment, steps in zip(segments, member_steps):
+                evaluate_step(steps[i][1], segment)
+            i += 1
+
+    residuals = np.hstack([segment.state.residuals.pack_array() for segment in segments])
+
+    return residuals
+
+## @ingroup Methods-Missions-Segments
+def process_steps(process, prefix=''):
+    """Flattens a process into a list of (tag, step), with the tags of nested processes joined by '.'
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    process                       [Process]
+
+    Outputs:
+    steps                         [list]
+
+    Properties Used:
+    N/A
+    """
+    steps = []
+    for tag, step in process.items():
+        if isinstance(step, Process):
+            steps.extend(process_steps(step, prefix + tag + '.'))
+        else:
+            steps.append((prefix + tag, step))
+    return steps
+
+## @ingroup Methods-Missions-Segments
+def evaluate_step(step, segment):
+    """Calls a single process step the same way Process.evaluate does.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    step                          [function or Analysis]
+    segment                       [Segment]
+
+    Outputs:
+    result                        [Any]
+
+    Properties Used:
+    N/A
+    """
+    if hasattr(step,'evaluate'):
+        return step.evaluate(segment)
+    else:
+        return step(segment)
+
+## @ingroup Methods-Missions-Segments
+def stack_segments(segments):
+    """Builds a segment whose state holds the members' conditions stacked by row,
+    with block diagonal differentiation and integration operators.
+
+    Assumptions:
+    Everything other than the state is taken from the first member
+
+    Source:
+    N/A
+
+    Inputs:
+    segments                      [list of Segments]
+
+    Outputs:
+    stacked                       [Data]
+
+    Properties Used:
+    N/A
+    """
+
+    rows = [segment.state._size for segment in segments]
+
+    stacked = Data()
+    dict.update(stacked, segments[0])
+
+    state = State()
+    state.conditions = stack_data([segment.state.conditions for segment in segments], rows)
+    set_size(state, sum(rows))
+
+    # operators
+    numerics = state.numerics
+    dict.update(numerics, segments[0].state.numerics)
+    for key in ['dimensionless','time']:
+        operators = segments[0].state.numerics[key].__class__()
+        operators.control_points = np.vstack([segment.state.numerics[key].control_points for segment in segments])
+        operators.differentiate  = scipy.linalg.block_diag(*[segment.state.numerics[key].differentiate for segment in segments])
+        operators.integrate      = scipy.linalg.block_diag(*[segment.state.numerics[key].integrate     for segment in segments])
+        numerics[key] = operators
+
+    stacked.state      = state
+    stacked.conditions = state.conditions
+
+    return stacked
+
+## @ingroup Methods-Missions-Segments
+def split_segments(stacked, segments):
+    """Hands the rows of a stacked segment back to its members.
+
+    Assumptions:
+    Arrays whose first dimension matches the stacked rows are split, other values are only added
+    to members that do not have them yet
+
+    Source:
+    N/A
+
+    Inputs:
+    stacked                       [Data]
+    segments                      [list of Segments]
+
+    Outputs:
+    segments[:].state             [Data]
+
+    Properties Used:
+    N/A
+    """
+
+    rows = [segment.state._size for segment in segments]
+
+    split_data(stacked.state.conditions, [segment.state.conditions for segment in segments], rows)
+
+    return
+
+## @ingroup Methods-Missions-Segments
+def stack_data(datas, rows):
+    """Stacks the arrays of several Data by row.
+
+    Assumptions:
+    Values that are not row arrays of every member are taken from the first member
+
+    Source:
+    N/A
+
+    Inputs:
+    datas                         [list of Data]
+    rows                          [list of ints]
+
+    Outputs:
+    stacked                       [Data]
+
+    Properties Used:
+    N/A
+    """
+
+    stacked = Conditions() if isinstance(datas[0], Conditions) else Data()
+
+    # plain dict access, this runs on every leaf of the state each iteration
+    for key, value in dict.items(datas[0]):
+        values = [dict.get(data, key) for data in datas]
+        if isinstance(value, dict):
+            if all([isinstance(v, dict) for v in values]):
+                dict.__setitem__(stacked, key, stack_data(values, rows))
+            else:
+                dict.__setitem__(stacked, key, value)
+        elif is_row_array(values, rows):
+            dict.__setitem__(stacked, key, np.concatenate(values, axis=0))
+        else:
+            dict.__setitem__(stacked, key, value)
+
+    return stacked
+
+## @ingroup Methods-Missions-Segments
+def split_data(stacked, datas, rows):
+    """Splits the row arrays of a stacked Data back into its members, adding any new entries.
+    Members keep their own values of anything that is not a row array.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    stacked                       [Data]
+    datas                         [list of Data]
+    rows                          [list of ints]
+
+    Outputs:
+    datas                         [list of Data]
+
+    Properties Used:
+    N/A
+    """
+
+    bounds = np.cumsum([0] + rows)
+    total  = bounds[-1]
+
+    for key, value in dict.items(stacked):
+        if isinstance(value, dict):
+            members = []
+            for data in datas:
+                member = dict.get(data, key)
+                if not isinstance(member, dict):
+                    member = value.__class__()
+                    dict.__setitem__(data, key, member)
+                members.append(member)
+            split_data(value, members, rows)
+        elif isinstance(value, np.ndarray) and value.ndim > 0 and value.shape[0] == total:
+            for i, data in enumerate(datas):
+                dict.__setitem__(data, key, value[bounds[i]:bounds[i+1]])
+        else:
+            for data in datas:
+                if not key in data:
+                    dict.__setitem__(data, key, value)
+
+    return
+
+## @ingroup Methods-Missions-Segments
+def is_row_array(values, rows):
+    """Checks that every member holds an array with one row per control point.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    values                        [list]
+    rows                          [list of ints]
+
+    Outputs:
+    flag                          [boolean]
+
+    Properties Used:
+    N/A
+    """
+    for value, n in zip(values, rows):
+        if not isinstance(value, np.ndarray) or not value.ndim or value.shape[0] != n:
+            return False
+    return True
+
+## @ingroup Methods-Missions-Segments
+def set_size(conditions, size):
+    """Sets the row count used by ones_row on a stacked state.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    conditions                    [Conditions]
+    size                          [int]
+
+    Outputs:
+    N/A
+
+    Properties Used:
+    N/A
+    """
+    conditions._size = size
+    for value in conditions.values():
+        if isinstance(value, Conditions):
+            set_size(value, size)
+    return
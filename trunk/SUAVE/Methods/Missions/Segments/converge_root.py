@@ -3,6 +3,7 @@
 # 
 # Created:  Jul 2014, SUAVE Team
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -18,8 +19,9 @@ from SUAVE.Core.Arrays import array_type
 # ----------------------------------------------------------------------
 
 ## @ingroup Methods-Missions-Segments
-def converge_root(segment):
+def converge_root(segment,unknowns=None):
     """Interfaces the mission to a numerical solver. The solver may be changed by using root_finder.
+    The solver starts from the given unknowns, or from initial_unknowns when none are given.
 
     Assumptions:
     N/A
@@ -31,6 +33,10 @@ def converge_root(segment):
     segment                            [Data]
     segment.settings.root_finder       [Data]
     state.numerics.tolerance_solution  [Unitless]
+    state.numerics.solver_jacobian     [string or function]
+    state.numerics.jacobian_sparsity   [boolean array or None]
+    state.numerics.initial_unknowns    [array or None]
+    unknowns                           [array or None]
 
     Outputs:
     state.unknowns                     [Any]
@@ -40,18 +46,26 @@ def converge_root(segment):
     N/A
     """       
     
-    unknowns = segment.state.unknowns.pack_array()
+    if unknowns is None:
+        unknowns = initial_unknowns(segment)
     
     try:
         root_finder = segment.settings.root_finder
     except AttributeError:
         root_finder = scipy.optimize.fsolve 
+        
+    # pick how the solver gets its jacobian
+    options = dict()
+    fprime  = make_jacobian(segment)
+    if fprime is not None:
+        options['fprime'] = fprime
     
     unknowns,infodict,ier,msg = root_finder( iterate,
                                          unknowns,
                                          args = segment,
                                          xtol = segment.state.numerics.tolerance_solution,
-                                         full_output=1)
+                                         full_output=1,
+                                         **options)
 
     if ier!=1:
         print("Segment did not converge. Segment Tag: " + segment.tag)
@@ -67,6 +81,36 @@ def converge_root(segment):
 #  Helper Functions
 # ----------------------------------------------------------------------
 
+## @ingroup Methods-Missions-Segments
+def initial_unknowns(segment):
+    """Returns the packed unknowns the solver starts from. Unknowns seeded into the numerics,
+    for example by a mission warm start, replace the initialized ones when they have the same size.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    state.unknowns                     [Data]
+    state.numerics.initial_unknowns    [array or None]
+
+    Outputs:
+    unknowns                           [array]
+
+    Properties Used:
+    N/A
+    """
+    
+    unknowns = segment.state.unknowns.pack_array()
+    initials = segment.state.numerics.initial_unknowns
+    
+    if initials is not None and np.shape(initials) == np.shape(unknowns):
+        unknowns = np.array(initials, dtype=float)
+        
+    return unknowns
+
 ## @ingroup Methods-Missions-Segments
 def iterate(unknowns, segment):
     
@@ -97,4 +141,224 @@ def iterate(unknowns, segment):
     
     residuals = segment.state.residuals.pack_array()
         
-    return residuals 
\ No newline at end of file
+    return residuals
+
+## @ingroup Methods-Missions-Segments
+def make_jacobian(segment):
+    """Builds the jacobian function handed to the root finder, based on state.numerics.solver_jacobian.
+    
+    "none"   - the root finder builds its own jacobian with one residual evaluation per unknown
+    "sparse" - finite differences where unknowns that do not share residuals are perturbed together, with
+               the sparsity of state.numerics.jacobian_sparsity or else that of the first jacobian
+    function - user supplied analytic jacobian, called as solver_jacobian(segment) after an iteration
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    state.unknowns                     [Data]
+    state.numerics.solver_jacobian     [string or function]
+    state.numerics.jacobian_sparsity   [boolean array or None]
+
+    Outputs:
+    fprime                             [function or None]
+
+    Properties Used:
+    N/A
+    """      
+    
+    jacobian = segment.state.numerics.solver_jacobian
+    
+    if callable(jacobian):
+        return lambda unknowns, segment: analytic_jacobian(unknowns, segment, jacobian)
+    
+    elif jacobian == "none":
+        return None
+    
+    elif jacobian == "sparse":
+        sparsity = segment.state.numerics.jacobian_sparsity
+        if sparsity is not None:
+            return colored_jacobian(np.array(sparsity,dtype=bool))
+        size = len(segment.state.unknowns.pack_array())
+        return colored_jacobian(np.ones((size,size),dtype=bool), fixed = np.zeros((size,size),dtype=bool))
+        
+    else:
+        raise ValueError('Unknown solver_jacobian "%s" in segment %s' % (jacobian, segment.tag))
+        
+## @ingroup Methods-Missions-Segments
+def analytic_jacobian(unknowns, segment, jacobian):
+    """Evaluates a user supplied jacobian at the current unknowns.
+
+    Assumptions:
+    The supplied function returns d(residuals)/d(unknowns) in packed array order
+
+    Source:
+    N/A
+
+    Inputs:
+    unknowns                      [array]
+    jacobian                      [function]
+
+    Outputs:
+    J                             [array]
+
+    Properties Used:
+    N/A
+    """     
+    
+    iterate(unknowns, segment)
+    
+    return np.atleast_2d(jacobian(segment))
+
+## @ingroup Methods-Missions-Segments
+def sparse_jacobian(unknowns, segment, sparsity, colors, function = iterate):
+    """Finite differences the residuals, perturbing every unknown of a color at once.
+    The baseline point is evaluated last so the segment state is left at the unknowns.
+
+    Assumptions:
+    Residuals not flagged in the sparsity pattern do not depend on the unknown
+
+    Source:
+    Curtis, Powell and Reid, "On the estimation of sparse Jacobian matrices",
+    IMA Journal of Applied Mathematics, 1974
+
+    Inputs:
+    unknowns                      [array]
+    sparsity                      [boolean array]
+    colors                        [int array]
+    function                      [function]     residual function, defaults to iterate
+
+    Outputs:
+    J                             [array]
+
+    Properties Used:
+    N/A
+    """     
+    
+    unknowns = np.array(unknowns, dtype=float)
+    
+    # forward difference step sizes
+    step = np.sqrt(np.finfo(float).eps) * np.maximum(np.abs(unknowns),1.)
+    
+    # one residual evaluation per color
+    perturbed = []
+    for color in range(np.max(colors)+1):
+        x = unknowns + step * (colors == color)
+        perturbed.append(function(x, segment))
+        
+    residuals = function(unknowns, segment)
+    
+    # pick each column out of its color's difference
+    deltas = np.array(perturbed).T - residuals[:,None]
+    J      = np.where(sparsity, deltas[:,colors], 0.) / step
+    
+    return J
+
+## @ingroup Methods-Missions-Segments
+def colored_jacobian(sparsity, function = iterate, fixed = None):
+    """Builds a jacobian function from colored finite differences. When fixed is given the sparsity is only
+    a bound: the first jacobian is found with it, and the nonzeros of that jacobian together with the fixed
+    entries become the sparsity of every later jacobian. A bound with every entry set makes the first jacobian
+    a full finite difference, so the structure is found without any extra residual evaluations.
+
+    Assumptions:
+    A residual left exactly unchanged by an unknown at the first jacobian never depends on that unknown
+
+    Source:
+    N/A
+
+    Inputs:
+    sparsity                      [boolean array]
+    function                      [function]     residual function, defaults to iterate
+    fixed                         [boolean array or None]
+
+    Outputs:
+    fprime                        [function]
+
+    Properties Used:
+    N/A
+    """     
+    
+    pattern = dict(sparsity = sparsity, colors = color_jacobian(sparsity), fixed = fixed)
+    
+    def fprime(unknowns, args):
+        J = sparse_jacobian(unknowns, args, pattern['sparsity'], pattern['colors'], function)
+        if pattern['fixed'] is not None:
+            pattern['sparsity'] = (J != 0.) | pattern['fixed']
+            pattern['colors']   = color_jacobian(pattern['sparsity'])
+            pattern['fixed']    = None
+        return J
+    
+    return fprime
+
+## @ingroup Methods-Missions-Segments
+def jacobian_sparsity(segment):
+    """Finds which residuals each unknown can change. Unless supplied in state.numerics.jacobian_sparsity,
+    every unknown is perturbed on its own at the current unknowns, and every residual that moves at all
+    is taken to depend on it.
+
+    Assumptions:
+    A residual left exactly unchanged by an unknown at the current unknowns never depends on it
+
+    Source:
+    N/A
+
+    Inputs:
+    state.unknowns                     [Data]
+    state.numerics.jacobian_sparsity   [boolean array or None]
+
+    Outputs:
+    sparsity                           [boolean array]
+
+    Properties Used:
+    N/A
+    """     
+    
+    sparsity = segment.state.numerics.jacobian_sparsity
+    if sparsity is not None:
+        return np.array(sparsity,dtype=bool)
+    
+    unknowns = segment.state.unknowns.pack_array()
+    size     = len(unknowns)
+    J        = sparse_jacobian(unknowns, segment, np.ones((size,size),dtype=bool), np.arange(size))
+    
+    return J != 0.
+
+## @ingroup Methods-Missions-Segments
+def color_jacobian(sparsity):
+    """Greedily groups the columns of the jacobian so no two columns in a group share a row.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    sparsity                      [boolean array]
+
+    Outputs:
+    colors                        [int array]
+
+    Properties Used:
+    N/A
+    """     
+    
+    colors = np.zeros(sparsity.shape[1],dtype=int)
+    filled = []
+    
+    for j in range(sparsity.shape[1]):
+        column = sparsity[:,j]
+        for color, rows in enumerate(filled):
+            if not np.any(rows & column):
+                rows |= column
+                break
+        else:
+            color = len(filled)
+            filled.append(column.copy())
+        colors[j] = color
+        
+    return colors
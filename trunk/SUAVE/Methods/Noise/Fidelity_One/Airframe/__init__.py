@@ -7,3 +7,6 @@ from .noise_clean_wing import noise_clean_wing
 from . import noise_landing_gear
 from . import noise_leading_edge_slat
 from . import noise_trailing_edge_flap
+from .noise_airframe_Fink_source import noise_airframe_Fink_source
+from .noise_airframe_Fink_spectra import noise_airframe_Fink_spectra
+from .noise_airframe_Fink_output import noise_airframe_Fink_output
@@ -0,0 +1,141 @@
+## @ingroupMethods-Noise-Fidelity_One-Airframe
+# noise_airframe_Fink_output.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+# SUAVE Imports
+from SUAVE.Core            import Units
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#  Noise Airframe Fink Output
+# ----------------------------------------------------------------------
+
+## @ingroupMethods-Noise-Fidelity_One-Airframe
+def noise_airframe_Fink_output(config, source, spectra, levels, filename=0):
+
+    """ SUAVE.Methods.Noise.Fidelity_One.Airframe.noise_airframe_Fink_output(config, source, spectra, levels, filename=0):
+            Writes the PNLT history, the EPNL of each airframe component and the SPL history of the total airframe
+            noise computed by noise_airframe_Fink to text files. This stage is separate from the noise calculation.
+
+            Inputs:
+                config          - SUAVE type vehicle, its tag names the output files
+                source          - airframe geometry and flow conditions from noise_airframe_Fink_source
+                spectra         - 1/3 octave band SPL histories from noise_airframe_Fink_spectra
+                levels          - noise metrics of the airframe, with the fields:
+                    distance, theta, phi                     - geometry at the noise time steps
+                    PNLT                                     - PNLT history of each component and total
+                    EPNL                                     - EPNL of each component and total
+                    SENEL                                    - SENEL of the total airframe noise
+                    dBA_max                                  - maximum dBA of each time step
+                filename        - name of the file with the levels, Noise_<config tag>.dat by default
+
+            Outputs:
+                Noise_<config tag>.dat and History_Noise_<config tag>.dat
+
+            Assumptions:
+                N/A"""
+
+    #unpack
+    velocity   = source.velocity
+    altitude   = source.altitude
+    noise_time = source.noise_time
+    frequency  = source.frequency
+    M          = source.mach_number
+
+    distance_vector = levels.distance
+    angle           = levels.theta
+    phi             = levels.phi
+    PNLT            = levels.PNLT
+    EPNL            = levels.EPNL
+    SPLt_dBA_max    = levels.dBA_max
+
+    SPL_total_history = spectra.total
+    SPLt_dBA_history  = spectra.dBA
+
+    # write header of file
+    if not filename:
+        filename = ('Noise_' + str(config.tag) + '.dat')
+
+    fid = open(filename,'w')   # Open output file
+
+    fid.write('Reference speed =  ')
+    fid.write(str('%2.2f' % (velocity/Units.kts))+'  kts')
+    fid.write('\n')
+    fid.write('PNLT history')
+    fid.write('\n')
+    fid.write('time       altitude      Mach    Polar_angle    Azim_angle   distance        wing  	   ht 	        vt 	   flap   	 slat         nose        main         total         dBA')
+    fid.write('\n')
+
+    for id in range (0,len(noise_time)):
+        fid.write(str('%2.2f' % noise_time[id])+'        ')
+        fid.write(str('%2.2f' % altitude[id])+'        ')
+        fid.write(str('%2.2f' % M[id])+'        ')
+        fid.write(str('%2.2f' % (angle[id]*180/np.pi))+'        ')
+        fid.write(str('%2.2f' % (phi[id]*180/np.pi))+'        ')
+        fid.write(str('%2.2f' % distance_vector[id])+'        ')
+        fid.write(str('%2.2f' % PNLT.wing[id])+'        ')
+        fid.write(str('%2.2f' % PNLT.horizontal_tail[id])+'        ')
+        fid.write(str('%2.2f' % PNLT.vertical_tail[id])+'        ')
+        fid.write(str('%2.2f' % PNLT.flap[id])+'        ')
+        fid.write(str('%2.2f' % PNLT.slat[id])+'        ')
+        fid.write(str('%2.2f' % PNLT.nose_landing_gear[id])+'        ')
+        fid.write(str('%2.2f' % PNLT.main_landing_gear[id])+'        ')
+        fid.write(str('%2.2f' % PNLT.total[id])+'        ')
+        fid.write(str('%2.2f' % SPLt_dBA_max[id])+'        ')
+        fid.write('\n')
+    fid.write('\n')
+    fid.write('PNLT max =  ')
+    fid.write(str('%2.2f' % (np.max(PNLT.total)))+'  dB')
+    fid.write('\n')
+    fid.write('dBA max =  ')
+    fid.write(str('%2.2f' % (np.max(SPLt_dBA_max)))+'  dBA')
+    fid.write('\n')
+    fid.write('\n')
+    fid.write('EPNdB')
+    fid.write('\n')
+    fid.write('wing	       ht          vt         flap         slat    	nose        main	total')
+    fid.write('\n')
+    fid.write(str('%2.2f' % EPNL.wing)+'        ')
+    fid.write(str('%2.2f' % EPNL.horizontal_tail)+'        ')
+    fid.write(str('%2.2f' % EPNL.vertical_tail)+'        ')
+    fid.write(str('%2.2f' % EPNL.flap)+'        ')
+    fid.write(str('%2.2f' % EPNL.slat)+'        ')
+    fid.write(str('%2.2f' % EPNL.nose_landing_gear)+'        ')
+    fid.write(str('%2.2f' % EPNL.main_landing_gear)+'        ')
+    fid.write(str('%2.2f' % EPNL.total)+'        ')
+    fid.write('\n')
+    fid.write('SENEL = ')
+    fid.write(str('%2.2f' % levels.SENEL)+'        ')
+    fid.close()
+
+    filename1 = ('History_Noise_' + str(config.tag) + '.dat')
+    fid = open(filename1,'w')   # Open output file
+    fid.write('Reference speed =  ')
+    fid.write(str('%2.2f' % (velocity/Units.kts))+'  kts')
+    fid.write('\n')
+    fid.write('Sound Pressure Level for the Total Aircraft Noise')
+    fid.write('\n')
+
+    for nid in range (0,len(angle)):
+        fid.write('Polar angle = ' + str('%2.2f' % (angle[nid]*(180/np.pi))) + '  degrees' + '\n')
+        fid.write('f		total SPL(dB)    total SPL(dBA)' + '\n')
+        for id in range(0,24):
+            fid.write(str((frequency[id])) + '           ')
+            fid.write(str('%3.2f' % SPL_total_history[nid][id]) + '          ')
+            fid.write(str('%3.2f' % SPLt_dBA_history[nid][id]))
+            fid.write('\n')
+        fid.write('SPLmax (dB) =  ')
+        fid.write(str('%3.2f' % (np.max(SPL_total_history[nid][:])))+'  dB' + '\n')
+        fid.write('SPLmax (dBA) =  ')
+        fid.write(str('%3.2f' % (np.max(SPLt_dBA_history[nid][:])))+'  dB')
+        fid.write('\n')
+
+    fid.close()
+
+    return
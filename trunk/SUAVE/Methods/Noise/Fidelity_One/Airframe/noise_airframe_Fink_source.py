@@ -0,0 +1,128 @@
+## @ingroupMethods-Noise-Fidelity_One-Airframe
+# noise_airframe_Fink_source.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+# SUAVE Imports
+from SUAVE.Core            import Data
+from SUAVE.Core            import Units
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#  Noise Airframe Fink Source
+# ----------------------------------------------------------------------
+
+## @ingroupMethods-Noise-Fidelity_One-Airframe
+def noise_airframe_Fink_source(config, analyses, noise_segment):
+
+    """ SUAVE.Methods.Noise.Fidelity_One.Airframe.noise_airframe_Fink_source(config, analyses, noise_segment):
+            Computes the airframe geometry and the flow conditions of the Fink method on the noise time steps of a segment.
+            These values do not depend on the observer, so they are computed once and used for the spectra at any number of observers.
+
+            Inputs:
+                config        - SUAVE type vehicle, with the wings, flaps and landing gear
+                analyses      - contains the atmosphere
+                noise_segment - flight segment with the freestream and the time
+
+            Outputs:
+                source        - Data with the time steps of the noise calculation, the geometry of the airframe in feet
+                                and the Mach number, viscosity and wing boundary layer thickness of each time step
+
+            Assumptions:
+                Correlation based. The noise is computed every 0.5 s of the segment."""
+
+
+    # ==============================================
+        # Unpack
+    # ==============================================
+    wing     = config.wings
+    flap     = wing.main_wing.control_surfaces.flap
+
+    Sw       = wing.main_wing.areas.reference  / (Units.ft)**2              #wing area, sq.ft
+    bw       = wing.main_wing.spans.projected / Units.ft                    #wing span, ft
+    Sht      = wing.horizontal_stabilizer.areas.reference / (Units.ft)**2   #horizontal tail area, sq.ft
+    bht      = wing.horizontal_stabilizer.spans.projected / Units.ft        #horizontal tail span, ft
+    Svt      = wing.vertical_stabilizer.areas.reference / (Units.ft)**2     #vertical tail area, sq.ft
+    bvt      = wing.vertical_stabilizer.spans.projected  / Units.ft         #vertical tail span, ft
+    deltaf   = flap.deflection                                              #flap delection, rad
+    Sf       = flap.area  / (Units.ft)**2                                   #flap area, sq.ft
+    cf       = flap.chord_dimensional  / Units.ft                           #flap chord, ft
+    Dp       = config.landing_gear.main_tire_diameter  / Units.ft           #MLG tyre diameter, ft
+    Hp       = config.landing_gear.nose_tire_diameter  / Units.ft           #MLG strut length, ft
+    Dn       = config.landing_gear.main_strut_length   / Units.ft           #NLG tyre diameter, ft
+    Hn       = config.landing_gear.nose_strut_length   / Units.ft           #NLG strut length, ft
+    gear     = config.landing_gear.gear_condition                           #Gear up or gear down
+
+    nose_wheels    =   config.landing_gear.nose_wheels                           #Number of wheels
+    main_wheels    =   config.landing_gear.main_wheels                           #Number of wheels
+    main_units     =   config.landing_gear.main_units                            #Number of main units
+    velocity       =   np.float(noise_segment.conditions.freestream.velocity[0,0]) #aircraft velocity
+    altitude       =   noise_segment.conditions.freestream.altitude[:,0]           #aircraft altitude
+    time           =   noise_segment.conditions.frames.inertial.time[:,0]          #time discretization
+
+    noise_time = np.arange(0.,time[-1],.5)
+    altitude = np.interp(noise_time,time,altitude)
+
+    # determining flap slot number
+    if wing.main_wing.control_surfaces.flap.configuration_type   == 'single_slotted':
+        slots = 1
+    elif wing.main_wing.control_surfaces.flap.configuration_type == 'double_slotted':
+        slots = 2
+    elif wing.main_wing.control_surfaces.flap.configuration_type == 'triple_slotted':
+        slots = 3
+
+    # ==============================================
+    #         Computing atmospheric conditions
+    # ==============================================
+
+    atmo_data = analyses.atmosphere.compute_values(altitude)
+
+    #unpack
+    viscosity   = atmo_data.dynamic_viscosity[:,0]*10.7639 #units converstion - m2 to ft2
+    temperature = atmo_data.temperature[:,0]
+
+    #Mach number
+    M = velocity/np.sqrt(1.4*287*temperature)
+
+    #Wing Turbulent Boundary Layer thickness, ft
+    deltaw = 0.37*(Sw/bw)*((velocity/Units.ft)*Sw/(bw*viscosity))**(-0.2)
+
+    #Generate array with the One Third Octave Band Center Frequencies
+    frequency = np.array((50, 63, 80, 100, 125, 160, 200, 250, 315, 400, 500, 630, 800, 1000, 1250, 1600, \
+            2000, 2500, 3150, 4000, 5000, 6300, 8000, 10000))
+
+    #Pack the results
+    source = Data()
+    source.time            = time
+    source.noise_time      = noise_time
+    source.frequency       = frequency
+    source.altitude        = altitude
+    source.velocity        = velocity
+    source.mach_number     = M
+    source.viscosity       = viscosity
+    source.deltaw          = deltaw
+    source.wing_area       = Sw
+    source.wing_span       = bw
+    source.horizontal_tail_area = Sht
+    source.horizontal_tail_span = bht
+    source.vertical_tail_area   = Svt
+    source.vertical_tail_span   = bvt
+    source.flap_deflection = deltaf
+    source.flap_area       = Sf
+    source.flap_chord      = cf
+    source.flap_slots      = slots
+    source.main_tire_diameter = Dp
+    source.main_strut_length  = Hp
+    source.nose_tire_diameter = Dn
+    source.nose_strut_length  = Hn
+    source.gear_condition  = gear
+    source.nose_wheels     = nose_wheels
+    source.main_wheels     = main_wheels
+    source.main_units      = main_units
+
+    return source
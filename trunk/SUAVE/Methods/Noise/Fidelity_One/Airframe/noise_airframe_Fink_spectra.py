@@ -0,0 +1,127 @@
+## @ingroupMethods-Noise-Fidelity_One-Airframe
+# noise_airframe_Fink_spectra.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+# SUAVE Imports
+from SUAVE.Core            import Data
+
+from .noise_clean_wing import noise_clean_wing
+from .noise_landing_gear import noise_landing_gear
+from .noise_leading_edge_slat import noise_leading_edge_slat
+from .noise_trailing_edge_flap import noise_trailing_edge_flap
+
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import atmospheric_attenuation
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import dbA_noise
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#  Noise Airframe Fink Spectra
+# ----------------------------------------------------------------------
+
+## @ingroupMethods-Noise-Fidelity_One-Airframe
+def noise_airframe_Fink_spectra(source, distance_vector, angle, phi):
+
+    """ SUAVE.Methods.Noise.Fidelity_One.Airframe.noise_airframe_Fink_spectra(source, distance_vector, angle, phi):
+            Computes the 1/3 octave band SPL histories of the airframe components from the source values given by
+            noise_airframe_Fink_source. Any number of observers can be computed at once, with the observers along
+            the leading axes of the geometry.
+
+            Inputs:
+                source          - airframe geometry and flow conditions from noise_airframe_Fink_source
+                distance_vector - distance from the source location to the observers at the noise time steps [m]
+                angle           - polar angle from the source to the observers at the noise time steps [rad]
+                phi             - azimuthal angle from the source to the observers at the noise time steps [rad]
+
+            Outputs: One Third Octave Band SPL [dB], with a row for each time step and a column for each band
+                wing, horizontal_tail, vertical_tail, flap, slat,
+                main_landing_gear, nose_landing_gear  - Sound Pressure Level of each component
+                total                                 - Sound Pressure Level of the airframe
+                dBA                                   - A-weighted Sound Pressure Level of the airframe
+
+            Assumptions:
+                Correlation based. All time steps of all observers are computed in one vectorized evaluation."""
+
+    #unpack
+    velocity    = source.velocity
+    M           = source.mach_number
+    viscosity   = source.viscosity
+    deltaw      = source.deltaw
+    frequency   = source.frequency
+    Sw          = source.wing_area
+    bw          = source.wing_span
+    Sht         = source.horizontal_tail_area
+    bht         = source.horizontal_tail_span
+    Svt         = source.vertical_tail_area
+    bvt         = source.vertical_tail_span
+    deltaf      = source.flap_deflection
+    Sf          = source.flap_area
+    cf          = source.flap_chord
+    slots       = source.flap_slots
+    Dp          = source.main_tire_diameter
+    Hp          = source.main_strut_length
+    Dn          = source.nose_tire_diameter
+    Hn          = source.nose_strut_length
+    gear        = source.gear_condition
+    nose_wheels = source.nose_wheels
+    main_wheels = source.main_wheels
+    main_units  = source.main_units
+
+    # the geometry of each time step is a column, which broadcasts over the frequency bands
+    distance_vector, angle, phi = np.broadcast_arrays(distance_vector, angle, phi)
+    shape    = np.shape(angle)
+    theta    = angle[...,None]
+    distance = distance_vector[...,None]
+    phi      = phi[...,None]
+
+    # the flow conditions of each time step
+    M         = np.reshape(M,(-1,1))
+    viscosity = np.reshape(viscosity,(-1,1))
+    deltaw    = np.reshape(deltaw,(-1,1))
+
+    #Atmospheric attenuation
+    delta_atmo = atmospheric_attenuation(distance)
+
+    #Call each noise source model, for all observers and positions of the aircraft at once
+    SPL_wing = noise_clean_wing(Sw,bw,0,1,deltaw,velocity,viscosity,M,phi,theta,distance,frequency) - delta_atmo    #Wing Noise
+    SPLht    = noise_clean_wing(Sht,bht,0,1,deltaw,velocity,viscosity,M,phi,theta,distance,frequency)  -delta_atmo    #Horizontal Tail Noise
+    SPLvt    = noise_clean_wing(Svt,bvt,0,0,deltaw,velocity,viscosity,M,phi,theta,distance,frequency)  -delta_atmo    #Vertical Tail Noise
+
+    SPL_slat = noise_leading_edge_slat(SPL_wing,Sw,bw,velocity,deltaw,viscosity,M,phi,theta,distance,frequency) -delta_atmo        #Slat leading edge
+
+    if (deltaf==0):
+        SPL_flap = np.zeros(shape+(24,))
+    else:
+        SPL_flap = noise_trailing_edge_flap(Sf,cf,deltaf,slots,velocity,M,phi,theta,distance,frequency) - delta_atmo #Trailing Edge Flaps Noise
+
+    if gear=='up': #0
+        SPL_main_landing_gear = np.zeros(shape+(24,))
+        SPL_nose_landing_gear = np.zeros(shape+(24,))
+    else:
+        SPL_main_landing_gear = noise_landing_gear(Dp,Hp,main_wheels,M,velocity,phi,theta,distance,frequency)  - delta_atmo     #Main Landing Gear Noise
+        SPL_nose_landing_gear = noise_landing_gear(Dn,Hn,nose_wheels,M,velocity,phi,theta,distance,frequency)  - delta_atmo     #Nose Landing Gear Noise
+    if main_units>1: #Incoherent summation of each main landing gear unit
+        SPL_main_landing_gear = SPL_main_landing_gear+3*(main_units-1)
+
+    #Total Airframe Noise
+    SPL_total = 10.*np.log10(10.0**(0.1*SPL_wing)+10.0**(0.1*SPLht)+10**(0.1*SPL_flap)+ \
+         10.0**(0.1*SPL_slat)+10.0**(0.1*SPL_main_landing_gear)+10.0**(0.1*SPL_nose_landing_gear))
+
+    #Pack the results
+    spectra = Data()
+    spectra.wing              = SPL_wing
+    spectra.horizontal_tail   = SPLht
+    spectra.vertical_tail     = SPLvt
+    spectra.flap              = SPL_flap
+    spectra.slat              = SPL_slat
+    spectra.main_landing_gear = SPL_main_landing_gear
+    spectra.nose_landing_gear = SPL_nose_landing_gear
+    spectra.total             = SPL_total
+    spectra.dBA               = dbA_noise(SPL_total)
+
+    return spectra
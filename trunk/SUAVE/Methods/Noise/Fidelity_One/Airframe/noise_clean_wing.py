@@ -3,6 +3,7 @@
 # 
 # Created:  Jun 2015, C. Ilario
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
@@ -38,7 +39,7 @@ def noise_clean_wing(S,b,ND,IsHorz,deltaw,velocity,viscosity,M,phi,theta,distanc
                     distance                   - Distance from airplane to observer, evaluated at retarded time [ft]
                     frequency                  - Frequency array [Hz]
 
-
+                The flow conditions and the geometry may be columns of time steps, which broadcast over the frequencies.
 
             Outputs: One Third Octave Band SPL [dB]
                 SPL                              - Sound Pressure Level of the clean wing [dB]
@@ -58,16 +59,17 @@ def noise_clean_wing(S,b,ND,IsHorz,deltaw,velocity,viscosity,M,phi,theta,distanc
         DIR = np.sin(phi)
 
 
-    if DIR==0:
-        SPL = np.zeros(24)
-    else:
+    # the levels are zero where the directivity vanishes
+    no_directivity = (DIR==0)
+    DIR            = np.where(no_directivity,1.,DIR)
 
-        fmax  = 0.1*(velocity/Units.ft)/(delta*(1-M*np.cos(theta)))
-        fmaxw = 0.1*(velocity/Units.ft)/deltaw
+    fmax  = 0.1*(velocity/Units.ft)/(delta*(1-M*np.cos(theta)))
+    fmaxw = 0.1*(velocity/Units.ft)/deltaw
 
-        OASPL = 50*np.log10((velocity/Units.kts)/100.0)+10*np.log10(delta*b/(distance**2.0))+8*ND+ \
-            20*np.log10(DIR*np.sin(theta)*np.cos(theta/2.0))+104.3
+    OASPL = 50*np.log10((velocity/Units.kts)/100.0)+10*np.log10(delta*b/(distance**2.0))+8*ND+ \
+        20*np.log10(DIR*np.sin(theta)*np.cos(theta/2.0))+104.3
 
-        SPL   = OASPL+10.0*np.log10(0.613*(frequency/fmax)**4*((frequency/fmax)**1.5+0.5)**(-4))-0.03*np.abs(((frequency/fmaxw)-1))**1.5
+    SPL   = OASPL+10.0*np.log10(0.613*(frequency/fmax)**4*((frequency/fmax)**1.5+0.5)**(-4))-0.03*np.abs(((frequency/fmaxw)-1))**1.5
+    SPL   = np.where(no_directivity,0.,SPL)
 
     return(SPL);
@@ -0,0 +1,196 @@
+## @ingroupMethods-Noise-Fidelity_One-Engine
+# noise_SAE_source.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+from SUAVE.Core import Units, Data
+
+# ----------------------------------------------------------------------
+#   Noise SAE Source
+# ----------------------------------------------------------------------
+
+## @ingroupMethods-Noise-Fidelity_One-Engine
+def noise_SAE_source(turbofan,noise_segment,analyses):
+    """This method computes the jet flow of the SAE ARP*876D model on the noise time steps of a segment.
+    These values do not depend on the observer, so they are computed once and used for the spectra
+    at any number of observers.
+
+        Inputs:
+                    turbofan        - SUAVE type turbofan, with the nozzle diameters, noise speeds and installation geometry
+                    noise_segment   - flight segment with the acoustic outputs of the propulsion, the freestream and the time
+                    analyses        - contains the atmosphere
+
+        Outputs:
+                    source          - Data with the time steps of the noise calculation, the engine geometry, the
+                                      atmosphere and the jet flow parameters, one row per time step
+
+        Assumptions:
+                    The noise is computed every 0.5 s of the segment."""
+
+    #unpack
+    Velocity_primary_1      =       np.float(turbofan.core_nozzle.noise_speed * 0.92*(turbofan.design_thrust/52700.))
+    Temperature_primary     =       noise_segment.conditions.propulsion.acoustic_outputs.core.exit_stagnation_temperature[:,0]
+    Pressure_primary        =       noise_segment.conditions.propulsion.acoustic_outputs.core.exit_stagnation_pressure[:,0]
+
+    Velocity_secondary_1    =       np.float(turbofan.fan_nozzle.noise_speed * (turbofan.design_thrust/52700.))
+    Temperature_secondary   =       noise_segment.conditions.propulsion.acoustic_outputs.fan.exit_stagnation_temperature[:,0]
+    Pressure_secondary      =       noise_segment.conditions.propulsion.acoustic_outputs.fan.exit_stagnation_pressure[:,0]
+
+    N1                      =       np.float(turbofan.fan.rotation * 0.92*(turbofan.design_thrust/52700.))
+    Diameter_primary        =       turbofan.core_nozzle_diameter
+    Diameter_secondary      =       turbofan.fan_nozzle_diameter
+    engine_height           =       turbofan.engine_height
+    EXA                     =       turbofan.exa
+    Plug_diameter           =       turbofan.plug_diameter
+    Xe                      =       turbofan.geometry_xe
+    Ye                      =       turbofan.geometry_ye
+    Ce                      =       turbofan.geometry_Ce
+
+    Velocity_aircraft       =       np.float(noise_segment.conditions.freestream.velocity[0,0])
+    Altitude                =       noise_segment.conditions.freestream.altitude[:,0]
+    AOA                     =       np.mean(noise_segment.conditions.aerodynamics.angle_of_attack / Units.deg)
+
+    time                    =       noise_segment.conditions.frames.inertial.time[:,0]
+
+    noise_time = np.arange(0.,time[-1],.5)
+
+    Temperature_primary   = np.interp(noise_time,time,Temperature_primary)
+    Pressure_primary      = np.interp(noise_time,time,Pressure_primary)
+    Temperature_secondary = np.interp(noise_time,time,Temperature_secondary)
+    Pressure_secondary    = np.interp(noise_time,time,Pressure_secondary)
+    Altitude              = np.interp(noise_time,time,Altitude)
+
+    nsteps = len(noise_time)
+
+    # the values of each time step are columns, which broadcast over the frequency bands
+    Temperature_primary   = Temperature_primary[:,None]
+    Pressure_primary      = Pressure_primary[:,None]
+    Temperature_secondary = Temperature_secondary[:,None]
+    Pressure_secondary    = Pressure_secondary[:,None]
+
+    Velocity_primary   = np.ones((nsteps,1))*Velocity_primary_1
+    Velocity_secondary = np.ones((nsteps,1))*Velocity_secondary_1
+
+    # ==============================================
+    # Computing atmospheric conditions
+    # ==============================================
+
+    atmo_data = analyses.atmosphere.compute_values(Altitude)
+
+    sound_ambient       = atmo_data.speed_of_sound
+    density_ambient     = atmo_data.density
+    pressure_amb        = atmo_data.pressure
+
+    #Base parameters necessary input for the noise code
+    R_gas        = 287.1  #[J/kg K]
+    gama_primary = 1.37   #Corretion for the primary jet
+    gama         = 1.4
+
+    #Calculation of nozzle areas
+    Area_primary   = np.pi*(Diameter_primary/2)**2
+    Area_secondary =  np.pi*(Diameter_secondary/2)**2
+
+    #Desired frequency range for noise evaluation
+    frequency = np.array((50, 63, 80, 100, 125, 160, 200, 250, 315, 400, 500, 630, 800, 1000, 1250, 1600, \
+            2000, 2500, 3150, 4000, 5000, 6300, 8000, 10000))
+
+    # Jet Flow Parameters, all positions of the aircraft at once
+
+    #Primary and Secondary jets
+    Cpp = R_gas/(1-1/gama_primary)
+    Cp  = R_gas/(1-1/gama)
+
+    density_primary   = Pressure_primary/(R_gas*Temperature_primary-(0.5*R_gas*Velocity_primary**2/Cpp))
+    density_secondary = Pressure_secondary/(R_gas*Temperature_secondary-(0.5*R_gas*Velocity_secondary**2/Cp))
+
+    mass_flow_primary   = Area_primary*Velocity_primary*density_primary
+    mass_flow_secondary = Area_secondary*Velocity_secondary*density_secondary
+
+    #Mach number of the external flow - based on the aircraft velocity
+    Mach_aircraft = Velocity_aircraft/sound_ambient
+
+    #Calculation Procedure for the Mixed Jet Flow Parameters
+    Velocity_mixed = (mass_flow_primary*Velocity_primary+mass_flow_secondary*Velocity_secondary)/ \
+            (mass_flow_primary+mass_flow_secondary)
+    Temperature_mixed =(mass_flow_primary*Temperature_primary+mass_flow_secondary*Temperature_secondary)/ \
+            (mass_flow_primary+mass_flow_secondary)
+    density_mixed = pressure_amb/(R_gas*Temperature_mixed-(0.5*R_gas*Velocity_mixed**2/Cp))
+    Area_mixed = Area_primary*density_primary*Velocity_primary*(1+(mass_flow_secondary/mass_flow_primary))/ \
+            (density_mixed*Velocity_mixed)
+    Diameter_mixed = (4*Area_mixed/np.pi)**0.5
+
+    XBPR = np.minimum(np.maximum(mass_flow_secondary/mass_flow_primary - 5.5, 0.), 4.)
+
+    #Auxiliary parameter defined as DVPS
+    DVPS = np.abs((Velocity_primary - (Velocity_secondary*Area_secondary+Velocity_aircraft*Area_primary)/(Area_secondary+Area_primary)))
+    DVPS = np.maximum(DVPS, 0.3)
+
+    # Calculation of the Strouhal number for each jet component (p-primary, s-secondary, m-mixed)
+    Str_p = frequency*Diameter_primary/(DVPS)  #Primary jet
+    Str_s = frequency*Diameter_mixed/(Velocity_secondary-Velocity_aircraft) #Secondary jet
+    Str_m = frequency*Diameter_mixed/(Velocity_mixed-Velocity_aircraft) #Mixed jet
+
+    #Calculation of the Excitation adjustment parameter
+    #Excitation Strouhal Number
+    excitation_Strouhal = (N1/60)*(Diameter_mixed/Velocity_mixed)
+    SX = np.where((excitation_Strouhal > 0.25) & (excitation_Strouhal < 0.5), 0.0, \
+                  50*(excitation_Strouhal-0.25)*(excitation_Strouhal-0.5))
+
+    #Effectiveness
+    exps = np.exp(-SX)
+
+    #Spectral Shape Factor
+    exs = 5*exps*np.exp(-(np.log10(Str_m/(2*excitation_Strouhal+0.00001)))**2)
+
+    #Fan Duct Lenght Factor
+    exd = np.exp(0.6-(EXA)**0.5)
+
+    #Excitation source location factor (zk)
+    zk = 1-0.4*(exd)*(exps)
+
+    #Pack the results
+    source = Data()
+    source.time                  = time
+    source.noise_time            = noise_time
+    source.frequency             = frequency
+    source.altitude              = Altitude
+    source.angle_of_attack       = AOA
+    source.velocity_aircraft     = Velocity_aircraft
+    source.mach_aircraft         = Mach_aircraft
+    source.sound_ambient         = sound_ambient
+    source.density_ambient       = density_ambient
+    source.pressure_ambient      = pressure_amb
+    source.R_gas                 = R_gas
+    source.diameter_primary      = Diameter_primary
+    source.diameter_secondary    = Diameter_secondary
+    source.engine_height         = engine_height
+    source.plug_diameter         = Plug_diameter
+    source.geometry_xe           = Xe
+    source.geometry_ye           = Ye
+    source.geometry_Ce           = Ce
+    source.area_primary          = Area_primary
+    source.area_secondary        = Area_secondary
+    source.temperature_primary   = Temperature_primary
+    source.velocity_primary      = Velocity_primary
+    source.velocity_secondary    = Velocity_secondary
+    source.velocity_mixed        = Velocity_mixed
+    source.density_primary       = density_primary
+    source.density_secondary     = density_secondary
+    source.density_mixed         = density_mixed
+    source.diameter_mixed        = Diameter_mixed
+    source.XBPR                  = XBPR
+    source.DVPS                  = DVPS
+    source.strouhal_primary      = Str_p
+    source.strouhal_secondary    = Str_s
+    source.strouhal_mixed        = Str_m
+    source.excitation_shape      = exs
+    source.excitation_duct       = exd
+    source.excitation_effectiveness = exps
+    source.zk                    = zk
+
+    return source
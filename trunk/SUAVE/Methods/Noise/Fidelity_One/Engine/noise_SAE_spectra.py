@@ -0,0 +1,194 @@
+## @ingroupMethods-Noise-Fidelity_One-Engine
+# noise_SAE_spectra.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+from SUAVE.Core import Data
+
+from .angle_of_attack_effect import angle_of_attack_effect
+from .external_plug_effect import external_plug_effect
+from .ground_proximity_effect import ground_proximity_effect
+from .jet_installation_effect import jet_installation_effect
+from .mixed_noise_component import mixed_noise_component
+from .noise_source_location import noise_source_location
+from .primary_noise_component import primary_noise_component
+from .secondary_noise_component import secondary_noise_component
+
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import atmospheric_attenuation
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import dbA_noise
+
+# ----------------------------------------------------------------------
+#   Noise SAE Spectra
+# ----------------------------------------------------------------------
+
+## @ingroupMethods-Noise-Fidelity_One-Engine
+def noise_SAE_spectra(source,distance_microphone,angles):
+    """This method computes the 1/3 octave band SPL histories of the primary, secondary and mixed jets
+    of the SAE ARP*876D model from the jet flow given by noise_SAE_source. Any number of observers can
+    be computed at once, with the observers along the leading axes of the geometry.
+
+        Inputs:
+                    source                - jet flow parameters from noise_SAE_source
+                    distance_microphone   - Distance from the aircraft to the observers at the noise time steps, [meters]
+                    angles                - Polar angles from the aircraft to the observers at the noise time steps, [rad]
+
+        Outputs: One Third Octave Band SPL [dB], with a row for each time step and a column for each band
+                    primary               - Sound Pressure Level of the primary jet
+                    secondary             - Sound Pressure Level of the secondary jet
+                    mixed                 - Sound Pressure Level of the mixed jet
+                    total                 - Sound Pressure Level of the total jet noise
+                    dBA                   - A-weighted Sound Pressure Level of the total jet noise
+
+        Assumptions:
+                    The geometry of the observers is given at the time steps of the source."""
+
+    #unpack
+    Diameter_primary      = source.diameter_primary
+    Diameter_secondary    = source.diameter_secondary
+    engine_height         = source.engine_height
+    Plug_diameter         = source.plug_diameter
+    Xe                    = source.geometry_xe
+    Ye                    = source.geometry_ye
+    Ce                    = source.geometry_Ce
+    frequency             = source.frequency
+    AOA                   = source.angle_of_attack
+    Velocity_aircraft     = source.velocity_aircraft
+    Mach_aircraft         = source.mach_aircraft
+    sound_ambient         = source.sound_ambient
+    density_ambient       = source.density_ambient
+    pressure_amb          = source.pressure_ambient
+    R_gas                 = source.R_gas
+    Area_primary          = source.area_primary
+    Area_secondary        = source.area_secondary
+    Temperature_primary   = source.temperature_primary
+    Velocity_primary      = source.velocity_primary
+    Velocity_secondary    = source.velocity_secondary
+    Velocity_mixed        = source.velocity_mixed
+    density_primary       = source.density_primary
+    density_secondary     = source.density_secondary
+    density_mixed         = source.density_mixed
+    Diameter_mixed        = source.diameter_mixed
+    XBPR                  = source.XBPR
+    DVPS                  = source.DVPS
+    Str_p                 = source.strouhal_primary
+    Str_s                 = source.strouhal_secondary
+    Str_m                 = source.strouhal_mixed
+    exs                   = source.excitation_shape
+    exd                   = source.excitation_duct
+    exps                  = source.excitation_effectiveness
+    zk                    = source.zk
+
+    # the geometry of each time step is a column, which broadcasts over the frequency bands
+    distance_microphone = np.asarray(distance_microphone)[...,None]
+    theta               = np.asarray(angles)[...,None]
+
+    #Base parameters necessary input for the noise code
+    pressure_isa = 101325 #[Pa]
+
+    Xo=0 #Acoustic center of reference [m] - Used for wind tunnel acoustic data
+
+    #Flags for definition of near-fiel or wind-tunnel data
+    near_field = 0
+    tunnel     = 0
+
+    #Call function noise source location for the calculation of theta, starting from the jet normal
+    theta_0 = np.pi/2
+    theta_p, theta_s, theta_m = noise_source_location(Xo,zk,Diameter_primary,theta_0,Area_primary,Area_secondary,distance_microphone,Diameter_secondary,theta,theta_0,theta_0,Diameter_mixed,Velocity_primary,Velocity_secondary,Velocity_mixed,Velocity_aircraft,sound_ambient,Str_m,Str_s)
+
+    #Calculation of the Directivity Factor
+    exc = np.where(theta_m <= 1.4, sound_ambient/Velocity_mixed, \
+                   (sound_ambient/Velocity_mixed)*(1-(1.8/np.pi)*(theta_m-1.4)))
+
+    #Acoustic excitation adjustment (EX)
+    EX_m = exd*exs*exc   #mixed component - dependant of the frequency
+    EX_p = +5*exd*exps   #primary component - no frequency dependance
+    EX_s = 2*sound_ambient/(Velocity_secondary*(zk)) #secondary component - no frequency dependance
+
+    distance_primary   = distance_microphone
+    distance_secondary = distance_microphone
+    distance_mixed     = distance_microphone
+
+    #Noise attenuation due to Ambient Pressure
+    dspl_ambient_pressure = 20*np.log10(pressure_amb/pressure_isa)
+
+    #Noise attenuation due to Density Gradientes
+    dspl_density_p = 20*np.log10((density_primary+density_secondary)/(2*density_ambient))
+    dspl_density_s = 20*np.log10((density_secondary+density_ambient)/(2*density_ambient))
+    dspl_density_m = 20*np.log10((density_mixed+density_ambient)/(2*density_ambient))
+
+    #Noise attenuation due to Spherical divergence
+    dspl_spherical_p = 20*np.log10(Diameter_primary/distance_primary)
+    dspl_spherical_s = 20*np.log10(Diameter_mixed/distance_secondary)
+    dspl_spherical_m = 20*np.log10(Diameter_mixed/distance_mixed)
+
+   #Noise attenuation due to Geometric Near-Field
+    if near_field ==0:
+            dspl_geometric_p = 0.0
+            dspl_geometric_s = 0.0
+            dspl_geometric_m = 0.0
+    elif near_field ==1:
+            dspl_geometric_p = -10*np.log10(1+(2*Diameter_primary+(Diameter_primary*sound_ambient/frequency))/distance_primary)
+            dspl_geometric_s = -10*np.log10(1+(2*Diameter_mixed+(Diameter_mixed*sound_ambient/frequency))/distance_secondary)
+            dspl_geometric_m = -10*np.log10(1+(2*Diameter_mixed+(Diameter_mixed*sound_ambient/frequency))/distance_mixed)
+
+   #Noise attenuation due to Acoustic Near-Field
+    if near_field ==0:
+            dspl_acoustic_p = 0.0;
+            dspl_acoustic_s = 0.0;
+            dspl_acoustic_m = 0.0;
+    elif near_field ==1:
+            dspl_acoustic_p = 10*np.log10(1+0.13*(sound_ambient/(distance_primary*frequency))**2)
+            dspl_acoustic_s = 10*np.log10(1+0.13*(sound_ambient/(distance_secondary*frequency))**2)
+            dspl_acoustic_m = 10*np.log10(1+0.13*(sound_ambient/(distance_mixed*frequency))**2)
+
+    #Atmospheric attenuation
+    if tunnel==0:
+            delta_atmo = atmospheric_attenuation(distance_primary)
+
+            dspl_attenuation_p = -delta_atmo
+            dspl_attenuation_s = -delta_atmo
+            dspl_attenuation_m = -delta_atmo
+
+    elif tunnel==1: #These corrections are not applicable for jet rigs or static conditions
+            dspl_attenuation_p = np.zeros(np.shape(theta_m))
+            dspl_attenuation_s = np.zeros(np.shape(theta_m))
+            dspl_attenuation_m = np.zeros(np.shape(theta_m))
+            EX_m = np.zeros(np.shape(theta_m))
+            EX_p = 0
+            EX_s = 0
+
+   #Calculation of the total noise attenuation (p-primary, s-secondary, m-mixed components)
+    DSPL_p = dspl_ambient_pressure+dspl_density_p+dspl_geometric_p+dspl_acoustic_p+dspl_attenuation_p+dspl_spherical_p
+    DSPL_s = dspl_ambient_pressure+dspl_density_s+dspl_geometric_s+dspl_acoustic_s+dspl_attenuation_s+dspl_spherical_s
+    DSPL_m = dspl_ambient_pressure+dspl_density_m+dspl_geometric_m+dspl_acoustic_m+dspl_attenuation_m+dspl_spherical_m
+
+  #Calculation of interference effects on jet noise
+    ATK_m   = angle_of_attack_effect(AOA,Mach_aircraft,theta_m)
+    INST_s  = jet_installation_effect(Xe,Ye,Ce,theta_s,Diameter_mixed)
+    Plug    = external_plug_effect(Velocity_primary,Velocity_secondary, Velocity_mixed, Diameter_primary,Diameter_secondary,Diameter_mixed, Plug_diameter, sound_ambient, theta_p,theta_s,theta_m)
+    GPROX_m = ground_proximity_effect(Velocity_mixed,sound_ambient,theta_m,engine_height,Diameter_mixed,frequency)
+
+  #Calculation of the sound pressure level for each jet component
+    SPL_p = primary_noise_component(0.,Velocity_primary,Temperature_primary,R_gas,theta_p,DVPS,sound_ambient,Velocity_secondary,Velocity_aircraft,Area_primary,Area_secondary,DSPL_p,EX_p,Str_p) + Plug[0]
+
+    SPL_s = secondary_noise_component(0.,Velocity_primary,theta_s,sound_ambient,Velocity_secondary,Velocity_aircraft,Area_primary,Area_secondary,DSPL_s,EX_s,Str_s) + Plug[1] + INST_s
+
+    SPL_m = mixed_noise_component(0.,Velocity_primary,theta_m,sound_ambient,Velocity_secondary,Velocity_aircraft,Area_primary,Area_secondary,DSPL_m,EX_m,Str_m,Velocity_mixed,XBPR) + Plug[2] + ATK_m + GPROX_m
+
+ #Sum of the Total Noise
+    SPL_total = 10 * np.log10(10**(0.1*SPL_p)+10**(0.1*SPL_s)+10**(0.1*SPL_m))
+
+    #Pack the results
+    spectra = Data()
+    spectra.primary   = SPL_p
+    spectra.secondary = SPL_s
+    spectra.mixed     = SPL_m
+    spectra.total     = SPL_total
+    spectra.dBA       = dbA_noise(SPL_total)
+
+    return spectra
@@ -1,118 +1,93 @@
 ## @ingroupMethods-Noise-Fidelity_One-Engine
 # noise_source_location.py
-# 
+#
 # Created:  Jul 2015, C. Ilario
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
-# ----------------------------------------------------------------------        
+# ----------------------------------------------------------------------
 #   Imports
-# ----------------------------------------------------------------------    
+# ----------------------------------------------------------------------
 
 import numpy as np
 
-# ----------------------------------------------------------------------        
+# ----------------------------------------------------------------------
 #   Noise Source Location
-# ----------------------------------------------------------------------   
+# ----------------------------------------------------------------------
 
 ## @ingroupMethods-Noise-Fidelity_One-Engine
-def noise_source_location (B,Xo,zk,Diameter_primary,theta_p,Area_primary,Area_secondary,distance_microphone,Diameter_secondary,theta,theta_s,theta_m,Diameter_mixed,Velocity_primary,Velocity_secondary,Velocity_mixed,Velocity_aircraft,sound_ambient,Str_m,Str_s):
-    
-    #Primary jet source location
-    XJ = np.zeros(24)
-    
-    for i in range(24):
-        residual = Diameter_primary
-        XJ[i]    = (zk*Diameter_primary)*(4.+4.*np.arctan((18.*theta_p[i]/np.pi)-9.)+(Area_secondary/Area_primary))
-        B[i]     = (1./np.sin(theta))*(((Xo+XJ[i])/distance_microphone)+np.cos(theta))
-        
-        if (B[i]>=0.):
-            theta_p[i]=np.arcsin(((B[i])**2.+1.)**(-0.5))
-        else:
-            theta_p[i]=np.pi-np.arcsin(((B[i])**2.+1.)**(-0.5))
-
-        XJ[i] = (zk*Diameter_primary)*(4.+4.*np.arctan((18.*theta_p[i]/np.pi)-9.)+(Area_secondary/Area_primary))
-        
-        while residual>(Diameter_primary/200.):
-            XJ_old = XJ[i]
-            theta1 = theta_p[i]
-            B[i]   = (1./np.sin(theta))*(((Xo+XJ[i])/distance_microphone)+np.cos(theta))
-            
-            if B[i]>=0.:
-                theta_p[i] = np.arcsin(((B[i])**2.+1.)**(-0.5))
-            else:
-                theta_p[i] = np.pi-np.arcsin(((B[i])**2.+1.)**(-0.5))
-
-            theta2     = theta_p[i]
-            theta_p[i] = (theta1+theta2)/2.
-            XJ[i]      = (zk*Diameter_primary)*(4.+4.*np.arctan((18.*theta_p[i]/np.pi)-9.)+(Area_secondary/Area_primary))
-            residual   = np.abs(XJ_old-XJ[i])
-
-        #Secondary jet source location
-        residual = Diameter_secondary
-        XJ_old   = 0.0
-        XJ[i]    = (zk*Diameter_secondary)*(2.+1.6*np.arctan((4.5*theta_s[i]/np.pi)-2.25))*(1.+0.5/np.sqrt(Str_s[i])) \
-            *  np.sqrt(1.+(0.7*Velocity_secondary/sound_ambient))*(Velocity_secondary/(Velocity_secondary-Velocity_aircraft))
-        
-        B[i]     = (1./np.sin(theta))*(((Xo+XJ[i])/distance_microphone)+np.cos(theta))
-        
-        if B[i]>=0.:
-            theta_s[i] = np.arcsin(((B[i])**2.+1.)**(-0.5))
-        else:
-            theta_s[i] = np.pi-np.arcsin(((B[i])**2.+1.)**(-0.5))
-            
-        XJ[i] = (zk*Diameter_mixed)*(2.+1.6*np.arctan((4.5*theta_s[i]/np.pi)-2.25))*(1.+0.5/np.sqrt(Str_s[i]))* \
-            np.sqrt(1.+(0.7*Velocity_secondary/sound_ambient))*(Velocity_secondary/(Velocity_secondary-Velocity_aircraft))
-        
-        while residual>(Diameter_mixed/200.):
-            XJ_old = XJ[i]
-            theta1 = theta_s[i]
-            B[i]   = (1/np.sin(theta))*(((Xo+XJ[i])/distance_microphone)+np.cos(theta))
-            
-            if B[i]>=0.:
-                theta_s[i] = np.arcsin((B[i]**2.+1.)**(-0.5))
-            else:
-                theta_s[i] = np.pi-np.arcsin(((B[i])**2.+1.)**(-0.5))
-
-            theta2     = theta_s[i]
-            theta_s[i] = (theta1+theta2)/2.
-            XJ[i]      = (zk*Diameter_mixed)*(2.+1.6*np.arctan((4.5*theta_s[i]/np.pi)-2.25))*(1.+0.5/np.sqrt(Str_s[i]))* \
-                np.sqrt(1.+(0.7*Velocity_secondary/sound_ambient))*(Velocity_secondary/(Velocity_secondary-Velocity_aircraft))
-            
-            residual = np.abs(XJ_old-XJ[i])
+def noise_source_location (Xo,zk,Diameter_primary,theta_p,Area_primary,Area_secondary,distance_microphone,Diameter_secondary,theta,theta_s,theta_m,Diameter_mixed,Velocity_primary,Velocity_secondary,Velocity_mixed,Velocity_aircraft,sound_ambient,Str_m,Str_s):
+    """This function calculates the polar angles of the primary, secondary and mixed jet noise sources
+    for all frequency bands at once. The values of each time step are rows, and the iteration at each
+    time step starts from the angles found at the previous one, the first from theta_p, theta_s and
+    theta_m. The distance and angle to the microphone may have leading axes for several microphones."""
+
+    # the angles of each microphone, time step and frequency band
+    shape   = np.broadcast(distance_microphone,theta,Str_m).shape
+    n_steps = shape[-2]
+
+    # the values of each time step
+    step_values = [np.broadcast_to(value,shape[:-1]+(1,)) for value in \
+                   (zk,distance_microphone,theta,Diameter_mixed,Velocity_secondary,Velocity_mixed,sound_ambient)]
+
+    angles_p = np.zeros(shape)
+    angles_s = np.zeros(shape)
+    angles_m = np.zeros(shape)
+    theta_p  = np.broadcast_to(theta_p,shape[:-2]+shape[-1:])
+    theta_s  = np.broadcast_to(theta_s,shape[:-2]+shape[-1:])
+    theta_m  = np.broadcast_to(theta_m,shape[:-2]+shape[-1:])
+
+    for i in range(n_steps):
+        zk, distance, theta_i, Diameter_m, Velocity_s, Velocity_m, sound = [value[...,i,:] for value in step_values]
+
+        #Primary jet source location
+        def primary_position(theta_p):
+            return (zk*Diameter_primary)*(4.+4.*np.arctan((18.*theta_p/np.pi)-9.)+(Area_secondary/Area_primary))
+
+        theta_p = source_angle(primary_position(theta_p),primary_position,Xo,distance,theta_i,Diameter_primary/200.)
+
+        #Secondary jet source location, the starting position uses the secondary diameter
+        def secondary_position(theta_s,Diameter=Diameter_m):
+            return (zk*Diameter)*(2.+1.6*np.arctan((4.5*theta_s/np.pi)-2.25))*(1.+0.5/np.sqrt(Str_s[i])) \
+                *  np.sqrt(1.+(0.7*Velocity_s/sound))*(Velocity_s/(Velocity_s-Velocity_aircraft))
+
+        theta_s = source_angle(secondary_position(theta_s,Diameter_secondary),secondary_position,Xo,distance,theta_i,Diameter_m/200.)
 
         #Mixed jet source location
-        residual = Diameter_mixed
-        XJ_old   = 0.
-        XJ[i] = (zk*Diameter_mixed)*(3.+np.exp(-Str_m[i])+(2.+1.1*np.arctan((18.*theta_m[i]/np.pi)-13.))+ \
-            (1.+0.5/np.sqrt(Str_m[i])))*np.sqrt(0.5+0.5*Velocity_mixed/sound_ambient) * \
-            (Velocity_mixed/(Velocity_mixed-Velocity_aircraft))
-        
-        B[i] = (1./np.sin(theta))*(((Xo+XJ[i])/distance_microphone)+np.cos(theta))
-        if B[i]>=0.:
-            theta_m[i] = np.arcsin(((B[i])**2.+1.)**(-0.5))
-        else:
-            theta_m[i] = np.pi-np.arcsin(((B[i])**2.+1.)**(-0.5))
-
-        XJ[i]=(zk*Diameter_mixed)*(3.+np.exp(-Str_m[i])+(2.+1.1*np.arctan((18.*theta_m[i]/np.pi)-13.))+\
-            (1.+0.5/np.sqrt(Str_m[i])))*np.sqrt(0.5+0.5*Velocity_mixed/sound_ambient) \
-            *(Velocity_mixed/(Velocity_mixed-Velocity_aircraft))
-        
-        while residual>(Diameter_mixed/200.):
-            XJ_old = XJ[i]
-            theta1 = theta_m[i]
-            B[i]   = (1./np.sin(theta))*(((Xo+XJ[i])/distance_microphone)+np.cos(theta))
-            
-            if B[i]>=0.:
-                theta_m[i] = np.arcsin(((B[i])**2.+1.)**(-0.5))
-            else:
-                theta_m[i] = np.pi-np.arcsin(((B[i])**2.+1.)**(-0.5))
-                
-            theta2     = theta_m[i]
-            theta_m[i] = (theta1+theta2)/2.
-            XJ[i]      = (zk*Diameter_mixed)*(3.+np.exp(-Str_m[i])+(2.+1.1*np.arctan((18.*theta_m[i]/np.pi)-13.))+\
-                (1.+0.5/np.sqrt(Str_m[i])))*np.sqrt(0.5+0.5*Velocity_mixed/sound_ambient) \
-                *(Velocity_mixed/(Velocity_mixed-Velocity_aircraft))
-            
-            residual   = abs(XJ_old-XJ[i])
-
-    return(theta_p,theta_s,theta_m)
\ No newline at end of file
+        def mixed_position(theta_m):
+            return (zk*Diameter_m)*(3.+np.exp(-Str_m[i])+(2.+1.1*np.arctan((18.*theta_m/np.pi)-13.))+ \
+                (1.+0.5/np.sqrt(Str_m[i])))*np.sqrt(0.5+0.5*Velocity_m/sound) * \
+                (Velocity_m/(Velocity_m-Velocity_aircraft))
+
+        theta_m = source_angle(mixed_position(theta_m),mixed_position,Xo,distance,theta_i,Diameter_m/200.)
+
+        angles_p[...,i,:] = theta_p
+        angles_s[...,i,:] = theta_s
+        angles_m[...,i,:] = theta_m
+
+    return(angles_p,angles_s,angles_m)
+
+def source_angle(XJ,source_position,Xo,distance_microphone,theta,tolerance):
+    """Relaxed fixed point iteration of the polar angle of a noise source and its position XJ along
+    the jet. Each angle stops changing once its position moves less than the tolerance."""
+
+    angle  = emission_angle(XJ,Xo,distance_microphone,theta)
+    XJ     = source_position(angle)
+    active = np.ones(np.shape(XJ),dtype=bool)
+
+    while np.any(active):
+        XJ_old = XJ
+        theta2 = emission_angle(XJ,Xo,distance_microphone,theta)
+        angle  = np.where(active,(angle+theta2)/2.,angle)
+        XJ     = np.where(active,source_position(angle),XJ)
+        active = active & (np.abs(XJ_old-XJ) > tolerance)
+
+    return angle
+
+def emission_angle(XJ,Xo,distance_microphone,theta):
+    """Polar angle from a noise source at XJ along the jet to the microphone"""
+
+    B     = (1./np.sin(theta))*(((Xo+XJ)/distance_microphone)+np.cos(theta))
+    angle = np.arcsin(((B)**2.+1.)**(-0.5))
+
+    return np.where(B>=0.,angle,np.pi-angle)
@@ -3,6 +3,7 @@
 # 
 # Created:  Jul 2015, C. Ilario
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
@@ -20,45 +21,15 @@ def epnl_noise(PNLT):
      (Perceived Noise Level with Tone Correction).
 
         Inputs:
-                    PNLT                     - Perceived Noise Level with Tone Correction
+                    PNLT                     - Perceived Noise Level with Tone Correction, with the time steps along
+                                               the last axis
 
                 Outputs: 
                     EPNL                     - Effective Perceived Noise Level in EPNdB"""
                     
                     
-    #Maximum PNLT on the time history data    
-    PNLT_max = np.max(PNLT)
-    
-    #Calculates the number of discrete points on the trajectory
-    nsteps   = len(PNLT)    
-    
-    #Exclude sources that are not being calculated or doesn't contribute for the total noise of the aircraft
-    if all(PNLT==0):
-        EPNL = 0
-        return(EPNL)
-
-    #Finding the time duration for the noise history where PNL is higher than the maximum PNLT - 10 dB
-    i = 0
-    while PNLT[i]<=(PNLT_max-10) and i<=nsteps:
-        i = i+1
-    t1 = i #t1 is the first time interval
-    i  = i+1
-
-    #Correction for PNLTM-10 when it falls outside the limit of the data
-    if PNLT[nsteps-1]>=(PNLT_max-10):
-        t2=nsteps-2
-    else:
-        while i<=nsteps and PNLT[i]>=(PNLT_max-10):
-            i = i+1
-        t2 = i-1 #t2 is the last time interval
-                
-    #The time duration where the noise is higher than the maximum PNLT - 10 dB is:
-    time_interval = (t2-t1)*0.5
-    
-    #Calculates the integral of the PNLT which between t1 and t2 points
-    sumation = 0
-    for i in range (t1-1,t2+1):
-        sumation = 10**(PNLT[i]/10)+sumation
+    #Maximum PNLT and integral of the PNLT over the time where it is higher than the maximum PNLT - 10 dB
+    PNLT_max, sumation = duration_sum(PNLT)
         
    #Duration Correction calculation
     duration_correction = 10*np.log10(sumation)-PNLT_max-13
@@ -66,4 +37,33 @@ def epnl_noise(PNLT):
     #Final EPNL calculation
     EPNL = PNLT_max+duration_correction
     
-    return (EPNL)    
\ No newline at end of file
+    #Exclude sources that are not being calculated or doesn't contribute for the total noise of the aircraft
+    EPNL = np.where(np.all(np.asarray(PNLT)==0,axis=-1), 0., EPNL)[()]
+    
+    return (EPNL)
+
+def duration_sum(level):
+    """Maximum of a level time history, with the time steps along the last axis, and the sum of 10**(level/10)
+    from the step before the level first rises above the maximum - 10 dB to the step where it last stays above it.
+    The terms are added one time step at a time."""
+    
+    level   = np.asarray(level)
+    nsteps  = np.shape(level)[-1]
+    steps   = np.arange(nsteps)
+    
+    #Maximum level on the time history data    
+    level_max = np.max(level,axis=-1,keepdims=True)
+    
+    #Finding the time duration for the noise history where the level is higher than the maximum - 10 dB
+    t1 = np.argmax(level>(level_max-10),axis=-1)[...,None] #t1 is the first time interval
+
+    #Correction for the maximum - 10 dB when it falls outside the limit of the data
+    after = (steps>t1) & (level<(level_max-10))
+    t2    = np.where(level[...,-1:]>=(level_max-10), nsteps-2, np.argmax(after,axis=-1)[...,None]-1) #t2 is the last time interval
+    
+    #Calculates the sum between the t1 and t2 points, where the step before the first one is the last step
+    terms    = 10**(level/10)
+    terms    = np.concatenate([np.where(t1==0, terms[...,-1:], 0.), np.where((steps>=t1-1) & (steps<=t2), terms, 0.)],axis=-1)
+    sumation = np.cumsum(terms,axis=-1)[...,-1]
+    
+    return level_max[...,0], sumation
@@ -2,7 +2,7 @@
 # noise_counterplot.py
 # 
 # Created:  Feb 2016, C. Ilario
-# Modified: 
+# Modified: Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #   Imports
@@ -17,11 +17,12 @@ import numpy as np
 def noise_counterplot(noise_segment,analyses,config):
     """ SUAVE.Methods.Noise.Fidelity_One.Noise_Tools.noise_counterplot(noise_segment,analyses,config):
             Computes the geometric parameters for the noise tools at any microphone potsition, not only the certification points:
-            distance and emission angles for both polar and azimuthal angles.
+            distance and emission angles for both polar and azimuthal angles. An array of microphones is computed
+            at once, with a row of results for each microphone.
 
             Inputs:
                 noise_segment	 - SUAVE type vehicle
-                analyses
+                analyses.mic_array - microphone position [x, height, lateral], or an array with one microphone per row [meters]
                 config
 
             Outputs:
@@ -30,48 +31,36 @@ def noise_counterplot(noise_segment,analyses,config):
                 phi             - Azimuthal angle emission vector relatively to the aircraft to the microphone coordinates, [rad]
 
             Assumptions:
-                None."""
+                The polar angle is measured from the flight direction, along the x axis."""
     
     #unpack
     position_vector = noise_segment.conditions.frames.inertial.position_vector
-    mic_position = analyses.mic_array
+    mic_position    = np.array(analyses.mic_array,dtype=float)
     
     #X,Y,Z position of the aircraft
     x_aircraft = position_vector[:,0]
     altitude   = - position_vector[:,2]
     z_aircraft = position_vector[:,1]
-    
-
-    n_steps = len(altitude)  #number of time steps (space discretization)
-    
-    # Preparing the matrix: Angles
-    phi = np.zeros(n_steps)
-    theta = np.zeros(n_steps)  
-    
    
-    #X,Y,Z position of each microphone
-    x_mic = np.float(mic_position[0])
-    y_mic = np.float(mic_position[1])
-    z_mic = np.float(mic_position[2])
+    #X,Y,Z position of each microphone, as columns against the time steps
+    mic_array = np.atleast_2d(mic_position)
+    x_mic     = mic_array[:,0:1]
+    y_mic     = mic_array[:,1:2]
+    z_mic     = mic_array[:,2:3]
 
-    dist = np.sqrt((x_aircraft-x_mic)**2+(altitude-y_mic)**2+(z_aircraft-z_mic)**2)
-    phi   = np.arctan(np.abs(z_mic)/altitude)
+    dist  = np.sqrt((x_aircraft-x_mic)**2+(altitude-y_mic)**2+(z_aircraft-z_mic)**2)
+    phi   = np.arctan(np.abs(z_aircraft-z_mic)/(altitude-y_mic))
+    theta = np.arccos((x_mic-x_aircraft)/dist)
 
-    for i in range (0,n_steps):
-        if (x_aircraft[i]-x_mic)< 0.:
-            theta[i] = np.arctan(np.abs(altitude[i]/(x_aircraft[i]-x_mic)))
-        else:
-            theta[i] = np.pi - np.arctan(np.abs(altitude[i]/(x_aircraft[i]-x_mic)))
-            
+    # a single microphone gives a single history
+    if mic_position.ndim == 1:
+        dist  = dist[0]
+        theta = theta[0]
+        phi   = phi[0]
                 
     #Pack the results
     noise_segment.dist  = dist
     noise_segment.theta = theta
     noise_segment.phi   = phi
-          
 
     return (dist,theta,phi)
-
-
-#if __name__ == '__main__':
-        #main()
@@ -0,0 +1,166 @@
+## @ingroup Methods-Noise-Fidelity_One
+# noise_footprint.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from SUAVE.Core import Data
+
+from .Airframe import noise_airframe_Fink_source, noise_airframe_Fink_spectra
+from .Engine import noise_SAE_source, noise_SAE_spectra
+from .Noise_Tools import noise_counterplot, pnl_noise, noise_tone_correction, epnl_noise, senel_noise
+
+# the noise sources held by each worker process
+_worker_sources = None
+
+# ----------------------------------------------------------------------
+#  Noise Footprint
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Noise-Fidelity_One
+def noise_footprint(config,analyses,noise_segment,observer_positions,engine_flag=1,number_of_workers=1,chunk_size=50):
+    """Computes the EPNL and SENEL of a flight segment at an array of ground observers. The distance
+    and emission angles of all observers and time steps are computed at once, and the airframe (Fink)
+    and jet (SAE) source values are computed once for the segment and used for every observer. The
+    observers are evaluated in chunks, which are split over a pool of processes with more than one worker.
+
+    Assumptions:
+    The airframe and engine levels are summed as incoherent sources. Worker processes are forked where
+    the platform allows it, otherwise the noise sources have to be picklable.
+
+    Source:
+    N/A
+
+    Inputs:
+    config                  SUAVE type vehicle, with the turbofan in config.propulsors['turbofan']
+    analyses.atmosphere     atmosphere of the segment
+    noise_segment           flight segment with the conditions, including
+      conditions.frames.inertial.position_vector    [m]
+    observer_positions      [m]    one observer per row as [x, height, lateral], like mic_array of noise_counterplot
+    engine_flag             [int]  1 to add the jet noise, 0 for the airframe alone
+    number_of_workers       [int]
+    chunk_size              [int]  observers evaluated together
+
+    Outputs:
+    footprint.
+      EPNL                  [EPNdB] one value per observer
+      SENEL                 [dBA]   one value per observer
+      airframe.EPNL, airframe.SENEL
+      engine.EPNL, engine.SENEL     zero without engine noise
+
+    Properties Used:
+    N/A
+    """
+
+    observer_positions = np.atleast_2d(np.asarray(observer_positions,dtype=float))
+    n_observers        = len(observer_positions)
+
+    # distance and emission angles of every observer at every time step of the segment
+    geometry_segment = Data(conditions = noise_segment.conditions)
+    dist, theta, phi = noise_counterplot(geometry_segment,Data(mic_array = observer_positions),config)
+
+    # the sources do not depend on the observers
+    airframe = noise_airframe_Fink_source(config,analyses,noise_segment)
+    if engine_flag:
+        engine = noise_SAE_source(config.propulsors['turbofan'],noise_segment,analyses)
+    else:
+        engine = None
+    sources = (airframe,engine)
+
+    # the geometry at the time steps of the noise calculation
+    dist  = interpolate_history(airframe.noise_time,airframe.time,dist)
+    theta = interpolate_history(airframe.noise_time,airframe.time,theta)
+    phi   = interpolate_history(airframe.noise_time,airframe.time,phi)
+
+    chunk_size = max(1,int(chunk_size))
+    chunks     = [slice(start,start+chunk_size) for start in range(0,n_observers,chunk_size)]
+
+    if number_of_workers > 1 and len(chunks) > 1:
+        context = multiprocessing.get_context('fork') if 'fork' in multiprocessing.get_all_start_methods() else None
+        with ProcessPoolExecutor(max_workers=min(int(number_of_workers),len(chunks)),mp_context=context,
+                                 initializer=_initialize_worker,initargs=(sources,)) as pool:
+            levels = list(pool.map(_evaluate_chunk,[dist[chunk] for chunk in chunks],
+                                   [theta[chunk] for chunk in chunks],[phi[chunk] for chunk in chunks]))
+    else:
+        levels = [observer_levels(sources,dist[chunk],theta[chunk],phi[chunk]) for chunk in chunks]
+
+    levels = np.concatenate(levels,axis=0)
+
+    #Pack the results
+    footprint = Data()
+    footprint.airframe = Data(EPNL = levels[:,0], SENEL = levels[:,1])
+    footprint.engine   = Data(EPNL = levels[:,2], SENEL = levels[:,3])
+
+    footprint.EPNL  = 10. * np.log10(10**(levels[:,0]/10) + engine_flag*10**(levels[:,2]/10))
+    footprint.SENEL = 10. * np.log10(10**(levels[:,1]/10) + engine_flag*10**(levels[:,3]/10))
+
+    return footprint
+
+## @ingroup Methods-Noise-Fidelity_One
+def observer_levels(sources,distance,theta,phi):
+    """Computes the EPNL and SENEL of the airframe and of the jet at several observers from the
+    noise sources of a segment.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    sources                 (airframe, engine) from noise_airframe_Fink_source and noise_SAE_source, engine may be None
+    distance                [m]    one row of noise time steps per observer
+    theta                   [rad]  one row of noise time steps per observer
+    phi                     [rad]  one row of noise time steps per observer
+
+    Outputs:
+    levels                  [dB]   airframe EPNL, airframe SENEL, engine EPNL and engine SENEL, one row per observer
+
+    Properties Used:
+    N/A
+    """
+
+    airframe, engine = sources
+
+    spectra = [noise_airframe_Fink_spectra(airframe,distance,theta,phi)]
+    if engine is not None:
+        spectra.append(noise_SAE_spectra(engine,distance,theta))
+
+    # the metrics of all observers are evaluated at once
+    levels = np.zeros((len(distance),4))
+    for j, spectrum in enumerate(spectra):
+        PNLT = pnl_noise(spectrum.total) + noise_tone_correction(spectrum.total)
+        levels[:,2*j]   = epnl_noise(PNLT)
+        levels[:,2*j+1] = senel_noise(np.max(spectrum.dBA,axis=-1))
+
+    return levels
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+def interpolate_history(noise_time,time,values):
+    """Linear interpolation of each row of values from the segment time to the noise time, as np.interp,
+    which holds the end values outside of the segment time"""
+
+    noise_time = np.clip(noise_time, time[0], time[-1])
+    index = np.clip(np.searchsorted(time,noise_time,side='right') - 1, 0, len(time) - 2)
+    slope = (values[:,index+1] - values[:,index])/(time[index+1] - time[index])
+
+    return slope*(noise_time - time[index]) + values[:,index]
+
+def _initialize_worker(sources):
+    """Stores the noise sources of a worker process"""
+    global _worker_sources
+    _worker_sources = sources
+
+def _evaluate_chunk(distance,theta,phi):
+    """Computes the levels of a chunk of observers with the noise sources of a worker process"""
+    return observer_levels(_worker_sources,distance,theta,phi)
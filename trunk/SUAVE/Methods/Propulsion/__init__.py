@@ -13,6 +13,7 @@ from .scramjet_sizing import scramjet_sizing
 from .fm_id import fm_id
 from .fm_solver import fm_solver
 from .rayleigh import rayleigh
+from .compressible_flow_solvers import area_ratio_mach_number, rayleigh_mach_number, bracketed_newton
 from .nozzle_calculations import exit_Mach_shock, mach_area, normal_shock, pressure_ratio_isentropic, pressure_ratio_shock_in_nozzle
 from . import electric_motor_sizing
 from .liquid_rocket_sizing import liquid_rocket_sizing
\ No newline at end of file
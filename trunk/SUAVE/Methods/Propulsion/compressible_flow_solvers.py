@@ -0,0 +1,163 @@
+## @ingroup Methods-Propulsion
+# compressible_flow_solvers.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#  Compressible Flow Solvers
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Propulsion
+def area_ratio_mach_number(area_ratio, gamma, supersonic):
+    """Inverts the isentropic area-Mach relation A/A* = f(M) for every element independently.
+
+    Assumptions:
+    Isentropic flow of a calorically perfect gas
+    Each element is solved on the subsonic or the supersonic branch
+
+    Source:
+    https://web.stanford.edu/~cantwell/AA210A_Course_Material/AA210A_Course_Notes/
+
+    Inputs:
+    area_ratio    [-]          A/A*, at least 1
+    gamma         [-]
+    supersonic    <boolean>    branch of the solution, scalar or array
+
+    Outputs:
+    M             [-]          broadcast shape of the inputs
+
+    Properties Used:
+    N/A
+    """
+
+    area_ratio, gamma, supersonic = np.broadcast_arrays(np.asarray(area_ratio,dtype=float),
+                                                        np.asarray(gamma,dtype=float),
+                                                        np.asarray(supersonic,dtype=bool))
+    # the relation is solved in log form, which is close to linear on both branches
+    target = np.log(area_ratio)
+
+    def residual(M):
+        k    = (gamma-1.)/2.
+        term = (1.+k*M*M)*2./(gamma+1.)
+        f    = (gamma+1.)/(2.*(gamma-1.))*np.log(term) - np.log(M) - target
+        df   = (M*M-1.)/(M*(1.+k*M*M))
+        return f, df
+
+    lower = np.where(supersonic, 1., 1e-8)
+    upper = np.where(supersonic, 100., 1.)
+    guess = np.where(supersonic, 2., 0.5)
+
+    return bracketed_newton(residual, lower, upper, guess)
+
+## @ingroup Methods-Propulsion
+def rayleigh_mach_number(temperature_ratio, M0, gamma):
+    """Finds the Mach number of a Rayleigh flow after a stagnation temperature change Tt1/Tt0
+    from a Mach number M0, for every element independently.
+
+    Assumptions:
+    Constant area, frictionless flow of a calorically perfect gas
+    The flow stays on the branch (subsonic or supersonic) of M0
+
+    Source:
+    https://web.stanford.edu/~cantwell/AA210A_Course_Material/AA210A_Course_Notes/
+
+    Inputs:
+    temperature_ratio  [-]    Tt1/Tt0
+    M0                 [-]
+    gamma              [-]
+
+    Outputs:
+    M1                 [-]    broadcast shape of the inputs
+
+    Properties Used:
+    N/A
+    """
+
+    temperature_ratio, M0, gamma = np.broadcast_arrays(np.asarray(temperature_ratio,dtype=float),
+                                                       np.asarray(M0,dtype=float),
+                                                       np.asarray(gamma,dtype=float))
+    supersonic = M0 > 1.
+    target     = np.log(temperature_ratio) + log_rayleigh_temperature(M0, gamma)
+
+    def residual(M):
+        k  = (gamma-1.)/2.
+        f  = log_rayleigh_temperature(M, gamma) - target
+        df = 2./M + 2.*k*M/(1.+k*M*M) - 4.*gamma*M/(1.+gamma*M*M)
+        return f, df
+
+    lower = np.where(supersonic, 1., 1e-8)
+    upper = np.where(supersonic, 100., 1.)
+    guess = np.where(supersonic, 2., 0.5)
+
+    return bracketed_newton(residual, lower, upper, guess)
+
+## @ingroup Methods-Propulsion
+def bracketed_newton(residual, lower, upper, guess, tol=1e-12, max_iterations=100):
+    """Solves many independent scalar equations at once with a Newton iteration that is kept
+    inside a bracket around each root. A step that leaves the bracket is replaced by bisection.
+
+    Assumptions:
+    Each residual changes sign once between its lower and upper bound. Elements without a sign
+    change are returned at the bound with the smaller residual.
+
+    Source:
+    N/A
+
+    Inputs:
+    residual       function returning the residual and its derivative, f, df = residual(x)
+    lower, upper   [-]   bounds of each root
+    guess          [-]   initial value of each root
+
+    Outputs:
+    x              [-]   same shape as the bounds
+
+    Properties Used:
+    N/A
+    """
+
+    lower = np.array(lower, dtype=float)
+    upper = np.array(upper, dtype=float)
+    x     = np.clip(np.array(guess, dtype=float), lower, upper)
+
+    f_lower, _ = residual(lower)
+    f_upper, _ = residual(upper)
+    bracketed  = np.sign(f_lower) != np.sign(f_upper)
+    closest    = np.where(np.abs(f_lower) < np.abs(f_upper), lower, upper)
+
+    for ii in range(max_iterations):
+        f, df = residual(x)
+
+        # shrink the bracket on the side with the same sign
+        same        = np.sign(f) == np.sign(f_lower)
+        lower       = np.where(same, x, lower)
+        upper       = np.where(same, upper, x)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            x_newton = x - f/df
+        inside = np.logical_and(x_newton >= lower, x_newton <= upper)
+        x_new  = np.where(inside, x_newton, 0.5*(lower + upper))
+
+        done = np.all(np.abs(x_new - x) <= tol*np.maximum(1., np.abs(x)))
+        x    = x_new
+        if done:
+            break
+
+    # without a root on the branch, return the closest bound
+    x = np.where(bracketed, x, closest)
+
+    return x
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+def log_rayleigh_temperature(M, gamma):
+    """Logarithm of the Rayleigh flow stagnation temperature ratio Tt/Tt*, up to a constant"""
+    k = (gamma-1.)/2.
+    return 2.*np.log(M) + np.log(1.+k*M*M) - 2.*np.log(1.+gamma*M*M)
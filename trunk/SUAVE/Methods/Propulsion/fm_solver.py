@@ -3,13 +3,15 @@
 #
 # Created:  Sep 2017, P Goncalves
 # Modified: Jan 2018, W. Maier
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 
 import numpy as np
-from scipy.optimize import fsolve
+from .fm_id import fm_id
+from .compressible_flow_solvers import area_ratio_mach_number
 
 # ----------------------------------------------------------------------
 #  fm_solver
@@ -33,23 +35,13 @@ def fm_solver(area_ratio, M0, gamma):
     Source:
     https://web.stanford.edu/~cantwell/AA210A_Course_Material/AA210A_Course_Notes/
     """
-    # Area-Mach Function
-    func = lambda M1: ((M0/M1*((1.+(gamma-1.)/2.*M1*M1)/(1.+(gamma-1.)/2.*M0*M0))**((gamma+1.)/(2.*(gamma-1.))))-area_ratio)
-
-    # Initializing the array
-    M1_guess = np.ones_like(M0)
-
     # Separating supersonic and subsonic solutions
-    i_low = M0 < 1.0
-    i_high = M0 >= 1.0
-
-    # Subsonic solution initialization
-    M1_guess[i_low]= 0.1
+    i_high = np.asarray(M0) >= 1.0
 
-    # Supersonic solution initialization
-    M1_guess[i_high]= 1.1
+    # Area ratio of the unknown Mach number to the sonic area
+    area_ratio_sonic = area_ratio/fm_id(M0,gamma)
 
-    # Solving
-    M1 = fsolve(func,M1_guess, factor=0.1)
+    # Solving each element independently
+    M1 = np.ravel(area_ratio_mach_number(area_ratio_sonic, gamma, i_high))
 
     return M1
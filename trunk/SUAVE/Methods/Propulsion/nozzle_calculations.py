@@ -2,10 +2,10 @@
 # nozzle_calculations.py
 # 
 # Created:  Sep 2017, P. Goncalves
-# Modified: 
+# Modified: Oct 2026, SUAVE Team
 
 import numpy as np
-from scipy.optimize import fsolve
+from .compressible_flow_solvers import area_ratio_mach_number
 
 # ----------------------------------------------------------------------
 #  nozzle calculations
@@ -33,15 +33,10 @@ def exit_Mach_shock(area_ratio, gamma, Pt_out, P0):
     Me            [dimensionless]      
     
     """
-    func = lambda Me : (Pt_out/P0)*(1./area_ratio)-(((gamma+1.)/2.)**((gamma+1.)/(2.*(gamma-1.))))*Me*((1.+(gamma-1.)/2.*Me**2.)**0.5)
-
-    #Initializing the array
-    Me_initial_guess = np.ones_like(Pt_out) 
-    i_sol = Me_initial_guess < 10.0
-    Me_initial_guess[i_sol] = 0.1
-
-    # Solving for Me
-    Me = fsolve(func,Me_initial_guess)
+    # Me*sqrt(1+(gamma-1)/2*Me^2) = q is a quadratic in Me^2
+    q  = (Pt_out/P0)*(1./area_ratio)/(((gamma+1.)/2.)**((gamma+1.)/(2.*(gamma-1.))))
+    k  = (gamma-1.)/2.
+    Me = np.ravel(np.sqrt(2.*q*q/(1.+np.sqrt(1.+4.*k*q*q))))
         
     return Me
         
@@ -64,13 +59,8 @@ def mach_area(area_ratio, gamma, subsonic):
     Me            [dimensionless]  
     
     """
-    func = lambda Me : (area_ratio**2. - ((1./Me)**2.)*(((2./(gamma+1.))*(1.+((gamma-1.)/2.)*Me**2.))**((gamma+1.)/((gamma-1.)))))[:,0]
-    if subsonic:
-        Me_initial_guess = 0.01
-    else:
-        Me_initial_guess = 2.0         
-        
-    Me = fsolve(func,Me_initial_guess, factor = 0.1)
+    # Solving each element independently on the requested branch
+    Me = np.ravel(area_ratio_mach_number(area_ratio, gamma, not subsonic))
 
     return Me
 
@@ -3,10 +3,11 @@
 # 
 # Created:  Aug 2017, P. Goncalves
 # Modified: Jan 2018, W. Maier
+#           Oct 2026, SUAVE Team
 
 import numpy as np
 
-from scipy.optimize import fsolve
+from .compressible_flow_solvers import rayleigh_mach_number
 
 # ----------------------------------------------------------------------
 #  rayleigh
@@ -31,23 +32,8 @@ def rayleigh(gamma, M0, TtR):
     
     """
 
-    func = lambda M1: (((1.+gamma*M0*M0)**2.*M1*M1*(1.+(gamma-1.)/2.*M1*M1))/((1.+gamma*M1*M1)**2.*M0*M0*(1.+(gamma-1.)/2.*M0*M0))-TtR)
-
-    #Initializing the array
-    M1_guess = np.ones_like(M0)
-    
-    # Separating supersonic and subsonic solutions
-    i_low = M0 <= 1.0
-    i_high = M0 > 1.0
-
-    #--Subsonic solution Guess
-    M1_guess[i_low]= .01
-    
-    #--Supersonic solution Guess
-    M1_guess[i_high]= 1.1
-
-    # Find Mach number
-    M1 = fsolve(func,M1_guess, factor=0.1)
+    # Find Mach number, on the subsonic or supersonic branch of M0
+    M1 = np.ravel(rayleigh_mach_number(TtR, M0, gamma))
     
     #Calculate stagnation pressure ratio
     Ptr = ((1.+gamma*M0*M0)/(1.+gamma*M1*M1)*((1.+(gamma-1.)/2.*M1*M1)/(1.+(gamma-1.)/2.*M0*M0))**(gamma/(gamma-1.)))
@@ -0,0 +1,120 @@
+## @ingroup Methods-Utilities
+# Grid_Surrogate.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+from scipy.interpolate import RegularGridInterpolator
+
+# ----------------------------------------------------------------------
+#  Grid Surrogate Class
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Utilities
+class Grid_Surrogate():
+    """Tabulates a trained surrogate model, such as a scikit-learn Gaussian process, on a regular
+    grid and replaces its predictions with a linear interpolation of the table. Building the table
+    costs one batched prediction, after which every evaluation is a table lookup.
+
+    Assumptions:
+    The model varies smoothly enough to be interpolated linearly between grid points.
+    Points outside of the grid are linearly extrapolated. Dimensions with a single grid point
+    are constant and are left out of the interpolation.
+
+    Source:
+    None
+    """
+
+    def __init__(self, model, grid_points):
+        """Evaluates the model at every node of the grid.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        model         surrogate with a predict(X) method, X is (n_points, n_dimensions)
+        grid_points   list of increasing 1D arrays, one per input dimension, a dimension with a
+                      single point is held constant
+
+        Outputs:
+        None
+
+        Properties Used:
+        N/A
+        """
+        grid_points = [np.array(points,dtype=float).flatten() for points in grid_points]
+        mesh        = np.meshgrid(*grid_points, indexing='ij')
+        X           = np.vstack([m.flatten() for m in mesh]).T
+        values      = np.reshape(model.predict(X), mesh[0].shape)
+
+        # the interpolation only spans the dimensions that vary
+        active = [i for i, points in enumerate(grid_points) if len(points) > 1]
+
+        self.grid_points  = grid_points
+        self.values       = values
+        self.active       = active
+        if active:
+            self.interpolator = RegularGridInterpolator([grid_points[i] for i in active], np.reshape(values, [len(grid_points[i]) for i in active]),
+                                                        bounds_error=False, fill_value=None)
+        else:
+            self.interpolator = None
+
+    def predict(self,X):
+        """Interpolates the tabulated model, matching the call of the original model
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        X        [-]  (n_points, n_dimensions)
+
+        Outputs:
+        y        [-]  (n_points)
+
+        Properties Used:
+        N/A
+        """
+        X = np.atleast_2d(X)
+        if self.interpolator is None:
+            return np.full(len(X), self.values.item())
+        return self.interpolator(X[:,self.active])
+
+## @ingroup Methods-Utilities
+def surrogate_grid_points(training_points,points_per_dimension):
+    """Builds an evenly spaced grid spanning the range of the training points in each dimension.
+    A dimension with a single training value gets that value as its only grid point.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    training_points        [-]  (n_points, n_dimensions)
+    points_per_dimension   [-]
+
+    Outputs:
+    grid_points            list of 1D arrays
+
+    Properties Used:
+    N/A
+    """
+    if points_per_dimension < 2:
+        raise ValueError('a surrogate grid needs at least 2 points per dimension, got ' + str(points_per_dimension))
+
+    training_points = np.atleast_2d(training_points)
+    lower = np.min(training_points,axis=0)
+    upper = np.max(training_points,axis=0)
+
+    return [np.linspace(lo,up,points_per_dimension) if up > lo else np.array([lo]) for lo,up in zip(lower,upper)]
@@ -0,0 +1,258 @@
+## @ingroup Optimization
+# Evaluation_Cache.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Data
+from SUAVE.Input_Output.SUAVE import hash_data
+
+from collections import OrderedDict
+from copy import deepcopy
+import numpy as np
+import pickle
+import os
+
+# ----------------------------------------------------------------------
+#  Evaluation Cache
+# ----------------------------------------------------------------------
+
+## @ingroup Optimization
+class Evaluation_Cache(Data):
+    """Remembers the outputs of the designs a nexus has evaluated, so designs that an optimizer
+    revisits are not run again. Designs are keyed by their rounded scaled inputs and the fidelity
+    level, and the least recently used designs are dropped once the cache is full. Evaluations
+    can also be appended to a file, which a restarted optimization replays.
+
+    Each design stores the results and the summary of the nexus in full, the values behind the
+    objective and the constraints, and any other paths of the nexus listed in stored_paths.
+
+    Assumptions:
+    The procedure gives the same outputs each time it is run at the same design.
+
+    Source:
+    N/A
+    """
+
+    def __defaults__(self):
+        """This sets the default values.
+
+            Assumptions:
+            The cache is off until maximum_size is set.
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            None
+
+            Properties Used:
+            None
+        """
+        self.maximum_size    = 0      # number of designs kept, 0 turns the cache off
+        self.decimals        = 12     # scaled inputs are rounded to this many decimals in the keys
+        self.stored_paths    = []     # other nexus paths stored with each design, wildcards are expanded
+        self.filename        = None   # file evaluations are appended to and replayed from
+        self.hits            = 0
+        self.misses          = 0
+        self.entries         = OrderedDict()
+        self.loaded_filename = None
+
+    def make_key(self,nexus):
+        """Builds the key of the current design of a nexus.
+
+            Assumptions:
+            The problem definition is part of the key, so a changed problem never replays old entries.
+
+            Source:
+            N/A
+
+            Inputs:
+            nexus              [nexus()]
+
+            Outputs:
+            key                [tuple]
+
+            Properties Used:
+            self.decimals      [int]
+        """
+        problem = nexus.optimization_problem
+        inputs  = problem.inputs
+        scaled  = np.array(inputs[:,1],dtype=float)/np.array(inputs[:,3],dtype=float)
+
+        # adding zero turns -0.0 into 0.0
+        design    = tuple(np.round(scaled,self.decimals) + 0.)
+        # the tables are compared as text, since evaluating a problem can change their types
+        signature = hash_data(table_text(inputs[:,[0,3]]),table_text(problem.objective),table_text(problem.constraints),
+                              str(problem.aliases),str(self.stored_paths))
+
+        return (signature, design, nexus.fidelity_level)
+
+    def fetch(self,key):
+        """Returns the stored outputs of a design, counting hits and misses.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            key                [tuple]
+
+            Outputs:
+            entry              [dict] stored values by path, None on a miss
+
+            Properties Used:
+            self.filename      [str]
+        """
+        if self.filename is not None and self.filename != self.loaded_filename:
+            self.load(self.filename)
+
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.entries.move_to_end(key)
+
+        return deepcopy(entry)
+
+    def store(self,key,entry,persist=True):
+        """Stores the outputs of a design, dropping the least recently used designs beyond
+            maximum_size, and appends it to the file.
+
+            Assumptions:
+            Each record is written with a single call, so processes sharing a file append whole records.
+
+            Source:
+            N/A
+
+            Inputs:
+            key                [tuple]
+            entry              [dict]
+            persist            [bool]  also append the entry to the file
+
+            Outputs:
+            None
+
+            Properties Used:
+            self.maximum_size  [int]
+            self.filename      [str]
+        """
+        self.entries[key] = deepcopy(entry)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maximum_size:
+            self.entries.popitem(last=False)
+
+        if persist and self.filename is not None:
+            record = pickle.dumps((key,entry),protocol=pickle.HIGHEST_PROTOCOL)
+            with open(self.filename,'ab') as f:
+                f.write(record)
+
+    def load(self,filename):
+        """Replays the evaluations stored in a file. A record that was only partly written when a
+            run stopped ends the replay.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            filename           [str]
+
+            Outputs:
+            number_of_records  [int]
+
+            Properties Used:
+            None
+        """
+        self.loaded_filename = filename
+        number_of_records    = 0
+        if not os.path.isfile(filename):
+            return number_of_records
+
+        with open(filename,'rb') as f:
+            while True:
+                try:
+                    key, entry = pickle.load(f)
+                except (EOFError, pickle.UnpicklingError, ValueError, TypeError):
+                    break
+                self.store(key,entry,persist=False)
+                number_of_records += 1
+
+        return number_of_records
+
+    def reset(self):
+        """Forgets the stored designs and the statistics, the file is kept.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            None
+
+            Properties Used:
+            None
+        """
+        self.hits            = 0
+        self.misses          = 0
+        self.entries         = OrderedDict()
+        self.loaded_filename = None
+
+    def hit_rate(self):
+        """Fraction of the lookups that found a stored design.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            hit_rate           [float]
+
+            Properties Used:
+            None
+        """
+        lookups = self.hits + self.misses
+        if lookups == 0:
+            return 0.
+
+        return self.hits/float(lookups)
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+def table_text(table):
+    """Writes each entry of a problem table as text, numbers and units as floats"""
+    rows = []
+    for row in np.atleast_2d(np.array(table,dtype=object)):
+        text = []
+        for value in row:
+            try:
+                text.append(repr(float(value*1.)))
+            except (TypeError, ValueError):
+                text.append(str(value))
+        rows.append(text)
+
+    return rows
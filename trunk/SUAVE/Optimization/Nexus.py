@@ -4,6 +4,7 @@
 # Created:  Jul 2015, E. Botero 
 # Modified: Feb 2016, M. Vegh
 #           Apr 2017, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -15,6 +16,8 @@ from SUAVE.Core import Data, DataOrdered
 from SUAVE.Analyses import Process
 from copy import deepcopy
 from . import helper_functions as help_fun
+from .parallel_evaluation import evaluate_designs
+from .Evaluation_Cache import Evaluation_Cache
 import numpy as np
 
 # ----------------------------------------------------------------------
@@ -68,13 +71,20 @@ class Nexus(Data):
         self.last_fidelity          = None
         self.evaluation_count       = 0
         self.force_evaluate         = False
+        self.number_of_workers      = 1
+        self.evaluation_cache       = Evaluation_Cache()
     
     def evaluate(self,x = None):
         """This function runs the problem you setup in SUAVE.
-            If the last time you ran this the inputs were the same, a cache is used.
+            If the last time you ran this the inputs were the same, nothing is run. With the
+            evaluation cache turned on, the outputs of designs that were run before are
+            restored from the cache instead.
     
             Assumptions:
-            None
+            A design restored from the cache sets the results, the summary, the values behind the
+            objective and constraints, and the stored paths of the cache. Anything else the procedure
+            writes, such as sized values of the vehicle configurations, is left from the last design
+            that was run unless its path is in the stored paths.
     
             Source:
             N/A
@@ -86,7 +96,7 @@ class Nexus(Data):
             None
     
             Properties Used:
-            None
+            self.evaluation_cache.maximum_size [int]
         """          
         
         self.unpack_inputs(x)
@@ -95,10 +105,23 @@ class Nexus(Data):
         if np.all(self.optimization_problem.inputs==self.last_inputs) \
            and self.last_fidelity == self.fidelity_level \
            and self.force_evaluate == False:
-            pass
+            return
+        
+        cache = self.evaluation_cache
+        if cache.maximum_size > 0:
+            key   = cache.make_key(self)
+            entry = None if self.force_evaluate else cache.fetch(key)
+            if entry is not None:
+                for path, value in entry.items():
+                    self.deep_set(path,value)
+                self.last_inputs   = deepcopy(self.optimization_problem.inputs)
+                self.last_fidelity = self.fidelity_level
+                return
+            
+            self._really_evaluate()
+            cache.store(key,self.cache_entry())
         else:
             self._really_evaluate()
-        
     
     def _really_evaluate(self):
         """Tricky little function you're not supposed to use. Doesn't check if the last inputs were already run.
@@ -124,6 +147,9 @@ class Nexus(Data):
         
         self.evaluation_count += 1
         
+        # missions with a warm start reuse the unknowns of the closest design
+        self.set_warm_start_keys()
+        
         for key,step in nexus.procedure.items():
             if hasattr(step,'evaluate'):
                 self = step.evaluate(nexus)
@@ -136,6 +162,109 @@ class Nexus(Data):
         self.last_fidelity = self.fidelity_level
           
     
+    def cache_entry(self):
+        """Collects the values the evaluation cache stores for the current design: the results and
+            the summary, the outputs behind the objective and the constraints, and the stored paths.
+    
+            Assumptions:
+            Wildcards in the aliases and stored paths stand for every key at their level.
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            entry              [dict] values by path
+    
+            Properties Used:
+            self.evaluation_cache.stored_paths [list of str]
+        """
+        
+        problem = self.optimization_problem
+        names   = list(np.array(problem.objective)[:,0])
+        if len(problem.constraints) > 0:
+            names += list(np.array(problem.constraints)[:,0])
+        
+        paths = ['results','summary']
+        for alias in problem.aliases:
+            if alias[0] in names:
+                paths += [alias[1]] if isinstance(alias[1],str) else list(alias[1])
+        paths += list(self.evaluation_cache.stored_paths)
+        
+        entry = dict()
+        for path in paths:
+            for key in self.expand_path(path):
+                entry[key] = deepcopy(self.deep_get(key))
+        
+        return entry
+    
+    def expand_path(self,path):
+        """Lists the paths of the nexus a path with wildcards stands for.
+    
+            Assumptions:
+            A level of the path with a * in it stands for every key at that level.
+    
+            Source:
+            N/A
+    
+            Inputs:
+            path               [str]
+    
+            Outputs:
+            paths              [list of str]
+    
+            Properties Used:
+            None
+        """
+        
+        levels = path.split('.')
+        for ii in range(len(levels)):
+            if '*' in levels[ii]:
+                parent = self.deep_get('.'.join(levels[0:ii])) if ii > 0 else self
+                paths  = []
+                for key in parent.keys():
+                    paths += self.expand_path('.'.join(levels[0:ii] + [key] + levels[ii+1:]))
+                return paths
+        
+        return [path]
+    
+    def set_warm_start_keys(self):
+        """Keys the warm starts of the missions by the current scaled inputs.
+    
+            Assumptions:
+            None
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            None
+    
+            Properties Used:
+            None
+        """
+        
+        missions = self.missions
+        if isinstance(missions, SUAVE.Analyses.Mission.Mission):
+            missions = [missions]
+        elif isinstance(missions, Data):
+            missions = list(missions.values())
+        else:
+            return
+        
+        inputs = self.optimization_problem.inputs
+        key    = np.array(inputs[:,1],dtype=float)/np.array(inputs[:,3],dtype=float)
+        
+        for mission in missions:
+            warm_start = getattr(mission,'warm_start',None)
+            if warm_start is not None:
+                warm_start.key = key
+    
     def objective(self,x = None):
         """Retrieve the objective value for your function
     
@@ -345,8 +474,10 @@ class Nexus(Data):
         """           
         pass     
 
-    def finite_difference(self,x,diff_interval=1e-8):
-        """Finite difference gradients and jacobians of the problem.
+    def finite_difference(self,x,diff_interval=1e-8,central_difference=False):
+        """Finite difference gradients and jacobians of the problem. With more than one worker
+            the perturbed designs are evaluated in parallel processes, each with its own copy of
+            the problem.
     
             Assumptions:
             N/A
@@ -357,13 +488,14 @@ class Nexus(Data):
             Inputs:
             x                  [vector]
             diff_interval      [float]
+            central_difference [bool]
     
             Outputs:
             grad_obj           [vector]
             jac_con            [array]
     
             Properties Used:
-            None
+            self.number_of_workers [int]
         """           
         
         obj = self.objective(x)
@@ -375,21 +507,30 @@ class Nexus(Data):
         inplen = len(inpu)
         conlen = len(const)
         
-        grad_obj = np.zeros(inplen)
-        jac_con  = np.zeros((inplen,conlen))
-        
-        con2 = (con*np.ones_like(jac_con))
+        # the perturbed designs, forward and then backward
+        steps  = diff_interval*np.eye(inplen)
+        points = np.asarray(x)*1.0 + steps
+        if central_difference:
+            points = np.vstack([points,np.asarray(x)*1.0 - steps])
         
-        for ii in range(0,inplen):
-            newx     = np.asarray(x)*1.0
-            newx[ii] = newx[ii] + diff_interval
+        if self.number_of_workers > 1:
+            objs, cons = evaluate_designs(self,points,self.number_of_workers)
+            objs       = objs[:,0]
             
-            grad_obj[ii]  = self.objective(newx)
-            jac_con[ii,:] = self.all_constraints(newx)
-        
-        grad_obj = (grad_obj - obj)/diff_interval
-        
-        jac_con = (jac_con - con2).T/diff_interval
+        else:
+            objs = np.zeros(len(points))
+            cons = np.zeros((len(points),conlen))
+            for ii in range(0,len(points)):
+                objs[ii]   = self.objective(points[ii])
+                cons[ii,:] = self.all_constraints(points[ii])
+        
+        if central_difference:
+            grad_obj = (objs[0:inplen] - objs[inplen:])/(2.*diff_interval)
+            jac_con  = (cons[0:inplen] - cons[inplen:]).T/(2.*diff_interval)
+        else:
+            con2     = (con*np.ones((inplen,conlen)))
+            grad_obj = (objs - obj)/diff_interval
+            jac_con  = (cons - con2).T/diff_interval
         
         grad_obj = grad_obj.astype(float)
         jac_con  = jac_con.astype(float)
@@ -4,6 +4,7 @@
 # Created:  Apr 2017, T. MacDonald
 # Modified: Jun 2017, T. MacDonald
 #           Oct 2019, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -391,6 +392,7 @@ class Trust_Region_Optimization(Data):
         
     def evaluate_model(self,problem,x,der_flag=True):
         """Evaluates the SUAVE nexus problem. This is often a mission evaluation.
+        The finite differences run in parallel when the problem has more than one worker.
 
         Assumptions:
         None
@@ -415,6 +417,7 @@ class Trust_Region_Optimization(Data):
 
         Properties Used:
         self.difference_interval [-]
+        problem.number_of_workers [-]
         """              
         f  = problem.objective(x)
         g  = problem.all_constraints(x)
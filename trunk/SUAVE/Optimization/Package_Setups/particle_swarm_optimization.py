@@ -2,6 +2,7 @@
 # particle_swarm_optimization.py
 # 
 # Created:  Sep. 2019, M. Clarke
+# Modified: Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -14,10 +15,14 @@ import scipy as sp
 ## @ingroup Optimization-Package_Setups
 def particle_swarm_optimization(func, lb, ub, ieqcons=[], f_ieqcons=None, args=(), kwargs={}, 
         swarmsize=100, omega=0.5, phip=0.5, phig=0.5, maxiter=100, 
-        minstep=1e-8, minfunc=1e-8, debug=False):
+        minstep=1e-8, minfunc=1e-8, debug=False, f_batch=None, seed=None):
     """
     This function perform a particle swarm optimization (PSO)
     
+    When a batch function is given the whole swarm is evaluated at once each iteration,
+    for example by a pool of worker processes. The particles then move towards the swarm's
+    best position at the start of the iteration, instead of the best position found so far.
+    
     Source:
         Pyswarm: https://github.com/tisimst/pyswarm
           
@@ -41,6 +46,10 @@ def particle_swarm_optimization(func, lb, ub, ieqcons=[], f_ieqcons=None, args=(
         minstep   : The minimum stepsize of swarm's best position before the search terminates (Default: 1e-8)      [scalar]
         minfunc   : The minimum change of swarm's best objective value before the search terminates (Default: 1e-8) [scalar]
         debug     : If True, progress statements will be displayed every iteration (Default: False)                 [boolean]
+        f_batch   : Returns the objective values and the inequality constraint values of a whole swarm, given       
+                    one particle per row. The constraint values may be None. If f_batch is specified, func,         
+                    ieqcons and f_ieqcons are not called (Default: None)                                            [function]
+        seed      : Seed of the random numbers of the swarm, None uses the numpy global random state (Default: None) [int]
    
     Outputs:
         g         : The swarm's best known position (optimal design)                                                [list] 
@@ -82,7 +91,7 @@ def particle_swarm_optimization(func, lb, ub, ieqcons=[], f_ieqcons=None, args=(
     SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.'''
     
     assert len(lb)==len(ub), 'Lower- and upper-bounds must be the same length'
-    assert hasattr(func, '__call__'), 'Invalid function handle'
+    assert hasattr(func, '__call__') or hasattr(f_batch, '__call__'), 'Invalid function handle'
     lb = np.array(lb)
     ub = np.array(ub)
     assert np.all(ub>lb), 'All upper-bound values must be greater than lower-bound values'
@@ -109,17 +118,27 @@ def particle_swarm_optimization(func, lb, ub, ieqcons=[], f_ieqcons=None, args=(
     def is_feasible(x):
         check = np.all(cons(x)>=0)
         return check
+    
+    # Random numbers of the swarm
+    if seed is None:
+        random = np.random
+    else:
+        random = np.random.RandomState(seed)
         
     # Initialize the particle swarm ############################################
     S = swarmsize
     D = len(lb)  # the number of dimensions each particle has
-    x = np.random.rand(S, D)  # particle positions
+    x = random.rand(S, D)  # particle positions
     v = np.zeros_like(x)  # particle velocities
     p = np.zeros_like(x)  # best particle positions
     fp = np.zeros(S)  # best particle function values
     g = []  # best swarm position
     fg = 1e100  # artificial best swarm position starting value
     
+    if f_batch is not None:
+        return batch_swarm_search(f_batch, lb, ub, x, vlow, vhigh, random, args, kwargs, 
+                                  omega, phip, phig, maxiter, minstep, minfunc, debug)
+    
     for i in range(S):
         # Initialize the particle's position
         x[i, :] = lb + x[i, :]*(ub - lb)
@@ -142,13 +161,13 @@ def particle_swarm_optimization(func, lb, ub, ieqcons=[], f_ieqcons=None, args=(
             g = p[i, :].copy()
        
         # Initialize the particle's velocity
-        v[i, :] = vlow + np.random.rand(D)*(vhigh - vlow)
+        v[i, :] = vlow + random.rand(D)*(vhigh - vlow)
        
     # Iterate until termination criterion met ##################################
     it = 1
     while it<=maxiter:
-        rp = np.random.uniform(size=(S, D))
-        rg = np.random.uniform(size=(S, D))
+        rp = random.uniform(size=(S, D))
+        rg = random.uniform(size=(S, D))
         for i in range(S):
 
             # Update the particle's velocity
@@ -197,3 +216,109 @@ def particle_swarm_optimization(func, lb, ub, ieqcons=[], f_ieqcons=None, args=(
         print("However, the optimization couldn't find a feasible design. Sorry")
     return g, fg
 
+
+## @ingroup Optimization-Package_Setups
+def batch_swarm_search(f_batch, lb, ub, x, vlow, vhigh, random, args=(), kwargs={},
+        omega=0.5, phip=0.5, phig=0.5, maxiter=100, minstep=1e-8, minfunc=1e-8, debug=False):
+    """
+    The particle swarm search of particle_swarm_optimization with the whole swarm evaluated
+    at once each iteration
+    
+    Source:
+        Pyswarm: https://github.com/tisimst/pyswarm
+          
+    Inputs: 
+        f_batch   : Returns the objective and inequality constraint values of a swarm                               [function] 
+        lb        : The lower bounds of the design variable(s)                                                      [array] 
+        ub        : The upper bounds of the design variable(s)                                                      [array]
+        x         : Random numbers of the initial particle positions, one particle per row                          [array]
+        vlow      : The lower bounds of the particle velocities                                                     [array]
+        vhigh     : The upper bounds of the particle velocities                                                     [array]
+        random    : Source of the random numbers of the swarm                                                       [RandomState]
+        args, kwargs, omega, phip, phig, maxiter, minstep, minfunc, debug : see particle_swarm_optimization
+   
+    Outputs:
+        g         : The swarm's best known position (optimal design)                                                [list] 
+        f         : The objective value at ``g``                                                                    [float]
+         
+    Properties Used:
+        None
+    """
+    
+    # the objective values are returned as given by f_batch, one row or value per particle
+    def evaluate_swarm(x):
+        fx, cx = f_batch(x, *args, **kwargs)
+        fx     = np.asarray(fx, dtype=float)
+        values = np.reshape(fx, (len(x), -1))[:, 0]
+        if cx is None:
+            feasible = np.ones(len(x), dtype=bool)
+        else:
+            feasible = np.all(np.reshape(np.asarray(cx, dtype=float), (len(x), -1))>=0, axis=1)
+        return fx, values, feasible
+    
+    # Initialize the particle swarm ############################################
+    S, D = x.shape
+    x  = lb + x*(ub - lb)  # particle positions
+    p  = x.copy()  # best particle positions
+    f0, fp, feasible = evaluate_swarm(p)  # best particle function values
+    g  = p[0, :].copy()  # best swarm position, temporary if no particle is feasible
+    fg = 1e100  # artificial best swarm position starting value
+    fg_out = fg
+    g_feasible = False
+    
+    for i in range(S):
+        if fp[i]<fg and feasible[i]:
+            fg = fp[i]
+            fg_out = f0[i]
+            g  = p[i, :].copy()
+            g_feasible = True
+            
+    v = vlow + random.rand(S, D)*(vhigh - vlow)  # particle velocities
+       
+    # Iterate until termination criterion met ##################################
+    it = 1
+    while it<=maxiter:
+        rp = random.uniform(size=(S, D))
+        rg = random.uniform(size=(S, D))
+        
+        # Update the velocities and positions of all particles, correcting lower 
+        # and upper bound violations, then evaluate the swarm
+        v  = omega*v + phip*rp*(p - x) + phig*rg*(g - x)
+        x  = np.minimum(np.maximum(x + v, lb), ub)
+        fx_out, fx, feasible = evaluate_swarm(x)
+        
+        for i in range(S):
+            
+            # Compare particle's best position (if constraints are satisfied)
+            if fx[i]<fp[i] and feasible[i]:
+                p[i, :] = x[i, :].copy()
+                fp[i] = fx[i]
+
+                # Compare swarm's best position to current particle's position
+                if fx[i]<fg:
+                    if debug:
+                        print('New best for swarm at iteration {:}: {:} {:}'.format(it, x[i, :], fx[i]))
+
+                    tmp = x[i, :].copy()
+                    stepsize = np.sqrt(np.sum((g-tmp)**2))
+                    if np.abs(fg - fx[i])<=minfunc:
+                        print('Stopping search: Swarm best objective change less than {:}'.format(minfunc))
+                        return tmp, fx_out[i]
+                    elif stepsize<=minstep:
+                        print('Stopping search: Swarm best position change less than {:}'.format(minstep))
+                        return tmp, fx_out[i]
+                    else:
+                        g  = tmp.copy()
+                        fg = fx[i]
+                        fg_out = fx_out[i]
+                        g_feasible = True
+
+        if debug:
+            print('Best after iteration {:}: {:} {:}'.format(it, g, fg))
+        it += 1
+
+    print('Stopping search: maximum iterations reached --> {:}'.format(maxiter))
+    
+    if not g_feasible:
+        print("However, the optimization couldn't find a feasible design. Sorry")
+    return g, fg_out
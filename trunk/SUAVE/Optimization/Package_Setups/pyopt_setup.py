@@ -3,6 +3,7 @@
 #
 # Created:  Jul 2015, E. Botero
 # Modified: Feb 2016, M. Vegh
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -21,6 +22,8 @@ from SUAVE.Optimization import helper_functions as help_fun
 def Pyopt_Solve(problem,solver='SNOPT',FD='single', sense_step=1.0E-6,  nonderivative_line_search=False):
     """ This converts your SUAVE Nexus problem into a PyOpt optimization problem and solves it
         PyOpt has many algorithms, they can be switched out by using the solver input. 
+        When the problem has more than one worker, SNOPT and SLSQP use the finite difference
+        gradients of the problem, which evaluates the perturbed designs in parallel.
 
         Assumptions:
         None
@@ -39,7 +42,7 @@ def Pyopt_Solve(problem,solver='SNOPT',FD='single', sense_step=1.0E-6,  nonderiv
         outputs                   [list]
 
         Properties Used:
-        None
+        problem.number_of_workers [int]
     """      
    
     # Have the optimizer call the wrapper
@@ -142,6 +145,9 @@ def Pyopt_Solve(problem,solver='SNOPT',FD='single', sense_step=1.0E-6,  nonderiv
     if FD == 'parallel':
         outputs = opt(opt_prob, sens_type='FD',sens_mode='pgc')
         
+    elif (solver == 'SNOPT' or solver == 'SLSQP') and problem.number_of_workers > 1:
+        outputs = opt(opt_prob, sens_type=lambda x,f,g:PyOpt_Gradients(problem,x,f,g,sense_step))
+        
     elif solver == 'SNOPT' or solver == 'SLSQP':
         outputs = opt(opt_prob, sens_type='FD', sens_step = sense_step)
   
@@ -193,3 +199,36 @@ def PyOpt_Problem(problem,x):
     print(const)
    
     return obj,const,fail
+
+
+## @ingroup Optimization-Package_Setups
+def PyOpt_Gradients(problem,x,f,g,sense_step):
+    """ This wrapper finite differences the SUAVE problem for the PyOpt solver.
+        The perturbed designs are evaluated in parallel when the problem has more than one worker.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        problem      [nexus()]
+        x            [array]
+        f            [float]   objective at x, unused
+        g            [array]   constraints at x, unused
+        sense_step   [float]
+
+        Outputs:
+        grad_obj     [array]
+        jac_con      [array]
+        fail         [bool]
+
+        Properties Used:
+        None
+    """      
+   
+    grad_obj, jac_con = problem.finite_difference(x,diff_interval=sense_step)
+    fail              = np.array(np.isnan(grad_obj).any() or np.isnan(jac_con).any()).astype(int)
+   
+    return grad_obj.reshape(1,-1),jac_con,fail
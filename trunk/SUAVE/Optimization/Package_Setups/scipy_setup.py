@@ -4,6 +4,7 @@
 # Created:  Aug 2015, E. Botero 
 # Modified: Feb 2017, M. Vegh
 #           Mar 2020, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -12,7 +13,10 @@
 # suave imports
 import numpy as np
 import scipy as sp
+from SUAVE.Core import Data
 from SUAVE.Optimization.Package_Setups.particle_swarm_optimization import particle_swarm_optimization
+from SUAVE.Optimization.parallel_evaluation import evaluate_designs, evaluation_pool
+from SUAVE.Optimization import helper_functions as help_fun
 # ----------------------------------------------------------------------
 #  Something that should become a class at some point
 # ----------------------------------------------------------------------
@@ -21,6 +25,9 @@ from SUAVE.Optimization.Package_Setups.particle_swarm_optimization import partic
 def SciPy_Solve(problem,solver='SLSQP', sense_step = 1.4901161193847656e-08, tolerance = 1e-6, pop_size =  10 , prob_seed = None ):  
     """ This converts your SUAVE Nexus problem into a SciPy optimization problem and solves it
         SciPy has many algorithms, they can be switched out by using the solver input. 
+        When the problem has more than one worker, SLSQP uses the finite difference gradients of
+        the problem, which evaluates the perturbed designs in parallel, and the particle swarm
+        evaluates each swarm with a pool of worker processes.
 
         Assumptions:
         1.4901161193847656e-08 is SLSQP default FD step in scipy
@@ -32,12 +39,14 @@ def SciPy_Solve(problem,solver='SLSQP', sense_step = 1.4901161193847656e-08, tol
         problem                   [nexus()]
         solver                    [str]
         sense_step                [float]
+        pop_size                  [int]
+        prob_seed                 [int]
 
         Outputs:
         outputs                   [list]
 
         Properties Used:
-        None
+        problem.number_of_workers [int]
     """
     
     inp = problem.optimization_problem.inputs
@@ -67,12 +76,20 @@ def SciPy_Solve(problem,solver='SLSQP', sense_step = 1.4901161193847656e-08, tol
         de_bnds.append((bnd[ii][0]/scl[ii],bnd[ii][1]/scl[ii]))      
 
     # Finalize problem statement and run
-    if solver=='SLSQP':
+    if solver=='SLSQP' and problem.number_of_workers > 1:
+        fprime, fprime_eqcons, fprime_ieqcons = SciPy_Gradients(problem,sense_step)
+        outputs = sp.optimize.fmin_slsqp(wrapper,x,f_eqcons=problem.equality_constraint,f_ieqcons=problem.inequality_constraint,bounds=bnds,iter=200, acc  = tolerance,
+                                         fprime=fprime,fprime_eqcons=fprime_eqcons,fprime_ieqcons=fprime_ieqcons)
+    elif solver=='SLSQP':
         outputs = sp.optimize.fmin_slsqp(wrapper,x,f_eqcons=problem.equality_constraint,f_ieqcons=problem.inequality_constraint,bounds=bnds,iter=200, epsilon = sense_step, acc  = tolerance)
     elif solver == 'differential_evolution':
         outputs = sp.optimize.differential_evolution(wrapper, bounds= de_bnds, strategy='best1bin', maxiter=1000, popsize = pop_size, tol=0.01, mutation=(0.5, 1), recombination=0.7, seed=prob_seed, callback=None, disp=False, polish=True, init='latinhypercube', atol=0, updating='immediate', workers=1)
+    elif solver == 'particle_swarm_optimization' and problem.number_of_workers > 1:
+        with evaluation_pool(problem,problem.number_of_workers) as pool:
+            outputs = particle_swarm_optimization(wrapper, lb, ub, kwargs={}, swarmsize=pop_size , omega=0.5, phip=0.5, phig=0.5, maxiter=1000, minstep=1e-4, minfunc=1e-4, debug=False,
+                                                  f_batch=SciPy_Swarm(problem,pool), seed=prob_seed)
     elif solver == 'particle_swarm_optimization':
-        outputs = particle_swarm_optimization(wrapper, lb, ub, f_ieqcons=problem.inequality_constraint, kwargs={}, swarmsize=pop_size , omega=0.5, phip=0.5, phig=0.5, maxiter=1000, minstep=1e-4, minfunc=1e-4, debug=False)    
+        outputs = particle_swarm_optimization(wrapper, lb, ub, f_ieqcons=problem.inequality_constraint, kwargs={}, swarmsize=pop_size , omega=0.5, phip=0.5, phig=0.5, maxiter=1000, minstep=1e-4, minfunc=1e-4, debug=False, seed=prob_seed)    
     else:
         outputs = sp.optimize.minimize(wrapper,x,method=solver)
     
@@ -109,3 +126,91 @@ def SciPy_Problem(problem,x):
     
     return obj
 
+## @ingroup Optimization-Package_Setups
+def SciPy_Gradients(problem,sense_step):
+    """ Builds the gradient functions of the objective, equality and inequality constraints
+        from one finite difference of the SUAVE problem at each design. The finite difference
+        evaluates the perturbed designs in parallel when the problem has more than one worker.
+
+        Assumptions:
+        Constraints follow the signs of Nexus.equality_constraint and Nexus.inequality_constraint
+
+        Source:
+        N/A
+
+        Inputs:
+        problem          [nexus()]
+        sense_step       [float]
+
+        Outputs:
+        fprime           function, gradient of the objective
+        fprime_eqcons    function, jacobian of the equality constraints
+        fprime_ieqcons   function, jacobian of the inequality constraints
+
+        Properties Used:
+        None
+    """
+
+    con  = problem.optimization_problem.constraints
+    
+    if len(con) > 0:
+        eq   = con[:,1] == '='
+        sign = np.where(con[:,1]=='<',-1.,1.)
+    
+    # the solver asks for the three gradients at the same design, so the last one is kept
+    last = Data(x = None)
+    
+    def finite_difference(x):
+        if last.x is None or np.any(last.x != x):
+            last.grad_obj, last.jac_con = problem.finite_difference(x,diff_interval=sense_step)
+            last.x = np.array(x)
+        return last.grad_obj, last.jac_con
+    
+    def constraint_jacobian(x,equality):
+        if len(con) == 0:
+            return np.zeros((0,len(x)))
+        jac_con = sign[:,None]*finite_difference(x)[1]
+        return jac_con[eq,:] if equality else jac_con[~eq,:]
+    
+    fprime         = lambda x: finite_difference(x)[0]
+    fprime_eqcons  = lambda x: constraint_jacobian(x,True)
+    fprime_ieqcons = lambda x: constraint_jacobian(x,False)
+    
+    return fprime, fprime_eqcons, fprime_ieqcons
+
+## @ingroup Optimization-Package_Setups
+def SciPy_Swarm(problem,pool):
+    """ Builds the function that evaluates a whole particle swarm of the SUAVE problem, with
+        the particles split over a pool of worker processes that each hold a copy of the problem.
+
+        Assumptions:
+        Constraints follow the signs of Nexus.inequality_constraint
+
+        Source:
+        N/A
+
+        Inputs:
+        problem          [nexus()]
+        pool             [ProcessPoolExecutor] see evaluation_pool
+
+        Outputs:
+        swarm            function, objectives and inequality constraints of a swarm
+
+        Properties Used:
+        None
+    """
+
+    con = problem.optimization_problem.constraints
+    
+    if len(con) > 0:
+        ieq  = con[:,1] != '='
+        sign = np.where(con[:,1]=='<',-1.,1.)
+        bnds = np.array(help_fun.scale_const_bnds(con),dtype=float)
+    
+    def swarm(x):
+        obj, cons = evaluate_designs(problem,x,constraints=len(con) > 0,pool=pool)
+        if cons is not None:
+            cons = (sign*(cons - bnds))[:,ieq]
+        return obj, cons
+    
+    return swarm
@@ -6,6 +6,9 @@ from .read_optimization_outputs  import read_optimization_outputs
 from .write_optimization_outputs import write_optimization_outputs
 from .carpet_plot                import carpet_plot
 from .line_plot                  import line_plot
+from .design_sweep               import design_sweep
+from .parallel_evaluation        import evaluate_designs, evaluation_pool
+from .Evaluation_Cache           import Evaluation_Cache
 from .Surrogate_Optimization     import Surrogate_Optimization
 
 from . import helper_functions
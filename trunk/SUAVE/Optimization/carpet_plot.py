@@ -3,12 +3,14 @@
 #
 # Created : Feb 2016, M. Vegh 
 # Modified : Feb 2017, M. Vegh
+#            Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # -------------------------------------------
  
 from SUAVE.Core import Data
+from .design_sweep import design_sweep
 import numpy as np
 import matplotlib.pyplot as plt
 
@@ -17,9 +19,11 @@ import matplotlib.pyplot as plt
 # ----------------------------------------------------------------------
 
 ## @ingroup Optimization
-def carpet_plot(problem, number_of_points,  plot_obj=1, plot_const=0, sweep_index_0=0, sweep_index_1=1): 
+def carpet_plot(problem, number_of_points,  plot_obj=1, plot_const=0, sweep_index_0=0, sweep_index_1=1, number_of_workers=1, filename=None): 
     """ Takes in an optimization problem and runs a carpet plot of the first 2 variables
         sweep_index_0, sweep_index_1 is index of variables you want to run carpet plot (i.e. sweep_index_0=0 means you want to sweep first variable, sweep_index_0 = 4 is the 5th variable)
+        The points are run by design_sweep, in parallel with more than one worker, and can be
+        stored in a table file that lets an interrupted carpet plot be resumed.
     
         Assumptions:
         N/A
@@ -34,6 +38,8 @@ def carpet_plot(problem, number_of_points,  plot_obj=1, plot_const=0, sweep_inde
         plot_const         [int]
         sweep_index_0      [int]
         sweep_index_1      [int]
+        number_of_workers  [int]
+        filename           [str]
         
         Outputs:
         Beautiful Beautiful Plots!
@@ -74,14 +80,13 @@ def carpet_plot(problem, number_of_points,  plot_obj=1, plot_const=0, sweep_inde
 
     
     #inputs defined; now run sweep
+    points = np.array([[inputs[0,i], inputs[1,j]] for i in range(0, number_of_points) for j in range(0,number_of_points)])
+    sweep_obj, sweep_const, _ = design_sweep(problem, [idx0, idx1], points, number_of_workers, filename)
+    
     for i in range(0, number_of_points):
         for j in range(0,number_of_points):
-            #problem.optimization_problem.inputs=base_inputs  #overwrite any previous modification
-            opt_prob.inputs[:,1][idx0]= inputs[0,i]
-            opt_prob.inputs[:,1][idx1]= inputs[1,j]
-
-            obj[j,i]             = problem.objective()*obj_scaling
-            constraint_val[:,j,i]= problem.all_constraints().tolist()
+            obj[j,i]             = sweep_obj[i*number_of_points + j]*obj_scaling
+            constraint_val[:,j,i]= sweep_const[i*number_of_points + j]
   
     if plot_obj==1:
         plt.figure(0)
@@ -0,0 +1,223 @@
+## @ingroup Optimization
+# design_sweep.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from .parallel_evaluation import evaluation_pool, run_in_worker
+
+from concurrent.futures import wait, FIRST_COMPLETED
+import numpy as np
+import os
+
+# ----------------------------------------------------------------------
+#  Design Sweep
+# ----------------------------------------------------------------------
+
+## @ingroup Optimization
+def design_sweep(problem,sweep_indices,values,number_of_workers=1,filename=None,solve=None):
+    """Evaluates a problem at a list of points of a design sweep, where each point sets the
+    values of some of the inputs. This is the engine of carpet_plot, line_plot and pareto_sweep.
+
+    With more than one worker the points are split over a pool of processes that each hold
+    their own copy of the problem. Each finished point is appended to a table file, and the
+    points already in the table are not run again, so an interrupted sweep can be resumed.
+    The other inputs of each point start from the design of the nearest finished point,
+    which gives a solve function a good starting design.
+
+    Assumptions:
+    The points are run in the order given, so neighbouring points should follow each other.
+
+    Source:
+    N/A
+
+    Inputs:
+    problem             [nexus()]
+    sweep_indices       [list]     indices of the inputs that are swept
+    values              [array]    unscaled values of the swept inputs, one point per row
+    number_of_workers   [int]
+    filename            [str]      table of the finished points, None to not store them
+    solve               function(problem,sweep_indices) run at each point before the objective,
+                                   for example an optimization of the other inputs
+
+    Outputs:
+    objectives          [array]    scaled objective of each point
+    constraint_values   [array]    scaled constraints of each point
+    designs             [array]    unscaled inputs of each point
+
+    Properties Used:
+    None
+    """
+
+    opt_prob         = problem.optimization_problem
+    sweep_indices    = list(np.atleast_1d(sweep_indices))
+    values           = np.reshape(np.array(values,dtype=float),(-1,len(sweep_indices)))
+    number_of_points = len(values)
+    number_of_inputs = len(opt_prob.inputs)
+    scale            = np.array(opt_prob.inputs[:,3],dtype=float)
+    swept_scale      = scale[sweep_indices]
+
+    objectives        = np.zeros(number_of_points)
+    constraint_values = np.zeros((number_of_points,len(opt_prob.constraints)))
+    designs           = np.zeros((number_of_points,number_of_inputs))
+    finished          = np.zeros(number_of_points,dtype=bool)
+
+    # points of a previous run
+    if filename is not None:
+        for index, row in read_sweep_table(filename):
+            if index < number_of_points and len(row) == 1 + number_of_inputs + len(opt_prob.constraints) \
+               and np.allclose(row[1:1+number_of_inputs][sweep_indices],values[index],rtol=1e-12,atol=0.):
+                objectives[index]        = row[0]
+                designs[index]           = row[1:1+number_of_inputs]
+                constraint_values[index] = row[1+number_of_inputs:]
+                finished[index]          = True
+        start_sweep_table(filename,opt_prob)
+
+    base_design = np.array(opt_prob.inputs[:,1],dtype=float)
+
+    def starting_design(index):
+        if not np.any(finished):
+            return base_design
+        distance = np.linalg.norm((designs[finished][:,sweep_indices] - values[index])/swept_scale,axis=1)
+        return designs[finished][np.argmin(distance)]
+
+    def record(index,output):
+        objectives[index], constraint_values[index], designs[index], _ = output
+        finished[index] = True
+        if filename is not None:
+            write_sweep_row(filename,index,objectives[index],designs[index],constraint_values[index])
+
+    pending = [index for index in range(number_of_points) if not finished[index]]
+
+    if number_of_workers > 1 and len(pending) > 1:
+        with evaluation_pool(problem,min(int(number_of_workers),len(pending))) as pool:
+            running = dict()
+            while len(pending) > 0 or len(running) > 0:
+                while len(pending) > 0 and len(running) < number_of_workers:
+                    index = pending.pop(0)
+                    future = pool.submit(run_in_worker,sweep_point,sweep_indices,values[index],starting_design(index),solve)
+                    running[future] = index
+                done, _ = wait(list(running.keys()),return_when=FIRST_COMPLETED)
+                for future in done:
+                    output = future.result()
+                    record(running.pop(future),output)
+
+                    # the evaluations ran in the workers
+                    problem.evaluation_count += output[3]
+    else:
+        for index in pending:
+            record(index,sweep_point(problem,sweep_indices,values[index],starting_design(index),solve))
+
+    return objectives, constraint_values, designs
+
+## @ingroup Optimization
+def sweep_point(problem,sweep_indices,values,design,solve=None):
+    """Runs one point of a design sweep.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    problem             [nexus()]
+    sweep_indices       [list]
+    values              [array]    unscaled values of the swept inputs
+    design              [array]    unscaled starting values of all inputs
+    solve               function(problem,sweep_indices), optional
+
+    Outputs:
+    objective           [float]    scaled
+    constraint_values   [array]    scaled
+    design              [array]    unscaled inputs
+    evaluations         [int]      number of new evaluations of the problem
+
+    Properties Used:
+    None
+    """
+
+    count    = problem.evaluation_count
+    opt_prob = problem.optimization_problem
+    for ii in range(len(design)):
+        opt_prob.inputs[ii][1] = design[ii]
+    for ii, value in zip(sweep_indices,values):
+        opt_prob.inputs[ii][1] = value
+
+    if solve is not None:
+        solve(problem,sweep_indices)
+
+    objective         = float(np.atleast_1d(problem.objective())[0])
+    constraint_values = np.array(problem.all_constraints(),dtype=float)
+    design            = np.array(opt_prob.inputs[:,1],dtype=float)
+
+    return objective, constraint_values, design, problem.evaluation_count - count
+
+# ----------------------------------------------------------------------
+#  Sweep Table
+# ----------------------------------------------------------------------
+
+## @ingroup Optimization
+def read_sweep_table(filename):
+    """Reads the finished points of a design sweep table. A line that was only partly written
+    when a sweep stopped is skipped.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    filename            [str]
+
+    Outputs:
+    rows                [list]     (point index, [objective, design, constraints]) of each point
+
+    Properties Used:
+    None
+    """
+
+    rows = []
+    if not os.path.isfile(filename):
+        return rows
+
+    with open(filename,'r') as f:
+        lines = f.read().split('\n')
+
+    # the last entry is either empty or a line still being written
+    for line in lines[:-1]:
+        if line.startswith('#') or line.strip() == '':
+            continue
+        try:
+            entries = [float(entry) for entry in line.split(',')]
+        except ValueError:
+            continue
+        rows.append((int(entries[0]),np.array(entries[1:])))
+
+    return rows
+
+def start_sweep_table(filename,opt_prob):
+    """Starts a sweep table with the names of its columns, or removes a partly written last line
+    from the table of a previous run"""
+    if os.path.isfile(filename):
+        with open(filename,'rb+') as f:
+            contents = f.read()
+            f.truncate(contents.rfind(b'\n') + 1)
+        return
+
+    names = ['point','objective'] + list(opt_prob.inputs[:,0])
+    if len(opt_prob.constraints) > 0:
+        names += list(np.array(opt_prob.constraints)[:,0])
+    with open(filename,'w') as f:
+        f.write('# ' + ', '.join([str(name) for name in names]) + '\n')
+
+def write_sweep_row(filename,index,objective,design,constraint_values):
+    """Appends a finished point to a sweep table"""
+    entries = [objective] + list(design) + list(constraint_values)
+    with open(filename,'a') as f:
+        f.write(str(index) + ', ' + ', '.join([repr(float(entry)) for entry in entries]) + '\n')
+        f.flush()
@@ -3,12 +3,14 @@
 #
 # Created  : Oct 2017, M. Vegh 
 # Modified : Nov 2017, M. Vegh
+#            Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # -------------------------------------------
  
 from SUAVE.Core import Data
+from .design_sweep import design_sweep
 import numpy as np
 import matplotlib.pyplot as plt
 
@@ -17,10 +19,12 @@ import matplotlib.pyplot as plt
 # ----------------------------------------------------------------------
 
 
-def line_plot(problem, number_of_points,  plot_obj=1, plot_const=1, sweep_index=0): 
+def line_plot(problem, number_of_points,  plot_obj=1, plot_const=1, sweep_index=0, number_of_workers=1, filename=None): 
     """
     Takes in an optimization problem and runs a line plot of the first  variable of sweep index
     sweep_index. i.e. sweep_index=0 means you want to sweep the first variable, sweep_index = 4 is the 5th variable)
+    The points are run by design_sweep, in parallel with more than one worker, and can be
+    stored in a table file that lets an interrupted line plot be resumed.
     
         Assumptions:
         N/A
@@ -34,6 +38,8 @@ def line_plot(problem, number_of_points,  plot_obj=1, plot_const=1, sweep_index=
         plot_obj           [int]
         plot_const         [int]
         sweep_index        [int]
+        number_of_workers  [int]
+        filename           [str]
 
         
         Outputs:
@@ -77,11 +83,10 @@ def line_plot(problem, number_of_points,  plot_obj=1, plot_const=1, sweep_index=
 
     
     #inputs defined; now run sweep
-    for i in range(0, number_of_points):
-        opt_prob.inputs[:,1][idx0]= inputs[0,i]
-   
-        obj[i]             = problem.objective()*obj_scaling
-        constraint_val[:,i]= problem.all_constraints().tolist()
+    sweep_obj, sweep_const, _ = design_sweep(problem, [idx0], inputs[0,:], number_of_workers, filename)
+    
+    obj[:]            = sweep_obj*obj_scaling
+    constraint_val[:] = sweep_const.T
   
     if plot_obj==1:
         plt.figure(0)
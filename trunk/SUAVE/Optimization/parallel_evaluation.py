@@ -0,0 +1,144 @@
+## @ingroup Optimization
+# parallel_evaluation.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+# the copy of the problem held by each worker process
+_worker_problem = None
+
+# ----------------------------------------------------------------------
+#  Evaluate Designs
+# ----------------------------------------------------------------------
+
+## @ingroup Optimization
+def evaluate_designs(problem,points,number_of_workers=1,constraints=True,pool=None):
+    """Evaluates the objective and constraints of a problem at several scaled design vectors.
+    With more than one worker the designs are split over a pool of processes, each of which
+    holds its own copy of the problem as it was when the pool was started. A pool from
+    evaluation_pool can be given to reuse the same worker processes for many calls.
+
+    Assumptions:
+    The designs are independent of each other. Worker processes are forked where the platform
+    allows it, otherwise the problem has to be picklable.
+
+    Source:
+    N/A
+
+    Inputs:
+    problem             [nexus()]
+    points              [array]    one scaled design vector per row
+    number_of_workers   [int]
+    constraints         [bool]     also evaluate all_constraints
+    pool                [ProcessPoolExecutor] started by evaluation_pool, optional
+
+    Outputs:
+    objectives          [array]    one row per design
+    constraint_values   [array]    one row per design, None without constraints
+
+    Properties Used:
+    None
+    """
+
+    points = np.atleast_2d(np.asarray(points,dtype=float))
+
+    if pool is not None and len(points) > 0:
+        outputs = list(pool.map(_evaluate_design,points,[constraints]*len(points)))
+
+        # the evaluations ran in the workers
+        problem.evaluation_count += sum([output[2] for output in outputs])
+    elif number_of_workers > 1 and len(points) > 1:
+        with evaluation_pool(problem,min(int(number_of_workers),len(points))) as executor:
+            outputs = list(executor.map(_evaluate_design,points,[constraints]*len(points)))
+
+        problem.evaluation_count += sum([output[2] for output in outputs])
+    else:
+        outputs = [_evaluate_problem(problem,x,constraints) for x in points]
+
+    objectives = np.array([np.atleast_1d(output[0]) for output in outputs],dtype=float)
+    if constraints:
+        constraint_values = np.array([np.atleast_1d(output[1]) for output in outputs],dtype=float)
+    else:
+        constraint_values = None
+
+    return objectives, constraint_values
+
+## @ingroup Optimization
+def evaluation_pool(problem,number_of_workers):
+    """Starts a pool of worker processes for evaluate_designs, each of which holds its own copy of
+    the problem. The pool is shut down by using it as a context manager.
+
+    Assumptions:
+    Worker processes are forked where the platform allows it, otherwise the problem has to be
+    picklable. Changes made to the problem after the pool is started are not seen by the workers.
+
+    Source:
+    N/A
+
+    Inputs:
+    problem             [nexus()]
+    number_of_workers   [int]
+
+    Outputs:
+    pool                [ProcessPoolExecutor]
+
+    Properties Used:
+    None
+    """
+
+    context = multiprocessing.get_context('fork') if 'fork' in multiprocessing.get_all_start_methods() else None
+    pool    = ProcessPoolExecutor(max_workers=int(number_of_workers),mp_context=context,
+                                  initializer=_initialize_worker,initargs=(problem,))
+
+    return pool
+
+## @ingroup Optimization
+def run_in_worker(function,*args):
+    """Calls a function with the copy of the problem held by a worker process of an evaluation_pool,
+    for tasks other than evaluating a design, for example pool.submit(run_in_worker,function,x).
+
+    Assumptions:
+    The function and its arguments are picklable, functions defined at module level are.
+
+    Source:
+    N/A
+
+    Inputs:
+    function            function(problem,*args)
+    args                arguments of the function
+
+    Outputs:
+    output              output of the function
+
+    Properties Used:
+    None
+    """
+
+    return function(_worker_problem,*args)
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+def _initialize_worker(problem):
+    """Stores the copy of the problem of a worker process"""
+    global _worker_problem
+    _worker_problem = problem
+
+def _evaluate_design(x,constraints):
+    """Evaluates one design with the copy of the problem of a worker process"""
+    return _evaluate_problem(_worker_problem,x,constraints)
+
+def _evaluate_problem(problem,x,constraints):
+    """Evaluates one design, returning the objective, the constraints and the number of new evaluations"""
+    count = problem.evaluation_count
+    obj   = problem.objective(x)
+    con   = problem.all_constraints(x) if constraints else None
+    return obj, con, problem.evaluation_count - count
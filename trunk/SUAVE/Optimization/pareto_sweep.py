@@ -2,7 +2,7 @@
 #  pareto_sweep.py
 #
 # Created  : Nov 2019, M. Kruger
-# Modified :
+# Modified : Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -13,6 +13,7 @@ from SUAVE.Core import Data
 from .Package_Setups import pyoptsparse_setup
 from .Package_Setups import pyopt_setup
 from .Package_Setups import scipy_setup
+from .design_sweep import design_sweep
 
 
 import numpy as np
@@ -23,7 +24,7 @@ import matplotlib.pyplot as plt
 # ----------------------------------------------------------------------
 
 
-def pareto_sweep(problem, number_of_points, sweep_index):
+def pareto_sweep(problem, number_of_points, sweep_index, number_of_workers=1, filename=None):
     """
     Takes in an optimization problem and runs a Pareto sweep of the sweep index sweep_index.
     i.e. sweep_index=0 means you want to sweep the first variable, sweep_index = 4 is the 5th variable)
@@ -31,8 +32,11 @@ def pareto_sweep(problem, number_of_points, sweep_index):
     with the added functionality that it runs the optimization problem for every point in the sweep,
     not just evaluate the objective function with other design variables fixed at their initial values,
     such as in line_plot()
+    The optimizations are run by design_sweep, in parallel with more than one worker, each starting
+    from the optimum of the nearest finished point. They can be stored in a table file that lets an
+    interrupted sweep be resumed.
 
-    Users can update line 85 and specify their optimizer of choice
+    Users can update pareto_solve and specify their optimizer of choice
 
         Assumptions:
         N/A
@@ -44,6 +48,8 @@ def pareto_sweep(problem, number_of_points, sweep_index):
         problem            [Nexus Class]
         number_of_points   [int]
         sweep_index        [int]
+        number_of_workers  [int]
+        filename           [str]
 
 
         Outputs:
@@ -76,16 +82,11 @@ def pareto_sweep(problem, number_of_points, sweep_index):
     #create inputs matrix
     inputs[0,:] = np.linspace(bnd[idx0][0], bnd[idx0][1], number_of_points)
 
-    # Create file to write results into
-    for i in range(0, number_of_points):
-        opt_prob.inputs[:,1][idx0]= inputs[0,i]
-
-        opt_prob.inputs[idx0][2] = (inputs[0,i], inputs[0,i])
-        problem.optimization_problem = opt_prob
-        sol = pyoptsparse_setup.Pyoptsparse_Solve(
-            problem, solver='SLSQP', FD='parallel', sense_step=1e-06)
-        obj[i] = problem.objective() * obj_scaling
-        constraint_val[:,i] = problem.all_constraints().tolist()
+    # Optimize at each point
+    sweep_obj, sweep_const, _ = design_sweep(problem, [idx0], inputs[0,:], number_of_workers, filename, pareto_solve)
+    
+    obj[:]            = sweep_obj * obj_scaling
+    constraint_val[:] = sweep_const.T
 
     # Create plot
     fig, ax = plt.subplots()
@@ -103,3 +104,32 @@ def pareto_sweep(problem, number_of_points, sweep_index):
     outputs.constraint_val = constraint_val
 
     return outputs
+
+def pareto_solve(problem, sweep_indices):
+    """
+    Optimizes the other inputs of a problem with the swept inputs fixed at their current values
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        problem            [Nexus Class]
+        sweep_indices      [list]
+
+        Outputs:
+            sol        optimizer output
+
+        Properties Used:
+        N/A
+    """
+
+    opt_prob = problem.optimization_problem
+    for idx in sweep_indices:
+        opt_prob.inputs[idx][2] = (opt_prob.inputs[idx][1], opt_prob.inputs[idx][1])
+    sol = pyoptsparse_setup.Pyoptsparse_Solve(
+        problem, solver='SLSQP', FD='parallel', sense_step=1e-06)
+
+    return sol
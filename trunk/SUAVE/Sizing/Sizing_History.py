@@ -0,0 +1,202 @@
+## @ingroup Sizing
+#Sizing_History.py
+#Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Data
+from .read_sizing_inputs import format_input_data
+
+from scipy.spatial import cKDTree
+from sklearn.base import clone
+
+import numpy as np
+import os
+
+## @ingroup Sizing
+class Sizing_History(Data):
+    def __defaults__(self):
+        """
+        Data class that keeps the converged sizing results of a sizing loop output file in memory.
+        The file is append only, so each load only reads the lines written since the previous
+        load. Nearest neighbours are found with a KD-tree, and regression models of the sizing
+        variables are stored and only refit once enough new points have arrived.
+        """
+        self.filename          = None
+        self.inputs            = None   #scaled optimization inputs of each point
+        self.outputs           = None   #converged sizing variables of each point
+        self.refit_points      = 1      #number of new points before a stored regression model is refit
+        self.tree_buffer       = 32     #number of new points searched directly before the KD-tree is rebuilt
+        self.file_position     = 0
+        self.file_id           = None
+        self.tree              = None
+        self.tree_size         = 0
+        self.models            = dict()
+
+    def load(self, filename, number_of_inputs, number_of_outputs):
+        """
+        Reads the points added to a sizing loop output file since the previous load. The
+        history is reloaded when the file has been replaced or shortened.
+
+        Inputs:
+        filename            [string]
+        number_of_inputs    [int]
+        number_of_outputs   [int]
+
+        Outputs:
+        number_of_points    [int]
+        """
+        if filename is None or not os.path.exists(filename):
+            self.reset(filename, number_of_inputs, number_of_outputs)
+            return 0
+
+        stat    = os.stat(filename)
+        file_id = (stat.st_dev, stat.st_ino)
+        if filename != self.filename or file_id != self.file_id or stat.st_size < self.file_position or self.inputs is None:
+            self.reset(filename, number_of_inputs, number_of_outputs)
+            self.file_id = file_id
+
+        if stat.st_size > self.file_position:
+            with open(filename, 'rb') as file_in:
+                file_in.seek(self.file_position)
+                new_data = file_in.read()
+
+            #only read complete lines, a line still being written is read by the next load
+            end = new_data.rfind(b'\n') + 1
+            self.file_position += end
+            lines = [line for line in new_data[:end].decode().splitlines() if line.strip()]
+            if len(lines) > 0:
+                data         = format_input_data(lines)
+                self.inputs  = np.vstack([self.inputs,  data[:, 0:number_of_inputs]])
+                self.outputs = np.vstack([self.outputs, data[:, number_of_inputs:number_of_inputs+number_of_outputs]])
+
+        return len(self.inputs)
+
+    def reset(self, filename, number_of_inputs, number_of_outputs):
+        """
+        Clears the history
+
+        Inputs:
+        filename            [string]
+        number_of_inputs    [int]
+        number_of_outputs   [int]
+
+        Outputs:
+        None
+        """
+        self.filename      = filename
+        self.inputs        = np.zeros([0, number_of_inputs])
+        self.outputs       = np.zeros([0, number_of_outputs])
+        self.file_position = 0
+        self.file_id       = None
+        self.tree          = None
+        self.tree_size     = 0
+        self.models        = dict()
+
+    def nearest(self, x, k=1):
+        """
+        Finds the k points closest to x in the L2 norm. Points added since the KD-tree was built
+        are searched directly, and the tree is rebuilt once there are more than tree_buffer of them.
+
+        Inputs:
+        x                   [array]
+        k                   [int]
+
+        Outputs:
+        distances           [array]  closest first
+        indices             [array]
+        """
+        number_of_points = len(self.inputs)
+        if self.tree is None or number_of_points - self.tree_size > self.tree_buffer:
+            self.tree      = cKDTree(self.inputs)
+            self.tree_size = number_of_points
+
+        k                = min(k, number_of_points)
+        tree_k           = min(k, self.tree_size)
+        tree_distances   = np.zeros(0)
+        tree_indices     = np.zeros(0, dtype=int)
+        if tree_k > 0:
+            tree_distances, tree_indices = self.tree.query(x, k=tree_k)
+            tree_distances, tree_indices = np.atleast_1d(tree_distances), np.atleast_1d(tree_indices)
+
+        new_distances    = np.linalg.norm(self.inputs[self.tree_size:] - x, axis=1)
+        new_indices      = np.arange(self.tree_size, number_of_points)
+
+        distances        = np.hstack([tree_distances, new_distances])
+        indices          = np.hstack([tree_indices, new_indices]).astype(int)
+        order            = np.argsort(distances, kind='mergesort')[0:k]
+
+        return distances[order], indices[order]
+
+    def find_min_norm(self, x):
+        """
+        Finds the distance to and the index of the point closest to x
+
+        Inputs:
+        x                   [array]
+
+        Outputs:
+        min_norm            [float]
+        imin_dist           [int]
+        """
+        distances, indices = self.nearest(x, 1)
+
+        return distances[0], indices[0]
+
+    def predict_neighbors(self, x, n_neighbors, weighted_distance=False):
+        """
+        Predicts all of the sizing variables at x from the nearest points, as a
+        k-nearest neighbours regression
+
+        Inputs:
+        x                   [array]
+        n_neighbors         [int]
+        weighted_distance   [boolean] weight the neighbours by the inverse of their distance
+
+        Outputs:
+        y                   [array]
+        """
+        distances, indices = self.nearest(x, n_neighbors)
+
+        if weighted_distance:
+            exact = distances == 0.
+            if np.any(exact):
+                weights = 1.*exact
+            else:
+                weights = 1./distances
+        else:
+            weights = np.ones_like(distances)
+
+        y = np.dot(weights, self.outputs[indices])/np.sum(weights)
+
+        return y
+
+    def predict(self, x, regression, key=None):
+        """
+        Predicts all of the sizing variables at x with a scikit-learn regression, one model per
+        sizing variable. Models stored under a key are reused until refit_points new points
+        have been added.
+
+        Inputs:
+        x                   [array]
+        regression          scikit-learn regressor, used as a template for each model
+        key                 [string] name to store the fitted models under, None to always refit
+
+        Outputs:
+        y                   [array]
+        """
+        number_of_points = len(self.inputs)
+        stored           = self.models.get(key)
+
+        if stored is None or number_of_points - stored[0] >= self.refit_points:
+            models = [clone(regression).fit(self.inputs, self.outputs[:,j]) for j in range(self.outputs.shape[1])]
+            stored = (number_of_points, models)
+            if key is not None:
+                self.models[key] = stored
+
+        x = np.reshape(x, (1,-1))
+        y = np.array([model.predict(x)[0] for model in stored[1]])
+
+        return y
@@ -2,6 +2,7 @@
 #Sizing_Loop.py
 #Created:  Jun 2016, M. Vegh
 #Modified: May 2018, M. Vegh
+#          Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -16,10 +17,9 @@ import sklearn.ensemble as ensemble
 import sklearn.gaussian_process as gaussian_process
 from sklearn.gaussian_process.kernels import RationalQuadratic 
 import sklearn.linear_model as linear_model
-import sklearn.neighbors as neighbors
 from .write_sizing_outputs import write_sizing_outputs
-from .read_sizing_inputs import read_sizing_inputs
 from .write_sizing_residuals import write_sizing_residuals
+from .Sizing_History import Sizing_History
 
 
 import numpy as np
@@ -54,6 +54,7 @@ class Sizing_Loop(Data):
         self.write_threshhold      = 3     #number of iterations before it writes,
         self.write_residuals       = False  #set to True to write the residuals at every iteration
         self.residual_filename     = 'y_err_values.txt'
+        self.history               = Sizing_History() #in-memory index of the output file, used for the initial step
         
         #parameters that may only apply to certain methods
         self.iteration_options     = Data()
@@ -71,6 +72,7 @@ class Sizing_Loop(Data):
         self.iteration_options.number_of_surrogate_calls         = 0
         self.iteration_options.newton_raphson_damping_threshhold = 5E-5
         self.iteration_options.n_neighbors                       = 5
+        self.iteration_options.neighbors_weighted_distance       = False
         self.iteration_options.err_save                          = 0.
         
         #backtracking 
@@ -113,23 +115,31 @@ class Sizing_Loop(Data):
         #determine the initial step
         min_norm = 1000.
         if self.initial_step != 'Default':
-            data_inputs, data_outputs, read_success = read_sizing_inputs(self, scaled_inputs)
+            history      = self.history
+            read_success = history.load(self.output_filename, len(scaled_inputs), len(self.default_y)) > 0
             
-            if read_success:
-                min_norm, i_min_dist = find_min_norm(scaled_inputs, data_inputs)
+            if not read_success:
+                print('no data to read, use default values')
+            
+            else:
+                data_inputs  = history.inputs
+                data_outputs = history.outputs
+                min_norm, i_min_dist = history.find_min_norm(scaled_inputs)
                 
                 if min_norm<iteration_options.max_initial_step: #make sure data is close to current guess
                     if self.initial_step == 'Table' or min_norm<iteration_options.min_surrogate_step or len(data_outputs[:,0])< iteration_options.min_surrogate_length:
-                        regr    = neighbors.KNeighborsRegressor( n_neighbors = 1)
+                        y = history.predict_neighbors(scaled_inputs, 1)
                       
                     else:
                         print('running surrogate method')
+                        regr = None
+                        key  = self.initial_step
                         if self.initial_step == 'SVR':
                             #for SVR, can optimize parameters C and eps for closest point
                             print('optimizing svr parameters')
                             x = [2.,-1.] #initial guess for 10**C, 10**eps
                         
-                            out = sp.optimize.minimize(check_svr_accuracy, x, method='Nelder-Mead', args=(data_inputs, data_outputs, imin_dist))
+                            out = sp.optimize.minimize(check_svr_accuracy, x, method='Nelder-Mead', args=(data_inputs, data_outputs, i_min_dist))
                             t2=time.time()
                             c_out = 10**out.x[0]
                             eps_out = 10**out.x[1]
@@ -139,6 +149,7 @@ class Sizing_Loop(Data):
                                 eps_out = 1E-8
             
                             regr        = svm.SVR(C=c_out,  epsilon = eps_out)
+                            key         = None #parameters change with the point
                             
                         elif self.initial_step == 'GradientBoosting':
                             regr        = ensemble.GradientBoostingRegressor()
@@ -159,32 +170,21 @@ class Sizing_Loop(Data):
                         elif self.initial_step == 'RANSAC':
                             regr        = linear_model.RANSACRegressor()
                         
-                        elif self.initial_step == 'Neighbors':
+                        #now run the fits/guesses, the neighbors are found in the history index
+                        if self.initial_step == 'Neighbors':
                             n_neighbors = min(iteration_options.n_neighbors, len(data_outputs))
-                            if iteration_options.neighbors_weighted_distance  == True:
-                                regr    = neighbors.KNeighborsRegressor( n_neighbors = n_neighbors ,weights = 'distance')
-                            
-                            else:  
-                                regr    = neighbors.KNeighborsRegressor( n_neighbors = n_neighbors)
-                        
-                        #now run the fits/guesses  
+                            y = history.predict_neighbors(scaled_inputs, n_neighbors, iteration_options.neighbors_weighted_distance)
+                        else:
+                            y = history.predict(scaled_inputs, regr, key)
                     
                         iteration_options.number_of_surrogate_calls += 1
-                    y = []    
-                    input_for_regr = scaled_inputs.reshape(1,-1)
-                    for j in range(len(data_outputs[0,:])):
-                        y_surrogate = regr.fit(data_inputs, data_outputs[:,j])
-                        y.append(y_surrogate.predict(input_for_regr)[0])    
+                    
+                    for j in range(len(y)):
                         if y[j] > self.max_y[j] or y[j]< self.min_y[j]: 
                             print('sizing variable range violated, val = ', y[j], ' j = ', j)
                             n_neighbors = min(iteration_options.n_neighbors, len(data_outputs))
-                            regr_backup = neighbors.KNeighborsRegressor( n_neighbors = n_neighbors)
-                            y = []
-                            for j in range(len(data_outputs[0,:])):
-                                y_surrogate = regr_backup.fit(data_inputs, data_outputs[:,j])
-                                y.append(y_surrogate.predict(input_for_regr)[0])
+                            y = history.predict_neighbors(scaled_inputs, n_neighbors)
                             break
-                    y = np.array(y)
                    
         # initialize previous sizing values
         y_save   = 1*y  #save values to detect oscillation
@@ -470,33 +470,3 @@ def Finite_Difference_Gradient(x,f , my_function, inputs, scaling, iter, h):
         iter=iter+1
         
     return J, iter
-
-def find_min_norm(scaled_inputs, data_inputs):
-    """
-    Finds the minimum and location of the L2 norm of two sets of data
-    
-    Inputs:
-    scaled_inputs    [array]
-    data_outputs     [array]
-    
-    Outputs:
-    min_norm         [float]
-    imin_dist        [int]
-    """
-    min_norm  = 1E9
-    diff      = np.subtract(scaled_inputs, data_inputs) #check how close inputs are to tabulated values  
-  
-    imin_dist = -1 
-    for k in range(len(diff[:,-1])):
-        row      = diff[k,:]
-        row_norm = np.linalg.norm(row)
-        if row_norm < min_norm:
-            min_norm  = row_norm
-            imin_dist = k*1 
-    
-    return min_norm, imin_dist
-
-        
-        
-        
-    
\ No newline at end of file